@@ -0,0 +1,108 @@
+"""Benchmark de memoria de las representaciones de vehiculos.
+
+Compara la memoria de 100.000 vehiculos estacionados (con hora de
+ingreso) en tres representaciones:
+
+- objetos con __dict__ (como eran las entidades antes de __slots__),
+- objetos con __slots__ (las entidades actuales),
+- TablaVehiculos (columnas tipadas).
+
+Uso:
+    python benchmarks/benchmark_memoria.py [cantidad]
+"""
+
+# Standard library
+from __future__ import annotations
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.entidades.vehiculos.tabla_vehiculos import TablaVehiculos
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+
+TIPOS = ["Moto", "Auto", "Camioneta"]
+BASE = datetime(2025, 11, 4, 8, 0)
+
+
+class VehiculoConDict:
+    """Replica de la disposicion anterior de las entidades (con __dict__)."""
+
+    def __init__(self, patente: str, superficie: float, tarifa_base: float, tolerancia_minutos: int):
+        self._patente = patente
+        self._superficie = superficie
+        self._tarifa_base = tarifa_base
+        self._tolerancia_minutos = tolerancia_minutos
+        self._hora_ingreso = None
+        self._hora_egreso = None
+        self._marca = "Sin especificar"
+
+
+def crear_con_dict(cantidad: int) -> dict:
+    """Crea vehiculos con __dict__."""
+    vehiculos = {}
+    for i in range(cantidad):
+        patente = f"BM{i:07d}"
+        vehiculo = VehiculoConDict(patente, 12.0, 100.0, 15)
+        vehiculo._hora_ingreso = BASE + timedelta(seconds=i)
+        vehiculos[patente] = vehiculo
+    return vehiculos
+
+
+def crear_con_slots(cantidad: int) -> dict:
+    """Crea vehiculos con las entidades actuales (__slots__)."""
+    vehiculos = {}
+    for i in range(cantidad):
+        patente = f"BM{i:07d}"
+        vehiculo = VehiculoFactory.crear_vehiculo(TIPOS[i % 3], patente)
+        vehiculo.set_hora_ingreso(BASE + timedelta(seconds=i))
+        vehiculos[patente] = vehiculo
+    return vehiculos
+
+
+def crear_tabla(cantidad: int) -> TablaVehiculos:
+    """Crea una TablaVehiculos (los objetos temporales se liberan al agregarlos)."""
+    tabla = TablaVehiculos()
+    for i in range(cantidad):
+        vehiculo = VehiculoFactory.crear_vehiculo(TIPOS[i % 3], f"BM{i:07d}")
+        vehiculo.set_hora_ingreso(BASE + timedelta(seconds=i))
+        tabla.agregar(vehiculo)
+    return tabla
+
+
+def medir(crear: Callable[[int], object], cantidad: int) -> int:
+    """Mide la memoria retenida por una representacion, en bytes."""
+    tracemalloc.start()
+    resultado = crear(cantidad)
+    retenida, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return retenida
+
+
+def main():
+    """Ejecuta el benchmark e imprime la comparacion."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    resultados = {
+        '__dict__': medir(crear_con_dict, cantidad),
+        '__slots__': medir(crear_con_slots, cantidad),
+        'tabla': medir(crear_tabla, cantidad),
+    }
+
+    print(f"\nMemoria de {cantidad} vehiculos")
+    print(f"{'representacion':<16}{'total (MB)':>12}{'por vehiculo (B)':>18}")
+    for nombre, retenida in resultados.items():
+        print(f"{nombre:<16}{retenida / 2**20:>12.1f}{retenida / cantidad:>18.0f}")
+
+    base = resultados['__dict__']
+    print(f"\nReduccion: __slots__ x{base / resultados['__slots__']:.1f}, tabla x{base / resultados['tabla']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark de puertas en procesos separados.
+
+Reparte 20.000 ingresos y sus egresos entre 1, 2, 4 y 8 procesos de
+puerta, cada uno con su ParkingLot sobre la misma TablaOcupacionCompartida,
+y mide las operaciones por segundo. Cada puerta egresa los vehiculos que
+ingresaron por la siguiente. La aceleracion depende de los nucleos
+disponibles.
+
+Uso:
+    python benchmarks/benchmark_puertas_procesos.py [vehiculos] [procesos...]
+"""
+
+# Standard library
+from __future__ import annotations
+import logging
+import os
+import sys
+from pathlib import Path
+from time import perf_counter
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.servicios.puertas_procesos import PuertasEnProcesos
+from python_estacionamiento.servicios.tabla_ocupacion_compartida import TablaOcupacionCompartida
+
+
+def crear_tandas(vehiculos: int, puertas: int) -> tuple[list, list]:
+    """Reparte los ingresos entre las puertas y arma los egresos cruzados."""
+    tipos = VehiculoFactory.get_tipos()
+    por_puerta = vehiculos // puertas
+    ingresos = [
+        [("ingreso", f"PB{puerta:02d}{i:05d}", tipos[i % len(tipos)]) for i in range(por_puerta)]
+        for puerta in range(puertas)
+    ]
+    egresos = [
+        [("egreso", operacion[1]) for operacion in ingresos[(puerta + 1) % puertas]]
+        for puerta in range(puertas)
+    ]
+    return ingresos, egresos
+
+
+def medir(vehiculos: int, procesos: int) -> tuple[int, float]:
+    """Mide ingresos y egresos de todas las puertas con una cantidad de procesos."""
+    tabla = TablaOcupacionCompartida.crear(vehiculos)
+    puertas = PuertasEnProcesos(tabla, procesos)
+    try:
+        ingresos, egresos = crear_tandas(vehiculos, procesos)
+        # Calentar los procesos antes de medir
+        puertas.procesar([[] for _ in range(procesos)])
+
+        inicio = perf_counter()
+        resultados = puertas.procesar(ingresos) + puertas.procesar(egresos)
+        tiempo = perf_counter() - inicio
+
+        operaciones = sum(len(puerta) for puerta in resultados)
+        assert None not in (plaza for puerta in resultados for plaza in puerta)
+        assert tabla.get_plazas_ocupadas() == 0
+        return operaciones, tiempo
+    finally:
+        puertas.cerrar()
+        tabla.destruir()
+
+
+def main():
+    """Ejecuta el benchmark e imprime el rendimiento por cantidad de procesos."""
+    vehiculos = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    cantidades = [int(valor) for valor in sys.argv[2:]] or [1, 2, 4, 8]
+    # Sin el log por operacion (los procesos de puerta lo heredan con fork)
+    logging.disable(logging.INFO)
+
+    print(f"\nPuertas en procesos: {vehiculos} ingresos y egresos ({os.cpu_count()} CPUs)")
+    print(f"{'procesos':<10}{'tiempo (s)':>12}{'ops/s':>12}{'aceleracion':>14}")
+    base = None
+    for procesos in cantidades:
+        operaciones, tiempo = medir(vehiculos, procesos)
+        rendimiento = operaciones / tiempo
+        base = base or rendimiento
+        print(f"{procesos:<10}{tiempo:>12.3f}{rendimiento:>12.0f}{rendimiento / base:>13.2f}x")
+
+
+if __name__ == "__main__":
+    main()
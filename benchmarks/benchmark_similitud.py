@@ -0,0 +1,82 @@
+"""Benchmark de busqueda de patentes similares.
+
+Carga 50.000 patentes en un IndicePatentes y mide cuanto tarda en
+encontrar los candidatos de lecturas erroneas (un caracter confundido o
+cambiado) con distintas distancias maximas.
+
+Uso:
+    python benchmarks/benchmark_similitud.py [cantidad] [consultas]
+"""
+
+# Standard library
+from __future__ import annotations
+import random
+import string
+import sys
+from pathlib import Path
+from time import perf_counter
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.servicios.indice_patentes import IndicePatentes
+
+CONFUSIONES = {'0': 'O', 'O': '0', '1': 'I', 'I': '1', '8': 'B', 'B': '8', '5': 'S', 'S': '5'}
+
+
+def generar_patentes(cantidad: int, generador: random.Random) -> list[str]:
+    """Genera patentes unicas con formatos "AB123CD" y "ABC123"."""
+    letras, digitos = string.ascii_uppercase, string.digits
+    patentes = set()
+    while len(patentes) < cantidad:
+        if generador.random() < 0.5:
+            patente = (''.join(generador.choices(letras, k=2)) + ''.join(generador.choices(digitos, k=3))
+                       + ''.join(generador.choices(letras, k=2)))
+        else:
+            patente = ''.join(generador.choices(letras, k=3)) + ''.join(generador.choices(digitos, k=3))
+        patentes.add(patente)
+    return list(patentes)
+
+
+def leer_con_error(patente: str, generador: random.Random) -> str:
+    """Simula una lectura de camara con un caracter confundido o cambiado."""
+    caracteres = list(patente)
+    posicion = generador.randrange(len(caracteres))
+    caracteres[posicion] = CONFUSIONES.get(
+        caracteres[posicion], generador.choice(string.ascii_uppercase + string.digits)
+    )
+    return ''.join(caracteres)
+
+
+def main():
+    """Ejecuta el benchmark e imprime los tiempos por consulta."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    generador = random.Random(42)
+
+    patentes = generar_patentes(cantidad, generador)
+    indice = IndicePatentes()
+    inicio = perf_counter()
+    for patente in patentes:
+        indice.agregar(patente)
+    tiempo_carga = perf_counter() - inicio
+
+    originales = generador.sample(patentes, consultas)
+    lecturas = [leer_con_error(patente, generador) for patente in originales]
+
+    print(f"\nIndice de {cantidad} patentes (carga: {tiempo_carga:.2f} s)")
+    print(f"{'distancia':<12}{'ms/consulta':>14}{'encontradas':>14}")
+    for distancia in (0, 1, 2):
+        encontradas = 0
+        inicio = perf_counter()
+        for original, lectura in zip(originales, lecturas):
+            candidatos = indice.buscar_similares(lectura, distancia)
+            encontradas += any(c.patente == original for c in candidatos)
+        por_consulta = (perf_counter() - inicio) / consultas * 1000
+        print(f"{distancia:<12}{por_consulta:>14.3f}{encontradas / consultas:>13.0%}")
+
+
+if __name__ == "__main__":
+    main()
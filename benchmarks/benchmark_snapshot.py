@@ -0,0 +1,83 @@
+"""Benchmark de snapshots JSON vs binario.
+
+Mide el tiempo de guardar y cargar el estado de un estacionamiento con
+100.000 vehiculos en cada formato, incluyendo la conversion de horas que
+hace ParkingLotManager al restaurar.
+
+Uso:
+    python benchmarks/benchmark_snapshot.py [cantidad]
+"""
+
+# Standard library
+from __future__ import annotations
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.persistencia.json_storage import JsonStorage, FormatoSnapshot
+
+
+def crear_estado(cantidad: int) -> dict:
+    """Crea un estado con la cantidad de vehiculos indicada."""
+    tipos = ["Moto", "Auto", "Camioneta"]
+    base = datetime(2025, 11, 4, 8, 0)
+    vehiculos = {}
+    for i in range(cantidad):
+        patente = f"BM{i:07d}"
+        vehiculo = VehiculoFactory.crear_vehiculo(tipos[i % 3], patente)
+        vehiculo.set_hora_ingreso(base + timedelta(seconds=i))
+        vehiculos[patente] = vehiculo
+    return {'plazas_ocupadas': cantidad, 'capacidad_maxima': cantidad, 'vehiculos': vehiculos}
+
+
+def medir(formato: FormatoSnapshot, estado: dict, directorio: Path) -> tuple[float, float, int]:
+    """Mide guardado y carga (con restauracion de horas) en un formato."""
+    storage = JsonStorage(archivo=f'bench_{formato.value}', directorio=directorio, formato=formato)
+
+    inicio = perf_counter()
+    storage.guardar_estado(estado)
+    tiempo_guardado = perf_counter() - inicio
+
+    inicio = perf_counter()
+    cargado = storage.cargar_estado()
+    for vehiculo_data in cargado['vehiculos_data']:
+        hora = vehiculo_data['hora_ingreso']
+        if isinstance(hora, str):
+            datetime.fromisoformat(hora)
+    tiempo_carga = perf_counter() - inicio
+
+    tamano = (directorio / f'bench_{formato.value}').stat().st_size
+    return tiempo_guardado, tiempo_carga, tamano
+
+
+def main():
+    """Ejecuta el benchmark e imprime la comparacion."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    estado = crear_estado(cantidad)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        resultados = {
+            formato: medir(formato, estado, Path(directorio))
+            for formato in (FormatoSnapshot.JSON, FormatoSnapshot.BINARIO)
+        }
+
+    print(f"\nSnapshot de {cantidad} vehiculos")
+    print(f"{'formato':<10}{'guardar (s)':>14}{'cargar (s)':>14}{'tamano (KB)':>14}")
+    for formato, (guardar, cargar, tamano) in resultados.items():
+        print(f"{formato.value:<10}{guardar:>14.3f}{cargar:>14.3f}{tamano / 1024:>14.0f}")
+
+    json_guardar, json_cargar, _ = resultados[FormatoSnapshot.JSON]
+    bin_guardar, bin_cargar, _ = resultados[FormatoSnapshot.BINARIO]
+    print(f"\nAceleracion: guardar x{json_guardar / bin_guardar:.1f}, cargar x{json_cargar / bin_cargar:.1f}")
+
+
+if __name__ == "__main__":
+    main()
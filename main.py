@@ -134,7 +134,7 @@ def main():
     # Estrategia 2: Happy Hour (descuento)
     pricing_registry.set_estrategia(PricingHappyHourStrategy())
     precio_happy_hour = pricing_registry.calcular_precio(auto1, hora_ingreso, hora_egreso)
-    print(f"   - Estrategia HAPPY HOUR (20% desc): ${precio_happy_hour}")
+    print(f"   - Estrategia HAPPY HOUR (20% desc. 14 a 17 hs): ${precio_happy_hour}")
 
     # Estrategia 3: Valet (recargo)
     pricing_registry.set_estrategia(PricingValetStrategy())
@@ -11,6 +11,13 @@ from __future__ import annotations
 CAPACIDAD_MAXIMA_PLAZAS = 100
 AGUA_DISPONIBLE_INICIAL = 0  # No aplica para estacionamiento
 
+# Plazas por tipo de vehiculo (asignacion por plaza, suman CAPACIDAD_MAXIMA_PLAZAS)
+PLAZAS_MOTO = 20
+PLAZAS_AUTO = 60
+PLAZAS_CAMIONETA = 20
+PLAZAS_POR_TIPO = {"Moto": PLAZAS_MOTO, "Auto": PLAZAS_AUTO, "Camioneta": PLAZAS_CAMIONETA}
+LOTE_POR_DEFECTO = "principal"  # id del lote que administra ParkingLotManager
+
 # Tarifas base por tipo de vehiculo (en pesos por hora)
 TARIFA_BASE_MOTO = 50.0
 TARIFA_BASE_AUTO = 100.0
@@ -26,6 +33,12 @@ TOLERANCIA_MOTO = 10
 TOLERANCIA_AUTO = 15
 TOLERANCIA_CAMIONETA = 15
 
+# Codigos de tipo de vehiculo (tablas columnares, memoria compartida y snapshots binarios)
+CODIGO_MOTO = 1
+CODIGO_AUTO = 2
+CODIGO_CAMIONETA = 3
+CODIGO_MAXIMO_TIPO = 255  # los codigos se guardan en un byte sin signo
+
 # Configuracion de sensores
 INTERVALO_SENSOR_OCUPACION = 5.0  # segundos
 INTERVALO_SENSOR_CAMARA = 3.0  # segundos
@@ -45,13 +58,40 @@ HORA_FIN_NOCTURNO = 6
 
 # Configuracion de threading
 THREAD_JOIN_TIMEOUT = 2.0
+CANTIDAD_STRIPES_PATENTE = 64  # locks por patente (lock striping)
+CAPACIDAD_COLA_OBSERVADOR = 1000  # eventos pendientes por observador asincrono
+ESPERA_LOCK_COMPARTIDO = 0.0002  # segundos entre intentos de la fachada asyncio sobre un lock de hilos
+SEGMENTOS_TABLA_COMPARTIDA = 16  # locks del indice y del bitmap de la tabla de ocupacion entre procesos
+
+# Configuracion de patentes
+CARACTERES_MINIMOS_PATENTE = 4  # letras y digitos de una patente normalizada
+CARACTERES_MAXIMOS_PATENTE = 12
+DISTANCIA_MAXIMA_SIMILITUD = 1  # ediciones toleradas al conciliar lecturas (ademas de confundibles)
+CANDIDATOS_SIMILITUD = 5  # patentes similares devueltas por defecto
+
+# Configuracion de cotizaciones
+CAPACIDAD_CACHE_COTIZACIONES = 4096  # cotizaciones memorizadas en PricingRegistry
+VERSIONES_PRECIOS_CONSERVADAS = 64  # fotos de precios disponibles para auditoria
 
 # Configuracion de persistencia
 DIRECTORIO_PERSISTENCIA = "data"
 EXTENSION_ARCHIVO = ".pkl"
+REGISTROS_POR_FSYNC = 32  # registros de journal pendientes que adelantan el fsync
+INTERVALO_VOLCADO_JOURNAL = 0.05  # segundos maximos entre cada fsync del journal
+ESPERA_REINTENTO_JOURNAL = 0.5  # segundos antes del primer reintento de un journal degradado
+ESPERA_MAXIMA_REINTENTO_JOURNAL = 30.0  # tope de la espera exponencial entre reintentos
+REGISTROS_POR_SNAPSHOT = 10000  # registros de journal entre cada compactacion
+GENERACIONES_SNAPSHOT = 3  # snapshots JSON conservados (el actual y anteriores)
+CAMBIOS_POR_AUTOGUARDADO = 100  # cambios acumulados que disparan un autoguardado
+INTERVALO_AUTOGUARDADO = 30.0  # segundos maximos entre autoguardados con cambios
 
 __all__ = [
     "CAPACIDAD_MAXIMA_PLAZAS",
+    "PLAZAS_MOTO",
+    "PLAZAS_AUTO",
+    "PLAZAS_CAMIONETA",
+    "PLAZAS_POR_TIPO",
+    "LOTE_POR_DEFECTO",
     "TARIFA_BASE_MOTO",
     "TARIFA_BASE_AUTO",
     "TARIFA_BASE_CAMIONETA",
@@ -61,6 +101,10 @@ __all__ = [
     "TOLERANCIA_MOTO",
     "TOLERANCIA_AUTO",
     "TOLERANCIA_CAMIONETA",
+    "CODIGO_MOTO",
+    "CODIGO_AUTO",
+    "CODIGO_CAMIONETA",
+    "CODIGO_MAXIMO_TIPO",
     "INTERVALO_SENSOR_OCUPACION",
     "INTERVALO_SENSOR_CAMARA",
     "INTERVALO_VERIFICACION_SEGURIDAD",
@@ -73,6 +117,24 @@ __all__ = [
     "HORA_INICIO_NOCTURNO",
     "HORA_FIN_NOCTURNO",
     "THREAD_JOIN_TIMEOUT",
+    "CANTIDAD_STRIPES_PATENTE",
+    "CAPACIDAD_COLA_OBSERVADOR",
+    "ESPERA_LOCK_COMPARTIDO",
+    "SEGMENTOS_TABLA_COMPARTIDA",
+    "CARACTERES_MINIMOS_PATENTE",
+    "CARACTERES_MAXIMOS_PATENTE",
+    "DISTANCIA_MAXIMA_SIMILITUD",
+    "CANDIDATOS_SIMILITUD",
+    "CAPACIDAD_CACHE_COTIZACIONES",
+    "VERSIONES_PRECIOS_CONSERVADAS",
     "DIRECTORIO_PERSISTENCIA",
     "EXTENSION_ARCHIVO",
+    "REGISTROS_POR_FSYNC",
+    "INTERVALO_VOLCADO_JOURNAL",
+    "ESPERA_REINTENTO_JOURNAL",
+    "ESPERA_MAXIMA_REINTENTO_JOURNAL",
+    "REGISTROS_POR_SNAPSHOT",
+    "GENERACIONES_SNAPSHOT",
+    "CAMBIOS_POR_AUTOGUARDADO",
+    "INTERVALO_AUTOGUARDADO",
 ]
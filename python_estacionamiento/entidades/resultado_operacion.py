@@ -0,0 +1,29 @@
+"""Entidad ResultadoOperacion.
+
+Representa el resultado individual de una operacion dentro de un lote.
+"""
+
+# Standard library
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+    from python_estacionamiento.excepciones.estacionamiento_exception import EstacionamientoException
+
+
+@dataclass(frozen=True)
+class ResultadoOperacion:
+    """Resultado de ingresar o egresar un vehiculo dentro de un lote.
+
+    Attributes:
+        patente: Patente del vehiculo procesado
+        exito: True si la operacion se realizo
+        vehiculo: Vehiculo procesado (None si no se encontro)
+        error: Excepcion que explica el rechazo (None si hubo exito)
+    """
+    patente: str
+    exito: bool
+    vehiculo: Vehiculo | None = None
+    error: EstacionamientoException | None = None
@@ -0,0 +1,45 @@
+"""Entidad Ticket.
+
+Representa el comprobante inmutable de una estadia cobrada.
+"""
+
+# Standard library
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+
+@dataclass(frozen=True)
+class Ticket:
+    """Comprobante de una estadia cobrada al egresar.
+
+    Attributes:
+        numero: Numero correlativo del ticket
+        patente: Patente del vehiculo
+        tipo_vehiculo: Tipo de vehiculo ("Auto", "Moto", "Camioneta")
+        hora_ingreso: Hora de ingreso
+        hora_egreso: Hora de egreso
+        monto: Monto cobrado
+        version_precios: Version de la configuracion de precios usada
+        estrategia: Nombre de la estrategia de precio aplicada
+        zona: Zona del estacionamiento (None si no se indico)
+        clase_cliente: Clase de cliente (None si no se indico)
+    """
+    numero: int
+    patente: str
+    tipo_vehiculo: str
+    hora_ingreso: datetime
+    hora_egreso: datetime
+    monto: float
+    version_precios: int
+    estrategia: str
+    zona: str | None = None
+    clase_cliente: str | None = None
+
+    def get_tiempo_estadia(self) -> timedelta:
+        """Obtiene la duracion de la estadia.
+
+        Returns:
+            Tiempo entre el ingreso y el egreso
+        """
+        return self.hora_egreso - self.hora_ingreso
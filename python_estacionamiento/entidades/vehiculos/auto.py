@@ -8,11 +8,7 @@ from __future__ import annotations
 
 # Local application
 from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
-from python_estacionamiento.constantes import (
-    SUPERFICIE_AUTO,
-    TARIFA_BASE_AUTO,
-    TOLERANCIA_AUTO
-)
+from python_estacionamiento.entidades.vehiculos.tipo_vehiculo import TIPO_AUTO
 
 
 class Auto(Vehiculo):
@@ -21,6 +17,9 @@ class Auto(Vehiculo):
     Representa un automovil con caracteristicas especificas.
     """
 
+    __slots__ = ('_marca',)
+    _tipo = TIPO_AUTO
+
     def __init__(self, patente: str, marca: str = "Sin especificar"):
         """Inicializa un auto.
 
@@ -28,12 +27,7 @@ class Auto(Vehiculo):
             patente: Patente del auto
             marca: Marca del auto (default: "Sin especificar")
         """
-        super().__init__(
-            patente=patente,
-            superficie=SUPERFICIE_AUTO,
-            tarifa_base=TARIFA_BASE_AUTO,
-            tolerancia_minutos=TOLERANCIA_AUTO
-        )
+        super().__init__(patente=patente)
         self._marca = marca
 
     def get_marca(self) -> str:
@@ -8,11 +8,7 @@ from __future__ import annotations
 
 # Local application
 from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
-from python_estacionamiento.constantes import (
-    SUPERFICIE_CAMIONETA,
-    TARIFA_BASE_CAMIONETA,
-    TOLERANCIA_CAMIONETA
-)
+from python_estacionamiento.entidades.vehiculos.tipo_vehiculo import TIPO_CAMIONETA
 
 
 class Camioneta(Vehiculo):
@@ -21,6 +17,9 @@ class Camioneta(Vehiculo):
     Representa una camioneta con caracteristicas especificas.
     """
 
+    __slots__ = ('_capacidad_carga',)
+    _tipo = TIPO_CAMIONETA
+
     def __init__(self, patente: str, capacidad_carga: float = 1000.0):
         """Inicializa una camioneta.
 
@@ -28,12 +27,7 @@ class Camioneta(Vehiculo):
             patente: Patente de la camioneta
             capacidad_carga: Capacidad de carga en kg (default: 1000.0)
         """
-        super().__init__(
-            patente=patente,
-            superficie=SUPERFICIE_CAMIONETA,
-            tarifa_base=TARIFA_BASE_CAMIONETA,
-            tolerancia_minutos=TOLERANCIA_CAMIONETA
-        )
+        super().__init__(patente=patente)
         self._capacidad_carga = capacidad_carga
 
     def get_capacidad_carga(self) -> float:
@@ -8,11 +8,7 @@ from __future__ import annotations
 
 # Local application
 from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
-from python_estacionamiento.constantes import (
-    SUPERFICIE_MOTO,
-    TARIFA_BASE_MOTO,
-    TOLERANCIA_MOTO
-)
+from python_estacionamiento.entidades.vehiculos.tipo_vehiculo import TIPO_MOTO
 
 
 class Moto(Vehiculo):
@@ -21,6 +17,9 @@ class Moto(Vehiculo):
     Representa una motocicleta con caracteristicas especificas.
     """
 
+    __slots__ = ('_cilindrada',)
+    _tipo = TIPO_MOTO
+
     def __init__(self, patente: str, cilindrada: int = 150):
         """Inicializa una moto.
 
@@ -28,12 +27,7 @@ class Moto(Vehiculo):
             patente: Patente de la moto
             cilindrada: Cilindrada en cc (default: 150)
         """
-        super().__init__(
-            patente=patente,
-            superficie=SUPERFICIE_MOTO,
-            tarifa_base=TARIFA_BASE_MOTO,
-            tolerancia_minutos=TOLERANCIA_MOTO
-        )
+        super().__init__(patente=patente)
         self._cilindrada = cilindrada
 
     def get_cilindrada(self) -> int:
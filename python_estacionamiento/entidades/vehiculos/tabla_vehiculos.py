@@ -0,0 +1,259 @@
+"""Tabla columnar de vehiculos.
+
+Guarda muchos vehiculos en columnas tipadas (array) en lugar de un objeto
+por vehiculo: la patente, el codigo de su TipoVehiculo, superficie, tarifa,
+tolerancia y las horas de ingreso y egreso como epoch en segundos. Las
+columnas de tarifas, tolerancias y horas sirven directamente como entrada
+de PricingStrategy.calcular_precios_lote.
+
+Cada fila se consulta mediante una VistaVehiculo liviana que ofrece los
+mismos getters y setters que Vehiculo.
+
+Las horas son locales y sin zona horaria, como las que registra el
+estacionamiento: el epoch no guarda el offset, por lo que una hora con
+tzinfo se rechaza en lugar de devolverse cambiada.
+"""
+
+# Standard library
+from __future__ import annotations
+import math
+from array import array
+from datetime import datetime
+from typing import Dict, Iterator, List
+
+# Local application
+from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+
+# Hora ausente (None) en las columnas de epoch
+_SIN_HORA = math.nan
+
+
+def _a_epoch(hora: datetime | None) -> float:
+    """Convierte una hora local sin zona horaria a epoch en segundos (NaN si es None).
+
+    Raises:
+        ValueError: Si la hora tiene zona horaria
+    """
+    if hora is None:
+        return _SIN_HORA
+    if hora.tzinfo is not None:
+        raise ValueError(f"La tabla solo admite horas sin zona horaria: {hora.isoformat()}")
+    return hora.timestamp()
+
+
+def _desde_epoch(segundos: float) -> datetime | None:
+    """Convierte epoch en segundos a hora local (None si es NaN)."""
+    return None if math.isnan(segundos) else datetime.fromtimestamp(segundos)
+
+
+class TablaVehiculos:
+    """Vehiculos almacenados en columnas tipadas.
+
+    Agregar, buscar y eliminar por patente son O(1): al eliminar, la ultima
+    fila ocupa el lugar de la eliminada.
+    """
+
+    def __init__(self):
+        """Inicializa una tabla vacia."""
+        self._filas: Dict[str, int] = {}
+        self._patentes: List[str] = []
+        self._nombres_tipo: Dict[int, str] = {}
+        self._tipos = array('B')
+        self._superficies = array('d')
+        self._tarifas = array('d')
+        self._tolerancias = array('i')
+        self._ingresos = array('d')
+        self._egresos = array('d')
+
+    def agregar(self, vehiculo: Vehiculo) -> VistaVehiculo:
+        """Copia un vehiculo a la tabla.
+
+        Los atributos propios de cada tipo (marca, cilindrada, capacidad de
+        carga) no se guardan.
+
+        Args:
+            vehiculo: Vehiculo a agregar
+
+        Returns:
+            Vista sobre la fila agregada
+
+        Raises:
+            ValueError: Si el tipo no esta registrado en VehiculoFactory, la
+                patente ya esta en la tabla o alguna hora tiene zona horaria
+        """
+        tipo = vehiculo.get_tipo_vehiculo()
+        if not tipo.codigo or self._nombres_tipo.get(tipo.codigo, tipo.nombre) != tipo.nombre:
+            raise ValueError(f"Tipo de vehiculo no registrado: {tipo.nombre}")
+        patente = vehiculo.get_patente()
+        if patente in self._filas:
+            raise ValueError(f"La patente {patente} ya esta en la tabla")
+
+        ingreso = _a_epoch(vehiculo.get_hora_ingreso())
+        egreso = _a_epoch(vehiculo.get_hora_egreso())
+
+        self._filas[patente] = len(self._patentes)
+        self._patentes.append(patente)
+        self._nombres_tipo[tipo.codigo] = tipo.nombre
+        self._tipos.append(tipo.codigo)
+        self._superficies.append(vehiculo.get_superficie())
+        self._tarifas.append(vehiculo.get_tarifa_base())
+        self._tolerancias.append(vehiculo.get_tolerancia_minutos())
+        self._ingresos.append(ingreso)
+        self._egresos.append(egreso)
+        return VistaVehiculo(self, patente)
+
+    def eliminar(self, patente: str) -> None:
+        """Elimina un vehiculo de la tabla.
+
+        Args:
+            patente: Patente del vehiculo
+
+        Raises:
+            KeyError: Si la patente no esta en la tabla
+        """
+        fila = self._filas.pop(patente)
+        ultima = len(self._patentes) - 1
+        columnas = (self._tipos, self._superficies, self._tarifas,
+                    self._tolerancias, self._ingresos, self._egresos)
+        if fila != ultima:
+            movida = self._patentes[ultima]
+            self._patentes[fila] = movida
+            self._filas[movida] = fila
+            for columna in columnas:
+                columna[fila] = columna[ultima]
+        self._patentes.pop()
+        for columna in columnas:
+            columna.pop()
+
+    def get(self, patente: str) -> VistaVehiculo | None:
+        """Obtiene la vista de un vehiculo.
+
+        Args:
+            patente: Patente del vehiculo
+
+        Returns:
+            Vista sobre su fila, o None si no esta en la tabla
+        """
+        return VistaVehiculo(self, patente) if patente in self._filas else None
+
+    def get_tipo(self, patente: str) -> str:
+        """Obtiene el tipo de un vehiculo.
+
+        Args:
+            patente: Patente del vehiculo
+
+        Returns:
+            Tipo de vehiculo ("Moto", "Auto", "Camioneta")
+        """
+        return self._nombres_tipo[self._tipos[self._filas[patente]]]
+
+    def get_tarifas(self) -> array:
+        """Obtiene la columna de tarifas por hora (en orden de fila)."""
+        return self._tarifas
+
+    def get_tolerancias(self) -> array:
+        """Obtiene la columna de minutos de tolerancia (en orden de fila)."""
+        return self._tolerancias
+
+    def get_ingresos(self) -> array:
+        """Obtiene la columna de horas de ingreso como epoch (NaN si no tiene)."""
+        return self._ingresos
+
+    def get_egresos(self) -> array:
+        """Obtiene la columna de horas de egreso como epoch (NaN si no tiene)."""
+        return self._egresos
+
+    def get_patentes(self) -> List[str]:
+        """Obtiene las patentes en orden de fila (copia defensiva)."""
+        return list(self._patentes)
+
+    def __len__(self) -> int:
+        """Cantidad de vehiculos en la tabla."""
+        return len(self._patentes)
+
+    def __contains__(self, patente: str) -> bool:
+        """Indica si una patente esta en la tabla."""
+        return patente in self._filas
+
+    def __iter__(self) -> Iterator[VistaVehiculo]:
+        """Recorre las vistas de todos los vehiculos."""
+        return (VistaVehiculo(self, patente) for patente in list(self._patentes))
+
+
+class VistaVehiculo:
+    """Vista de una fila de TablaVehiculos con la API de Vehiculo.
+
+    No copia datos: cada getter lee la columna y cada setter la escribe.
+    La fila se busca por patente, por lo que la vista sigue siendo valida
+    aunque otras filas se eliminen.
+    """
+
+    __slots__ = ('_tabla', '_patente')
+
+    def __init__(self, tabla: TablaVehiculos, patente: str):
+        """Inicializa la vista.
+
+        Args:
+            tabla: Tabla que contiene el vehiculo
+            patente: Patente del vehiculo
+        """
+        self._tabla = tabla
+        self._patente = patente
+
+    def _fila(self) -> int:
+        """Obtiene la fila actual del vehiculo en la tabla."""
+        return self._tabla._filas[self._patente]
+
+    def get_patente(self) -> str:
+        """Obtiene la patente del vehiculo."""
+        return self._patente
+
+    def get_tipo(self) -> str:
+        """Obtiene el tipo de vehiculo."""
+        return self._tabla.get_tipo(self._patente)
+
+    def get_superficie(self) -> float:
+        """Obtiene la superficie ocupada."""
+        return self._tabla._superficies[self._fila()]
+
+    def set_superficie(self, superficie: float) -> None:
+        """Establece la superficie ocupada."""
+        if superficie <= 0:
+            raise ValueError("La superficie debe ser mayor a cero")
+        self._tabla._superficies[self._fila()] = superficie
+
+    def get_tarifa_base(self) -> float:
+        """Obtiene la tarifa base por hora."""
+        return self._tabla._tarifas[self._fila()]
+
+    def set_tarifa_base(self, tarifa: float) -> None:
+        """Establece la tarifa base por hora."""
+        if tarifa < 0:
+            raise ValueError("La tarifa no puede ser negativa")
+        self._tabla._tarifas[self._fila()] = tarifa
+
+    def get_tolerancia_minutos(self) -> int:
+        """Obtiene los minutos de tolerancia."""
+        return self._tabla._tolerancias[self._fila()]
+
+    def set_tolerancia_minutos(self, minutos: int) -> None:
+        """Establece los minutos de tolerancia."""
+        if minutos < 0:
+            raise ValueError("La tolerancia no puede ser negativa")
+        self._tabla._tolerancias[self._fila()] = minutos
+
+    def get_hora_ingreso(self) -> datetime | None:
+        """Obtiene la hora de ingreso."""
+        return _desde_epoch(self._tabla._ingresos[self._fila()])
+
+    def set_hora_ingreso(self, hora: datetime) -> None:
+        """Establece la hora de ingreso (local, sin zona horaria)."""
+        self._tabla._ingresos[self._fila()] = _a_epoch(hora)
+
+    def get_hora_egreso(self) -> datetime | None:
+        """Obtiene la hora de egreso."""
+        return _desde_epoch(self._tabla._egresos[self._fila()])
+
+    def set_hora_egreso(self, hora: datetime) -> None:
+        """Establece la hora de egreso (local, sin zona horaria)."""
+        self._tabla._egresos[self._fila()] = _a_epoch(hora)
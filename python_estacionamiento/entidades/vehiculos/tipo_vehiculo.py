@@ -0,0 +1,72 @@
+"""Descriptor TipoVehiculo (Flyweight).
+
+Agrupa los valores comunes a todos los vehiculos de un tipo. Cada clase de
+vehiculo apunta a un unico descriptor compartido, de modo que las
+instancias no duplican esos valores y un cambio de tarifa para todo un
+tipo consiste en reemplazar un solo descriptor.
+
+El codigo numerico del descriptor identifica al tipo en las tablas
+columnares, la memoria compartida y los snapshots binarios.
+"""
+
+# Standard library
+from __future__ import annotations
+from dataclasses import dataclass
+
+# Local application
+from python_estacionamiento.constantes import (
+    CODIGO_MOTO,
+    CODIGO_AUTO,
+    CODIGO_CAMIONETA,
+    CODIGO_MAXIMO_TIPO,
+    SUPERFICIE_MOTO,
+    SUPERFICIE_AUTO,
+    SUPERFICIE_CAMIONETA,
+    TARIFA_BASE_MOTO,
+    TARIFA_BASE_AUTO,
+    TARIFA_BASE_CAMIONETA,
+    TOLERANCIA_MOTO,
+    TOLERANCIA_AUTO,
+    TOLERANCIA_CAMIONETA
+)
+
+
+@dataclass(frozen=True)
+class TipoVehiculo:
+    """Valores compartidos por todos los vehiculos de un tipo.
+
+    Attributes:
+        nombre: Nombre del tipo ("Moto", "Auto", "Camioneta")
+        superficie: Superficie ocupada en metros cuadrados
+        tarifa_base: Tarifa base por hora
+        tolerancia_minutos: Minutos de tolerancia sin cargo
+        codigo: Codigo numerico del tipo (1..CODIGO_MAXIMO_TIPO); 0 para que
+            VehiculoFactory.registrar_tipo asigne el primero libre
+    """
+    nombre: str
+    superficie: float
+    tarifa_base: float
+    tolerancia_minutos: int
+    codigo: int = 0
+
+    def __post_init__(self):
+        """Valida el descriptor.
+
+        Raises:
+            ValueError: Si la superficie, la tarifa, la tolerancia o el codigo no son validos
+        """
+        if self.superficie <= 0:
+            raise ValueError("La superficie debe ser mayor a cero")
+        if self.tarifa_base < 0:
+            raise ValueError("La tarifa no puede ser negativa")
+        if self.tolerancia_minutos < 0:
+            raise ValueError("La tolerancia no puede ser negativa")
+        if not 0 <= self.codigo <= CODIGO_MAXIMO_TIPO:
+            raise ValueError(f"El codigo de tipo debe estar entre 1 y {CODIGO_MAXIMO_TIPO}")
+
+
+TIPO_MOTO = TipoVehiculo("Moto", SUPERFICIE_MOTO, TARIFA_BASE_MOTO, TOLERANCIA_MOTO, CODIGO_MOTO)
+TIPO_AUTO = TipoVehiculo("Auto", SUPERFICIE_AUTO, TARIFA_BASE_AUTO, TOLERANCIA_AUTO, CODIGO_AUTO)
+TIPO_CAMIONETA = TipoVehiculo(
+    "Camioneta", SUPERFICIE_CAMIONETA, TARIFA_BASE_CAMIONETA, TOLERANCIA_CAMIONETA, CODIGO_CAMIONETA
+)
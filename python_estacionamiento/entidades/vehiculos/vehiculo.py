@@ -7,6 +7,10 @@ Define la interfaz comun para todos los tipos de vehiculos del estacionamiento.
 from __future__ import annotations
 from abc import ABC
 from datetime import datetime
+from typing import ClassVar
+
+# Local application
+from python_estacionamiento.entidades.vehiculos.tipo_vehiculo import TipoVehiculo
 
 
 class Vehiculo(ABC):
@@ -14,22 +18,41 @@ class Vehiculo(ABC):
 
     Esta clase define los atributos y metodos comunes a todos los vehiculos.
     Solo contiene datos (DTO), sin logica de negocio.
+
+    Usa __slots__ (igual que sus subclases) para que cada instancia no
+    cargue un __dict__: con miles de vehiculos activos la diferencia de
+    memoria es significativa.
+
+    Superficie, tarifa y tolerancia se leen del TipoVehiculo compartido de
+    la clase (Flyweight). Los setters guardan un valor propio que tiene
+    prioridad sobre el del tipo solo para esa instancia.
     """
 
+    _tipo: ClassVar[TipoVehiculo]
+
+    __slots__ = (
+        '_patente',
+        '_superficie',
+        '_tarifa_base',
+        '_tolerancia_minutos',
+        '_hora_ingreso',
+        '_hora_egreso'
+    )
+
     def __init__(
         self,
         patente: str,
-        superficie: float,
-        tarifa_base: float,
-        tolerancia_minutos: int
+        superficie: float | None = None,
+        tarifa_base: float | None = None,
+        tolerancia_minutos: int | None = None
     ):
         """Inicializa un vehiculo.
 
         Args:
             patente: Patente del vehiculo
-            superficie: Superficie ocupada en metros cuadrados
-            tarifa_base: Tarifa base por hora
-            tolerancia_minutos: Minutos de tolerancia sin cargo
+            superficie: Superficie propia (None: la del tipo)
+            tarifa_base: Tarifa base propia (None: la del tipo)
+            tolerancia_minutos: Tolerancia propia (None: la del tipo)
         """
         self._patente = patente
         self._superficie = superficie
@@ -38,6 +61,16 @@ class Vehiculo(ABC):
         self._hora_ingreso: datetime | None = None
         self._hora_egreso: datetime | None = None
 
+    @classmethod
+    def get_tipo_vehiculo(cls) -> TipoVehiculo:
+        """Obtiene el descriptor compartido del tipo de vehiculo."""
+        return cls._tipo
+
+    @classmethod
+    def set_tipo_vehiculo(cls, tipo: TipoVehiculo) -> None:
+        """Reemplaza el descriptor del tipo para todas las instancias de la clase."""
+        cls._tipo = tipo
+
     # Getters y setters
     def get_patente(self) -> str:
         """Obtiene la patente del vehiculo."""
@@ -49,6 +82,8 @@ class Vehiculo(ABC):
 
     def get_superficie(self) -> float:
         """Obtiene la superficie ocupada."""
+        if self._superficie is None:
+            return self._tipo.superficie
         return self._superficie
 
     def set_superficie(self, superficie: float) -> None:
@@ -59,6 +94,8 @@ class Vehiculo(ABC):
 
     def get_tarifa_base(self) -> float:
         """Obtiene la tarifa base por hora."""
+        if self._tarifa_base is None:
+            return self._tipo.tarifa_base
         return self._tarifa_base
 
     def set_tarifa_base(self, tarifa: float) -> None:
@@ -69,6 +106,8 @@ class Vehiculo(ABC):
 
     def get_tolerancia_minutos(self) -> int:
         """Obtiene los minutos de tolerancia."""
+        if self._tolerancia_minutos is None:
+            return self._tipo.tolerancia_minutos
         return self._tolerancia_minutos
 
     def set_tolerancia_minutos(self, minutos: int) -> None:
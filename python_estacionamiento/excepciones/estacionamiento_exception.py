@@ -53,3 +53,54 @@ class VehiculoNoEncontradoException(EstacionamientoException):
     def get_patente(self) -> str:
         """Obtiene la patente del vehiculo."""
         return self._patente
+
+
+class VehiculoYaIngresadoException(EstacionamientoException):
+    """Excepcion lanzada cuando un vehiculo ya se encuentra en el estacionamiento."""
+
+    def __init__(self, patente: str):
+        """Inicializa la excepcion.
+
+        Args:
+            patente: Patente del vehiculo duplicado
+        """
+        super().__init__(f"Vehiculo con patente {patente} ya se encuentra en el estacionamiento")
+        self._patente = patente
+
+    def get_patente(self) -> str:
+        """Obtiene la patente del vehiculo."""
+        return self._patente
+
+
+class PatenteInvalidaException(EstacionamientoException):
+    """Excepcion lanzada cuando una patente no tiene un formato valido."""
+
+    def __init__(self, patente: str):
+        """Inicializa la excepcion.
+
+        Args:
+            patente: Patente recibida (sin normalizar)
+        """
+        super().__init__(f"Patente invalida: {patente!r}")
+        self._patente = patente
+
+    def get_patente(self) -> str:
+        """Obtiene la patente recibida."""
+        return self._patente
+
+
+class LoteNoEncontradoException(EstacionamientoException):
+    """Excepcion lanzada cuando un lote o una puerta no estan registrados."""
+
+    def __init__(self, identificador: str):
+        """Inicializa la excepcion.
+
+        Args:
+            identificador: Id del lote o de la puerta no registrados
+        """
+        super().__init__(f"No hay un lote registrado para {identificador}")
+        self._identificador = identificador
+
+    def get_identificador(self) -> str:
+        """Obtiene el id del lote o de la puerta."""
+        return self._identificador
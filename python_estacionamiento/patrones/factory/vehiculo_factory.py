@@ -6,10 +6,17 @@ a clases concretas.
 
 # Standard library
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from dataclasses import replace
+from threading import Lock
+from typing import Callable, Dict, List, Sequence, Type
 
-if TYPE_CHECKING:
-    from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+# Local application
+from python_estacionamiento.constantes import CODIGO_MAXIMO_TIPO
+from python_estacionamiento.entidades.vehiculos.auto import Auto
+from python_estacionamiento.entidades.vehiculos.camioneta import Camioneta
+from python_estacionamiento.entidades.vehiculos.moto import Moto
+from python_estacionamiento.entidades.vehiculos.tipo_vehiculo import TipoVehiculo
+from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
 
 
 class VehiculoFactory:
@@ -17,8 +24,25 @@ class VehiculoFactory:
 
     Encapsula la logica de creacion de diferentes tipos de vehiculos,
     permitiendo extensibilidad sin modificar codigo existente.
+
+    La tabla de despacho tipo -> constructor se arma una sola vez al cargar
+    el modulo. Cada clase apunta a un TipoVehiculo compartido (Flyweight),
+    por lo que cambiar la tarifa de todo un tipo es reemplazar un descriptor.
+
+    Se pueden registrar tipos nuevos al iniciar la aplicacion con
+    registrar_tipo. Las tablas se reemplazan con una unica asignacion
+    (copy-on-write), asi que crear vehiculos no toma locks.
+
+    El registro es la unica fuente de tipos: cada uno tiene un codigo
+    numerico unico (el de su TipoVehiculo) con el que lo representan las
+    tablas columnares, la memoria compartida y los snapshots binarios.
     """
 
+    _clases: Dict[str, Type[Vehiculo]] = {}
+    _constructores: Dict[str, Callable[[str], Vehiculo]] = {}
+    _tipos_por_codigo: Dict[int, str] = {}
+    _lock = Lock()
+
     @staticmethod
     def crear_vehiculo(tipo: str, patente: str) -> Vehiculo:
         """Crea un vehiculo del tipo especificado.
@@ -33,16 +57,200 @@ class VehiculoFactory:
         Raises:
             ValueError: Si el tipo de vehiculo es desconocido
         """
-        factories = {
-            "Moto": VehiculoFactory._crear_moto,
-            "Auto": VehiculoFactory._crear_auto,
-            "Camioneta": VehiculoFactory._crear_camioneta
-        }
+        constructor = VehiculoFactory._constructores.get(tipo)
+        if constructor is None:
+            raise ValueError(f"Tipo de vehiculo desconocido: {tipo}")
+        return constructor(patente)
+
+    @staticmethod
+    def crear_vehiculos(tipos: Sequence[str] | str, patentes: Sequence[str]) -> List[Vehiculo]:
+        """Crea muchos vehiculos de una vez.
+
+        Resuelve cada tipo distinto una sola vez y despues solo llama a los
+        constructores. Si algun tipo es desconocido no se crea ninguno.
+
+        Args:
+            tipos: Tipo de cada vehiculo, o un unico tipo para todos
+            patentes: Patente de cada vehiculo
+
+        Returns:
+            Vehiculos creados, en el mismo orden que las patentes
+
+        Raises:
+            ValueError: Si algun tipo es desconocido o las secuencias no
+                tienen el mismo largo
+        """
+        constructores = VehiculoFactory._constructores
+        if isinstance(tipos, str):
+            constructor = constructores.get(tipos)
+            if constructor is None:
+                raise ValueError(f"Tipo de vehiculo desconocido: {tipos}")
+            return [constructor(patente) for patente in patentes]
+
+        if len(tipos) != len(patentes):
+            raise ValueError("La cantidad de tipos y de patentes no coincide")
+        desconocidos = set(tipos).difference(constructores)
+        if desconocidos:
+            raise ValueError(f"Tipo de vehiculo desconocido: {', '.join(sorted(desconocidos))}")
+        return [constructores[tipo](patente) for tipo, patente in zip(tipos, patentes)]
+
+    @staticmethod
+    def registrar_tipo(
+        tipo: str,
+        clase: Type[Vehiculo],
+        constructor: Callable[[str], Vehiculo] | None = None
+    ) -> None:
+        """Registra un tipo de vehiculo nuevo.
+
+        El nombre debe coincidir con el de la clase para que la persistencia
+        pueda recrear los vehiculos guardados. Si el TipoVehiculo no trae
+        codigo se le asigna el primero libre; los tipos que se guardan en
+        snapshots binarios deben fijarlo para que no dependa del orden de
+        registro.
+
+        Args:
+            tipo: Nombre del tipo (por ejemplo "Bicicleta")
+            clase: Subclase de Vehiculo con su TipoVehiculo en _tipo
+            constructor: Funcion patente -> vehiculo (default: la clase)
+
+        Raises:
+            ValueError: Si el tipo ya esta registrado, la clase no es valida
+                o su codigo esta en uso (o no quedan codigos libres)
+        """
+        if not (isinstance(clase, type) and issubclass(clase, Vehiculo)):
+            raise ValueError(f"{clase!r} no es una subclase de Vehiculo")
+        if not isinstance(getattr(clase, '_tipo', None), TipoVehiculo):
+            raise ValueError(f"{clase.__name__} no define su TipoVehiculo")
+        if tipo != clase.__name__:
+            raise ValueError(f"El tipo {tipo} no coincide con la clase {clase.__name__}")
+
+        with VehiculoFactory._lock:
+            if tipo in VehiculoFactory._clases:
+                raise ValueError(f"El tipo de vehiculo {tipo} ya esta registrado")
+            descriptor = clase.get_tipo_vehiculo()
+            codigo = descriptor.codigo or VehiculoFactory._codigo_libre()
+            if codigo in VehiculoFactory._tipos_por_codigo:
+                raise ValueError(
+                    f"El codigo {codigo} ya esta usado por el tipo {VehiculoFactory._tipos_por_codigo[codigo]}"
+                )
+            if codigo != descriptor.codigo:
+                clase.set_tipo_vehiculo(replace(descriptor, codigo=codigo))
+
+            VehiculoFactory._clases = {**VehiculoFactory._clases, tipo: clase}
+            VehiculoFactory._constructores = {**VehiculoFactory._constructores, tipo: constructor or clase}
+            VehiculoFactory._tipos_por_codigo = {**VehiculoFactory._tipos_por_codigo, codigo: tipo}
+
+    @staticmethod
+    def desregistrar_tipo(tipo: str) -> None:
+        """Quita un tipo de vehiculo registrado.
+
+        Args:
+            tipo: Nombre del tipo
+
+        Raises:
+            ValueError: Si el tipo de vehiculo es desconocido
+        """
+        with VehiculoFactory._lock:
+            if tipo not in VehiculoFactory._clases:
+                raise ValueError(f"Tipo de vehiculo desconocido: {tipo}")
+            VehiculoFactory._clases = {k: v for k, v in VehiculoFactory._clases.items() if k != tipo}
+            VehiculoFactory._constructores = {
+                k: v for k, v in VehiculoFactory._constructores.items() if k != tipo
+            }
+            VehiculoFactory._tipos_por_codigo = {
+                k: v for k, v in VehiculoFactory._tipos_por_codigo.items() if v != tipo
+            }
+
+    @staticmethod
+    def get_tipos() -> List[str]:
+        """Obtiene los tipos de vehiculo registrados.
+
+        Returns:
+            Nombres de los tipos en orden de registro
+        """
+        return list(VehiculoFactory._clases)
+
+    @staticmethod
+    def get_codigos() -> Dict[str, int]:
+        """Obtiene el codigo numerico de cada tipo registrado.
+
+        Returns:
+            Diccionario tipo -> codigo (copia)
+        """
+        return {tipo: codigo for codigo, tipo in VehiculoFactory._tipos_por_codigo.items()}
+
+    @staticmethod
+    def get_tipos_por_codigo() -> Dict[int, str]:
+        """Obtiene el tipo registrado con cada codigo numerico.
+
+        Returns:
+            Diccionario codigo -> tipo (copia)
+        """
+        return dict(VehiculoFactory._tipos_por_codigo)
+
+    @staticmethod
+    def get_tipo(tipo: str) -> TipoVehiculo:
+        """Obtiene el descriptor compartido de un tipo de vehiculo.
+
+        Args:
+            tipo: Tipo de vehiculo ("Moto", "Auto", "Camioneta")
+
+        Returns:
+            Descriptor vigente del tipo
+
+        Raises:
+            ValueError: Si el tipo de vehiculo es desconocido
+        """
+        return VehiculoFactory._get_clase(tipo).get_tipo_vehiculo()
+
+    @staticmethod
+    def actualizar_tipo(tipo: str, **cambios) -> TipoVehiculo:
+        """Cambia superficie, tarifa o tolerancia de todo un tipo en O(1).
 
-        if tipo not in factories:
+        Afecta a los vehiculos ya creados salvo en los valores que cada
+        instancia haya establecido con sus setters.
+
+        Args:
+            tipo: Tipo de vehiculo ("Moto", "Auto", "Camioneta")
+            **cambios: superficie, tarifa_base y/o tolerancia_minutos
+
+        Returns:
+            El nuevo descriptor del tipo
+
+        Raises:
+            ValueError: Si el tipo es desconocido, se intenta cambiar el
+                nombre o el codigo o algun valor no es valido
+        """
+        clase = VehiculoFactory._get_clase(tipo)
+        if 'nombre' in cambios or 'codigo' in cambios:
+            raise ValueError("No se puede cambiar el nombre ni el codigo de un tipo de vehiculo")
+        nuevo = replace(clase.get_tipo_vehiculo(), **cambios)
+        clase.set_tipo_vehiculo(nuevo)
+        return nuevo
+
+    @staticmethod
+    def _get_clase(tipo: str) -> Type[Vehiculo]:
+        """Obtiene la clase concreta de un tipo.
+
+        Raises:
+            ValueError: Si el tipo de vehiculo es desconocido
+        """
+        clase = VehiculoFactory._clases.get(tipo)
+        if clase is None:
             raise ValueError(f"Tipo de vehiculo desconocido: {tipo}")
+        return clase
+
+    @staticmethod
+    def _codigo_libre() -> int:
+        """Obtiene el menor codigo de tipo sin usar (requiere _lock).
 
-        return factories[tipo](patente)
+        Raises:
+            ValueError: Si no quedan codigos libres
+        """
+        for codigo in range(1, CODIGO_MAXIMO_TIPO + 1):
+            if codigo not in VehiculoFactory._tipos_por_codigo:
+                return codigo
+        raise ValueError("No quedan codigos de tipo de vehiculo libres")
 
     @staticmethod
     def _crear_moto(patente: str) -> Vehiculo:
@@ -54,7 +262,6 @@ class VehiculoFactory:
         Returns:
             Instancia de Moto
         """
-        from python_estacionamiento.entidades.vehiculos.moto import Moto
         return Moto(patente=patente, cilindrada=150)
 
     @staticmethod
@@ -67,7 +274,6 @@ class VehiculoFactory:
         Returns:
             Instancia de Auto
         """
-        from python_estacionamiento.entidades.vehiculos.auto import Auto
         return Auto(patente=patente, marca="Sin especificar")
 
     @staticmethod
@@ -80,5 +286,15 @@ class VehiculoFactory:
         Returns:
             Instancia de Camioneta
         """
-        from python_estacionamiento.entidades.vehiculos.camioneta import Camioneta
         return Camioneta(patente=patente, capacidad_carga=1000.0)
+
+
+VehiculoFactory._clases = {"Moto": Moto, "Auto": Auto, "Camioneta": Camioneta}
+VehiculoFactory._constructores = {
+    "Moto": VehiculoFactory._crear_moto,
+    "Auto": VehiculoFactory._crear_auto,
+    "Camioneta": VehiculoFactory._crear_camioneta
+}
+VehiculoFactory._tipos_por_codigo = {
+    clase.get_tipo_vehiculo().codigo: tipo for tipo, clase in VehiculoFactory._clases.items()
+}
@@ -0,0 +1,234 @@
+"""Patron Observer - Despacho asincrono de notificaciones.
+
+Cada observador recibe su propia cola acotada y un hilo trabajador, de modo
+que un observador lento no agrega latencia al hilo que notifica.
+"""
+
+# Standard library
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from threading import Condition, Thread
+from typing import Any, Callable, Deque, Generic, TypeVar, TYPE_CHECKING
+
+# Local application
+from python_estacionamiento.constantes import CAPACIDAD_COLA_OBSERVADOR, THREAD_JOIN_TIMEOUT
+from python_estacionamiento.utils.logger import configurar_logger
+
+if TYPE_CHECKING:
+    from python_estacionamiento.patrones.observer.observer import Observer
+
+T = TypeVar('T')
+
+
+class PoliticaDesborde(Enum):
+    """Que hacer cuando la cola de un observador esta llena."""
+
+    BLOQUEAR = "bloquear"
+    DESCARTAR_ANTIGUO = "descartar_antiguo"
+    COALESCER = "coalescer"
+
+
+@dataclass(frozen=True)
+class MetricasDespacho:
+    """Metricas de la cola de un observador.
+
+    Attributes:
+        profundidad_cola: Eventos pendientes en este momento
+        profundidad_maxima: Mayor profundidad observada
+        eventos_encolados: Eventos aceptados en la cola
+        eventos_procesados: Eventos entregados al observador
+        eventos_descartados: Eventos perdidos por desborde
+        eventos_coalescidos: Eventos reemplazados por uno mas reciente
+        errores: Excepciones lanzadas por el observador
+    """
+    profundidad_cola: int
+    profundidad_maxima: int
+    eventos_encolados: int
+    eventos_procesados: int
+    eventos_descartados: int
+    eventos_coalescidos: int
+    errores: int
+
+
+class DespachadorObservador(Generic[T]):
+    """Cola acotada con hilo trabajador para un unico observador."""
+
+    def __init__(
+        self,
+        observador: Observer[T],
+        capacidad_cola: int = CAPACIDAD_COLA_OBSERVADOR,
+        politica: PoliticaDesborde = PoliticaDesborde.BLOQUEAR,
+        clave_coalescencia: Callable[[T], Any] | None = None
+    ):
+        """Inicializa el despachador y arranca su hilo trabajador.
+
+        Args:
+            observador: Observador que recibe los eventos
+            capacidad_cola: Maximo de eventos pendientes
+            politica: Politica a aplicar cuando la cola esta llena
+            clave_coalescencia: Clave para coalescer eventos (default: tipo del evento)
+
+        Raises:
+            ValueError: Si la capacidad no es positiva
+        """
+        if capacidad_cola <= 0:
+            raise ValueError("La capacidad de la cola debe ser mayor a cero")
+
+        self._logger = configurar_logger('DespachadorObservador')
+        self._observador = observador
+        self._capacidad_cola = capacidad_cola
+        self._politica = politica
+        self._clave_coalescencia = clave_coalescencia or type
+        self._cola: Deque[T] = deque()
+        self._condicion = Condition()
+        self._en_proceso = False
+        self._detenido = False
+
+        self._profundidad_maxima = 0
+        self._encolados = 0
+        self._procesados = 0
+        self._descartados = 0
+        self._coalescidos = 0
+        self._errores = 0
+
+        self._hilo = Thread(
+            target=self._procesar,
+            name=f'Despachador-{observador.__class__.__name__}',
+            daemon=True
+        )
+        self._hilo.start()
+
+    def encolar(self, evento: T) -> None:
+        """Encola un evento aplicando la politica de desborde.
+
+        Si el despachador ya fue detenido (por ejemplo, porque se deshabilito
+        el despacho asincrono mientras otro hilo notificaba) el evento se
+        descarta y se cuenta como descartado: quien notifica ya modifico su
+        estado y no debe fallar por eso.
+
+        Args:
+            evento: Evento a entregar al observador
+        """
+        with self._condicion:
+            if self._detenido:
+                self._descartar_detenido()
+                return
+
+            if len(self._cola) >= self._capacidad_cola:
+                if self._politica is PoliticaDesborde.BLOQUEAR:
+                    self._condicion.wait_for(
+                        lambda: len(self._cola) < self._capacidad_cola or self._detenido
+                    )
+                    if self._detenido:
+                        self._descartar_detenido()
+                        return
+                elif self._politica is PoliticaDesborde.COALESCER and self._coalescer(evento):
+                    return
+                else:
+                    self._cola.popleft()
+                    self._descartados += 1
+
+            self._cola.append(evento)
+            self._encolados += 1
+            self._profundidad_maxima = max(self._profundidad_maxima, len(self._cola))
+            self._condicion.notify_all()
+
+    def esperar_vaciado(self, timeout: float | None = None) -> bool:
+        """Espera a que todos los eventos pendientes sean procesados.
+
+        Args:
+            timeout: Segundos maximos de espera (None: sin limite)
+
+        Returns:
+            True si la cola quedo vacia, False si vencio el timeout
+        """
+        with self._condicion:
+            return self._condicion.wait_for(
+                lambda: not self._cola and not self._en_proceso, timeout
+            )
+
+    def detener(self, timeout: float = THREAD_JOIN_TIMEOUT) -> None:
+        """Procesa los eventos pendientes y detiene el hilo trabajador.
+
+        Args:
+            timeout: Segundos maximos de espera del hilo
+        """
+        with self._condicion:
+            self._detenido = True
+            self._condicion.notify_all()
+        self._hilo.join(timeout)
+
+    def get_observador(self) -> Observer[T]:
+        """Obtiene el observador atendido por este despachador."""
+        return self._observador
+
+    def get_metricas(self) -> MetricasDespacho:
+        """Obtiene una foto de las metricas de la cola.
+
+        Returns:
+            Metricas actuales del despachador
+        """
+        with self._condicion:
+            return MetricasDespacho(
+                profundidad_cola=len(self._cola),
+                profundidad_maxima=self._profundidad_maxima,
+                eventos_encolados=self._encolados,
+                eventos_procesados=self._procesados,
+                eventos_descartados=self._descartados,
+                eventos_coalescidos=self._coalescidos,
+                errores=self._errores
+            )
+
+    def _descartar_detenido(self) -> None:
+        """Cuenta un evento recibido con el despachador detenido.
+
+        Debe llamarse con la condicion adquirida.
+        """
+        self._descartados += 1
+        self._logger.debug(
+            f'Evento descartado: despachador de {self._observador.__class__.__name__} detenido'
+        )
+
+    def _coalescer(self, evento: T) -> bool:
+        """Reemplaza el evento pendiente mas reciente con la misma clave.
+
+        Debe llamarse con la condicion adquirida.
+
+        Args:
+            evento: Evento nuevo
+
+        Returns:
+            True si se coalescio, False si no habia evento con esa clave
+        """
+        clave = self._clave_coalescencia(evento)
+        for indice in range(len(self._cola) - 1, -1, -1):
+            if self._clave_coalescencia(self._cola[indice]) == clave:
+                self._cola[indice] = evento
+                self._coalescidos += 1
+                return True
+        return False
+
+    def _procesar(self) -> None:
+        """Bucle del hilo trabajador."""
+        while True:
+            with self._condicion:
+                self._condicion.wait_for(lambda: self._cola or self._detenido)
+                if not self._cola:
+                    return
+                evento = self._cola.popleft()
+                self._en_proceso = True
+                self._condicion.notify_all()
+
+            try:
+                self._observador.actualizar(evento)
+            except Exception as e:
+                self._logger.error(f'Error en observador {self._observador.__class__.__name__}: {e}')
+                with self._condicion:
+                    self._errores += 1
+
+            with self._condicion:
+                self._procesados += 1
+                self._en_proceso = False
+                self._condicion.notify_all()
@@ -6,7 +6,15 @@ Define la clase base para objetos observables.
 # Standard library
 from __future__ import annotations
 from abc import ABC
-from typing import List, TypeVar, Generic, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, TypeVar, Generic, TYPE_CHECKING
+
+# Local application
+from python_estacionamiento.constantes import CAPACIDAD_COLA_OBSERVADOR, THREAD_JOIN_TIMEOUT
+from python_estacionamiento.patrones.observer.despachador_observador import (
+    DespachadorObservador,
+    MetricasDespacho,
+    PoliticaDesborde
+)
 
 if TYPE_CHECKING:
     from python_estacionamiento.patrones.observer.observer import Observer
@@ -18,12 +26,15 @@ class Observable(Generic[T], ABC):
     """Clase base Observable generica.
 
     Los observables mantienen una lista de observadores y los notifican
-    cuando su estado cambia.
+    cuando su estado cambia. Por defecto la notificacion es sincronica;
+    opcionalmente cada observador puede atenderse desde su propia cola.
     """
 
     def __init__(self):
         """Inicializa el observable con una lista vacia de observadores."""
         self._observadores: List[Observer[T]] = []
+        self._despachadores: Dict[int, DespachadorObservador[T]] | None = None
+        self._config_despacho: Dict[str, Any] = {}
 
     def agregar_observador(self, observador: Observer[T]) -> None:
         """Agrega un observador a la lista.
@@ -32,6 +43,10 @@ class Observable(Generic[T], ABC):
             observador: El observador a agregar
         """
         if observador not in self._observadores:
+            if self._despachadores is not None:
+                self._despachadores[id(observador)] = DespachadorObservador(
+                    observador, **self._config_despacho
+                )
             self._observadores.append(observador)
 
     def eliminar_observador(self, observador: Observer[T]) -> None:
@@ -42,12 +57,93 @@ class Observable(Generic[T], ABC):
         """
         if observador in self._observadores:
             self._observadores.remove(observador)
+            if self._despachadores is not None:
+                despachador = self._despachadores.pop(id(observador), None)
+                if despachador is not None:
+                    despachador.detener()
 
     def notificar_observadores(self, evento: T) -> None:
         """Notifica a todos los observadores de un cambio.
 
+        En modo asincrono solo encola el evento; cada observador lo procesa
+        desde su propio hilo.
+
         Args:
             evento: El evento o dato a notificar
         """
+        despachadores = self._despachadores
+        if despachadores is not None:
+            for despachador in list(despachadores.values()):
+                despachador.encolar(evento)
+            return
+
         for observador in self._observadores:
             observador.actualizar(evento)
+
+    def habilitar_despacho_asincrono(
+        self,
+        capacidad_cola: int = CAPACIDAD_COLA_OBSERVADOR,
+        politica: PoliticaDesborde = PoliticaDesborde.BLOQUEAR,
+        clave_coalescencia: Callable[[T], Any] | None = None
+    ) -> None:
+        """Activa el despacho asincrono con una cola acotada por observador.
+
+        Args:
+            capacidad_cola: Maximo de eventos pendientes por observador
+            politica: Politica a aplicar cuando una cola esta llena
+            clave_coalescencia: Clave para la politica COALESCER (default: tipo del evento)
+        """
+        if self._despachadores is not None:
+            self.deshabilitar_despacho_asincrono()
+
+        self._config_despacho = {
+            'capacidad_cola': capacidad_cola,
+            'politica': politica,
+            'clave_coalescencia': clave_coalescencia
+        }
+        self._despachadores = {
+            id(observador): DespachadorObservador(observador, **self._config_despacho)
+            for observador in self._observadores
+        }
+
+    def deshabilitar_despacho_asincrono(self, timeout: float = THREAD_JOIN_TIMEOUT) -> None:
+        """Vacia las colas pendientes y vuelve al despacho sincronico.
+
+        Args:
+            timeout: Segundos maximos de espera por cada hilo trabajador
+        """
+        despachadores = self._despachadores
+        self._despachadores = None
+        if despachadores is None:
+            return
+
+        for despachador in despachadores.values():
+            despachador.detener(timeout)
+
+    def esperar_despacho(self, timeout: float | None = None) -> bool:
+        """Espera a que todas las colas de observadores esten vacias.
+
+        Args:
+            timeout: Segundos maximos de espera por cola (None: sin limite)
+
+        Returns:
+            True si todas las colas se vaciaron a tiempo
+        """
+        despachadores = self._despachadores
+        if despachadores is None:
+            return True
+        return all(d.esperar_vaciado(timeout) for d in list(despachadores.values()))
+
+    def get_metricas_despacho(self, observador: Observer[T]) -> MetricasDespacho | None:
+        """Obtiene las metricas de la cola de un observador.
+
+        Args:
+            observador: Observador consultado
+
+        Returns:
+            Metricas de su cola, None si el despacho es sincronico
+        """
+        despachadores = self._despachadores
+        if despachadores is None or id(observador) not in despachadores:
+            return None
+        return despachadores[id(observador)].get_metricas()
@@ -26,3 +26,20 @@ class Observer(Generic[T], ABC):
             evento: El evento o dato notificado por el observable
         """
         pass
+
+
+class AsyncObserver(Observer[T], ABC):
+    """Interfaz Observer asincrona.
+
+    Para observables asyncio: su metodo actualizar es una corrutina
+    que el observable espera (await) al notificar.
+    """
+
+    @abstractmethod
+    async def actualizar(self, evento: T) -> None:
+        """Corrutina llamada cuando el observable notifica un cambio.
+
+        Args:
+            evento: El evento o dato notificado por el observable
+        """
+        pass
@@ -0,0 +1,185 @@
+"""Patron Strategy - Calculo de precios por lote.
+
+Operaciones sobre columnas de estadias que usan las estrategias para
+calcular muchos precios a la vez. Si NumPy esta instalado las columnas son
+arrays y las operaciones se vectorizan; si no, se usan listas de Python.
+
+Los resultados coinciden con los del calculo individual: las operaciones
+se aplican en el mismo orden y el redondeo reproduce el de round().
+"""
+
+# Standard library
+from __future__ import annotations
+from typing import Any, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+NUMPY_DISPONIBLE = np is not None
+
+# Margen para detectar valores cuyo redondeo queda cerca del empate
+_MARGEN_EMPATE = 1e-9
+
+
+def precios_estandar_lote(
+    tarifas_base: Sequence[float],
+    tolerancias: Sequence[float],
+    ingresos: Sequence[float],
+    egresos: Sequence[float]
+) -> Any:
+    """Calcula el precio estandar de un lote de estadias.
+
+    Args:
+        tarifas_base: Tarifa por hora de cada estadia
+        tolerancias: Minutos sin cargo de cada estadia
+        ingresos: Hora de ingreso de cada estadia (epoch en segundos)
+        egresos: Hora de egreso de cada estadia (epoch en segundos)
+
+    Returns:
+        Columna de precios redondeados a 2 decimales
+
+    Raises:
+        ValueError: Si las columnas no tienen el mismo largo
+    """
+    cantidad = len(tarifas_base)
+    if not (len(tolerancias) == len(ingresos) == len(egresos) == cantidad):
+        raise ValueError("Las columnas del lote deben tener el mismo largo")
+
+    if np is None:
+        return [
+            round(tarifa * (max(0, (egreso - ingreso) / 60.0 - tolerancia) / 60.0), 2)
+            for tarifa, tolerancia, ingreso, egreso
+            in zip(tarifas_base, tolerancias, ingresos, egresos)
+        ]
+
+    minutos_totales = (
+        np.asarray(egresos, dtype=np.float64) - np.asarray(ingresos, dtype=np.float64)
+    ) / 60.0
+    minutos_cobrables = np.maximum(0.0, minutos_totales - np.asarray(tolerancias, dtype=np.float64))
+    horas = minutos_cobrables / 60.0
+    return redondear_lote(np.asarray(tarifas_base, dtype=np.float64) * horas)
+
+
+def sumar_minutos_lote(segundos: Any, minutos: Sequence[float]) -> Any:
+    """Desplaza una columna de momentos en segundos por una cantidad de minutos.
+
+    Args:
+        segundos: Columna de momentos en segundos
+        minutos: Minutos a sumar a cada momento
+
+    Returns:
+        Columna desplazada
+    """
+    if np is None:
+        return [momento + minuto * 60.0 for momento, minuto in zip(segundos, minutos)]
+    return segundos + np.asarray(minutos, dtype=np.float64) * 60.0
+
+
+def precios_por_segundos_lote(tarifas_base: Sequence[float], segundos: Any) -> Any:
+    """Calcula tarifa * horas para una columna de segundos cobrables.
+
+    Args:
+        tarifas_base: Tarifa por hora de cada estadia
+        segundos: Segundos cobrables (ya ponderados) de cada estadia
+
+    Returns:
+        Columna de precios redondeados a 2 decimales
+    """
+    if np is None:
+        return [round(tarifa * (segundo / 3600.0), 2) for tarifa, segundo in zip(tarifas_base, segundos)]
+    return redondear_lote(np.asarray(tarifas_base, dtype=np.float64) * (segundos / 3600.0))
+
+
+def recargar_lote(precios: Any, porcentaje: float) -> Any:
+    """Aplica un recargo porcentual a una columna de precios.
+
+    Args:
+        precios: Columna de precios base
+        porcentaje: Recargo a sumar (0.30 = 30%)
+
+    Returns:
+        Columna de precios con recargo, redondeados a 2 decimales
+    """
+    if np is None:
+        return [round(precio + precio * porcentaje, 2) for precio in precios]
+    return redondear_lote(precios + precios * porcentaje)
+
+
+def descontar_lote(precios: Any, porcentaje: float) -> Any:
+    """Aplica un descuento porcentual a una columna de precios.
+
+    Args:
+        precios: Columna de precios base
+        porcentaje: Descuento a restar (0.20 = 20%)
+
+    Returns:
+        Columna de precios con descuento, redondeados a 2 decimales
+    """
+    if np is None:
+        return [round(precio - precio * porcentaje, 2) for precio in precios]
+    return redondear_lote(precios - precios * porcentaje)
+
+
+def limitar_lote(precios: Any, minimo: float | None = None, maximo: float | None = None) -> Any:
+    """Acota una columna de precios entre un minimo y un maximo.
+
+    Args:
+        precios: Columna de precios
+        minimo: Precio minimo (None: sin minimo)
+        maximo: Precio maximo (None: sin maximo)
+
+    Returns:
+        Columna de precios acotados
+    """
+    if np is None:
+        if maximo is not None:
+            precios = [maximo if precio > maximo else precio for precio in precios]
+        if minimo is not None:
+            precios = [minimo if precio < minimo else precio for precio in precios]
+        return precios
+
+    if maximo is not None:
+        precios = np.minimum(precios, maximo)
+    if minimo is not None:
+        precios = np.maximum(precios, minimo)
+    return precios
+
+
+def redondear_lote(valores: Any) -> Any:
+    """Redondea una columna a 2 decimales igual que round(valor, 2).
+
+    np.round escala y redondea, por lo que puede diferir de round() en
+    valores muy cerca del empate; esos pocos se redondean con round().
+
+    Args:
+        valores: Columna de valores
+
+    Returns:
+        Columna redondeada
+    """
+    if np is None:
+        return [round(valor, 2) for valor in valores]
+
+    escalados = valores * 100.0
+    redondeados = np.rint(escalados) / 100.0
+    distancia_empate = np.abs(escalados - np.floor(escalados) - 0.5)
+    dudosos = np.nonzero(distancia_empate <= _MARGEN_EMPATE * (np.abs(escalados) + 1.0))[0]
+    for indice in dudosos.tolist():
+        redondeados[indice] = round(float(valores[indice]), 2)
+    return redondeados
+
+
+def a_lista(valores: Any) -> List[float]:
+    """Convierte una columna a lista de floats de Python.
+
+    Args:
+        valores: Columna (array o lista)
+
+    Returns:
+        Lista de precios
+    """
+    if np is not None and isinstance(valores, np.ndarray):
+        return valores.tolist()
+    return list(valores)
@@ -0,0 +1,324 @@
+"""Patron Strategy - Cronograma tarifario por franjas horarias.
+
+Divide cada dia en franjas con un factor sobre la tarifa por hora (por
+ejemplo, 0.8 durante el Happy Hour). Los limites de cada dia se calculan
+una sola vez y se acumulan en una tabla semanal, de modo que las horas
+ponderadas de una estadia se obtienen con dos busquedas binarias sin
+importar cuantos dias dure.
+"""
+
+# Standard library
+from __future__ import annotations
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Sequence, Tuple
+
+# Local application
+from python_estacionamiento.constantes import (
+    DESCUENTO_HAPPY_HOUR,
+    DESCUENTO_NOCTURNO,
+    HORA_INICIO_HAPPY_HOUR,
+    HORA_FIN_HAPPY_HOUR,
+    HORA_INICIO_NOCTURNO,
+    HORA_FIN_NOCTURNO
+)
+from python_estacionamiento.patrones.strategy import calculo_lote
+
+# Lunes 00:00 de referencia: las horas se expresan en segundos locales desde aqui
+_REFERENCIA = datetime(1970, 1, 5)
+_SEGUNDOS_DIA = 86400.0
+_SEGUNDOS_SEMANA = 7 * _SEGUNDOS_DIA
+# Los cambios de huso horario ocurren en multiplos de 15 minutos
+_CUBETA_HUSO = 900.0
+
+NOMBRE_FRANJA_NORMAL = "normal"
+
+
+@dataclass(frozen=True)
+class FranjaHoraria:
+    """Franja del dia con un factor sobre la tarifa por hora.
+
+    Si hora_fin es menor que hora_inicio la franja cruza la medianoche y
+    termina al dia siguiente.
+
+    Attributes:
+        nombre: Nombre de la franja
+        hora_inicio: Hora de inicio (0 a 24, admite fracciones)
+        hora_fin: Hora de fin (0 a 24, admite fracciones)
+        factor: Multiplicador de la tarifa (0.8 = 20% de descuento)
+        dias: Dias de la semana en que empieza la franja (0 = lunes)
+    """
+    nombre: str
+    hora_inicio: float
+    hora_fin: float
+    factor: float
+    dias: FrozenSet[int] = frozenset(range(7))
+
+    def __post_init__(self):
+        """Valida la franja.
+
+        Raises:
+            ValueError: Si las horas, el factor o los dias no son validos
+        """
+        if not (0 <= self.hora_inicio < 24 and 0 <= self.hora_fin <= 24):
+            raise ValueError(f"Horas fuera de rango en la franja {self.nombre}")
+        if self.hora_inicio == self.hora_fin:
+            raise ValueError(f"La franja {self.nombre} no tiene duracion")
+        if self.factor < 0:
+            raise ValueError(f"El factor de la franja {self.nombre} no puede ser negativo")
+        if not self.dias or not set(self.dias) <= set(range(7)):
+            raise ValueError(f"Dias invalidos en la franja {self.nombre}")
+
+    def tramos_del_dia(self, dia_semana: int) -> List[Tuple[float, float]]:
+        """Obtiene los tramos (en horas) que la franja ocupa en un dia.
+
+        Args:
+            dia_semana: Dia de la semana (0 = lunes)
+
+        Returns:
+            Lista de tramos (hora_inicio, hora_fin) dentro del dia
+        """
+        tramos = []
+        cruza_medianoche = self.hora_fin < self.hora_inicio
+        if dia_semana in self.dias:
+            tramos.append((self.hora_inicio, 24.0 if cruza_medianoche else self.hora_fin))
+        if cruza_medianoche and (dia_semana - 1) % 7 in self.dias and self.hora_fin > 0:
+            tramos.append((0.0, self.hora_fin))
+        return tramos
+
+
+@dataclass(frozen=True)
+class CronogramaTarifario:
+    """Conjunto de franjas horarias que se repite cada semana.
+
+    Fuera de toda franja se cobra la tarifa completa (factor 1). Si dos
+    franjas se superponen prevalece la que aparece primero.
+
+    Attributes:
+        franjas: Franjas en orden de prioridad
+    """
+    franjas: Tuple[FranjaHoraria, ...] = ()
+
+    def segmentos_del_dia(self, dia_semana: int) -> Tuple[Tuple[float, float, float, str], ...]:
+        """Obtiene los segmentos contiguos que cubren un dia completo.
+
+        Args:
+            dia_semana: Dia de la semana (0 = lunes)
+
+        Returns:
+            Segmentos (hora_inicio, hora_fin, factor, nombre) de 0 a 24 hs
+        """
+        return _segmentos_del_dia(self, dia_semana)
+
+    def horas_ponderadas(self, inicio: datetime, fin: datetime) -> float:
+        """Calcula las horas entre dos momentos ponderadas por el factor de cada franja.
+
+        Args:
+            inicio: Comienzo del periodo
+            fin: Fin del periodo
+
+        Returns:
+            Horas ponderadas (0 si fin no es posterior a inicio)
+        """
+        return self.segundos_ponderados(segundos_locales(inicio), segundos_locales(fin)) / 3600.0
+
+    def segundos_ponderados(self, inicio: float, fin: float) -> float:
+        """Calcula los segundos ponderados entre dos momentos en segundos locales.
+
+        Args:
+            inicio: Comienzo en segundos locales (ver segundos_locales)
+            fin: Fin en segundos locales
+
+        Returns:
+            Segundos ponderados (0 si fin no es posterior a inicio)
+        """
+        if fin <= inicio:
+            return 0.0
+        inicios, acumulados, factores, total_semana = _tabla_semanal(self)
+
+        semanas_inicio = inicio // _SEGUNDOS_SEMANA
+        resto_inicio = inicio - semanas_inicio * _SEGUNDOS_SEMANA
+        semanas_fin = fin // _SEGUNDOS_SEMANA
+        resto_fin = fin - semanas_fin * _SEGUNDOS_SEMANA
+
+        j = bisect_right(inicios, resto_inicio) - 1
+        acumulado_inicio = acumulados[j] + factores[j] * (resto_inicio - inicios[j])
+        j = bisect_right(inicios, resto_fin) - 1
+        acumulado_fin = acumulados[j] + factores[j] * (resto_fin - inicios[j])
+
+        return (semanas_fin - semanas_inicio) * total_semana + (acumulado_fin - acumulado_inicio)
+
+    def segundos_ponderados_lote(self, inicios: Any, fines: Any) -> Any:
+        """Calcula segundos ponderados para columnas de periodos.
+
+        Con NumPy se vectoriza; sin NumPy se aplica segundos_ponderados a
+        cada periodo. Ambos caminos hacen las mismas operaciones.
+
+        Args:
+            inicios: Comienzos en segundos locales
+            fines: Fines en segundos locales
+
+        Returns:
+            Columna de segundos ponderados
+        """
+        np = calculo_lote.np
+        if np is None:
+            return [self.segundos_ponderados(inicio, fin) for inicio, fin in zip(inicios, fines)]
+
+        tabla_inicios, acumulados, factores, total_semana = _tabla_semanal(self)
+        tabla_inicios = np.asarray(tabla_inicios, dtype=np.float64)
+        acumulados = np.asarray(acumulados, dtype=np.float64)
+        factores = np.asarray(factores, dtype=np.float64)
+        inicios = np.asarray(inicios, dtype=np.float64)
+        fines = np.asarray(fines, dtype=np.float64)
+
+        semanas_inicio = np.floor_divide(inicios, _SEGUNDOS_SEMANA)
+        resto_inicio = inicios - semanas_inicio * _SEGUNDOS_SEMANA
+        semanas_fin = np.floor_divide(fines, _SEGUNDOS_SEMANA)
+        resto_fin = fines - semanas_fin * _SEGUNDOS_SEMANA
+
+        j = np.searchsorted(tabla_inicios, resto_inicio, side='right') - 1
+        acumulado_inicio = acumulados[j] + factores[j] * (resto_inicio - tabla_inicios[j])
+        j = np.searchsorted(tabla_inicios, resto_fin, side='right') - 1
+        acumulado_fin = acumulados[j] + factores[j] * (resto_fin - tabla_inicios[j])
+
+        ponderados = (semanas_fin - semanas_inicio) * total_semana + (acumulado_fin - acumulado_inicio)
+        return np.where(fines > inicios, ponderados, 0.0)
+
+    def desglosar(self, inicio: datetime, fin: datetime) -> List[Tuple[datetime, datetime, float, str]]:
+        """Divide un periodo en tramos por franja.
+
+        Args:
+            inicio: Comienzo del periodo
+            fin: Fin del periodo
+
+        Returns:
+            Tramos (inicio, fin, factor, nombre de la franja) en orden
+        """
+        tramos: List[Tuple[datetime, datetime, float, str]] = []
+        dia = datetime(inicio.year, inicio.month, inicio.day)
+        while dia < fin:
+            for hora_inicio, hora_fin, factor, nombre in self.segmentos_del_dia(dia.weekday()):
+                desde = max(inicio, dia + timedelta(hours=hora_inicio))
+                hasta = min(fin, dia + timedelta(hours=hora_fin))
+                if desde >= hasta:
+                    continue
+                if tramos and tramos[-1][3] == nombre and tramos[-1][1] == desde:
+                    tramos[-1] = (tramos[-1][0], hasta, factor, nombre)
+                else:
+                    tramos.append((desde, hasta, factor, nombre))
+            dia += timedelta(days=1)
+        return tramos
+
+
+def segundos_locales(momento: datetime) -> float:
+    """Convierte una hora local a segundos desde el lunes de referencia.
+
+    Args:
+        momento: Hora local (sin zona horaria)
+
+    Returns:
+        Segundos locales
+    """
+    return (momento - _REFERENCIA).total_seconds()
+
+
+def segundos_locales_lote(epochs: Sequence[float]) -> Any:
+    """Convierte epochs a segundos locales (equivalente a segundos_locales(fromtimestamp)).
+
+    Con NumPy el desfase horario se calcula una vez por cubeta de 15
+    minutos, por lo que los cambios de horario de verano se respetan.
+
+    Args:
+        epochs: Momentos en segundos desde 1970 (UTC)
+
+    Returns:
+        Columna de segundos locales
+    """
+    np = calculo_lote.np
+    if np is None:
+        return [segundos_locales(datetime.fromtimestamp(epoch)) for epoch in epochs]
+
+    epochs = np.asarray(epochs, dtype=np.float64)
+    cubetas, posiciones = np.unique(np.floor_divide(epochs, _CUBETA_HUSO), return_inverse=True)
+    desfases = np.array([
+        segundos_locales(datetime.fromtimestamp(cubeta * _CUBETA_HUSO)) - cubeta * _CUBETA_HUSO
+        for cubeta in cubetas.tolist()
+    ])
+    return epochs + desfases[posiciones.reshape(-1)]
+
+
+@lru_cache(maxsize=None)
+def _segmentos_del_dia(
+    cronograma: CronogramaTarifario, dia_semana: int
+) -> Tuple[Tuple[float, float, float, str], ...]:
+    """Calcula y cachea los segmentos de un dia para un cronograma.
+
+    Args:
+        cronograma: Cronograma tarifario
+        dia_semana: Dia de la semana (0 = lunes)
+
+    Returns:
+        Segmentos (hora_inicio, hora_fin, factor, nombre) de 0 a 24 hs
+    """
+    tramos = [
+        (desde, hasta, franja)
+        for franja in cronograma.franjas
+        for desde, hasta in franja.tramos_del_dia(dia_semana)
+    ]
+    limites = sorted({0.0, 24.0} | {h for desde, hasta, _ in tramos for h in (desde, hasta)})
+
+    segmentos: List[Tuple[float, float, float, str]] = []
+    for desde, hasta in zip(limites, limites[1:]):
+        # La primera franja que cubre el segmento tiene prioridad
+        franja = next((f for d, h, f in tramos if d <= desde and hasta <= h), None)
+        factor, nombre = (franja.factor, franja.nombre) if franja else (1.0, NOMBRE_FRANJA_NORMAL)
+        if segmentos and segmentos[-1][3] == nombre:
+            segmentos[-1] = (segmentos[-1][0], hasta, factor, nombre)
+        else:
+            segmentos.append((desde, hasta, factor, nombre))
+    return tuple(segmentos)
+
+
+@lru_cache(maxsize=None)
+def _tabla_semanal(
+    cronograma: CronogramaTarifario
+) -> Tuple[Tuple[float, ...], Tuple[float, ...], Tuple[float, ...], float]:
+    """Acumula los segmentos de la semana en una tabla de busqueda.
+
+    Args:
+        cronograma: Cronograma tarifario
+
+    Returns:
+        Tupla (inicio de cada segmento en segundos, segundos ponderados
+        acumulados al inicio, factor, total ponderado de la semana)
+    """
+    inicios: List[float] = []
+    acumulados: List[float] = []
+    factores: List[float] = []
+    acumulado = 0.0
+    for dia_semana in range(7):
+        base = dia_semana * _SEGUNDOS_DIA
+        for hora_inicio, hora_fin, factor, _ in _segmentos_del_dia(cronograma, dia_semana):
+            inicios.append(base + hora_inicio * 3600.0)
+            acumulados.append(acumulado)
+            factores.append(factor)
+            acumulado += factor * (hora_fin - hora_inicio) * 3600.0
+    return tuple(inicios), tuple(acumulados), tuple(factores), acumulado
+
+
+FRANJA_HAPPY_HOUR = FranjaHoraria(
+    nombre="happy_hour",
+    hora_inicio=HORA_INICIO_HAPPY_HOUR,
+    hora_fin=HORA_FIN_HAPPY_HOUR,
+    factor=1 - DESCUENTO_HAPPY_HOUR
+)
+
+FRANJA_NOCTURNA = FranjaHoraria(
+    nombre="nocturna",
+    hora_inicio=HORA_INICIO_NOCTURNO,
+    hora_fin=HORA_FIN_NOCTURNO,
+    factor=1 - DESCUENTO_NOCTURNO
+)
@@ -6,10 +6,11 @@ Aplica recargo significativo durante eventos.
 # Standard library
 from __future__ import annotations
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
 # Local application
 from python_estacionamiento.patrones.strategy.impl.pricing_standard_strategy import PricingStandardStrategy
+from python_estacionamiento.patrones.strategy.calculo_lote import recargar_lote
 from python_estacionamiento.constantes import RECARGO_EVENTO_ESPECIAL
 
 if TYPE_CHECKING:
@@ -46,3 +47,14 @@ class PricingEventoStrategy(PricingStandardStrategy):
         precio_final = precio_base + recargo
 
         return round(precio_final, 2)
+
+    def _ajustar_lote(self, precios: Any) -> Any:
+        """Aplica el recargo de evento a una columna de precios estandar.
+
+        Args:
+            precios: Columna de precios estandar
+
+        Returns:
+            Columna de precios finales
+        """
+        return recargar_lote(precios, RECARGO_EVENTO_ESPECIAL)
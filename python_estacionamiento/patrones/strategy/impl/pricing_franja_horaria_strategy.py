@@ -0,0 +1,109 @@
+"""Estrategia de precio por franjas horarias.
+
+Cobra cada tramo de la estadia con el factor de su franja horaria.
+"""
+
+# Standard library
+from __future__ import annotations
+from datetime import datetime
+from typing import List, Sequence, TYPE_CHECKING
+
+# Local application
+from python_estacionamiento.patrones.strategy.impl.pricing_standard_strategy import PricingStandardStrategy
+from python_estacionamiento.patrones.strategy.calculo_lote import (
+    a_lista,
+    precios_por_segundos_lote,
+    sumar_minutos_lote
+)
+from python_estacionamiento.patrones.strategy.cronograma_tarifario import (
+    CronogramaTarifario,
+    FRANJA_HAPPY_HOUR,
+    FRANJA_NOCTURNA,
+    segundos_locales,
+    segundos_locales_lote
+)
+
+if TYPE_CHECKING:
+    from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+
+
+class PricingFranjaHorariaStrategy(PricingStandardStrategy):
+    """Estrategia de precio por franjas horarias.
+
+    La tolerancia se descuenta del comienzo de la estadia y el resto se
+    cobra como tarifa_base * horas ponderadas por el cronograma. Por
+    defecto aplica el Happy Hour y el descuento nocturno.
+    """
+
+    def __init__(self, cronograma: CronogramaTarifario | None = None):
+        """Inicializa la estrategia.
+
+        Args:
+            cronograma: Cronograma a aplicar (default: Happy Hour y nocturno)
+        """
+        self._cronograma = cronograma or CronogramaTarifario((FRANJA_HAPPY_HOUR, FRANJA_NOCTURNA))
+
+    def get_cronograma(self) -> CronogramaTarifario:
+        """Obtiene el cronograma tarifario de la estrategia.
+
+        Returns:
+            El cronograma aplicado
+        """
+        return self._cronograma
+
+    def depende_solo_de_duracion(self) -> bool:
+        """Indica que el precio depende tambien de la hora del dia.
+
+        Returns:
+            False
+        """
+        return False
+
+    def calcular_precio(
+        self,
+        vehiculo: Vehiculo,
+        hora_ingreso: datetime,
+        hora_egreso: datetime
+    ) -> float:
+        """Calcula el precio ponderando cada tramo por su franja.
+
+        Args:
+            vehiculo: El vehiculo a calcular
+            hora_ingreso: Hora de ingreso
+            hora_egreso: Hora de egreso
+
+        Returns:
+            Precio calculado considerando tolerancia y franjas
+        """
+        inicio = segundos_locales(hora_ingreso) + vehiculo.get_tolerancia_minutos() * 60.0
+        segundos = self._cronograma.segundos_ponderados(inicio, segundos_locales(hora_egreso))
+
+        return round(vehiculo.get_tarifa_base() * (segundos / 3600.0), 2)
+
+    def calcular_precios_lote(
+        self,
+        tarifas_base: Sequence[float],
+        tolerancias: Sequence[float],
+        ingresos: Sequence[float],
+        egresos: Sequence[float]
+    ) -> List[float]:
+        """Calcula los precios de un lote de estadias ponderando por franja.
+
+        Args:
+            tarifas_base: Tarifa por hora de cada estadia
+            tolerancias: Minutos sin cargo de cada estadia
+            ingresos: Hora de ingreso de cada estadia (epoch en segundos)
+            egresos: Hora de egreso de cada estadia (epoch en segundos)
+
+        Returns:
+            Precio de cada estadia, en el mismo orden
+
+        Raises:
+            ValueError: Si las columnas no tienen el mismo largo
+        """
+        if not (len(tarifas_base) == len(tolerancias) == len(ingresos) == len(egresos)):
+            raise ValueError("Las columnas del lote deben tener el mismo largo")
+
+        inicios = sumar_minutos_lote(segundos_locales_lote(ingresos), tolerancias)
+        segundos = self._cronograma.segundos_ponderados_lote(inicios, segundos_locales_lote(egresos))
+        return a_lista(precios_por_segundos_lote(tarifas_base, segundos))
@@ -0,0 +1,95 @@
+"""Estrategia de precio definida por un pipeline de modificadores.
+
+Permite combinar tolerancia, franjas, recargos, descuentos y topes sin
+escribir nuevas subclases.
+"""
+
+# Standard library
+from __future__ import annotations
+from datetime import datetime
+from typing import List, Sequence, Tuple, TYPE_CHECKING
+
+# Local application
+from python_estacionamiento.patrones.strategy.pricing_strategy import PricingStrategy
+from python_estacionamiento.patrones.strategy.pipeline_precios import (
+    FranjasHorarias,
+    ModificadorPrecio,
+    compilar_pipeline
+)
+
+if TYPE_CHECKING:
+    from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+
+
+class PricingPipelineStrategy(PricingStrategy):
+    """Estrategia de precio compuesta por modificadores.
+
+    El pipeline se compila al construir la estrategia; calcular_precio
+    solo invoca la funcion compilada.
+    """
+
+    def __init__(self, *modificadores: ModificadorPrecio):
+        """Compila el pipeline de la estrategia.
+
+        Args:
+            modificadores: Modificadores en orden de aplicacion
+
+        Raises:
+            ValueError: Si el pipeline no es valido
+        """
+        self._pipeline = compilar_pipeline(modificadores)
+        self._calcular = self._pipeline.calcular
+
+    def get_modificadores(self) -> Tuple[ModificadorPrecio, ...]:
+        """Obtiene los modificadores del pipeline.
+
+        Returns:
+            Modificadores en orden de aplicacion
+        """
+        return self._pipeline.modificadores
+
+    def depende_solo_de_duracion(self) -> bool:
+        """Indica si el pipeline no usa franjas horarias.
+
+        Returns:
+            True si el precio depende solo de la duracion
+        """
+        return not any(isinstance(m, FranjasHorarias) for m in self._pipeline.modificadores)
+
+    def calcular_precio(
+        self,
+        vehiculo: Vehiculo,
+        hora_ingreso: datetime,
+        hora_egreso: datetime
+    ) -> float:
+        """Calcula el precio con la funcion compilada del pipeline.
+
+        Args:
+            vehiculo: El vehiculo a calcular
+            hora_ingreso: Hora de ingreso
+            hora_egreso: Hora de egreso
+
+        Returns:
+            Precio calculado por el pipeline
+        """
+        return self._calcular(vehiculo, hora_ingreso, hora_egreso)
+
+    def calcular_precios_lote(
+        self,
+        tarifas_base: Sequence[float],
+        tolerancias: Sequence[float],
+        ingresos: Sequence[float],
+        egresos: Sequence[float]
+    ) -> List[float]:
+        """Calcula los precios de un lote de estadias con el pipeline.
+
+        Args:
+            tarifas_base: Tarifa por hora de cada estadia
+            tolerancias: Minutos sin cargo de cada estadia
+            ingresos: Hora de ingreso de cada estadia (epoch en segundos)
+            egresos: Hora de egreso de cada estadia (epoch en segundos)
+
+        Returns:
+            Precio de cada estadia, en el mismo orden
+        """
+        return self._pipeline.calcular_lote(tarifas_base, tolerancias, ingresos, egresos)
@@ -6,10 +6,11 @@ Calcula el precio basado en la tarifa base del vehiculo y el tiempo de estadia.
 # Standard library
 from __future__ import annotations
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Any, List, Sequence, TYPE_CHECKING
 
 # Local application
 from python_estacionamiento.patrones.strategy.pricing_strategy import PricingStrategy
+from python_estacionamiento.patrones.strategy.calculo_lote import a_lista, precios_estandar_lote
 
 if TYPE_CHECKING:
     from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
@@ -50,3 +51,43 @@ class PricingStandardStrategy(PricingStrategy):
         precio = vehiculo.get_tarifa_base() * horas
 
         return round(precio, 2)
+
+    def depende_solo_de_duracion(self) -> bool:
+        """Indica que el precio estandar depende solo de la duracion.
+
+        Returns:
+            True
+        """
+        return True
+
+    def calcular_precios_lote(
+        self,
+        tarifas_base: Sequence[float],
+        tolerancias: Sequence[float],
+        ingresos: Sequence[float],
+        egresos: Sequence[float]
+    ) -> List[float]:
+        """Calcula los precios de un lote de estadias en columnas.
+
+        Args:
+            tarifas_base: Tarifa por hora de cada estadia
+            tolerancias: Minutos sin cargo de cada estadia
+            ingresos: Hora de ingreso de cada estadia (epoch en segundos)
+            egresos: Hora de egreso de cada estadia (epoch en segundos)
+
+        Returns:
+            Precio de cada estadia, en el mismo orden
+        """
+        precios = precios_estandar_lote(tarifas_base, tolerancias, ingresos, egresos)
+        return a_lista(self._ajustar_lote(precios))
+
+    def _ajustar_lote(self, precios: Any) -> Any:
+        """Ajusta la columna de precios estandar (las subclases aplican su regla).
+
+        Args:
+            precios: Columna de precios estandar
+
+        Returns:
+            Columna de precios finales
+        """
+        return precios
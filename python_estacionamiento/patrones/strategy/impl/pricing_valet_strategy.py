@@ -6,10 +6,11 @@ Aplica recargo por servicio de valet parking.
 # Standard library
 from __future__ import annotations
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
 # Local application
 from python_estacionamiento.patrones.strategy.impl.pricing_standard_strategy import PricingStandardStrategy
+from python_estacionamiento.patrones.strategy.calculo_lote import recargar_lote
 from python_estacionamiento.constantes import RECARGO_VALET
 
 if TYPE_CHECKING:
@@ -46,3 +47,14 @@ class PricingValetStrategy(PricingStandardStrategy):
         precio_final = precio_base + recargo
 
         return round(precio_final, 2)
+
+    def _ajustar_lote(self, precios: Any) -> Any:
+        """Aplica el recargo de valet a una columna de precios estandar.
+
+        Args:
+            precios: Columna de precios estandar
+
+        Returns:
+            Columna de precios finales
+        """
+        return recargar_lote(precios, RECARGO_VALET)
@@ -0,0 +1,336 @@
+"""Patron Strategy - Pipeline de precios componible.
+
+Un pipeline es una lista de modificadores (tolerancia, tarifa base, franjas
+horarias, recargos, descuentos y topes) que se compila una sola vez en una
+funcion de precio base y una lista de ajustes, armadas como closures con
+los valores de cada modificador. Asi combinar reglas no requiere nuevas
+subclases y el calculo no recorre una cadena de llamadas a super().
+
+Cada recargo o descuento redondea a 2 decimales igual que las estrategias
+clasicas, por lo que Tolerancia + TarifaBase + Recargo(RECARGO_VALET)
+produce exactamente el precio de PricingValetStrategy.
+"""
+
+# Standard library
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TYPE_CHECKING
+
+# Local application
+from python_estacionamiento.patrones.strategy import calculo_lote
+from python_estacionamiento.patrones.strategy.cronograma_tarifario import (
+    CronogramaTarifario,
+    segundos_locales,
+    segundos_locales_lote
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+
+
+class ModificadorPrecio:
+    """Base de los modificadores que componen un pipeline."""
+
+
+@dataclass(frozen=True)
+class Tolerancia(ModificadorPrecio):
+    """Minutos iniciales sin cargo.
+
+    Attributes:
+        minutos: Minutos sin cargo (None: la tolerancia del vehiculo)
+    """
+    minutos: float | None = None
+
+
+@dataclass(frozen=True)
+class TarifaBase(ModificadorPrecio):
+    """Tarifa por hora que se multiplica por el tiempo cobrable.
+
+    Attributes:
+        tarifa_por_hora: Tarifa fija (None: la tarifa base del vehiculo)
+    """
+    tarifa_por_hora: float | None = None
+
+
+@dataclass(frozen=True)
+class FranjasHorarias(ModificadorPrecio):
+    """Pondera el tiempo cobrable segun las franjas de un cronograma.
+
+    Attributes:
+        cronograma: Cronograma tarifario a aplicar
+    """
+    cronograma: CronogramaTarifario
+
+
+@dataclass(frozen=True)
+class Recargo(ModificadorPrecio):
+    """Recargo porcentual sobre el precio acumulado.
+
+    Attributes:
+        porcentaje: Recargo a sumar (0.30 = 30%)
+    """
+    porcentaje: float
+
+
+@dataclass(frozen=True)
+class Descuento(ModificadorPrecio):
+    """Descuento porcentual sobre el precio acumulado.
+
+    Attributes:
+        porcentaje: Descuento a restar (0.20 = 20%)
+    """
+    porcentaje: float
+
+
+@dataclass(frozen=True)
+class Tope(ModificadorPrecio):
+    """Precio maximo a cobrar.
+
+    Attributes:
+        maximo: Monto maximo
+    """
+    maximo: float
+
+
+@dataclass(frozen=True)
+class Minimo(ModificadorPrecio):
+    """Precio minimo a cobrar.
+
+    Attributes:
+        monto: Monto minimo
+    """
+    monto: float
+
+
+_ETAPAS_TIEMPO = (Tolerancia, TarifaBase, FranjasHorarias)
+_AJUSTES = (Recargo, Descuento, Tope, Minimo)
+
+
+@dataclass(frozen=True)
+class PipelineCompilado:
+    """Resultado de compilar un pipeline.
+
+    Attributes:
+        modificadores: Modificadores en el orden recibido
+        calcular: Funcion (vehiculo, hora_ingreso, hora_egreso) -> precio
+    """
+    modificadores: Tuple[ModificadorPrecio, ...]
+    calcular: Callable[[Vehiculo, datetime, datetime], float]
+
+    def calcular_lote(
+        self,
+        tarifas_base: Sequence[float],
+        tolerancias: Sequence[float],
+        ingresos: Sequence[float],
+        egresos: Sequence[float]
+    ) -> List[float]:
+        """Calcula los precios de un lote de estadias en columnas.
+
+        Args:
+            tarifas_base: Tarifa por hora de cada estadia
+            tolerancias: Minutos sin cargo de cada estadia
+            ingresos: Hora de ingreso de cada estadia (epoch en segundos)
+            egresos: Hora de egreso de cada estadia (epoch en segundos)
+
+        Returns:
+            Precio de cada estadia, en el mismo orden
+
+        Raises:
+            ValueError: Si las columnas no tienen el mismo largo
+        """
+        cantidad = len(tarifas_base)
+        if not (len(tolerancias) == len(ingresos) == len(egresos) == cantidad):
+            raise ValueError("Las columnas del lote deben tener el mismo largo")
+
+        tolerancia, tarifa, franjas = self._etapas()
+        if tarifa.tarifa_por_hora is not None:
+            tarifas_base = [tarifa.tarifa_por_hora] * cantidad
+        if tolerancia is None:
+            tolerancias = [0.0] * cantidad
+        elif tolerancia.minutos is not None:
+            tolerancias = [tolerancia.minutos] * cantidad
+
+        if franjas is None:
+            precios = calculo_lote.precios_estandar_lote(tarifas_base, tolerancias, ingresos, egresos)
+        else:
+            inicios = calculo_lote.sumar_minutos_lote(segundos_locales_lote(ingresos), tolerancias)
+            segundos = franjas.cronograma.segundos_ponderados_lote(inicios, segundos_locales_lote(egresos))
+            precios = calculo_lote.precios_por_segundos_lote(tarifas_base, segundos)
+
+        for modificador in self.modificadores:
+            if isinstance(modificador, Recargo):
+                precios = calculo_lote.recargar_lote(precios, modificador.porcentaje)
+            elif isinstance(modificador, Descuento):
+                precios = calculo_lote.descontar_lote(precios, modificador.porcentaje)
+            elif isinstance(modificador, Tope):
+                precios = calculo_lote.limitar_lote(precios, maximo=modificador.maximo)
+            elif isinstance(modificador, Minimo):
+                precios = calculo_lote.limitar_lote(precios, minimo=modificador.monto)
+
+        return calculo_lote.a_lista(precios)
+
+    def _etapas(self) -> Tuple[Tolerancia | None, TarifaBase, FranjasHorarias | None]:
+        """Obtiene las etapas de tiempo del pipeline.
+
+        Returns:
+            Tupla (tolerancia, tarifa base, franjas horarias)
+        """
+        etapas: Dict[type, Any] = {type(m): m for m in self.modificadores if isinstance(m, _ETAPAS_TIEMPO)}
+        return etapas.get(Tolerancia), etapas[TarifaBase], etapas.get(FranjasHorarias)
+
+
+def compilar_pipeline(modificadores: Sequence[ModificadorPrecio]) -> PipelineCompilado:
+    """Compila una lista de modificadores en una funcion de precio.
+
+    Las etapas de tiempo (Tolerancia, TarifaBase, FranjasHorarias) van
+    primero y a lo sumo una de cada tipo; TarifaBase es obligatoria. Los
+    ajustes (Recargo, Descuento, Tope, Minimo) se aplican en el orden dado.
+
+    Args:
+        modificadores: Modificadores del pipeline
+
+    Returns:
+        Pipeline compilado
+
+    Raises:
+        ValueError: Si el pipeline no es valido
+    """
+    modificadores = tuple(modificadores)
+    _validar(modificadores)
+
+    etapas = {type(m): m for m in modificadores if isinstance(m, _ETAPAS_TIEMPO)}
+    precio_base = _compilar_precio_base(
+        etapas.get(Tolerancia), etapas[TarifaBase], etapas.get(FranjasHorarias)
+    )
+    ajustes = tuple(_compilar_ajuste(m) for m in modificadores if isinstance(m, _AJUSTES))
+
+    if not ajustes:
+        return PipelineCompilado(modificadores=modificadores, calcular=precio_base)
+
+    def calcular(vehiculo: Vehiculo, hora_ingreso: datetime, hora_egreso: datetime) -> float:
+        precio = precio_base(vehiculo, hora_ingreso, hora_egreso)
+        for ajuste in ajustes:
+            precio = ajuste(precio)
+        return precio
+
+    return PipelineCompilado(modificadores=modificadores, calcular=calcular)
+
+
+def _compilar_precio_base(
+    tolerancia: Tolerancia | None,
+    tarifa: TarifaBase,
+    franjas: FranjasHorarias | None
+) -> Callable[[Vehiculo, datetime, datetime], float]:
+    """Arma la funcion que calcula el precio antes de los ajustes.
+
+    Hace las mismas operaciones y en el mismo orden que las estrategias
+    clasicas, por lo que los redondeos coinciden.
+
+    Args:
+        tolerancia: Etapa de tolerancia (None: sin tolerancia)
+        tarifa: Etapa de tarifa base
+        franjas: Etapa de franjas horarias (None: tarifa plana)
+
+    Returns:
+        Funcion (vehiculo, hora_ingreso, hora_egreso) -> precio redondeado
+    """
+    if tolerancia is None:
+        tolerancia_de = None
+    elif tolerancia.minutos is None:
+        tolerancia_de = _tolerancia_del_vehiculo
+    else:
+        minutos_fijos = tolerancia.minutos
+        tolerancia_de = lambda vehiculo: minutos_fijos
+
+    if tarifa.tarifa_por_hora is None:
+        tarifa_de = _tarifa_del_vehiculo
+    else:
+        tarifa_fija = tarifa.tarifa_por_hora
+        tarifa_de = lambda vehiculo: tarifa_fija
+
+    if franjas is not None:
+        ponderar = franjas.cronograma.segundos_ponderados
+
+        def precio_por_franjas(vehiculo: Vehiculo, hora_ingreso: datetime, hora_egreso: datetime) -> float:
+            inicio = segundos_locales(hora_ingreso)
+            if tolerancia_de is not None:
+                inicio += tolerancia_de(vehiculo) * 60.0
+            segundos = ponderar(inicio, segundos_locales(hora_egreso))
+            return round(tarifa_de(vehiculo) * (segundos / 3600.0), 2)
+
+        return precio_por_franjas
+
+    if tolerancia_de is None:
+        def precio_sin_tolerancia(vehiculo: Vehiculo, hora_ingreso: datetime, hora_egreso: datetime) -> float:
+            minutos = max(0, (hora_egreso - hora_ingreso).total_seconds() / 60.0)
+            return round(tarifa_de(vehiculo) * (minutos / 60.0), 2)
+
+        return precio_sin_tolerancia
+
+    def precio_plano(vehiculo: Vehiculo, hora_ingreso: datetime, hora_egreso: datetime) -> float:
+        minutos = max(0, (hora_egreso - hora_ingreso).total_seconds() / 60.0 - tolerancia_de(vehiculo))
+        return round(tarifa_de(vehiculo) * (minutos / 60.0), 2)
+
+    return precio_plano
+
+
+def _compilar_ajuste(modificador: ModificadorPrecio) -> Callable[[float], float]:
+    """Arma la funcion que aplica un ajuste al precio acumulado.
+
+    Args:
+        modificador: Recargo, Descuento, Tope o Minimo
+
+    Returns:
+        Funcion precio -> precio ajustado
+    """
+    if isinstance(modificador, Recargo):
+        porcentaje = modificador.porcentaje
+        return lambda precio: round(precio + precio * porcentaje, 2)
+    if isinstance(modificador, Descuento):
+        porcentaje = modificador.porcentaje
+        return lambda precio: round(precio - precio * porcentaje, 2)
+    if isinstance(modificador, Tope):
+        maximo = modificador.maximo
+        return lambda precio: maximo if precio > maximo else precio
+    minimo = modificador.monto
+    return lambda precio: minimo if precio < minimo else precio
+
+
+def _tolerancia_del_vehiculo(vehiculo: Vehiculo) -> float:
+    """Obtiene la tolerancia propia del vehiculo."""
+    return vehiculo.get_tolerancia_minutos()
+
+
+def _tarifa_del_vehiculo(vehiculo: Vehiculo) -> float:
+    """Obtiene la tarifa base propia del vehiculo."""
+    return vehiculo.get_tarifa_base()
+
+
+def _validar(modificadores: Tuple[ModificadorPrecio, ...]) -> None:
+    """Valida la estructura de un pipeline.
+
+    Args:
+        modificadores: Modificadores del pipeline
+
+    Raises:
+        ValueError: Si hay modificadores desconocidos, repetidos o fuera de orden
+    """
+    vistos = set()
+    hubo_ajuste = False
+    for modificador in modificadores:
+        if isinstance(modificador, _ETAPAS_TIEMPO):
+            if hubo_ajuste:
+                raise ValueError(
+                    f"{type(modificador).__name__} debe ir antes de recargos, descuentos y topes"
+                )
+            if type(modificador) in vistos:
+                raise ValueError(f"{type(modificador).__name__} aparece mas de una vez")
+            vistos.add(type(modificador))
+        elif isinstance(modificador, _AJUSTES):
+            hubo_ajuste = True
+        else:
+            raise ValueError(f"Modificador de precio desconocido: {modificador!r}")
+
+    if TarifaBase not in vistos:
+        raise ValueError("El pipeline necesita una TarifaBase")
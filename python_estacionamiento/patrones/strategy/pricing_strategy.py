@@ -7,12 +7,36 @@ Define la interfaz para estrategias de calculo de precios.
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import List, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
 
 
+class _EstadiaLote:
+    """Fila de un lote de estadias con los getters de Vehiculo que usan los precios."""
+
+    __slots__ = ('_tarifa_base', '_tolerancia_minutos')
+
+    def __init__(self, tarifa_base: float, tolerancia_minutos: float):
+        """Inicializa la fila.
+
+        Args:
+            tarifa_base: Tarifa por hora
+            tolerancia_minutos: Minutos sin cargo
+        """
+        self._tarifa_base = tarifa_base
+        self._tolerancia_minutos = tolerancia_minutos
+
+    def get_tarifa_base(self) -> float:
+        """Obtiene la tarifa base por hora."""
+        return self._tarifa_base
+
+    def get_tolerancia_minutos(self) -> float:
+        """Obtiene los minutos de tolerancia."""
+        return self._tolerancia_minutos
+
+
 class PricingStrategy(ABC):
     """Interfaz Strategy para calcular precios.
 
@@ -37,3 +61,52 @@ class PricingStrategy(ABC):
             El precio total a cobrar
         """
         pass
+
+    def depende_solo_de_duracion(self) -> bool:
+        """Indica si el precio depende solo de la duracion de la estadia.
+
+        Las estrategias que ademas dependen de la hora del dia deben
+        devolver False para que sus cotizaciones no se reutilicen.
+
+        Returns:
+            True si dos estadias de igual duracion cuestan lo mismo
+        """
+        return False
+
+    def calcular_precios_lote(
+        self,
+        tarifas_base: Sequence[float],
+        tolerancias: Sequence[float],
+        ingresos: Sequence[float],
+        egresos: Sequence[float]
+    ) -> List[float]:
+        """Calcula los precios de un lote de estadias en columnas.
+
+        Cada posicion de las columnas es una estadia; el resultado coincide
+        con calcular_precio aplicado a cada una. Por defecto se llama a
+        calcular_precio por fila, con un vehiculo que solo expone tarifa y
+        tolerancia y horas locales; las estrategias redefinen este metodo
+        para calcular sobre las columnas directamente.
+
+        Args:
+            tarifas_base: Tarifa por hora de cada estadia
+            tolerancias: Minutos sin cargo de cada estadia
+            ingresos: Hora de ingreso de cada estadia (epoch en segundos)
+            egresos: Hora de egreso de cada estadia (epoch en segundos)
+
+        Returns:
+            Precio de cada estadia, en el mismo orden
+
+        Raises:
+            ValueError: Si las columnas no tienen el mismo largo
+        """
+        if not (len(tarifas_base) == len(tolerancias) == len(ingresos) == len(egresos)):
+            raise ValueError("Las columnas del lote deben tener el mismo largo")
+        return [
+            self.calcular_precio(
+                _EstadiaLote(tarifa, tolerancia),
+                datetime.fromtimestamp(ingreso),
+                datetime.fromtimestamp(egreso)
+            )
+            for tarifa, tolerancia, ingreso, egreso in zip(tarifas_base, tolerancias, ingresos, egresos)
+        ]
@@ -0,0 +1,131 @@
+"""Patron Strategy - Ruteo de estrategias por tipo, zona y clase de cliente.
+
+Las reglas asignan una estrategia a una combinacion de tipo de vehiculo,
+zona y clase de cliente (cualquiera de ellos puede omitirse como comodin).
+Al construir la tabla se resuelven todas las combinaciones posibles, de
+modo que elegir la estrategia de una estadia es una sola busqueda en un
+diccionario, sin recorrer las reglas.
+"""
+
+# Standard library
+from __future__ import annotations
+from dataclasses import dataclass
+from itertools import product
+from typing import Dict, FrozenSet, Sequence, Tuple
+
+# Local application
+from python_estacionamiento.patrones.strategy.pricing_strategy import PricingStrategy
+
+ClaveRuteo = Tuple[str | None, str | None, str | None]
+
+
+@dataclass(frozen=True)
+class ReglaRuteo:
+    """Asigna una estrategia a un tipo de vehiculo, zona y clase de cliente.
+
+    Un criterio en None aplica a cualquier valor.
+
+    Attributes:
+        estrategia: Estrategia a usar
+        tipo: Tipo de vehiculo ("Auto", "Moto", "Camioneta")
+        zona: Zona del estacionamiento
+        clase_cliente: Clase de cliente ("valet", "abonado", ...)
+    """
+    estrategia: PricingStrategy
+    tipo: str | None = None
+    zona: str | None = None
+    clase_cliente: str | None = None
+
+    def get_especificidad(self) -> int:
+        """Obtiene la cantidad de criterios que fija la regla.
+
+        Returns:
+            Criterios distintos de None (0 a 3)
+        """
+        return sum(criterio is not None for criterio in (self.tipo, self.zona, self.clase_cliente))
+
+    def aplica_a(self, clave: ClaveRuteo) -> bool:
+        """Indica si la regla aplica a una combinacion de criterios.
+
+        Args:
+            clave: Combinacion (tipo, zona, clase_cliente)
+
+        Returns:
+            True si cada criterio fijado por la regla coincide
+        """
+        return all(
+            propio is None or propio == valor
+            for propio, valor in zip((self.tipo, self.zona, self.clase_cliente), clave)
+        )
+
+
+class TablaRuteo:
+    """Tabla inmutable que resuelve la estrategia de cada combinacion.
+
+    Si varias reglas aplican gana la mas especifica (la que fija mas
+    criterios); entre igual especificidad gana la ultima de la lista.
+    Las combinaciones sin regla devuelven None (la estrategia por defecto).
+    """
+
+    def __init__(self, reglas: Sequence[ReglaRuteo] = ()):
+        """Construye la tabla expandiendo las reglas.
+
+        Args:
+            reglas: Reglas de ruteo
+
+        Raises:
+            TypeError: Si alguna regla no es un ReglaRuteo
+        """
+        self._reglas: Tuple[ReglaRuteo, ...] = tuple(reglas)
+        for regla in self._reglas:
+            if not isinstance(regla, ReglaRuteo):
+                raise TypeError(f"Regla de ruteo invalida: {regla!r}")
+
+        self._tipos: FrozenSet[str] = frozenset(r.tipo for r in self._reglas if r.tipo is not None)
+        self._zonas: FrozenSet[str] = frozenset(r.zona for r in self._reglas if r.zona is not None)
+        self._clases: FrozenSet[str] = frozenset(
+            r.clase_cliente for r in self._reglas if r.clase_cliente is not None
+        )
+
+        # Valores no mencionados por ninguna regla se representan con None
+        ordenadas = sorted(enumerate(self._reglas), key=lambda par: (par[1].get_especificidad(), par[0]))
+        self._tabla: Dict[ClaveRuteo, PricingStrategy] = {}
+        for clave in product((*self._tipos, None), (*self._zonas, None), (*self._clases, None)):
+            for _, regla in reversed(ordenadas):
+                if regla.aplica_a(clave):
+                    self._tabla[clave] = regla.estrategia
+                    break
+
+    def get_reglas(self) -> Tuple[ReglaRuteo, ...]:
+        """Obtiene las reglas con que se construyo la tabla.
+
+        Returns:
+            Reglas en el orden recibido
+        """
+        return self._reglas
+
+    def resolver(
+        self,
+        tipo: str | None,
+        zona: str | None = None,
+        clase_cliente: str | None = None
+    ) -> PricingStrategy | None:
+        """Obtiene la estrategia de una combinacion.
+
+        Args:
+            tipo: Tipo de vehiculo
+            zona: Zona del estacionamiento
+            clase_cliente: Clase de cliente
+
+        Returns:
+            Estrategia asignada, o None si ninguna regla aplica
+        """
+        return self._tabla.get((
+            tipo if tipo in self._tipos else None,
+            zona if zona in self._zonas else None,
+            clase_cliente if clase_cliente in self._clases else None
+        ))
+
+    def __len__(self) -> int:
+        """Cantidad de combinaciones resueltas en la tabla."""
+        return len(self._tabla)
@@ -0,0 +1,95 @@
+"""Patron Strategy - Fotos versionadas de la configuracion de precios.
+
+Una foto agrupa la estrategia por defecto y la tabla de ruteo vigentes en
+un momento, con un numero de version. Es inmutable: publicar una nueva
+configuracion crea otra foto, por lo que un calculo en curso nunca ve una
+mezcla y cualquier precio puede recalcularse con la version que lo produjo.
+"""
+
+# Standard library
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+# Local application
+from python_estacionamiento.patrones.strategy.pricing_strategy import PricingStrategy
+from python_estacionamiento.patrones.strategy.ruteo_estrategias import TablaRuteo
+
+if TYPE_CHECKING:
+    from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+
+
+@dataclass(frozen=True)
+class PrecioVersionado:
+    """Precio junto con la configuracion que lo produjo.
+
+    Attributes:
+        monto: Precio calculado
+        version: Version de la foto de precios usada
+        estrategia: Nombre de la estrategia aplicada
+    """
+    monto: float
+    version: int
+    estrategia: str
+
+
+@dataclass(frozen=True)
+class SnapshotPrecios:
+    """Configuracion de precios inmutable y versionada.
+
+    Attributes:
+        version: Numero de version (creciente)
+        estrategia: Estrategia por defecto
+        ruteo: Tabla de ruteo por tipo, zona y clase de cliente
+        publicado: Momento de publicacion
+    """
+    version: int
+    estrategia: PricingStrategy
+    ruteo: TablaRuteo
+    publicado: datetime
+
+    def resolver(
+        self,
+        vehiculo: Vehiculo,
+        zona: str | None = None,
+        clase_cliente: str | None = None
+    ) -> PricingStrategy:
+        """Obtiene la estrategia que corresponde a una estadia.
+
+        Args:
+            vehiculo: El vehiculo estacionado
+            zona: Zona del estacionamiento
+            clase_cliente: Clase de cliente
+
+        Returns:
+            Estrategia ruteada, o la estrategia por defecto si ninguna regla aplica
+        """
+        return self.ruteo.resolver(type(vehiculo).__name__, zona, clase_cliente) or self.estrategia
+
+    def calcular_precio(
+        self,
+        vehiculo: Vehiculo,
+        hora_ingreso: datetime,
+        hora_egreso: datetime,
+        zona: str | None = None,
+        clase_cliente: str | None = None
+    ) -> PrecioVersionado:
+        """Calcula el precio de una estadia con esta configuracion.
+
+        Args:
+            vehiculo: El vehiculo a calcular
+            hora_ingreso: Hora de ingreso
+            hora_egreso: Hora de egreso
+            zona: Zona del estacionamiento
+            clase_cliente: Clase de cliente
+
+        Returns:
+            Precio con la version y la estrategia usadas
+        """
+        estrategia = self.resolver(vehiculo, zona, clase_cliente)
+        return PrecioVersionado(
+            monto=estrategia.calcular_precio(vehiculo, hora_ingreso, hora_egreso),
+            version=self.version,
+            estrategia=type(estrategia).__name__
+        )
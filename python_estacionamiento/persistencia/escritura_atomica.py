@@ -0,0 +1,46 @@
+"""Escritura atomica de archivos.
+
+Escribe a un archivo temporal, hace fsync y lo renombra sobre el destino,
+de modo que un corte nunca deja un archivo a medio escribir.
+"""
+
+# Standard library
+from __future__ import annotations
+import os
+from pathlib import Path
+
+
+def escribir_atomico(destino: Path, contenido: bytes) -> None:
+    """Reemplaza el contenido de un archivo de forma atomica.
+
+    Args:
+        destino: Archivo a escribir
+        contenido: Bytes a escribir
+    """
+    temporal = destino.with_name(destino.name + '.tmp')
+    with open(temporal, 'wb') as f:
+        f.write(contenido)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, destino)
+    sincronizar_directorio(destino.parent)
+
+
+def sincronizar_directorio(directorio: Path) -> None:
+    """Hace fsync de un directorio para persistir renombres.
+
+    En plataformas que no permiten abrir directorios (Windows) no hace nada.
+
+    Args:
+        directorio: Directorio a sincronizar
+    """
+    try:
+        descriptor = os.open(directorio, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
@@ -0,0 +1,167 @@
+"""Formato binario de snapshots.
+
+Codifica el estado del estacionamiento con registros de ancho fijo:
+patente, codigo de tipo y horas como epoch. Mucho mas rapido de escribir
+y leer que el JSON indentado para estacionamientos grandes.
+
+Estructura:
+    Cabecera: magic, version, capacidad, plazas, cantidad, ultimo ticket,
+        timestamp, crc32
+    Registros: patente (12 bytes UTF-8), tipo (uint8), ingreso y egreso (float64)
+
+Las horas ausentes se guardan como NaN. El tipo se guarda con el codigo
+que le asigna el registro de VehiculoFactory. Los snapshots de la version 1
+(sin ultimo ticket) se siguen leyendo.
+"""
+
+# Standard library
+from __future__ import annotations
+import math
+import struct
+import zlib
+from datetime import datetime
+from typing import Dict, Any
+
+# Local application
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+
+MAGIC = b'PEST'
+VERSION = 2
+
+_CABECERA_V1 = struct.Struct('<4sHHIIIdI')
+_CABECERA = struct.Struct('<4sHHIIIQdI')
+_REGISTRO = struct.Struct('<12sBdd')
+
+
+def es_snapshot_binario(datos: bytes) -> bool:
+    """Indica si un contenido corresponde al formato binario.
+
+    Args:
+        datos: Contenido (o prefijo) del archivo
+
+    Returns:
+        True si comienza con la firma del formato binario
+    """
+    return datos[:len(MAGIC)] == MAGIC
+
+
+def codificar_snapshot(estado: Dict[str, Any]) -> bytes:
+    """Codifica un estado serializado en formato binario.
+
+    Args:
+        estado: Estado con plazas_ocupadas, capacidad_maxima, ultimo_ticket
+            y la lista 'vehiculos' (patente, tipo, hora_ingreso, hora_egreso).
+            Las horas pueden ser datetime, string ISO o None.
+
+    Returns:
+        Snapshot binario
+
+    Raises:
+        ValueError: Si una patente no entra en el registro o el tipo no esta registrado
+    """
+    codigos = VehiculoFactory.get_codigos()
+    vehiculos = estado.get('vehiculos', [])
+    cuerpo = bytearray(_REGISTRO.size * len(vehiculos))
+    pack_into = _REGISTRO.pack_into
+
+    desplazamiento = 0
+    for vehiculo in vehiculos:
+        patente = vehiculo['patente'].encode('utf-8')
+        if len(patente) > 12:
+            raise ValueError(f"Patente demasiado larga para el formato binario: {vehiculo['patente']}")
+        codigo = codigos.get(vehiculo['tipo'])
+        if codigo is None:
+            raise ValueError(f"Tipo de vehiculo desconocido: {vehiculo['tipo']}")
+
+        pack_into(
+            cuerpo, desplazamiento, patente, codigo,
+            _a_epoch(vehiculo.get('hora_ingreso')),
+            _a_epoch(vehiculo.get('hora_egreso'))
+        )
+        desplazamiento += _REGISTRO.size
+
+    cabecera = _CABECERA.pack(
+        MAGIC, VERSION, 0,
+        estado.get('capacidad_maxima', 0),
+        estado.get('plazas_ocupadas', 0),
+        len(vehiculos),
+        estado.get('ultimo_ticket', 0),
+        _a_epoch(estado.get('timestamp')) if estado.get('timestamp') else datetime.now().timestamp(),
+        zlib.crc32(cuerpo)
+    )
+    return cabecera + bytes(cuerpo)
+
+
+def decodificar_snapshot(datos: bytes) -> Dict[str, Any]:
+    """Decodifica un snapshot binario.
+
+    Args:
+        datos: Snapshot binario completo
+
+    Returns:
+        Estado con la lista 'vehiculos'; las horas se devuelven como datetime
+
+    Raises:
+        ValueError: Si la firma, la version, el largo o el checksum no son
+            validos, o algun codigo de tipo no esta registrado
+    """
+    if len(datos) < _CABECERA_V1.size or not es_snapshot_binario(datos):
+        raise ValueError('No es un snapshot binario valido')
+
+    version = struct.unpack_from('<H', datos, len(MAGIC))[0]
+    if version == 1:
+        cabecera = _CABECERA_V1
+        _, _, _, capacidad, plazas, cantidad, timestamp, crc = cabecera.unpack_from(datos)
+        ultimo_ticket = 0
+    elif version == VERSION:
+        cabecera = _CABECERA
+        if len(datos) < cabecera.size:
+            raise ValueError('No es un snapshot binario valido')
+        _, _, _, capacidad, plazas, cantidad, ultimo_ticket, timestamp, crc = cabecera.unpack_from(datos)
+    else:
+        raise ValueError(f'Version de snapshot binario no soportada: {version}')
+
+    cuerpo = memoryview(datos)[cabecera.size:]
+    if len(cuerpo) != cantidad * _REGISTRO.size:
+        raise ValueError('Snapshot binario truncado')
+    if zlib.crc32(cuerpo) != crc:
+        raise ValueError('checksum invalido')
+
+    tipos = VehiculoFactory.get_tipos_por_codigo()
+    desde_epoch = datetime.fromtimestamp
+    try:
+        vehiculos = [
+            {
+                'patente': patente.rstrip(b'\0').decode('utf-8'),
+                'tipo': tipos[codigo],
+                'hora_ingreso': None if ingreso != ingreso else desde_epoch(ingreso),
+                'hora_egreso': None if egreso != egreso else desde_epoch(egreso)
+            }
+            for patente, codigo, ingreso, egreso in _REGISTRO.iter_unpack(cuerpo)
+        ]
+    except KeyError as e:
+        raise ValueError(f"Codigo de tipo de vehiculo desconocido: {e.args[0]}") from e
+
+    return {
+        'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+        'plazas_ocupadas': plazas,
+        'capacidad_maxima': capacidad,
+        'ultimo_ticket': ultimo_ticket,
+        'vehiculos': vehiculos
+    }
+
+
+def _a_epoch(hora: datetime | str | None) -> float:
+    """Convierte una hora a epoch (NaN si no hay hora).
+
+    Args:
+        hora: datetime, string ISO o None
+
+    Returns:
+        Segundos desde epoch
+    """
+    if hora is None:
+        return math.nan
+    if isinstance(hora, str):
+        hora = datetime.fromisoformat(hora)
+    return hora.timestamp()
@@ -0,0 +1,497 @@
+"""Sistema de persistencia con journal (write-ahead log).
+
+Registra cada ingreso y egreso como una linea compacta agregada al final de
+un archivo. La escritura, el fsync agrupado y los snapshots compactados
+periodicos corren en un hilo de volcado propio.
+"""
+
+# Standard library
+from __future__ import annotations
+import atexit
+import json
+import os
+from pathlib import Path
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Dict, Any, Iterable, List, TYPE_CHECKING
+from datetime import datetime
+
+# Local application
+from python_estacionamiento.constantes import (
+    CAPACIDAD_MAXIMA_PLAZAS,
+    ESPERA_MAXIMA_REINTENTO_JOURNAL,
+    ESPERA_REINTENTO_JOURNAL,
+    INTERVALO_VOLCADO_JOURNAL,
+    REGISTROS_POR_FSYNC,
+    REGISTROS_POR_SNAPSHOT,
+    THREAD_JOIN_TIMEOUT
+)
+from python_estacionamiento.persistencia.escritura_atomica import escribir_atomico
+from python_estacionamiento.persistencia.storage import Storage
+from python_estacionamiento.utils.logger import configurar_logger
+
+if TYPE_CHECKING:
+    from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+
+_OPERACION_INGRESO = 'I'
+_OPERACION_EGRESO = 'E'
+_SEPARADORES_COMPACTOS = (',', ':')
+
+
+class JournalStorage(Storage):
+    """Gestor de persistencia basado en journal.
+
+    El estado se reconstruye desde el ultimo snapshot compactado mas el
+    journal de operaciones posteriores. Cada registro fija el estado final
+    de una patente, por lo que reaplicar registros ya incluidos en el
+    snapshot es inocuo (util si hubo un corte durante la compactacion).
+
+    En el hilo de la barrera cada registro solo se aplica a la imagen en
+    memoria y se encola; el hilo de volcado lo escribe y hace el fsync
+    cada INTERVALO_VOLCADO_JOURNAL segundos (antes si se acumulan
+    registros_por_fsync) y compacta al llegar a registros_por_snapshot.
+
+    Si no se puede escribir un registro el error se registra en el log y
+    el journal queda degradado: la imagen en memoria sigue al dia, no se
+    agregan mas lineas y el hilo de volcado reintenta compactar con una
+    espera que se duplica tras cada fallo. Un guardado explicito intenta
+    compactar sin esperar; un snapshot exitoso lo recupera.
+    """
+
+    def __init__(
+        self,
+        archivo: str = "estacionamiento",
+        registros_por_fsync: int = REGISTROS_POR_FSYNC,
+        registros_por_snapshot: int = REGISTROS_POR_SNAPSHOT,
+        directorio: Path | None = None,
+        intervalo_volcado: float = INTERVALO_VOLCADO_JOURNAL,
+        espera_reintento: float = ESPERA_REINTENTO_JOURNAL
+    ):
+        """Inicializa el gestor de journal.
+
+        Args:
+            archivo: Nombre base de los archivos de snapshot y journal
+            registros_por_fsync: Registros pendientes que adelantan el fsync
+            registros_por_snapshot: Registros agregados entre cada compactacion
+            directorio: Directorio de datos (default: data/ del proyecto)
+            intervalo_volcado: Segundos maximos entre cada fsync
+            espera_reintento: Segundos antes del primer reintento si se degrada
+        """
+        self._logger = configurar_logger('JournalStorage')
+        directorio = directorio or Path(__file__).parent.parent.parent / 'data'
+        directorio.mkdir(parents=True, exist_ok=True)
+        self._snapshot_path = directorio / f'{archivo}.snapshot.json'
+        self._journal_path = directorio / f'{archivo}.journal'
+
+        self._registros_por_fsync = registros_por_fsync
+        self._registros_por_snapshot = registros_por_snapshot
+        self._intervalo_volcado = intervalo_volcado
+        self._espera_reintento_inicial = espera_reintento
+
+        # Lock de estado: imagen en memoria, registros encolados y contadores.
+        # Solo se retiene para operaciones en memoria.
+        self._lock = Lock()
+        self._condicion = Condition(self._lock)
+        self._buffer: List[str] = []
+        self._registros_desde_snapshot = 0
+
+        # Lock de archivo: escritura a disco y estado de degradacion.
+        # Se toma siempre antes que el lock de estado.
+        self._lock_archivo = Lock()
+        self._journal = None
+        self._degradado = False
+        self._espera_reintento = espera_reintento
+        self._proximo_reintento = 0.0
+
+        self._hilo: Thread | None = None
+        self._detenido = False
+
+        # Imagen en memoria del estado persistido, usada para compactar
+        self._capacidad_maxima = CAPACIDAD_MAXIMA_PLAZAS
+        self._ultimo_ticket = 0
+        self._vehiculos: Dict[str, Dict[str, Any]] = {}
+        self._cargado = False
+
+    def registrar_ingreso(self, vehiculo: Vehiculo) -> None:
+        """Agrega al journal el ingreso de un vehiculo.
+
+        Args:
+            vehiculo: Vehiculo que ingreso (con hora de ingreso asignada)
+        """
+        hora_ingreso = vehiculo.get_hora_ingreso()
+        registro = {
+            'o': _OPERACION_INGRESO,
+            'p': vehiculo.get_patente(),
+            't': vehiculo.__class__.__name__,
+            'i': hora_ingreso.isoformat() if hora_ingreso else None
+        }
+        self._agregar(registro)
+
+    def registrar_egreso(self, vehiculo: Vehiculo, numero_ticket: int | None = None) -> None:
+        """Agrega al journal el egreso de un vehiculo.
+
+        Args:
+            vehiculo: Vehiculo que egreso
+            numero_ticket: Numero del ticket emitido (None si no se cobro)
+        """
+        registro = {'o': _OPERACION_EGRESO, 'p': vehiculo.get_patente()}
+        if numero_ticket is not None:
+            registro['n'] = numero_ticket
+        self._agregar(registro)
+
+    def sincronizar(self) -> None:
+        """Escribe y hace fsync de los registros pendientes sin esperar al hilo de volcado."""
+        with self._lock_archivo:
+            self._volcar()
+
+    def compactar(self) -> bool:
+        """Escribe un snapshot del estado actual y vacia el journal.
+
+        Returns:
+            True si se compacto correctamente, False si hubo error
+        """
+        with self._lock_archivo:
+            return self._volcar(compactar=True)
+
+    def cerrar(self) -> None:
+        """Detiene el hilo de volcado, sincroniza y cierra el archivo de journal."""
+        with self._condicion:
+            hilo = self._hilo
+            self._hilo = None
+            self._detenido = True
+            self._condicion.notify()
+        if hilo is not None:
+            hilo.join(THREAD_JOIN_TIMEOUT)
+            atexit.unregister(self.cerrar)
+
+        with self._lock_archivo:
+            self._volcar()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+        with self._condicion:
+            self._detenido = False
+
+    def guardar_estado(self, estado: Dict[str, Any]) -> bool:
+        """Guarda un estado completo como snapshot compactado.
+
+        Args:
+            estado: Diccionario con el estado a guardar
+
+        Returns:
+            True si se guardó correctamente, False si hubo error
+        """
+        with self._lock_archivo:
+            with self._lock:
+                self._cargar_si_hace_falta()
+                self._capacidad_maxima = estado.get('capacidad_maxima', self._capacidad_maxima)
+                self._ultimo_ticket = max(self._ultimo_ticket, estado.get('ultimo_ticket', 0))
+                self._vehiculos = {
+                    patente: {
+                        'patente': patente,
+                        'tipo': vehiculo.__class__.__name__,
+                        'hora_ingreso': vehiculo.get_hora_ingreso().isoformat() if vehiculo.get_hora_ingreso() else None
+                    }
+                    for patente, vehiculo in estado.get('vehiculos', {}).items()
+                }
+            return self._volcar(compactar=True)
+
+    def guardar_delta(
+        self,
+        estado: Dict[str, Any],
+        modificados: Dict[str, Vehiculo],
+        eliminados: Iterable[str]
+    ) -> bool:
+        """Confirma los cambios en disco.
+
+        Cada ingreso y egreso ya se encolo al ocurrir, por lo que solo resta
+        escribir y hacer fsync de lo pendiente (o compactar si el journal
+        esta degradado).
+
+        Args:
+            estado: Estado completo actual (no se usa)
+            modificados: Vehiculos agregados o modificados (ya registrados)
+            eliminados: Patentes egresadas (ya registradas)
+
+        Returns:
+            True si se confirmó correctamente, False si hubo error
+        """
+        with self._lock_archivo:
+            return self._volcar(compactar=self._degradado)
+
+    def cargar_estado(self) -> Dict[str, Any] | None:
+        """Reconstruye el estado desde el ultimo snapshot y el journal.
+
+        Returns:
+            Diccionario con el estado cargado, None si no existe o hay error
+        """
+        with self._lock_archivo:
+            try:
+                self._volcar()
+                with self._lock:
+                    if not self.existe_estado():
+                        self._logger.warning(f'Journal no encontrado: {self._journal_path}')
+                        return None
+
+                    self._leer_desde_disco()
+                    self._logger.info(
+                        f'Estado reconstruido desde journal: {len(self._vehiculos)} vehiculos'
+                    )
+                    return {
+                        'plazas_ocupadas': len(self._vehiculos),
+                        'capacidad_maxima': self._capacidad_maxima,
+                        'ultimo_ticket': self._ultimo_ticket,
+                        'vehiculos_data': list(self._vehiculos.values()),
+                        'timestamp': datetime.now().isoformat()
+                    }
+
+            except Exception as e:
+                self._logger.error(f'Error al cargar journal: {e}')
+                return None
+
+    def eliminar_estado(self) -> bool:
+        """Elimina snapshot y journal.
+
+        Returns:
+            True si se eliminó algo, False si no existia o hay error
+        """
+        with self._lock_archivo, self._lock:
+            try:
+                if self._journal is not None:
+                    self._journal.close()
+                    self._journal = None
+                existia = False
+                for path in (self._snapshot_path, self._journal_path):
+                    if path.exists():
+                        path.unlink()
+                        existia = True
+                self._vehiculos = {}
+                self._ultimo_ticket = 0
+                self._registros_desde_snapshot = 0
+                self._buffer = []
+                self._degradado = False
+                self._espera_reintento = self._espera_reintento_inicial
+                self._cargado = True
+                return existia
+
+            except Exception as e:
+                self._logger.error(f'Error al eliminar journal: {e}')
+                return False
+
+    def existe_estado(self) -> bool:
+        """Verifica si existe un snapshot o journal guardado.
+
+        Returns:
+            True si existe, False si no
+        """
+        return self._snapshot_path.exists() or self._journal_path.exists()
+
+    def esta_degradado(self) -> bool:
+        """Indica si fallo una escritura y aun no se pudo compactar.
+
+        Returns:
+            True si hay operaciones que solo estan en memoria
+        """
+        return self._degradado
+
+    def _agregar(self, registro: Dict[str, Any]) -> None:
+        """Aplica un registro a la imagen en memoria y lo encola para el hilo de volcado.
+
+        No hace entrada/salida: se llama desde la barrera, dentro del lock
+        de la patente, asi que la escritura, el fsync y la compactacion
+        quedan a cargo del hilo de volcado (ver _volcar).
+
+        Args:
+            registro: Registro compacto de la operacion
+        """
+        linea = json.dumps(registro, separators=_SEPARADORES_COMPACTOS, ensure_ascii=False)
+        with self._condicion:
+            self._cargar_si_hace_falta()
+            self._aplicar(registro)
+            # Se encola aun degradado: las lineas posteriores a la foto del
+            # snapshot que lo recupere tienen que llegar al journal nuevo
+            self._buffer.append(linea)
+            self._registros_desde_snapshot += 1
+            if self._hilo is None:
+                self._iniciar_hilo()
+            elif (len(self._buffer) >= self._registros_por_fsync
+                  or self._registros_desde_snapshot >= self._registros_por_snapshot):
+                self._condicion.notify()
+
+    def _iniciar_hilo(self) -> None:
+        """Arranca el hilo de volcado (requiere el lock de estado)."""
+        self._hilo = Thread(target=self._ejecutar, name='VolcadoJournal', daemon=True)
+        self._hilo.start()
+        atexit.register(self.cerrar)
+
+    def _ejecutar(self) -> None:
+        """Bucle del hilo de volcado."""
+        while True:
+            with self._condicion:
+                self._condicion.wait_for(
+                    lambda: (
+                        self._detenido
+                        or len(self._buffer) >= self._registros_por_fsync
+                        or self._registros_desde_snapshot >= self._registros_por_snapshot
+                    ),
+                    self._intervalo_volcado
+                )
+                if self._detenido:
+                    return
+
+            with self._lock_archivo:
+                self._volcar()
+
+    def _volcar(self, compactar: bool = False) -> bool:
+        """Escribe los registros encolados y compacta si corresponde (requiere el lock de archivo).
+
+        Los registros y, si se compacta, la foto de la imagen se toman bajo
+        el lock de estado; la escritura a disco ocurre despues de soltarlo,
+        asi que la barrera nunca espera un fsync. Con el journal degradado
+        los registros se descartan (la imagen ya los contiene) hasta que se
+        cumpla la espera del proximo reintento de compactacion.
+
+        Args:
+            compactar: True para compactar aunque no se haya alcanzado el umbral
+
+        Returns:
+            True si lo encolado quedo en disco, False si hubo error o sigue degradado
+        """
+        with self._lock:
+            lineas, self._buffer = self._buffer, []
+            if self._degradado:
+                compactar = compactar or monotonic() >= self._proximo_reintento
+                if not compactar:
+                    return False
+            if compactar or self._registros_desde_snapshot >= self._registros_por_snapshot:
+                snapshot = {
+                    'timestamp': datetime.now().isoformat(),
+                    'capacidad_maxima': self._capacidad_maxima,
+                    'ultimo_ticket': self._ultimo_ticket,
+                    'vehiculos': list(self._vehiculos.values())
+                }
+                self._registros_desde_snapshot = 0
+            else:
+                snapshot = None
+
+        if snapshot is not None:
+            # El snapshot ya contiene los registros tomados del buffer
+            return self._compactar(snapshot)
+        if not lineas:
+            return True
+
+        try:
+            if self._journal is None:
+                self._journal = open(self._journal_path, 'a', encoding='utf-8')
+            self._journal.write('\n'.join(lineas) + '\n')
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            return True
+        except Exception as e:
+            self._logger.error(f'Error al escribir journal, queda degradado: {e}')
+            self._degradar()
+            return False
+
+    def _degradar(self) -> None:
+        """Marca el journal como degradado y programa el reintento (requiere el lock de archivo)."""
+        if not self._degradado:
+            self._degradado = True
+            self._espera_reintento = self._espera_reintento_inicial
+        else:
+            self._espera_reintento = min(self._espera_reintento * 2, ESPERA_MAXIMA_REINTENTO_JOURNAL)
+        self._proximo_reintento = monotonic() + self._espera_reintento
+        if self._journal is not None:
+            try:
+                self._journal.close()
+            except Exception:
+                pass
+            self._journal = None
+
+    def _aplicar(self, registro: Dict[str, Any]) -> None:
+        """Aplica un registro a la imagen en memoria.
+
+        Args:
+            registro: Registro compacto de la operacion
+        """
+        if registro['o'] == _OPERACION_INGRESO:
+            self._vehiculos[registro['p']] = {
+                'patente': registro['p'],
+                'tipo': registro['t'],
+                'hora_ingreso': registro['i']
+            }
+        else:
+            self._vehiculos.pop(registro['p'], None)
+            if 'n' in registro:
+                self._ultimo_ticket = max(self._ultimo_ticket, registro['n'])
+
+    def _compactar(self, snapshot: Dict[str, Any]) -> bool:
+        """Escribe el snapshot de forma atomica y trunca el journal (requiere el lock de archivo).
+
+        Args:
+            snapshot: Foto de la imagen en memoria tomada bajo el lock de estado
+
+        Returns:
+            True si se compacto correctamente, False si hubo error
+        """
+        try:
+            contenido = json.dumps(snapshot, separators=_SEPARADORES_COMPACTOS, ensure_ascii=False)
+            escribir_atomico(self._snapshot_path, contenido.encode('utf-8'))
+
+            # El snapshot ya contiene todo lo registrado: vaciar el journal
+            if self._journal is not None:
+                self._journal.close()
+            self._journal = open(self._journal_path, 'w', encoding='utf-8')
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+
+            if self._degradado:
+                self._degradado = False
+                self._logger.info('Journal recuperado tras un error de escritura')
+            self._logger.info(f'Journal compactado: {len(snapshot["vehiculos"])} vehiculos en snapshot')
+            return True
+
+        except Exception as e:
+            self._logger.error(f'Error al compactar journal: {e}')
+            self._degradar()
+            return False
+
+    def _cargar_si_hace_falta(self) -> None:
+        """Lee el estado de disco la primera vez que se usa el journal (requiere el lock de estado)."""
+        if not self._cargado:
+            self._leer_desde_disco()
+
+    def _leer_desde_disco(self) -> None:
+        """Carga el ultimo snapshot y reaplica el journal (requiere el lock de estado)."""
+        if self._journal is not None:
+            self._journal.flush()
+        self._vehiculos = {}
+        self._ultimo_ticket = 0
+        self._registros_desde_snapshot = 0
+
+        if self._snapshot_path.exists():
+            with open(self._snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            self._capacidad_maxima = snapshot.get('capacidad_maxima', CAPACIDAD_MAXIMA_PLAZAS)
+            self._ultimo_ticket = snapshot.get('ultimo_ticket', 0)
+            self._vehiculos = {v['patente']: v for v in snapshot.get('vehiculos', [])}
+
+        if self._journal_path.exists():
+            valido = 0
+            with open(self._journal_path, 'rb') as f:
+                for linea in f:
+                    try:
+                        if not linea.endswith(b'\n'):
+                            raise ValueError('registro sin fin de linea')
+                        registro = json.loads(linea)
+                    except ValueError:
+                        # Registro truncado por un corte: se descarta el final
+                        self._logger.warning('Registro de journal incompleto descartado')
+                        break
+                    self._aplicar(registro)
+                    self._registros_desde_snapshot += 1
+                    valido += len(linea)
+
+            if valido < self._journal_path.stat().st_size:
+                os.truncate(self._journal_path, valido)
+
+        self._cargado = True
@@ -1,30 +1,86 @@
 """Sistema de persistencia con JSON.
 
-Permite guardar y cargar el estado del estacionamiento.
+Permite guardar y cargar el estado del estacionamiento, en JSON o en el
+formato binario compacto de formato_binario. Los guardados incrementales
+se agregan a un log de deltas que se compacta en el proximo snapshot.
 """
 
 # Standard library
+from __future__ import annotations
+import hashlib
 import json
+import os
+from enum import Enum
 from pathlib import Path
-from typing import Dict, Any
+from threading import Lock
+from typing import Dict, Any, Iterable, List, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 # Local application
+from python_estacionamiento.constantes import CAPACIDAD_MAXIMA_PLAZAS, GENERACIONES_SNAPSHOT
+from python_estacionamiento.persistencia.escritura_atomica import escribir_atomico
+from python_estacionamiento.persistencia.formato_binario import (
+    codificar_snapshot,
+    decodificar_snapshot,
+    es_snapshot_binario
+)
+from python_estacionamiento.persistencia.storage import Storage
 from python_estacionamiento.utils.logger import configurar_logger
 
+if TYPE_CHECKING:
+    from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
 
-class JsonStorage:
-    """Gestor de persistencia JSON."""
 
-    def __init__(self, archivo: str = "estacionamiento_estado.json"):
+class FormatoSnapshot(Enum):
+    """Formato en que JsonStorage escribe los snapshots."""
+
+    JSON = "json"
+    BINARIO = "binario"
+
+
+class JsonStorage(Storage):
+    """Gestor de persistencia JSON.
+
+    Cada guardado escribe un archivo temporal, hace fsync y lo renombra de
+    forma atomica. Se conservan las ultimas generaciones con su checksum;
+    al cargar se usa la generacion valida mas reciente. Al leer se detecta
+    el formato de cada archivo, por lo que se puede cambiar de formato sin
+    perder el estado anterior.
+
+    guardar_delta no reescribe el snapshot: agrega una linea con las altas,
+    bajas y contadores a un log de deltas (archivo.delta) y hace fsync, con
+    costo proporcional a los cambios. El log empieza con la huella del
+    snapshot sobre el que aplica; al cargar se reaplica solo si coincide
+    con la generacion leida. Cuando los registros del log igualan a los del
+    snapshot se escribe una generacion completa y el log vuelve a empezar,
+    de modo que cada cambio se reescribe una cantidad acotada de veces.
+    """
+
+    def __init__(
+        self,
+        archivo: str = "estacionamiento_estado.json",
+        generaciones: int = GENERACIONES_SNAPSHOT,
+        directorio: Path | None = None,
+        formato: FormatoSnapshot = FormatoSnapshot.JSON
+    ):
         """Inicializa el gestor de persistencia.
 
         Args:
             archivo: Nombre del archivo JSON
+            generaciones: Cantidad de snapshots a conservar (minimo 1)
+            directorio: Directorio de datos (default: data/ del proyecto)
+            formato: Formato de escritura de los snapshots
         """
         self._logger = configurar_logger('JsonStorage')
-        self._archivo_path = Path(__file__).parent.parent.parent / 'data' / archivo
-        self._archivo_path.parent.mkdir(parents=True, exist_ok=True)
+        directorio = directorio or Path(__file__).parent.parent.parent / 'data'
+        self._archivo_path = directorio / archivo
+        self._delta_path = directorio / f'{archivo}.delta'
+        self._generaciones = max(1, generaciones)
+        self._formato = formato
+        self._lock = Lock()
+        self._registros: Dict[str, Dict[str, Any]] | None = None
+        self._registros_en_log = 0
+        self._huella_base: str | None = None
 
     def guardar_estado(self, estado: Dict[str, Any]) -> bool:
         """Guarda el estado del estacionamiento.
@@ -35,53 +91,119 @@ class JsonStorage:
         Returns:
             True si se guardó correctamente, False si hubo error
         """
-        try:
-            # Convertir datetime a string para JSON
-            estado_serializable = self._preparar_para_json(estado)
+        with self._lock:
+            try:
+                self._registros = {
+                    patente: self._serializar(patente, vehiculo)
+                    for patente, vehiculo in estado.get('vehiculos', {}).items()
+                }
+                return self._escribir(estado)
+
+            except Exception as e:
+                self._registros = None
+                self._logger.error(f'Error al guardar estado: {e}')
+                return False
 
-            with open(self._archivo_path, 'w', encoding='utf-8') as f:
-                json.dump(estado_serializable, f, indent=2, ensure_ascii=False)
+    def guardar_delta(
+        self,
+        estado: Dict[str, Any],
+        modificados: Dict[str, Vehiculo],
+        eliminados: Iterable[str]
+    ) -> bool:
+        """Agrega los vehiculos que cambiaron al log de deltas.
 
-            self._logger.info(f'Estado guardado correctamente en {self._archivo_path}')
-            return True
+        Si todavia no hay registros en memoria (primer guardado o luego de
+        cargar) o el log ya es tan grande como el snapshot, se escribe una
+        generacion completa.
 
-        except Exception as e:
-            self._logger.error(f'Error al guardar estado: {e}')
-            return False
+        Args:
+            estado: Estado completo actual
+            modificados: Vehiculos agregados o modificados, por patente
+            eliminados: Patentes que ya no estan en el estacionamiento
+
+        Returns:
+            True si se guardó correctamente, False si hubo error
+        """
+        if self._registros is None:
+            return super().guardar_delta(estado, modificados, eliminados)
+
+        with self._lock:
+            try:
+                bajas = list(eliminados)
+                for patente in bajas:
+                    self._registros.pop(patente, None)
+                altas = []
+                for patente, vehiculo in modificados.items():
+                    self._registros[patente] = self._serializar(patente, vehiculo)
+                    altas.append(self._registro_delta(patente, vehiculo))
+
+                cambios = len(altas) + len(bajas)
+                if self._registros_en_log + cambios >= len(self._registros):
+                    return self._escribir(estado)
+
+                self._agregar_delta({
+                    'timestamp': datetime.now().isoformat(),
+                    'plazas_ocupadas': estado.get('plazas_ocupadas', 0),
+                    'capacidad_maxima': estado.get('capacidad_maxima', CAPACIDAD_MAXIMA_PLAZAS),
+                    'ultimo_ticket': estado.get('ultimo_ticket', 0),
+                    'altas': altas,
+                    'bajas': bajas
+                })
+                self._registros_en_log += cambios
+                return True
+
+            except Exception as e:
+                self._registros = None
+                self._logger.error(f'Error al guardar estado: {e}')
+                return False
 
     def cargar_estado(self) -> Dict[str, Any] | None:
         """Carga el estado del estacionamiento.
 
+        Prueba las generaciones de la mas reciente a la mas antigua y usa
+        la primera cuyo checksum sea valido, reaplicando el log de deltas
+        si corresponde a esa generacion.
+
         Returns:
             Diccionario con el estado cargado, None si no existe o hay error
         """
-        try:
-            if not self._archivo_path.exists():
-                self._logger.warning(f'Archivo de estado no encontrado: {self._archivo_path}')
-                return None
+        # Lo cargado puede ser una generacion anterior a los registros en memoria
+        self._registros = None
+        if not self.existe_estado():
+            self._logger.warning(f'Archivo de estado no encontrado: {self._archivo_path}')
+            return None
 
-            with open(self._archivo_path, 'r', encoding='utf-8') as f:
-                estado = json.load(f)
+        for path in self._paths_generaciones():
+            if not path.exists():
+                continue
+            try:
+                estado_json, huella = self._leer_snapshot(path)
+                estado_restaurado = self._restaurar_desde_json(estado_json)
+                self._reaplicar_deltas(estado_restaurado, huella)
 
-            # Convertir strings a datetime
-            estado_restaurado = self._restaurar_desde_json(estado)
+                if path != self._archivo_path:
+                    self._logger.warning(f'Usando generacion anterior del estado: {path}')
+                self._logger.info(f'Estado cargado correctamente desde {path}')
+                return estado_restaurado
 
-            self._logger.info(f'Estado cargado correctamente desde {self._archivo_path}')
-            return estado_restaurado
+            except Exception as e:
+                self._logger.error(f'Estado invalido en {path}: {e}')
 
-        except Exception as e:
-            self._logger.error(f'Error al cargar estado: {e}')
-            return None
+        self._logger.error('Ninguna generacion del estado es valida')
+        return None
 
     def eliminar_estado(self) -> bool:
-        """Elimina el archivo de estado.
+        """Elimina el archivo de estado y sus generaciones anteriores.
 
         Returns:
             True si se eliminó correctamente, False si no existe o hay error
         """
+        self._registros = None
         try:
-            if self._archivo_path.exists():
-                self._archivo_path.unlink()
+            if self.existe_estado():
+                for path in self._paths_generaciones() + [self._delta_path]:
+                    if path.exists():
+                        path.unlink()
                 self._logger.info(f'Estado eliminado: {self._archivo_path}')
                 return True
             else:
@@ -92,45 +214,317 @@ class JsonStorage:
             self._logger.error(f'Error al eliminar estado: {e}')
             return False
 
-    def _preparar_para_json(self, estado: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepara el estado para serialización JSON.
+    @classmethod
+    def convertir_snapshot(cls, origen: Path, destino: Path) -> FormatoSnapshot:
+        """Convierte un snapshot entre formato JSON y binario.
+
+        El formato de origen se detecta automaticamente y el destino se
+        escribe en el otro formato.
+
+        Args:
+            origen: Snapshot a convertir
+            destino: Archivo a escribir
+
+        Returns:
+            Formato en que se escribio el destino
+
+        Raises:
+            ValueError: Si el origen no es un snapshot valido
+        """
+        with open(origen, 'rb') as f:
+            datos = f.read()
+
+        if es_snapshot_binario(datos):
+            estado = decodificar_snapshot(datos)
+            for vehiculo in estado['vehiculos']:
+                for campo in ('hora_ingreso', 'hora_egreso'):
+                    if vehiculo[campo] is not None:
+                        vehiculo[campo] = vehiculo[campo].isoformat()
+            escribir_atomico(destino, cls._codificar_json(estado))
+            return FormatoSnapshot.JSON
+
+        estado = cls._verificar(json.loads(datos.decode('utf-8')))
+        escribir_atomico(destino, codificar_snapshot(estado))
+        return FormatoSnapshot.BINARIO
+
+    def _escribir(self, estado: Dict[str, Any]) -> bool:
+        """Escribe los registros en memoria como nueva generacion (requiere el lock).
 
         Args:
-            estado: Estado original
+            estado: Estado actual, del que se toman los contadores
 
         Returns:
-            Estado serializable
+            True al terminar la escritura
         """
-        estado_json = {
+        encabezado = {
             'timestamp': datetime.now().isoformat(),
             'plazas_ocupadas': estado.get('plazas_ocupadas', 0),
-            'capacidad_maxima': estado.get('capacidad_maxima', 100),
-            'vehiculos': []
+            'capacidad_maxima': estado.get('capacidad_maxima', CAPACIDAD_MAXIMA_PLAZAS),
+            'ultimo_ticket': estado.get('ultimo_ticket', 0),
+            'vehiculos': list(self._registros.values())
+        }
+        if self._formato is FormatoSnapshot.BINARIO:
+            datos = codificar_snapshot(encabezado)
+        else:
+            datos = self._codificar_json(encabezado)
+
+        # El directorio se crea al primer guardado, no al construir el backend
+        self._archivo_path.parent.mkdir(parents=True, exist_ok=True)
+        self._rotar_generaciones()
+        escribir_atomico(self._archivo_path, datos)
+
+        # El snapshot ya contiene todos los deltas: el log vuelve a empezar.
+        # Si hay un corte antes, el log viejo no coincide con la huella nueva
+        self._huella_base = self._huella(datos)
+        self._delta_path.unlink(missing_ok=True)
+        self._registros_en_log = 0
+
+        self._logger.info(f'Estado guardado correctamente en {self._archivo_path}')
+        return True
+
+    def _serializar(self, patente: str, vehiculo: Vehiculo) -> Dict[str, Any]:
+        """Serializa un vehiculo segun el formato configurado.
+
+        Args:
+            patente: Patente del vehiculo
+            vehiculo: Vehiculo a serializar
+
+        Returns:
+            Registro listo para el formato de escritura
+        """
+        if self._formato is FormatoSnapshot.BINARIO:
+            return self._registro_minimo(patente, vehiculo, como_iso=False)
+        # Convertir datetime a string para JSON
+        return self._serializar_vehiculo(patente, vehiculo)
+
+    def _registro_delta(self, patente: str, vehiculo: Vehiculo) -> Dict[str, Any]:
+        """Serializa un vehiculo para el log de deltas (siempre JSON).
+
+        Args:
+            patente: Patente del vehiculo
+            vehiculo: Vehiculo a serializar
+
+        Returns:
+            Registro con las horas en ISO 8601
+        """
+        if self._formato is FormatoSnapshot.BINARIO:
+            return self._registro_minimo(patente, vehiculo, como_iso=True)
+        return self._registros[patente]
+
+    def _agregar_delta(self, delta: Dict[str, Any]) -> None:
+        """Agrega una linea al log de deltas y hace fsync (requiere el lock).
+
+        El primer delta luego de un snapshot crea el log con su huella.
+
+        Args:
+            delta: Altas, bajas y contadores del guardado
+        """
+        linea = json.dumps(delta, separators=(',', ':'), ensure_ascii=False)
+        if not self._delta_path.exists():
+            linea = json.dumps({'base': self._huella_base}) + '\n' + linea
+        with open(self._delta_path, 'a', encoding='utf-8') as f:
+            f.write(linea + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _reaplicar_deltas(self, estado: Dict[str, Any], huella: str) -> None:
+        """Aplica al estado cargado los deltas guardados sobre ese snapshot.
+
+        Un log cuya huella no coincide (corresponde a otra generacion) se
+        ignora; una linea final truncada por un corte se descarta.
+
+        Args:
+            estado: Estado restaurado desde el snapshot (se modifica)
+            huella: Huella del snapshot leido
+        """
+        if not self._delta_path.exists():
+            return
+
+        with open(self._delta_path, 'rb') as f:
+            lineas = f.read().split(b'\n')
+        try:
+            base = json.loads(lineas[0]).get('base')
+        except ValueError:
+            base = None
+        if base != huella:
+            self._logger.warning('Log de deltas de otra generacion: se ignora')
+            return
+
+        vehiculos = {v['patente']: v for v in estado['vehiculos_data']}
+        aplicados = 0
+        # La ultima posicion es lo que sigue al ultimo fin de linea
+        for linea in lineas[1:-1]:
+            try:
+                delta = json.loads(linea)
+            except ValueError:
+                self._logger.warning('Delta incompleto descartado')
+                break
+            for patente in delta['bajas']:
+                vehiculos.pop(patente, None)
+            for registro in delta['altas']:
+                vehiculos[registro['patente']] = registro
+            for campo in ('plazas_ocupadas', 'capacidad_maxima', 'ultimo_ticket', 'timestamp'):
+                estado[campo] = delta[campo]
+            aplicados += 1
+
+        estado['vehiculos_data'] = list(vehiculos.values())
+        if aplicados:
+            self._logger.info(f'{aplicados} deltas reaplicados sobre el snapshot')
+
+    def _leer_snapshot(self, path: Path) -> Tuple[Dict[str, Any], str]:
+        """Lee y verifica un snapshot, detectando su formato.
+
+        Args:
+            path: Archivo de snapshot
+
+        Returns:
+            Tupla (estado serializado verificado, huella del archivo)
+
+        Raises:
+            ValueError: Si el archivo esta truncado o su checksum no coincide
+        """
+        with open(path, 'rb') as f:
+            datos = f.read()
+
+        if es_snapshot_binario(datos):
+            return decodificar_snapshot(datos), self._huella(datos)
+        return self._verificar(json.loads(datos.decode('utf-8'))), self._huella(datos)
+
+    @staticmethod
+    def _huella(datos: bytes) -> str:
+        """Calcula la huella de un snapshot tal como quedo en disco.
+
+        Args:
+            datos: Contenido del archivo
+
+        Returns:
+            SHA-256 del contenido en hexadecimal
+        """
+        return hashlib.sha256(datos).hexdigest()
+
+    @classmethod
+    def _codificar_json(cls, estado_serializable: Dict[str, Any]) -> bytes:
+        """Codifica un estado serializable como JSON con checksum.
+
+        Args:
+            estado_serializable: Estado ya preparado para JSON
+
+        Returns:
+            Contenido del archivo JSON
+        """
+        contenido = {
+            'checksum': cls._calcular_checksum(estado_serializable),
+            'estado': estado_serializable
+        }
+        return json.dumps(contenido, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _paths_generaciones(self) -> List[Path]:
+        """Obtiene los archivos de cada generacion, del mas reciente al mas antiguo.
+
+        Returns:
+            Lista de paths (el primero es el archivo de estado actual)
+        """
+        return [self._archivo_path] + [
+            self._archivo_path.with_name(f'{self._archivo_path.name}.{n}')
+            for n in range(1, self._generaciones)
+        ]
+
+    def _rotar_generaciones(self) -> None:
+        """Desplaza cada generacion un lugar, descartando la mas antigua."""
+        paths = self._paths_generaciones()
+        for origen, destino in zip(reversed(paths[:-1]), reversed(paths[1:])):
+            if origen.exists():
+                os.replace(origen, destino)
+
+    @staticmethod
+    def _calcular_checksum(estado_serializable: Dict[str, Any]) -> str:
+        """Calcula el checksum SHA-256 de un estado serializable.
+
+        Args:
+            estado_serializable: Estado ya preparado para JSON
+
+        Returns:
+            Checksum en hexadecimal
+        """
+        canonico = json.dumps(estado_serializable, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(canonico.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _verificar(cls, contenido: Dict[str, Any]) -> Dict[str, Any]:
+        """Verifica el checksum de un archivo de estado.
+
+        Los archivos previos al formato con checksum se aceptan tal cual.
+
+        Args:
+            contenido: Contenido JSON leido del archivo
+
+        Returns:
+            Estado serializable verificado
+
+        Raises:
+            ValueError: Si el checksum no coincide
+        """
+        if 'checksum' not in contenido:
+            return contenido
+
+        estado = contenido['estado']
+        if cls._calcular_checksum(estado) != contenido['checksum']:
+            raise ValueError('checksum invalido')
+        return estado
+
+    @staticmethod
+    def _serializar_vehiculo(patente: str, vehiculo: Vehiculo) -> Dict[str, Any]:
+        """Serializa un vehiculo con todos sus atributos para JSON.
+
+        Args:
+            patente: Patente del vehiculo
+            vehiculo: Vehiculo a serializar
+
+        Returns:
+            Diccionario serializable del vehiculo
+        """
+        vehiculo_data = {
+            'patente': patente,
+            'tipo': vehiculo.__class__.__name__,
+            'superficie': vehiculo.get_superficie(),
+            'tarifa_base': vehiculo.get_tarifa_base(),
+            'hora_ingreso': vehiculo.get_hora_ingreso().isoformat() if vehiculo.get_hora_ingreso() else None,
+            'hora_egreso': vehiculo.get_hora_egreso().isoformat() if vehiculo.get_hora_egreso() else None
         }
 
-        # Serializar vehículos
-        vehiculos = estado.get('vehiculos', {})
-        for patente, vehiculo in vehiculos.items():
-            vehiculo_data = {
-                'patente': patente,
-                'tipo': vehiculo.__class__.__name__,
-                'superficie': vehiculo.get_superficie(),
-                'tarifa_base': vehiculo.get_tarifa_base(),
-                'hora_ingreso': vehiculo.get_hora_ingreso().isoformat() if vehiculo.get_hora_ingreso() else None,
-                'hora_egreso': vehiculo.get_hora_egreso().isoformat() if vehiculo.get_hora_egreso() else None
-            }
-
-            # Agregar atributos específicos por tipo
-            if hasattr(vehiculo, 'get_cilindrada'):
-                vehiculo_data['cilindrada'] = vehiculo.get_cilindrada()
-            elif hasattr(vehiculo, 'get_marca'):
-                vehiculo_data['marca'] = vehiculo.get_marca()
-            elif hasattr(vehiculo, 'get_capacidad_carga'):
-                vehiculo_data['capacidad_carga'] = vehiculo.get_capacidad_carga()
-
-            estado_json['vehiculos'].append(vehiculo_data)
-
-        return estado_json
+        # Agregar atributos específicos por tipo
+        if hasattr(vehiculo, 'get_cilindrada'):
+            vehiculo_data['cilindrada'] = vehiculo.get_cilindrada()
+        elif hasattr(vehiculo, 'get_marca'):
+            vehiculo_data['marca'] = vehiculo.get_marca()
+        elif hasattr(vehiculo, 'get_capacidad_carga'):
+            vehiculo_data['capacidad_carga'] = vehiculo.get_capacidad_carga()
+
+        return vehiculo_data
+
+    @staticmethod
+    def _registro_minimo(patente: str, vehiculo: Vehiculo, como_iso: bool) -> Dict[str, Any]:
+        """Serializa un vehiculo con patente, tipo y horas.
+
+        Args:
+            patente: Patente del vehiculo
+            vehiculo: Vehiculo a serializar
+            como_iso: True para horas en ISO 8601, False para dejarlas como datetime
+
+        Returns:
+            Registro minimo del vehiculo
+        """
+        hora_ingreso = vehiculo.get_hora_ingreso()
+        hora_egreso = vehiculo.get_hora_egreso()
+        if como_iso:
+            hora_ingreso = hora_ingreso.isoformat() if hora_ingreso else None
+            hora_egreso = hora_egreso.isoformat() if hora_egreso else None
+        return {
+            'patente': patente,
+            'tipo': vehiculo.__class__.__name__,
+            'hora_ingreso': hora_ingreso,
+            'hora_egreso': hora_egreso
+        }
 
     def _restaurar_desde_json(self, estado_json: Dict[str, Any]) -> Dict[str, Any]:
         """Restaura el estado desde JSON.
@@ -143,7 +537,8 @@ class JsonStorage:
         """
         estado = {
             'plazas_ocupadas': estado_json.get('plazas_ocupadas', 0),
-            'capacidad_maxima': estado_json.get('capacidad_maxima', 100),
+            'capacidad_maxima': estado_json.get('capacidad_maxima', CAPACIDAD_MAXIMA_PLAZAS),
+            'ultimo_ticket': estado_json.get('ultimo_ticket', 0),
             'vehiculos_data': estado_json.get('vehiculos', []),
             'timestamp': estado_json.get('timestamp')
         }
@@ -154,6 +549,6 @@ class JsonStorage:
         """Verifica si existe un archivo de estado guardado.
 
         Returns:
-            True si existe, False si no
+            True si existe alguna generacion, False si no
         """
-        return self._archivo_path.exists()
+        return any(path.exists() for path in self._paths_generaciones())
@@ -0,0 +1,357 @@
+"""Sistema de persistencia con SQLite.
+
+Guarda los vehiculos activos y el historial de estadias completadas en una
+base SQLite en modo WAL.
+"""
+
+# Standard library
+from __future__ import annotations
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Any, Iterable, List, Tuple, TYPE_CHECKING
+from datetime import datetime
+
+# Local application
+from python_estacionamiento.constantes import CAPACIDAD_MAXIMA_PLAZAS, REGISTROS_POR_FSYNC
+from python_estacionamiento.persistencia.storage import Storage
+from python_estacionamiento.utils.logger import configurar_logger
+
+if TYPE_CHECKING:
+    from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+
+_ESQUEMA = (
+    '''CREATE TABLE IF NOT EXISTS vehiculos_activos (
+        patente TEXT PRIMARY KEY,
+        tipo TEXT NOT NULL,
+        hora_ingreso TEXT
+    )''',
+    '''CREATE TABLE IF NOT EXISTS estadias (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        patente TEXT NOT NULL,
+        tipo TEXT NOT NULL,
+        hora_ingreso TEXT,
+        hora_egreso TEXT
+    )''',
+    '''CREATE TABLE IF NOT EXISTS metadatos (
+        clave TEXT PRIMARY KEY,
+        valor TEXT NOT NULL
+    )''',
+    'CREATE INDEX IF NOT EXISTS idx_activos_hora_ingreso ON vehiculos_activos (hora_ingreso)',
+    'CREATE INDEX IF NOT EXISTS idx_estadias_patente ON estadias (patente)',
+    'CREATE INDEX IF NOT EXISTS idx_estadias_hora_ingreso ON estadias (hora_ingreso)',
+)
+
+# Sentencias parametrizadas: sqlite3 las prepara una vez y las reutiliza
+_SQL_UPSERT_ACTIVO = (
+    'INSERT OR REPLACE INTO vehiculos_activos (patente, tipo, hora_ingreso) VALUES (?, ?, ?)'
+)
+_SQL_DELETE_ACTIVO = 'DELETE FROM vehiculos_activos WHERE patente = ?'
+_SQL_INSERT_ESTADIA = (
+    'INSERT INTO estadias (patente, tipo, hora_ingreso, hora_egreso) VALUES (?, ?, ?, ?)'
+)
+_SQL_UPSERT_METADATO = 'INSERT OR REPLACE INTO metadatos (clave, valor) VALUES (?, ?)'
+# Los egresos de distintas patentes pueden registrarse fuera de orden: conservar el mayor
+_SQL_MAXIMO_METADATO = (
+    'INSERT INTO metadatos (clave, valor) VALUES (?, ?) ON CONFLICT (clave) DO UPDATE SET '
+    'valor = CAST(MAX(CAST(valor AS INTEGER), CAST(excluded.valor AS INTEGER)) AS TEXT)'
+)
+
+
+def _iso(hora: datetime | None) -> str | None:
+    """Convierte una hora a ISO 8601 (None si no hay hora)."""
+    return hora.isoformat() if hora else None
+
+
+class SqliteStorage(Storage):
+    """Gestor de persistencia SQLite.
+
+    Los ingresos y egresos se acumulan y se confirman en transacciones por
+    lote. Al cargar solo se leen los vehiculos activos; el historial de
+    estadias se consulta directamente en la base.
+
+    Si falla el registro de una operacion, la base queda degradada y el
+    proximo guardado reescribe los vehiculos activos completos.
+    """
+
+    def __init__(
+        self,
+        archivo: str = "estacionamiento.db",
+        registros_por_transaccion: int = REGISTROS_POR_FSYNC,
+        directorio: Path | None = None
+    ):
+        """Inicializa el gestor y crea el esquema si no existe.
+
+        Args:
+            archivo: Nombre del archivo de base de datos
+            registros_por_transaccion: Operaciones acumuladas por cada commit
+            directorio: Directorio de datos (default: data/ del proyecto)
+        """
+        self._logger = configurar_logger('SqliteStorage')
+        directorio = directorio or Path(__file__).parent.parent.parent / 'data'
+        directorio.mkdir(parents=True, exist_ok=True)
+        self._db_path = directorio / archivo
+        self._registros_por_transaccion = registros_por_transaccion
+        self._pendientes = 0
+        self._degradado = False
+        self._lock = Lock()
+
+        self._conexion = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._conexion.execute('PRAGMA journal_mode=WAL')
+        self._conexion.execute('PRAGMA synchronous=NORMAL')
+        with self._conexion:
+            for sentencia in _ESQUEMA:
+                self._conexion.execute(sentencia)
+
+    def registrar_ingreso(self, vehiculo: Vehiculo) -> None:
+        """Registra un vehiculo activo.
+
+        Args:
+            vehiculo: Vehiculo que ingreso
+        """
+        with self._lock:
+            try:
+                self._conexion.execute(_SQL_UPSERT_ACTIVO, (
+                    vehiculo.get_patente(),
+                    vehiculo.__class__.__name__,
+                    _iso(vehiculo.get_hora_ingreso())
+                ))
+                self._contar_pendiente()
+            except Exception as e:
+                self._logger.error(f'Error al registrar ingreso, base degradada: {e}')
+                self._degradado = True
+
+    def registrar_egreso(self, vehiculo: Vehiculo, numero_ticket: int | None = None) -> None:
+        """Quita un vehiculo activo y archiva su estadia.
+
+        Args:
+            vehiculo: Vehiculo que egreso (con horas de ingreso y egreso)
+            numero_ticket: Numero del ticket emitido (None si no se cobro)
+        """
+        with self._lock:
+            try:
+                self._conexion.execute(_SQL_DELETE_ACTIVO, (vehiculo.get_patente(),))
+                self._conexion.execute(_SQL_INSERT_ESTADIA, (
+                    vehiculo.get_patente(),
+                    vehiculo.__class__.__name__,
+                    _iso(vehiculo.get_hora_ingreso()),
+                    _iso(vehiculo.get_hora_egreso())
+                ))
+                if numero_ticket is not None:
+                    self._conexion.execute(_SQL_MAXIMO_METADATO, ('ultimo_ticket', str(numero_ticket)))
+                self._contar_pendiente()
+            except Exception as e:
+                self._logger.error(f'Error al registrar egreso, base degradada: {e}')
+                self._degradado = True
+
+    def sincronizar(self) -> None:
+        """Confirma la transaccion con las operaciones pendientes."""
+        with self._lock:
+            self._conexion.commit()
+            self._pendientes = 0
+
+    def cerrar(self) -> None:
+        """Confirma lo pendiente y cierra la conexion."""
+        with self._lock:
+            self._conexion.commit()
+            self._conexion.close()
+
+    def guardar_estado(self, estado: Dict[str, Any]) -> bool:
+        """Reemplaza los vehiculos activos en una unica transaccion.
+
+        Args:
+            estado: Diccionario con el estado a guardar
+
+        Returns:
+            True si se guardó correctamente, False si hubo error
+        """
+        filas = [
+            (patente, vehiculo.__class__.__name__, _iso(vehiculo.get_hora_ingreso()))
+            for patente, vehiculo in estado.get('vehiculos', {}).items()
+        ]
+        try:
+            with self._lock, self._conexion:
+                self._conexion.execute('DELETE FROM vehiculos_activos')
+                self._conexion.executemany(_SQL_UPSERT_ACTIVO, filas)
+                self._conexion.execute(_SQL_UPSERT_METADATO, (
+                    'capacidad_maxima', str(estado.get('capacidad_maxima', CAPACIDAD_MAXIMA_PLAZAS))
+                ))
+                self._conexion.execute(_SQL_UPSERT_METADATO, (
+                    'ultimo_ticket', str(estado.get('ultimo_ticket', 0))
+                ))
+                self._pendientes = 0
+                self._degradado = False
+
+            self._logger.info(f'Estado guardado en SQLite: {len(filas)} vehiculos activos')
+            return True
+
+        except Exception as e:
+            self._logger.error(f'Error al guardar estado: {e}')
+            return False
+
+    def guardar_delta(
+        self,
+        estado: Dict[str, Any],
+        modificados: Dict[str, Vehiculo],
+        eliminados: Iterable[str]
+    ) -> bool:
+        """Confirma los cambios en la base.
+
+        Cada ingreso y egreso ya se escribio al ocurrir, por lo que solo
+        resta confirmar la transaccion pendiente. Si alguno fallo se
+        reescriben los vehiculos activos desde el estado.
+
+        Args:
+            estado: Estado completo actual
+            modificados: Vehiculos agregados o modificados (ya registrados)
+            eliminados: Patentes egresadas (ya registradas)
+
+        Returns:
+            True si se confirmó correctamente, False si hubo error
+        """
+        if self._degradado:
+            return self.guardar_estado(dict(estado, vehiculos=dict(estado.get('vehiculos', {}))))
+        try:
+            self.sincronizar()
+            return True
+        except Exception as e:
+            self._logger.error(f'Error al confirmar cambios: {e}')
+            return False
+
+    def cargar_estado(self) -> Dict[str, Any] | None:
+        """Carga solo los vehiculos activos.
+
+        Returns:
+            Diccionario con el estado cargado, None si no existe o hay error
+        """
+        try:
+            with self._lock:
+                self._conexion.commit()
+                filas = self._conexion.execute(
+                    'SELECT patente, tipo, hora_ingreso FROM vehiculos_activos'
+                ).fetchall()
+                capacidad = self._conexion.execute(
+                    "SELECT valor FROM metadatos WHERE clave = 'capacidad_maxima'"
+                ).fetchone()
+                ultimo_ticket = self._conexion.execute(
+                    "SELECT valor FROM metadatos WHERE clave = 'ultimo_ticket'"
+                ).fetchone()
+
+            if not filas and capacidad is None:
+                self._logger.warning(f'Base sin estado guardado: {self._db_path}')
+                return None
+
+            self._logger.info(f'Estado cargado desde SQLite: {len(filas)} vehiculos activos')
+            return {
+                'plazas_ocupadas': len(filas),
+                'capacidad_maxima': int(capacidad[0]) if capacidad else CAPACIDAD_MAXIMA_PLAZAS,
+                'ultimo_ticket': int(ultimo_ticket[0]) if ultimo_ticket else 0,
+                'vehiculos_data': [
+                    {'patente': patente, 'tipo': tipo, 'hora_ingreso': hora_ingreso}
+                    for patente, tipo, hora_ingreso in filas
+                ],
+                'timestamp': datetime.now().isoformat()
+            }
+
+        except Exception as e:
+            self._logger.error(f'Error al cargar estado: {e}')
+            return None
+
+    def eliminar_estado(self) -> bool:
+        """Elimina vehiculos activos, historial y metadatos.
+
+        Returns:
+            True si se eliminó correctamente, False si hay error
+        """
+        try:
+            with self._lock, self._conexion:
+                for tabla in ('vehiculos_activos', 'estadias', 'metadatos'):
+                    self._conexion.execute(f'DELETE FROM {tabla}')
+                self._pendientes = 0
+                self._degradado = False
+            self._logger.info(f'Estado eliminado: {self._db_path}')
+            return True
+
+        except Exception as e:
+            self._logger.error(f'Error al eliminar estado: {e}')
+            return False
+
+    def esta_degradado(self) -> bool:
+        """Indica si fallo el registro de una operacion y aun no se reescribio.
+
+        Returns:
+            True si la base no refleja todas las operaciones
+        """
+        return self._degradado
+
+    def existe_estado(self) -> bool:
+        """Verifica si la base tiene un estado guardado.
+
+        Returns:
+            True si hay vehiculos activos o metadatos, False si no
+        """
+        with self._lock:
+            fila = self._conexion.execute(
+                'SELECT EXISTS (SELECT 1 FROM vehiculos_activos) '
+                "OR EXISTS (SELECT 1 FROM metadatos WHERE clave = 'capacidad_maxima')"
+            ).fetchone()
+        return bool(fila[0])
+
+    def consultar_estadias(
+        self,
+        patente: str | None = None,
+        desde: datetime | None = None,
+        hasta: datetime | None = None,
+        limite: int | None = None
+    ) -> List[Dict[str, Any]]:
+        """Consulta el historial de estadias completadas.
+
+        Args:
+            patente: Filtrar por patente
+            desde: Estadias que ingresaron en o despues de esta hora
+            hasta: Estadias que ingresaron antes de esta hora
+            limite: Cantidad maxima de filas (las mas recientes primero)
+
+        Returns:
+            Lista de estadias con patente, tipo, hora_ingreso y hora_egreso
+        """
+        condiciones: List[str] = []
+        parametros: List[Any] = []
+        if patente is not None:
+            condiciones.append('patente = ?')
+            parametros.append(patente)
+        if desde is not None:
+            condiciones.append('hora_ingreso >= ?')
+            parametros.append(desde.isoformat())
+        if hasta is not None:
+            condiciones.append('hora_ingreso < ?')
+            parametros.append(hasta.isoformat())
+
+        sql = 'SELECT patente, tipo, hora_ingreso, hora_egreso FROM estadias'
+        if condiciones:
+            sql += ' WHERE ' + ' AND '.join(condiciones)
+        sql += ' ORDER BY hora_ingreso DESC'
+        if limite is not None:
+            sql += ' LIMIT ?'
+            parametros.append(limite)
+
+        with self._lock:
+            self._conexion.commit()
+            filas: List[Tuple] = self._conexion.execute(sql, parametros).fetchall()
+
+        return [
+            {
+                'patente': patente,
+                'tipo': tipo,
+                'hora_ingreso': datetime.fromisoformat(ingreso) if ingreso else None,
+                'hora_egreso': datetime.fromisoformat(egreso) if egreso else None
+            }
+            for patente, tipo, ingreso, egreso in filas
+        ]
+
+    def _contar_pendiente(self) -> None:
+        """Cuenta una operacion y confirma el lote si corresponde (requiere el lock)."""
+        self._pendientes += 1
+        if self._pendientes >= self._registros_por_transaccion:
+            self._conexion.commit()
+            self._pendientes = 0
@@ -0,0 +1,113 @@
+"""Interfaz Storage.
+
+Define el contrato comun de los mecanismos de persistencia del estado.
+"""
+
+# Standard library
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+
+
+class Storage(ABC):
+    """Interfaz para persistir el estado del estacionamiento.
+
+    Los backends por snapshot solo implementan guardar/cargar. Los backends
+    incrementales ademas registran cada ingreso y egreso a medida que ocurren.
+
+    registrar_ingreso y registrar_egreso se llaman cuando el estacionamiento
+    ya modifico su estado, por lo que no deben lanzar: ante un error de
+    escritura el backend lo registra, queda degradado y se pone al dia en el
+    proximo guardado.
+    """
+
+    @abstractmethod
+    def guardar_estado(self, estado: Dict[str, Any]) -> bool:
+        """Guarda el estado completo del estacionamiento.
+
+        Args:
+            estado: Diccionario con plazas_ocupadas, capacidad_maxima y vehiculos
+
+        Returns:
+            True si se guardó correctamente, False si hubo error
+        """
+        pass
+
+    @abstractmethod
+    def cargar_estado(self) -> Dict[str, Any] | None:
+        """Carga el estado del estacionamiento.
+
+        Returns:
+            Diccionario con plazas_ocupadas, capacidad_maxima, vehiculos_data
+            y timestamp; None si no existe o hay error
+        """
+        pass
+
+    @abstractmethod
+    def eliminar_estado(self) -> bool:
+        """Elimina el estado persistido.
+
+        Returns:
+            True si se eliminó correctamente, False si no existe o hay error
+        """
+        pass
+
+    @abstractmethod
+    def existe_estado(self) -> bool:
+        """Verifica si existe un estado persistido.
+
+        Returns:
+            True si existe, False si no
+        """
+        pass
+
+    def guardar_delta(
+        self,
+        estado: Dict[str, Any],
+        modificados: Dict[str, Vehiculo],
+        eliminados: Iterable[str]
+    ) -> bool:
+        """Guarda solo los cambios desde el ultimo guardado.
+
+        Por defecto reescribe el estado completo; los backends que pueden
+        aplicar cambios parciales lo redefinen para costar O(cambios).
+
+        Args:
+            estado: Estado actual; 'vehiculos' es el diccionario en uso, que
+                puede cambiar mientras se guarda
+            modificados: Vehiculos agregados o modificados, por patente
+            eliminados: Patentes que ya no estan en el estacionamiento
+
+        Returns:
+            True si se guardó correctamente, False si hubo error
+        """
+        return self.guardar_estado(dict(estado, vehiculos=dict(estado.get('vehiculos', {}))))
+
+    def registrar_ingreso(self, vehiculo: Vehiculo) -> None:
+        """Registra un ingreso apenas ocurre (por defecto no hace nada).
+
+        Args:
+            vehiculo: Vehiculo que ingreso
+        """
+
+    def registrar_egreso(self, vehiculo: Vehiculo, numero_ticket: int | None = None) -> None:
+        """Registra un egreso apenas ocurre (por defecto no hace nada).
+
+        Args:
+            vehiculo: Vehiculo que egreso
+            numero_ticket: Numero del ticket emitido (None si no se cobro)
+        """
+
+    def esta_degradado(self) -> bool:
+        """Indica si hay operaciones registradas que no llegaron a disco.
+
+        Returns:
+            True si fallo una escritura y aun no se recupero (por defecto False)
+        """
+        return False
+
+    def cerrar(self) -> None:
+        """Libera los recursos del backend (por defecto no hace nada)."""
@@ -12,7 +12,9 @@ from python_estacionamiento.sensores.eventos import (
     VehiculoIngresoEvento,
     VehiculoEgresoEvento,
     PlazasAgotadasEvento,
-    CapacidadCriticaEvento
+    CapacidadCriticaEvento,
+    LoteIngresoEvento,
+    LoteEgresoEvento
 )
 from python_estacionamiento.sensores.sensor_ocupacion import SensorOcupacion
 from python_estacionamiento.sensores.sensor_camara import SensorCamara
@@ -24,6 +26,8 @@ __all__ = [
     'VehiculoEgresoEvento',
     'PlazasAgotadasEvento',
     'CapacidadCriticaEvento',
+    'LoteIngresoEvento',
+    'LoteEgresoEvento',
     'SensorOcupacion',
     'SensorCamara',
     'SensorSeguridad'
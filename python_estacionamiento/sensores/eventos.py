@@ -5,11 +5,12 @@ Define los eventos que los sensores pueden observar.
 
 # Standard library
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Dict, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from python_estacionamiento.entidades.ticket import Ticket
     from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
 
 
@@ -48,11 +49,18 @@ class VehiculoEgresoEvento(EventoEstacionamiento):
         plazas_ocupadas: Cantidad de plazas ocupadas despues del egreso
         plazas_disponibles: Cantidad de plazas disponibles
         tiempo_estadia: Tiempo que estuvo estacionado
+        monto: Monto cobrado (None si el egreso no se cobro)
+        ticket: Ticket emitido (None si el egreso no se cobro)
+        patente_leida: Patente tal como se leyo en la salida (None si no
+            se informo); puede diferir de la del vehiculo si se concilio
     """
     vehiculo: Vehiculo
     plazas_ocupadas: int
     plazas_disponibles: int
     tiempo_estadia: str
+    monto: float | None = None
+    ticket: Ticket | None = None
+    patente_leida: str | None = None
 
 
 @dataclass
@@ -77,3 +85,38 @@ class CapacidadCriticaEvento(EventoEstacionamiento):
     """
     plazas_disponibles: int
     porcentaje_ocupacion: float
+
+
+@dataclass
+class LoteIngresoEvento(EventoEstacionamiento):
+    """Evento agregado de ingreso de un lote de vehiculos.
+
+    Attributes:
+        vehiculos: Vehiculos que ingresaron
+        patentes_rechazadas: Patentes que no pudieron ingresar
+        plazas_ocupadas: Cantidad de plazas ocupadas despues del lote
+        plazas_disponibles: Cantidad de plazas disponibles
+    """
+    vehiculos: List[Vehiculo]
+    patentes_rechazadas: List[str]
+    plazas_ocupadas: int
+    plazas_disponibles: int
+
+
+@dataclass
+class LoteEgresoEvento(EventoEstacionamiento):
+    """Evento agregado de egreso de un lote de vehiculos.
+
+    Attributes:
+        vehiculos: Vehiculos que egresaron
+        patentes_no_encontradas: Patentes que no estaban en el estacionamiento
+        plazas_ocupadas: Cantidad de plazas ocupadas despues del lote
+        plazas_disponibles: Cantidad de plazas disponibles
+        lecturas_conciliadas: Lectura original de cada patente egresada
+            que se concilio con otra distinta
+    """
+    vehiculos: List[Vehiculo]
+    patentes_no_encontradas: List[str]
+    plazas_ocupadas: int
+    plazas_disponibles: int
+    lecturas_conciliadas: Dict[str, str] = field(default_factory=dict)
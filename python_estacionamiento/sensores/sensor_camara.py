@@ -3,14 +3,17 @@
 Sensor que simula camaras de lectura de patentes.
 """
 
-# Standard library
+# Local application
 from python_estacionamiento.patrones.observer.observer import Observer
 from python_estacionamiento.sensores.eventos import (
     EventoEstacionamiento,
     VehiculoIngresoEvento,
-    VehiculoEgresoEvento
+    VehiculoEgresoEvento,
+    LoteIngresoEvento,
+    LoteEgresoEvento
 )
 from python_estacionamiento.utils.logger import configurar_logger
+from python_estacionamiento.utils.patentes import clave_patente
 
 
 class SensorCamara(Observer[EventoEstacionamiento]):
@@ -18,6 +21,10 @@ class SensorCamara(Observer[EventoEstacionamiento]):
 
     Simula camaras de lectura automatica de patentes
     implementando el patron Observer.
+
+    Cada salida registra la lectura original y la patente con la que el
+    estacionamiento la concilio, si la camara confundio caracteres
+    (O/0, I/1, B/8, ...).
     """
 
     def __init__(self, ubicacion: str = "Principal"):
@@ -41,6 +48,10 @@ class SensorCamara(Observer[EventoEstacionamiento]):
             self._registrar_ingreso(evento)
         elif isinstance(evento, VehiculoEgresoEvento):
             self._registrar_egreso(evento)
+        elif isinstance(evento, LoteIngresoEvento):
+            self._registrar_lote(evento, 'INGRESO')
+        elif isinstance(evento, LoteEgresoEvento):
+            self._registrar_lote(evento, 'EGRESO')
 
     def _registrar_ingreso(self, evento: VehiculoIngresoEvento) -> None:
         """Registra ingreso de vehiculo.
@@ -66,17 +77,40 @@ class SensorCamara(Observer[EventoEstacionamiento]):
         Args:
             evento: Evento de egreso
         """
-        vehiculo = evento.vehiculo
-        print(f"[CAMARA {self._ubicacion}] Patente detectada: {vehiculo.get_patente()}")
+        patente = evento.vehiculo.get_patente()
+        leida = evento.patente_leida or patente
+        print(f"[CAMARA {self._ubicacion}] Patente detectada: {leida}")
+        if clave_patente(leida) != patente:
+            print(f"                  Conciliada con: {patente}")
         print(f"                  Accion: SALIDA")
         print(f"                  Hora: {evento.timestamp.strftime('%H:%M:%S')}")
 
         self._registros.append({
             'tipo': 'EGRESO',
-            'patente': vehiculo.get_patente(),
+            'patente': leida,
+            'patente_conciliada': patente,
             'timestamp': evento.timestamp
         })
 
+    def _registrar_lote(self, evento: LoteIngresoEvento | LoteEgresoEvento, tipo: str) -> None:
+        """Registra todas las patentes de un lote.
+
+        Args:
+            evento: Evento agregado de ingreso o egreso
+            tipo: 'INGRESO' o 'EGRESO'
+        """
+        print(f"[CAMARA {self._ubicacion}] Lote detectado: {len(evento.vehiculos)} patentes")
+        print(f"                  Accion: {tipo}")
+        print(f"                  Hora: {evento.timestamp.strftime('%H:%M:%S')}")
+
+        for vehiculo in evento.vehiculos:
+            patente = vehiculo.get_patente()
+            registro = {'tipo': tipo, 'patente': patente, 'timestamp': evento.timestamp}
+            if tipo == 'EGRESO':
+                registro['patente'] = evento.lecturas_conciliadas.get(patente, patente)
+                registro['patente_conciliada'] = patente
+            self._registros.append(registro)
+
     def get_registros(self) -> list:
         """Obtiene todos los registros capturados.
 
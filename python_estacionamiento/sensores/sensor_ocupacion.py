@@ -9,7 +9,9 @@ from python_estacionamiento.sensores.eventos import (
     EventoEstacionamiento,
     VehiculoIngresoEvento,
     VehiculoEgresoEvento,
-    CapacidadCriticaEvento
+    CapacidadCriticaEvento,
+    LoteIngresoEvento,
+    LoteEgresoEvento
 )
 from python_estacionamiento.utils.logger import configurar_logger
 
@@ -43,6 +45,8 @@ class SensorOcupacion(Observer[EventoEstacionamiento]):
             self._procesar_egreso(evento)
         elif isinstance(evento, CapacidadCriticaEvento):
             self._procesar_capacidad_critica(evento)
+        elif isinstance(evento, (LoteIngresoEvento, LoteEgresoEvento)):
+            self._procesar_lote(evento)
 
     def _procesar_ingreso(self, evento: VehiculoIngresoEvento) -> None:
         """Procesa evento de ingreso de vehiculo.
@@ -65,6 +69,8 @@ class SensorOcupacion(Observer[EventoEstacionamiento]):
         """
         print(f"[SENSOR OCUPACION] Vehiculo {evento.vehiculo.get_patente()} egreso")
         print(f"                   Tiempo estadia: {evento.tiempo_estadia}")
+        if evento.monto is not None:
+            print(f"                   Monto cobrado: ${evento.monto:.2f}")
         print(f"                   Disponibles: {evento.plazas_disponibles} plazas")
 
     def _procesar_capacidad_critica(self, evento: CapacidadCriticaEvento) -> None:
@@ -76,3 +82,17 @@ class SensorOcupacion(Observer[EventoEstacionamiento]):
         print(f"[SENSOR OCUPACION] CAPACIDAD CRITICA!")
         print(f"                   Solo {evento.plazas_disponibles} plazas disponibles")
         print(f"                   Ocupacion: {evento.porcentaje_ocupacion:.1f}%")
+
+    def _procesar_lote(self, evento: LoteIngresoEvento | LoteEgresoEvento) -> None:
+        """Procesa un evento agregado de ingreso o egreso.
+
+        Args:
+            evento: Evento de lote
+        """
+        accion = "ingresaron" if isinstance(evento, LoteIngresoEvento) else "egresaron"
+        print(f"[SENSOR OCUPACION] Lote: {len(evento.vehiculos)} vehiculos {accion}")
+        print(f"                   Ocupacion: {evento.plazas_ocupadas} plazas")
+        print(f"                   Disponibles: {evento.plazas_disponibles} plazas")
+
+        if isinstance(evento, LoteIngresoEvento) and evento.plazas_disponibles <= self._umbral_critico:
+            print(f"                   ALERTA: Capacidad critica!")
@@ -4,14 +4,20 @@ Sensor que monitorea eventos de seguridad en el estacionamiento.
 """
 
 # Standard library
+from typing import List, Tuple
+
+# Local application
 from python_estacionamiento.patrones.observer.observer import Observer
 from python_estacionamiento.sensores.eventos import (
     EventoEstacionamiento,
     VehiculoIngresoEvento,
     VehiculoEgresoEvento,
-    PlazasAgotadasEvento
+    PlazasAgotadasEvento,
+    LoteIngresoEvento,
+    LoteEgresoEvento
 )
 from python_estacionamiento.utils.logger import configurar_logger
+from python_estacionamiento.utils.patentes import clave_patente
 
 
 class SensorSeguridad(Observer[EventoEstacionamiento]):
@@ -19,6 +25,11 @@ class SensorSeguridad(Observer[EventoEstacionamiento]):
 
     Monitorea eventos de seguridad y genera alertas
     implementando el patron Observer.
+
+    Las lecturas erroneas de camara (O/0, I/1, una letra de mas o de
+    menos) ya llegan conciliadas por el estacionamiento: el sensor registra
+    la conciliacion y solo alerta si el vehiculo que sale no estaba
+    monitoreado.
     """
 
     def __init__(self):
@@ -26,6 +37,7 @@ class SensorSeguridad(Observer[EventoEstacionamiento]):
         self._logger = configurar_logger('SensorSeguridad')
         self._alertas = []
         self._vehiculos_monitoreados = set()
+        self._conciliaciones: List[Tuple[str, str]] = []
         print("[SENSOR SEGURIDAD] Sistema de seguridad activado...")
 
     def actualizar(self, evento: EventoEstacionamiento) -> None:
@@ -40,6 +52,10 @@ class SensorSeguridad(Observer[EventoEstacionamiento]):
             self._monitorear_egreso(evento)
         elif isinstance(evento, PlazasAgotadasEvento):
             self._alerta_acceso_denegado(evento)
+        elif isinstance(evento, LoteIngresoEvento):
+            self._monitorear_lote_ingreso(evento)
+        elif isinstance(evento, LoteEgresoEvento):
+            self._monitorear_lote_egreso(evento)
 
     def _monitorear_ingreso(self, evento: VehiculoIngresoEvento) -> None:
         """Monitorea ingreso de vehiculo.
@@ -47,8 +63,7 @@ class SensorSeguridad(Observer[EventoEstacionamiento]):
         Args:
             evento: Evento de ingreso
         """
-        patente = evento.vehiculo.get_patente()
-        self._vehiculos_monitoreados.add(patente)
+        patente = self._monitorear(evento.vehiculo.get_patente())
 
         print(f"[SENSOR SEGURIDAD] Vehiculo registrado en sistema: {patente}")
         print(f"                   Total vehiculos monitoreados: {len(self._vehiculos_monitoreados)}")
@@ -59,17 +74,11 @@ class SensorSeguridad(Observer[EventoEstacionamiento]):
         Args:
             evento: Evento de egreso
         """
-        patente = evento.vehiculo.get_patente()
+        patente = self._autorizar_salida(evento.vehiculo.get_patente(), evento.patente_leida)
 
-        if patente in self._vehiculos_monitoreados:
-            self._vehiculos_monitoreados.remove(patente)
+        if patente is not None:
             print(f"[SENSOR SEGURIDAD] Vehiculo autorizado para salir: {patente}")
             print(f"                   Vehiculos restantes: {len(self._vehiculos_monitoreados)}")
-        else:
-            # Alerta de seguridad
-            alerta = f"ALERTA: Vehiculo {patente} intenta salir sin registro de ingreso"
-            self._alertas.append(alerta)
-            print(f"[SENSOR SEGURIDAD] {alerta}")
 
     def _alerta_acceso_denegado(self, evento: PlazasAgotadasEvento) -> None:
         """Genera alerta de acceso denegado.
@@ -80,6 +89,75 @@ class SensorSeguridad(Observer[EventoEstacionamiento]):
         print(f"[SENSOR SEGURIDAD] ACCESO DENEGADO: {evento.patente_rechazada}")
         print(f"                   Razon: Estacionamiento completo")
 
+    def _monitorear_lote_ingreso(self, evento: LoteIngresoEvento) -> None:
+        """Monitorea el ingreso de un lote de vehiculos.
+
+        Args:
+            evento: Evento agregado de ingreso
+        """
+        for vehiculo in evento.vehiculos:
+            self._monitorear(vehiculo.get_patente())
+
+        print(f"[SENSOR SEGURIDAD] Lote registrado en sistema: {len(evento.vehiculos)} vehiculos")
+        print(f"                   Total vehiculos monitoreados: {len(self._vehiculos_monitoreados)}")
+
+        for patente in evento.patentes_rechazadas:
+            print(f"[SENSOR SEGURIDAD] ACCESO DENEGADO: {patente}")
+
+    def _monitorear_lote_egreso(self, evento: LoteEgresoEvento) -> None:
+        """Monitorea el egreso de un lote de vehiculos.
+
+        Args:
+            evento: Evento agregado de egreso
+        """
+        autorizados = 0
+        for vehiculo in evento.vehiculos:
+            patente = vehiculo.get_patente()
+            if self._autorizar_salida(patente, evento.lecturas_conciliadas.get(patente)) is not None:
+                autorizados += 1
+
+        print(f"[SENSOR SEGURIDAD] Lote autorizado para salir: {autorizados} vehiculos")
+        print(f"                   Vehiculos restantes: {len(self._vehiculos_monitoreados)}")
+
+    def _monitorear(self, patente: str) -> str:
+        """Empieza a monitorear una patente.
+
+        Args:
+            patente: Patente leida en el ingreso
+
+        Returns:
+            Patente monitoreada (normalizada si es valida)
+        """
+        patente = clave_patente(patente)
+        self._vehiculos_monitoreados.add(patente)
+        return patente
+
+    def _autorizar_salida(self, patente: str, patente_leida: str | None = None) -> str | None:
+        """Deja de monitorear la patente que sale.
+
+        Args:
+            patente: Patente del vehiculo que egresa
+            patente_leida: Lectura de la camara, si el estacionamiento la informo
+
+        Returns:
+            Patente monitoreada que sale, o None si se genero una alerta
+        """
+        monitoreada = clave_patente(patente)
+        leida = clave_patente(patente_leida) if patente_leida else monitoreada
+
+        if monitoreada not in self._vehiculos_monitoreados:
+            # Alerta de seguridad
+            alerta = f"ALERTA: Vehiculo {leida} intenta salir sin registro de ingreso"
+            self._alertas.append(alerta)
+            print(f"[SENSOR SEGURIDAD] {alerta}")
+            return None
+
+        if monitoreada != leida:
+            self._conciliaciones.append((leida, monitoreada))
+            print(f"[SENSOR SEGURIDAD] Lectura {leida} conciliada con {monitoreada}")
+        self._vehiculos_monitoreados.discard(monitoreada)
+        return monitoreada
+
     def get_alertas(self) -> list:
         """Obtiene todas las alertas de seguridad.
 
@@ -95,3 +173,11 @@ class SensorSeguridad(Observer[EventoEstacionamiento]):
             Set de patentes monitoreadas
         """
         return self._vehiculos_monitoreados.copy()
+
+    def get_conciliaciones(self) -> List[Tuple[str, str]]:
+        """Obtiene las lecturas de egreso conciliadas con una patente monitoreada.
+
+        Returns:
+            Lista de pares (patente leida, patente monitoreada)
+        """
+        return self._conciliaciones.copy()
@@ -0,0 +1,240 @@
+"""Asignador de plazas por tipo de vehiculo.
+
+Divide el estacionamiento en pools de plazas (por defecto uno por cada
+tipo registrado en VehiculoFactory), cada uno con la superficie de sus
+plazas. Cada pool mantiene una pila de
+plazas libres, de modo que asignar o liberar una plaza es O(1) aun con
+decenas de miles de plazas.
+"""
+
+# Standard library
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Sequence, Tuple
+
+# Local application
+from python_estacionamiento.constantes import PLAZAS_POR_TIPO
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+
+
+@dataclass(frozen=True)
+class PoolPlazas:
+    """Grupo de plazas del mismo tamano.
+
+    Attributes:
+        tipo: Tipo de vehiculo para el que se disenaron las plazas
+        superficie: Superficie de cada plaza (metros cuadrados)
+        cantidad: Cantidad de plazas del pool
+    """
+    tipo: str
+    superficie: float
+    cantidad: int
+
+    def __post_init__(self):
+        """Valida el pool.
+
+        Raises:
+            ValueError: Si la superficie o la cantidad no son validas
+        """
+        if self.superficie <= 0:
+            raise ValueError(f"La superficie de las plazas de {self.tipo} debe ser positiva")
+        if self.cantidad < 0:
+            raise ValueError(f"La cantidad de plazas de {self.tipo} no puede ser negativa")
+
+
+def pools_por_defecto(plazas: Dict[str, int] = PLAZAS_POR_TIPO) -> Tuple[PoolPlazas, ...]:
+    """Arma un pool por cada tipo registrado en VehiculoFactory.
+
+    La superficie de las plazas es la del TipoVehiculo vigente. Los tipos
+    sin cantidad configurada tienen un pool vacio: sus vehiculos ocupan la
+    plaza libre mas chica en la que entran.
+
+    Args:
+        plazas: Cantidad de plazas por tipo
+
+    Returns:
+        Pools en el orden de registro de los tipos
+    """
+    return tuple(
+        PoolPlazas(tipo, VehiculoFactory.get_tipo(tipo).superficie, plazas.get(tipo, 0))
+        for tipo in VehiculoFactory.get_tipos()
+    )
+
+
+class AsignadorPlazas:
+    """Asigna plazas numeradas segun la superficie de cada vehiculo.
+
+    Un vehiculo ocupa una plaza de su tamano y, si su pool esta completo,
+    la plaza libre mas chica en la que entra (una moto puede ocupar una
+    plaza de auto, pero no al reves). Las plazas se numeran desde 1,
+    consecutivas dentro de cada pool y en el orden de los pools.
+    """
+
+    def __init__(self, pools: Sequence[PoolPlazas] | None = None):
+        """Inicializa el asignador con todas las plazas libres.
+
+        Args:
+            pools: Pools de plazas del estacionamiento (default: pools_por_defecto())
+
+        Raises:
+            ValueError: Si no hay pools o hay tipos repetidos
+        """
+        if pools is None:
+            pools = pools_por_defecto()
+        if not pools:
+            raise ValueError("El asignador necesita al menos un pool de plazas")
+        if len({pool.tipo for pool in pools}) != len(pools):
+            raise ValueError("Hay pools de plazas con el mismo tipo")
+
+        self._pools = tuple(pools)
+        self._inicios: List[int] = []
+        inicio = 1
+        for pool in self._pools:
+            self._inicios.append(inicio)
+            inicio += pool.cantidad
+        self._capacidad = inicio - 1
+
+        # Pools ordenados por superficie para buscar la plaza mas chica que sirve
+        self._por_superficie = sorted(range(len(self._pools)), key=lambda i: self._pools[i].superficie)
+        self._superficies = [self._pools[i].superficie for i in self._por_superficie]
+
+        self._lock = Lock()
+        self._libres: List[List[int]] = []
+        self._plaza_por_patente: Dict[str, int] = {}
+        self._ocupantes: Dict[int, str] = {}
+        self.limpiar()
+
+    def asignar(self, patente: str, superficie: float) -> int | None:
+        """Asigna una plaza libre a un vehiculo.
+
+        Args:
+            patente: Patente del vehiculo
+            superficie: Superficie que ocupa el vehiculo
+
+        Returns:
+            Numero de plaza asignada, o None si no hay plaza en la que entre
+
+        Raises:
+            ValueError: Si la patente ya tiene una plaza
+        """
+        with self._lock:
+            if patente in self._plaza_por_patente:
+                raise ValueError(f"La patente {patente} ya tiene asignada una plaza")
+
+            for orden in range(bisect_left(self._superficies, superficie), len(self._superficies)):
+                libres = self._libres[self._por_superficie[orden]]
+                if libres:
+                    plaza = libres.pop()
+                    self._plaza_por_patente[patente] = plaza
+                    self._ocupantes[plaza] = patente
+                    return plaza
+        return None
+
+    def liberar(self, patente: str) -> int | None:
+        """Libera la plaza de un vehiculo.
+
+        Args:
+            patente: Patente del vehiculo
+
+        Returns:
+            Numero de plaza liberada, o None si la patente no tenia plaza
+        """
+        with self._lock:
+            plaza = self._plaza_por_patente.pop(patente, None)
+            if plaza is not None:
+                del self._ocupantes[plaza]
+                self._libres[self._indice_pool(plaza)].append(plaza)
+            return plaza
+
+    def limpiar(self) -> None:
+        """Libera todas las plazas."""
+        with self._lock:
+            # Pilas invertidas: las primeras plazas en asignarse son las de menor numero
+            self._libres = [
+                list(range(inicio + pool.cantidad - 1, inicio - 1, -1))
+                for pool, inicio in zip(self._pools, self._inicios)
+            ]
+            self._plaza_por_patente.clear()
+            self._ocupantes.clear()
+
+    def get_plaza(self, patente: str) -> int | None:
+        """Obtiene la plaza asignada a un vehiculo.
+
+        Args:
+            patente: Patente del vehiculo
+
+        Returns:
+            Numero de plaza, o None si no tiene plaza asignada
+        """
+        return self._plaza_por_patente.get(patente)
+
+    def get_ocupante(self, plaza: int) -> str | None:
+        """Obtiene la patente que ocupa una plaza.
+
+        Args:
+            plaza: Numero de plaza
+
+        Returns:
+            Patente del ocupante, o None si la plaza esta libre
+        """
+        return self._ocupantes.get(plaza)
+
+    def get_tipo_plaza(self, plaza: int) -> str:
+        """Obtiene el tipo de pool al que pertenece una plaza.
+
+        Args:
+            plaza: Numero de plaza
+
+        Returns:
+            Tipo del pool de la plaza
+
+        Raises:
+            ValueError: Si la plaza no existe
+        """
+        if not 1 <= plaza <= self._capacidad:
+            raise ValueError(f"La plaza {plaza} no existe")
+        return self._pools[self._indice_pool(plaza)].tipo
+
+    def get_capacidad(self) -> int:
+        """Obtiene la cantidad total de plazas.
+
+        Returns:
+            Plazas de todos los pools
+        """
+        return self._capacidad
+
+    def get_disponibles(self, tipo: str | None = None) -> int:
+        """Obtiene la cantidad de plazas libres.
+
+        Args:
+            tipo: Tipo de pool (None: todos los pools)
+
+        Returns:
+            Plazas libres del pool indicado o del total
+        """
+        with self._lock:
+            return sum(
+                len(libres) for pool, libres in zip(self._pools, self._libres)
+                if tipo is None or pool.tipo == tipo
+            )
+
+    def get_pools(self) -> Sequence[PoolPlazas]:
+        """Obtiene los pools de plazas.
+
+        Returns:
+            Pools en orden de numeracion
+        """
+        return self._pools
+
+    def _indice_pool(self, plaza: int) -> int:
+        """Obtiene el indice del pool de una plaza.
+
+        Args:
+            plaza: Numero de plaza
+
+        Returns:
+            Indice del pool en self._pools
+        """
+        return bisect_right(self._inicios, plaza) - 1
@@ -0,0 +1,390 @@
+"""Async Parking Lot Manager - Fachada asyncio.
+
+Expone un ParkingLot a controladores asyncio sin bloquear el event loop.
+Las operaciones corren en el loop, sin run_in_executor, sobre el mismo
+nucleo que usa el lote con hilos.
+"""
+
+# Standard library
+from __future__ import annotations
+import asyncio
+import inspect
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+# Local application
+from python_estacionamiento.constantes import (
+    CANTIDAD_STRIPES_PATENTE,
+    CAPACIDAD_MAXIMA_PLAZAS,
+    ESPERA_LOCK_COMPARTIDO,
+    LOTE_POR_DEFECTO
+)
+from python_estacionamiento.entidades.resultado_operacion import ResultadoOperacion
+from python_estacionamiento.entidades.ticket import Ticket
+from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+from python_estacionamiento.patrones.observer.observable import Observable
+from python_estacionamiento.patrones.observer.observer import Observer
+from python_estacionamiento.persistencia.storage import Storage
+from python_estacionamiento.sensores.eventos import EventoEstacionamiento
+from python_estacionamiento.servicios.parking_lot import OperacionPreparada, ParkingLot
+from python_estacionamiento.utils.logger import configurar_logger
+
+# Eventos del lote reenviados mientras la fachada entrega los de su propia
+# operacion; se notifican en el loop una vez que el lote termino
+_EVENTOS_OPERACION: ContextVar[List[EventoEstacionamiento] | None] = ContextVar(
+    'eventos_operacion', default=None
+)
+
+
+class _ReenvioEventos(Observer[EventoEstacionamiento]):
+    """Observador del lote que reenvia sus eventos a la fachada."""
+
+    def __init__(self, fachada: AsyncParkingLotManager):
+        """Inicializa el reenvio.
+
+        Args:
+            fachada: Fachada que recibe los eventos
+        """
+        self._fachada = fachada
+
+    def actualizar(self, evento: EventoEstacionamiento) -> None:
+        """Reenvia un evento del lote.
+
+        Args:
+            evento: Evento emitido por el lote
+        """
+        self._fachada._reenviar(evento)
+
+
+class AsyncParkingLotManager(Observable[EventoEstacionamiento]):
+    """Fachada asyncio sobre un ParkingLot.
+
+    La logica (normalizacion e indice de patentes, asignador de plazas,
+    persistencia, cobro y tickets, lotes de operaciones) es la del
+    ParkingLot subyacente: la fachada ejecuta en el loop el mismo nucleo
+    de cada operacion. Las operaciones sobre una misma patente se
+    serializan con asyncio.Lock por stripe, y el lock de hilos del mismo
+    stripe se toma sin bloquear (se reintenta cediendo el loop), de modo
+    que la fachada puede envolver un lote compartido con codigo sincronico
+    (por ejemplo ParkingLotManager.get_instance()). El nucleo no espera
+    nada; solo SqliteStorage puede confirmar su transaccion dentro de el.
+    guardar_estado y cargar_estado, que leen o escriben el estado
+    completo, corren en un hilo con asyncio.to_thread.
+
+    Los observadores pueden ser sincronicos (Observer) o asincronos
+    (AsyncObserver) y siempre se ejecutan en el loop, luego de soltar los
+    locks: pueden operar sobre la fachada, incluso con la misma patente.
+    Con despacho sincronico (por defecto) una operacion termina cuando
+    todos sus eventos fueron atendidos; con habilitar_despacho_asincrono
+    los observadores sincronicos se atienden desde su cola y los
+    asincronos en tareas propias, sin demorar la operacion. Los eventos
+    que el lote emite por operaciones hechas fuera de la fachada se
+    entregan sin esperar.
+    """
+
+    def __init__(
+        self,
+        lote: ParkingLot | None = None,
+        capacidad_maxima: int = CAPACIDAD_MAXIMA_PLAZAS,
+        storage: Storage | None = None
+    ):
+        """Inicializa la fachada.
+
+        Args:
+            lote: Lote a envolver (default: un ParkingLot nuevo)
+            capacidad_maxima: Cantidad de plazas del lote nuevo (ignorado si se pasa lote)
+            storage: Backend de persistencia del lote nuevo (ignorado si se pasa lote)
+
+        Raises:
+            ValueError: Si la capacidad del lote nuevo no es mayor a cero
+        """
+        Observable.__init__(self)
+        self._lote = lote or ParkingLot(LOTE_POR_DEFECTO, capacidad_maxima, storage)
+        self._logger = configurar_logger('AsyncParkingLotManager')
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._locks_patente = [asyncio.Lock() for _ in range(CANTIDAD_STRIPES_PATENTE)]
+        self._tareas: set = set()
+        self._reenvio = _ReenvioEventos(self)
+        self._lote.agregar_observador(self._reenvio)
+
+    def get_lote(self) -> ParkingLot:
+        """Obtiene el lote subyacente.
+
+        Returns:
+            El ParkingLot sobre el que opera la fachada
+        """
+        return self._lote
+
+    async def ingresar(self, vehiculo: Vehiculo) -> None:
+        """Registra el ingreso de un vehiculo al estacionamiento.
+
+        Args:
+            vehiculo: El vehiculo que ingresa
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+            PlazasAgotadasException: Si no hay plazas disponibles
+            VehiculoYaIngresadoException: Si la patente ya esta en el estacionamiento
+        """
+        await self._ejecutar(self._lote._preparar_ingreso, vehiculo)
+
+    async def egresar(self, patente: str) -> Vehiculo:
+        """Registra el egreso de un vehiculo del estacionamiento.
+
+        Args:
+            patente: Patente del vehiculo que egresa
+
+        Returns:
+            El vehiculo que egresa
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+            VehiculoNoEncontradoException: Si el vehiculo no esta en el estacionamiento
+        """
+        vehiculo, _ = await self._ejecutar(self._lote._preparar_egreso, patente, False)
+        return vehiculo
+
+    async def cobrar_y_egresar(
+        self,
+        patente: str,
+        zona: str | None = None,
+        clase_cliente: str | None = None
+    ) -> Ticket:
+        """Cobra la estadia de un vehiculo y registra su egreso.
+
+        Args:
+            patente: Patente del vehiculo que egresa
+            zona: Zona del estacionamiento (para el ruteo de precios)
+            clase_cliente: Clase de cliente (para el ruteo de precios)
+
+        Returns:
+            El ticket emitido
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+            VehiculoNoEncontradoException: Si el vehiculo no esta en el estacionamiento
+        """
+        _, ticket = await self._ejecutar(
+            self._lote._preparar_egreso, patente, True, zona, clase_cliente
+        )
+        return ticket
+
+    async def ingresar_lote(self, vehiculos: List[Vehiculo]) -> List[ResultadoOperacion]:
+        """Registra el ingreso de un lote de vehiculos.
+
+        Args:
+            vehiculos: Vehiculos que ingresan
+
+        Returns:
+            Resultado de cada ingreso, en el mismo orden
+        """
+        return await self._ejecutar(self._lote._preparar_ingreso_lote, vehiculos)
+
+    async def egresar_lote(self, patentes: List[str]) -> List[ResultadoOperacion]:
+        """Registra el egreso de un lote de vehiculos.
+
+        Args:
+            patentes: Patentes de los vehiculos que egresan
+
+        Returns:
+            Resultado de cada egreso, en el mismo orden
+        """
+        return await self._ejecutar(self._lote._preparar_egreso_lote, patentes)
+
+    async def consultar(self, patente: str) -> Vehiculo | None:
+        """Busca un vehiculo en el estacionamiento.
+
+        Args:
+            patente: Patente del vehiculo a buscar
+
+        Returns:
+            El vehiculo si esta en el estacionamiento, None si no
+        """
+        return self._lote.get_vehiculo(patente)
+
+    async def guardar_estado(self, completo: bool = False) -> bool:
+        """Guarda el estado del lote en un hilo de trabajo.
+
+        Args:
+            completo: True para reescribir el estado completo
+
+        Returns:
+            True si se guardó correctamente, False si hubo error
+        """
+        return await asyncio.to_thread(self._lote.guardar_estado, completo)
+
+    async def cargar_estado(self) -> bool:
+        """Carga el estado del lote desde su persistencia, en un hilo de trabajo.
+
+        Returns:
+            True si se cargó correctamente, False si no habia estado o hubo error
+        """
+        return await asyncio.to_thread(self._lote.cargar_estado)
+
+    def get_plazas_disponibles(self) -> int:
+        """Obtiene la cantidad de plazas disponibles.
+
+        Returns:
+            Numero de plazas libres
+        """
+        return self._lote.get_plazas_disponibles()
+
+    def get_plazas_ocupadas(self) -> int:
+        """Obtiene la cantidad de plazas ocupadas.
+
+        Returns:
+            Numero de plazas ocupadas
+        """
+        return self._lote.get_plazas_ocupadas()
+
+    def get_todos_vehiculos(self) -> Dict[str, Vehiculo]:
+        """Obtiene todos los vehiculos activos.
+
+        Returns:
+            Diccionario de vehiculos activos (copia defensiva)
+        """
+        return self._lote.get_todos_vehiculos()
+
+    async def esperar_notificaciones(self) -> None:
+        """Espera a los observadores asincronos lanzados en modo de despacho asincrono."""
+        while self._tareas:
+            await asyncio.gather(*list(self._tareas), return_exceptions=True)
+
+    def cerrar(self) -> None:
+        """Deja de observar el lote subyacente."""
+        self._lote.eliminar_observador(self._reenvio)
+
+    async def _ejecutar(self, preparar: Callable[..., OperacionPreparada], *args: Any) -> Any:
+        """Ejecuta una operacion del lote en el loop.
+
+        Args:
+            preparar: Preparacion de la operacion en el lote
+            *args: Argumentos de la preparacion
+
+        Returns:
+            Lo que devuelve el nucleo de la operacion
+        """
+        self._loop = asyncio.get_running_loop()
+        stripes, nucleo = preparar(*args)
+        eventos: List[EventoEstacionamiento] = []
+        try:
+            async with self._seccion_critica(stripes):
+                return nucleo(eventos)
+        finally:
+            # Fuera de la seccion critica de las patentes
+            await self._entregar(eventos)
+
+    @asynccontextmanager
+    async def _seccion_critica(self, stripes: List[int]) -> AsyncIterator[None]:
+        """Toma los locks de los stripes de una operacion sin bloquear el loop.
+
+        Por cada stripe, en orden, toma el asyncio.Lock de la fachada (las
+        corrutinas esperan en su cola sin consumir el loop) y luego el lock
+        de hilos del lote, reintentando sin bloquear mientras lo tenga otro
+        hilo.
+
+        Args:
+            stripes: Stripes de patente a tomar, sin repetir y en orden
+        """
+        tomados: List[int] = []
+        try:
+            for stripe in stripes:
+                lock = self._locks_patente[stripe]
+                await lock.acquire()
+                try:
+                    lock_lote = self._lote._locks_patente[stripe]
+                    while not lock_lote.acquire(blocking=False):
+                        await asyncio.sleep(ESPERA_LOCK_COMPARTIDO)
+                except BaseException:
+                    lock.release()
+                    raise
+                tomados.append(stripe)
+            yield
+        finally:
+            for stripe in reversed(tomados):
+                self._lote._locks_patente[stripe].release()
+                self._locks_patente[stripe].release()
+
+    async def _entregar(self, eventos: List[EventoEstacionamiento]) -> None:
+        """Notifica los eventos de una operacion de la fachada.
+
+        Primero los recibe el lote, como si la operacion se hubiera hecho
+        sobre el; los que este reenvia a la fachada se notifican despues a
+        sus observadores, esperando a los asincronos.
+
+        Args:
+            eventos: Eventos de la operacion, en orden
+        """
+        if not eventos:
+            return
+        reenviados: List[EventoEstacionamiento] = []
+        token = _EVENTOS_OPERACION.set(reenviados)
+        try:
+            self._lote._notificar_eventos(eventos)
+        finally:
+            _EVENTOS_OPERACION.reset(token)
+        for evento in reenviados:
+            await self._notificar(evento)
+
+    def _reenviar(self, evento: EventoEstacionamiento) -> None:
+        """Entrega un evento del lote a los observadores, dentro del loop.
+
+        Los eventos de una operacion de la fachada se juntan para que
+        _entregar los notifique. Los de operaciones hechas fuera de la
+        fachada (desde otro hilo) se programan en el loop sin esperarlos.
+
+        Args:
+            evento: Evento emitido por el lote
+        """
+        reenviados = _EVENTOS_OPERACION.get()
+        if reenviados is not None:
+            reenviados.append(evento)
+            return
+
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        futuro = asyncio.run_coroutine_threadsafe(self._notificar(evento), loop)
+        futuro.add_done_callback(self._registrar_error)
+
+    def _registrar_error(self, futuro: Future) -> None:
+        """Registra el error de una notificacion que nadie espera.
+
+        Args:
+            futuro: Notificacion terminada
+        """
+        if not futuro.cancelled() and futuro.exception() is not None:
+            self._logger.error(f'Error al notificar observadores: {futuro.exception()}')
+
+    async def _notificar(self, evento: EventoEstacionamiento) -> None:
+        """Notifica a los observadores.
+
+        Con despacho sincronico espera a los observadores asincronos, que se
+        ejecutan de forma concurrente. Con despacho asincrono los sincronicos
+        reciben el evento en su cola y los asincronos en una tarea propia.
+
+        Args:
+            evento: El evento a notificar
+        """
+        despachadores = self._despachadores
+        pendientes: List = []
+        for observador in list(self._observadores):
+            despachador = None if despachadores is None else despachadores.get(id(observador))
+            if despachador is not None and not inspect.iscoroutinefunction(observador.actualizar):
+                despachador.encolar(evento)
+                continue
+            resultado = observador.actualizar(evento)
+            if inspect.isawaitable(resultado):
+                pendientes.append(resultado)
+
+        if despachadores is None:
+            if pendientes:
+                await asyncio.gather(*pendientes)
+            return
+
+        for pendiente in pendientes:
+            tarea = asyncio.ensure_future(pendiente)
+            self._tareas.add(tarea)
+            tarea.add_done_callback(self._tareas.discard)
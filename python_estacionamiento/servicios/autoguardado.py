@@ -0,0 +1,190 @@
+"""Servicio de autoguardado en segundo plano.
+
+Persiste el estado del ParkingLotManager desde un hilo propio, de modo que
+los ingresos y egresos nunca esperan la escritura a disco.
+"""
+
+# Standard library
+from __future__ import annotations
+import atexit
+from dataclasses import dataclass
+from threading import Condition, Thread
+from time import perf_counter
+
+# Local application
+from python_estacionamiento.constantes import (
+    CAMBIOS_POR_AUTOGUARDADO,
+    INTERVALO_AUTOGUARDADO,
+    THREAD_JOIN_TIMEOUT
+)
+from python_estacionamiento.patrones.observer.observer import Observer
+from python_estacionamiento.sensores.eventos import EventoEstacionamiento
+from python_estacionamiento.servicios.parking_lot_manager import ParkingLotManager
+from python_estacionamiento.utils.logger import configurar_logger
+
+
+@dataclass(frozen=True)
+class MetricasAutoguardado:
+    """Metricas de los guardados realizados por el servicio.
+
+    Attributes:
+        guardados: Guardados exitosos
+        errores: Guardados fallidos
+        cambios_guardados: Patentes persistidas en total
+        duracion_ultimo: Segundos del ultimo guardado
+        duracion_maxima: Segundos del guardado mas lento
+        duracion_total: Segundos acumulados guardando
+    """
+    guardados: int
+    errores: int
+    cambios_guardados: int
+    duracion_ultimo: float
+    duracion_maxima: float
+    duracion_total: float
+
+
+class ServicioAutoguardado(Observer[EventoEstacionamiento]):
+    """Guarda el estado cada N cambios o cada T segundos, lo que ocurra primero.
+
+    Se registra como observador del manager: en el hilo de la barrera solo
+    compara la cantidad de cambios pendientes y, si alcanza el umbral,
+    despierta al hilo de guardado. Las rafagas de cambios que llegan
+    mientras se guarda se acumulan y se persisten en un unico guardado
+    incremental.
+    """
+
+    def __init__(
+        self,
+        manager: ParkingLotManager | None = None,
+        cambios_por_guardado: int = CAMBIOS_POR_AUTOGUARDADO,
+        intervalo: float = INTERVALO_AUTOGUARDADO,
+        registrar_atexit: bool = True
+    ):
+        """Inicializa el servicio y arranca su hilo de guardado.
+
+        Args:
+            manager: Gestor a persistir (default: la instancia Singleton)
+            cambios_por_guardado: Cambios pendientes que disparan un guardado
+            intervalo: Segundos maximos entre guardados con cambios pendientes
+            registrar_atexit: True para guardar lo pendiente al salir del proceso
+
+        Raises:
+            ValueError: Si el umbral de cambios o el intervalo no son positivos
+        """
+        if cambios_por_guardado <= 0:
+            raise ValueError("La cantidad de cambios por guardado debe ser mayor a cero")
+        if intervalo <= 0:
+            raise ValueError("El intervalo de autoguardado debe ser mayor a cero")
+
+        self._logger = configurar_logger('ServicioAutoguardado')
+        self._manager = manager or ParkingLotManager.get_instance()
+        self._cambios_por_guardado = cambios_por_guardado
+        self._intervalo = intervalo
+        self._condicion = Condition()
+        self._solicitado = False
+        self._detenido = False
+        self._registrado_atexit = registrar_atexit
+
+        self._guardados = 0
+        self._errores = 0
+        self._cambios_guardados = 0
+        self._duracion_ultimo = 0.0
+        self._duracion_maxima = 0.0
+        self._duracion_total = 0.0
+
+        self._hilo = Thread(target=self._ejecutar, name='Autoguardado', daemon=True)
+        self._hilo.start()
+        self._manager.agregar_observador(self)
+        if registrar_atexit:
+            atexit.register(self.detener)
+
+        self._logger.info(
+            f'Autoguardado iniciado: cada {cambios_por_guardado} cambios o {intervalo}s'
+        )
+
+    def actualizar(self, evento: EventoEstacionamiento) -> None:
+        """Despierta al hilo de guardado si se alcanzo el umbral de cambios.
+
+        Args:
+            evento: Evento notificado por el manager
+        """
+        if self._manager.get_cambios_pendientes() >= self._cambios_por_guardado:
+            with self._condicion:
+                self._solicitado = True
+                self._condicion.notify()
+
+    def solicitar_guardado(self) -> None:
+        """Pide un guardado inmediato sin esperar el umbral ni el intervalo."""
+        with self._condicion:
+            self._solicitado = True
+            self._condicion.notify()
+
+    def detener(self, timeout: float = THREAD_JOIN_TIMEOUT) -> None:
+        """Guarda los cambios pendientes y detiene el hilo de guardado.
+
+        Args:
+            timeout: Segundos maximos de espera del hilo
+        """
+        with self._condicion:
+            if self._detenido:
+                return
+            self._detenido = True
+            self._condicion.notify()
+
+        self._manager.eliminar_observador(self)
+        self._hilo.join(timeout)
+        if self._registrado_atexit:
+            atexit.unregister(self.detener)
+        self._logger.info('Autoguardado detenido')
+
+    def get_metricas(self) -> MetricasAutoguardado:
+        """Obtiene una foto de las metricas de guardado.
+
+        Returns:
+            Metricas actuales del servicio
+        """
+        with self._condicion:
+            return MetricasAutoguardado(
+                guardados=self._guardados,
+                errores=self._errores,
+                cambios_guardados=self._cambios_guardados,
+                duracion_ultimo=self._duracion_ultimo,
+                duracion_maxima=self._duracion_maxima,
+                duracion_total=self._duracion_total
+            )
+
+    def _ejecutar(self) -> None:
+        """Bucle del hilo de guardado."""
+        while True:
+            with self._condicion:
+                self._condicion.wait_for(
+                    lambda: self._solicitado or self._detenido, self._intervalo
+                )
+                self._solicitado = False
+                detenido = self._detenido
+
+            if self._manager.get_cambios_pendientes():
+                self._guardar()
+            if detenido:
+                return
+
+    def _guardar(self) -> None:
+        """Ejecuta un guardado incremental y registra su duracion."""
+        cambios = self._manager.get_cambios_pendientes()
+        inicio = perf_counter()
+        try:
+            exito = self._manager.guardar_estado()
+        except Exception as e:
+            self._logger.error(f'Error en autoguardado: {e}')
+            exito = False
+        duracion = perf_counter() - inicio
+
+        with self._condicion:
+            self._duracion_ultimo = duracion
+            self._duracion_maxima = max(self._duracion_maxima, duracion)
+            self._duracion_total += duracion
+            if exito:
+                self._guardados += 1
+                self._cambios_guardados += cambios
+            else:
+                self._errores += 1
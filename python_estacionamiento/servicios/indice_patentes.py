@@ -0,0 +1,347 @@
+"""Indice secundario de patentes.
+
+Permite buscar vehiculos estacionados por prefijo de patente o por
+patentes que una camara pudo haber leido mal.
+"""
+
+# Standard library
+from __future__ import annotations
+from bisect import bisect_left
+from collections import Counter, deque
+from dataclasses import dataclass
+from string import ascii_uppercase, digits
+from threading import Lock
+from typing import Deque, Dict, FrozenSet, List, Set, Tuple
+
+# Local application
+from python_estacionamiento.constantes import (
+    CANDIDATOS_SIMILITUD,
+    CANTIDAD_STRIPES_PATENTE,
+    DISTANCIA_MAXIMA_SIMILITUD
+)
+from python_estacionamiento.excepciones.estacionamiento_exception import PatenteInvalidaException
+from python_estacionamiento.utils.patentes import (
+    distancia_edicion,
+    esqueleto_patente,
+    limpiar_patente,
+    normalizar_patente
+)
+
+
+@dataclass(frozen=True)
+class CoincidenciaPatente:
+    """Patente candidata para una lectura.
+
+    Attributes:
+        patente: Patente presente en el indice
+        distancia: Ediciones entre esqueletos (los confundibles no cuentan)
+        distancia_literal: Ediciones entre la lectura y la patente tal cual
+    """
+    patente: str
+    distancia: int
+    distancia_literal: int
+
+
+# Caracteres posibles en un esqueleto (los confundibles ya reducidos)
+_ALFABETO_ESQUELETO = ''.join(sorted(set(esqueleto_patente(ascii_uppercase + digits))))
+
+
+def _bigramas(esqueleto: str) -> Set[str]:
+    """Obtiene los pares de caracteres consecutivos de un esqueleto."""
+    return {esqueleto[i:i + 2] for i in range(len(esqueleto) - 1)}
+
+
+def _vecinos(esqueleto: str) -> Set[str]:
+    """Obtiene los esqueletos a una edicion o menos (incluido el propio)."""
+    cortes = [(esqueleto[:i], esqueleto[i:]) for i in range(len(esqueleto) + 1)]
+    vecinos = {izquierda + derecha[1:] for izquierda, derecha in cortes if derecha}
+    for izquierda, derecha in cortes:
+        for caracter in _ALFABETO_ESQUELETO:
+            vecinos.add(izquierda + caracter + derecha)
+            if derecha:
+                vecinos.add(izquierda + caracter + derecha[1:])
+    return vecinos
+
+
+class IndicePatentes:
+    """Indice de patentes normalizadas.
+
+    Agrupa las patentes por esqueleto (busqueda de confundibles y de
+    similares a una edicion en O(1)). agregar y quitar solo tocan ese dict,
+    bajo el lock del stripe del esqueleto, y anotan el cambio en una cola.
+
+    La lista ordenada (busqueda por prefijo con bisect) y el indice
+    invertido de bigramas (similitud a mas de una edicion) se derivan de
+    esa cola recien cuando una busqueda los necesita: se aplican los
+    cambios pendientes y la lista se reordena con Timsort, que aprovecha
+    el tramo ya ordenado (O(N + k log k) para k cambios).
+
+    Solo guarda las patentes presentes, por lo que su tamano depende de la
+    ocupacion y no de la cantidad de lecturas.
+    """
+
+    def __init__(self):
+        """Inicializa un indice vacio."""
+        self._locks = [Lock() for _ in range(CANTIDAD_STRIPES_PATENTE)]
+        # Grupos inmutables: se reemplazan al cambiar, asi se leen sin lock
+        self._por_esqueleto: Dict[str, FrozenSet[str]] = {}
+        self._cambios: Deque[Tuple[str, bool]] = deque()
+
+        # Estructuras derivadas, al dia hasta el ultimo cambio aplicado
+        self._lock_derivadas = Lock()
+        self._ordenadas: List[str] = []
+        self._derivadas: Set[str] = set()
+        self._conteo_esqueletos: Dict[str, int] = {}
+        self._por_bigrama: Dict[str, Set[str]] = {}
+
+    def agregar(self, patente: str) -> None:
+        """Agrega una patente normalizada.
+
+        Args:
+            patente: Patente normalizada
+        """
+        esqueleto = esqueleto_patente(patente)
+        with self._lock_para(esqueleto):
+            grupo = self._por_esqueleto.get(esqueleto, frozenset())
+            if patente in grupo:
+                return
+            self._por_esqueleto[esqueleto] = grupo | {patente}
+            self._cambios.append((patente, True))
+
+    def quitar(self, patente: str) -> None:
+        """Quita una patente normalizada (si no esta, no hace nada).
+
+        Args:
+            patente: Patente normalizada
+        """
+        esqueleto = esqueleto_patente(patente)
+        with self._lock_para(esqueleto):
+            grupo = self._por_esqueleto.get(esqueleto)
+            if grupo is None or patente not in grupo:
+                return
+            if len(grupo) == 1:
+                del self._por_esqueleto[esqueleto]
+            else:
+                self._por_esqueleto[esqueleto] = grupo - {patente}
+            self._cambios.append((patente, False))
+
+    def limpiar(self) -> None:
+        """Quita todas las patentes."""
+        with self._lock_derivadas:
+            for lock in self._locks:
+                lock.acquire()
+            try:
+                self._por_esqueleto.clear()
+                self._cambios.clear()
+                self._ordenadas.clear()
+                self._derivadas.clear()
+                self._conteo_esqueletos.clear()
+                self._por_bigrama.clear()
+            finally:
+                for lock in reversed(self._locks):
+                    lock.release()
+
+    def buscar_por_prefijo(self, prefijo: str, limite: int | None = None) -> List[str]:
+        """Busca las patentes que empiezan con un prefijo.
+
+        Args:
+            prefijo: Comienzo de la patente (se ignoran mayusculas y separadores)
+            limite: Maximo de resultados (default: sin limite)
+
+        Returns:
+            Patentes encontradas en orden alfabetico
+        """
+        prefijo = limpiar_patente(prefijo)
+        resultado = []
+        with self._lock_derivadas:
+            self._sincronizar()
+            for indice in range(bisect_left(self._ordenadas, prefijo), len(self._ordenadas)):
+                patente = self._ordenadas[indice]
+                if not patente.startswith(prefijo) or len(resultado) == limite:
+                    break
+                resultado.append(patente)
+        return resultado
+
+    def buscar_confundibles(self, patente: str) -> List[str]:
+        """Busca las patentes que una camara podria confundir con la leida.
+
+        Incluye la propia patente si esta en el indice.
+
+        Args:
+            patente: Patente tal como se leyo
+
+        Returns:
+            Patentes con el mismo esqueleto, en orden alfabetico (vacia si
+            la lectura no es una patente valida)
+        """
+        try:
+            esqueleto = esqueleto_patente(normalizar_patente(patente))
+        except PatenteInvalidaException:
+            return []
+        return sorted(self._por_esqueleto.get(esqueleto, ()))
+
+    def buscar_similares(
+        self,
+        patente: str,
+        distancia_maxima: int = DISTANCIA_MAXIMA_SIMILITUD,
+        limite: int = CANDIDATOS_SIMILITUD
+    ) -> List[CoincidenciaPatente]:
+        """Busca las patentes mas parecidas a una lectura.
+
+        La distancia se mide entre esqueletos, asi que confundir O/0, I/1,
+        B/8, etc. no suma ediciones.
+
+        Con distancia_maxima <= 1 se generan todos los esqueletos a una
+        edicion de la lectura y se buscan en el indice (unos cientos de
+        consultas a un dict, sin importar cuantas patentes haya). Para
+        distancias mayores los candidatos salen del indice de bigramas: una
+        edicion rompe a lo sumo dos bigramas de la lectura, de modo que solo
+        se verifican las patentes que comparten al menos
+        len(bigramas) - 2 * distancia_maxima; si ese piso no filtra nada
+        (lecturas muy cortas) se recorren todos los esqueletos.
+
+        Args:
+            patente: Patente tal como se leyo
+            distancia_maxima: Ediciones toleradas ademas de los confundibles
+            limite: Maximo de candidatos
+
+        Returns:
+            Candidatos ordenados por distancia, distancia literal y patente
+            (vacia si la lectura no es una patente valida)
+        """
+        try:
+            leida = normalizar_patente(patente)
+        except PatenteInvalidaException:
+            return []
+        esqueleto = esqueleto_patente(leida)
+        bigramas = _bigramas(esqueleto)
+        piso = len(bigramas) - 2 * distancia_maxima
+        vecinos = _vecinos(esqueleto) if distancia_maxima == 1 else {esqueleto}
+
+        if distancia_maxima <= 1:
+            candidatos = [vecino for vecino in vecinos if vecino in self._por_esqueleto]
+        elif piso > 0:
+            conteo = Counter()
+            with self._lock_derivadas:
+                self._sincronizar()
+                for bigrama in bigramas:
+                    conteo.update(self._por_bigrama.get(bigrama, ()))
+            candidatos = [candidato for candidato, comunes in conteo.items() if comunes >= piso]
+        else:
+            candidatos = list(self._por_esqueleto)
+
+        coincidencias = []
+        for candidato in candidatos:
+            if distancia_maxima <= 1:
+                # Los vecinos ya estan a una edicion o menos por construccion
+                distancia = 0 if candidato == esqueleto else 1
+            else:
+                distancia = distancia_edicion(esqueleto, candidato, distancia_maxima)
+            if distancia is None:
+                continue
+            coincidencias.extend(
+                CoincidenciaPatente(similar, distancia, distancia_edicion(leida, similar))
+                for similar in self._por_esqueleto.get(candidato, ())
+            )
+
+        coincidencias.sort(key=lambda c: (c.distancia, c.distancia_literal, c.patente))
+        return coincidencias[:limite]
+
+    def conciliar(self, patente: str, distancia_maxima: int = DISTANCIA_MAXIMA_SIMILITUD) -> str | None:
+        """Resuelve una lectura a la patente presente que le corresponde.
+
+        Args:
+            patente: Patente tal como se leyo
+            distancia_maxima: Ediciones toleradas ademas de los confundibles
+
+        Returns:
+            La patente exacta si esta en el indice; si no, el unico candidato
+            mas cercano; None si no hay candidatos o el mejor es ambiguo
+        """
+        try:
+            leida = normalizar_patente(patente)
+        except PatenteInvalidaException:
+            return None
+        if leida in self:
+            return leida
+        mejores = self.buscar_similares(leida, distancia_maxima, limite=2)
+        if not mejores:
+            return None
+        if len(mejores) == 2 and (mejores[0].distancia, mejores[0].distancia_literal) == (
+            mejores[1].distancia, mejores[1].distancia_literal
+        ):
+            return None
+        return mejores[0].patente
+
+    def __len__(self) -> int:
+        """Cantidad de patentes en el indice."""
+        with self._lock_derivadas:
+            self._sincronizar()
+            return len(self._ordenadas)
+
+    def __contains__(self, patente: str) -> bool:
+        """Indica si una patente normalizada esta en el indice."""
+        return patente in self._por_esqueleto.get(esqueleto_patente(patente), ())
+
+    def _lock_para(self, esqueleto: str) -> Lock:
+        """Obtiene el lock del stripe que corresponde a un esqueleto.
+
+        Args:
+            esqueleto: Esqueleto de la patente
+
+        Returns:
+            Lock que serializa los cambios de ese grupo
+        """
+        return self._locks[hash(esqueleto) % CANTIDAD_STRIPES_PATENTE]
+
+    def _sincronizar(self) -> None:
+        """Aplica los cambios pendientes a las estructuras derivadas (requiere _lock_derivadas).
+
+        Los cambios de una misma patente se anotan en orden (los serializa
+        el lock de su stripe), de modo que aplicarlos en secuencia deja las
+        estructuras derivadas iguales al dict de esqueletos.
+        """
+        if not self._cambios:
+            return
+        altas: List[str] = []
+        bajas: Set[str] = set()
+        while self._cambios:
+            patente, alta = self._cambios.popleft()
+            if alta and patente not in self._derivadas:
+                self._derivadas.add(patente)
+                altas.append(patente)
+                self._contar_esqueleto(esqueleto_patente(patente), 1)
+            elif not alta and patente in self._derivadas:
+                self._derivadas.discard(patente)
+                bajas.add(patente)
+                self._contar_esqueleto(esqueleto_patente(patente), -1)
+
+        # Una patente quitada y vuelta a agregar sale de la lista y entra con las altas
+        if bajas:
+            self._ordenadas = [patente for patente in self._ordenadas if patente not in bajas]
+        nuevas = [patente for patente in dict.fromkeys(altas) if patente in self._derivadas]
+        if nuevas:
+            self._ordenadas.extend(nuevas)
+            self._ordenadas.sort()
+
+    def _contar_esqueleto(self, esqueleto: str, variacion: int) -> None:
+        """Actualiza el indice de bigramas cuando un esqueleto aparece o desaparece.
+
+        Args:
+            esqueleto: Esqueleto de la patente agregada o quitada
+            variacion: 1 al agregar, -1 al quitar
+        """
+        cantidad = self._conteo_esqueletos.get(esqueleto, 0) + variacion
+        if cantidad:
+            self._conteo_esqueletos[esqueleto] = cantidad
+            if cantidad == 1 and variacion == 1:
+                for bigrama in _bigramas(esqueleto):
+                    self._por_bigrama.setdefault(bigrama, set()).add(esqueleto)
+            return
+
+        del self._conteo_esqueletos[esqueleto]
+        for bigrama in _bigramas(esqueleto):
+            esqueletos = self._por_bigrama[bigrama]
+            esqueletos.discard(esqueleto)
+            if not esqueletos:
+                del self._por_bigrama[bigrama]
@@ -0,0 +1,1411 @@
+"""Parking Lot.
+
+Administra el estado de un estacionamiento (un lote o un nivel). Cada
+instancia es independiente: tiene sus propios locks, capacidad,
+persistencia y observadores.
+"""
+
+# Standard library
+from __future__ import annotations
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple, TypeVar
+from datetime import datetime
+
+# Local application
+from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+from python_estacionamiento.entidades.resultado_operacion import ResultadoOperacion
+from python_estacionamiento.entidades.ticket import Ticket
+from python_estacionamiento.excepciones.estacionamiento_exception import (
+    PatenteInvalidaException,
+    PlazasAgotadasException,
+    VehiculoNoEncontradoException,
+    VehiculoYaIngresadoException
+)
+from python_estacionamiento.constantes import (
+    CAPACIDAD_MAXIMA_PLAZAS,
+    CANDIDATOS_SIMILITUD,
+    CANTIDAD_STRIPES_PATENTE,
+    DISTANCIA_MAXIMA_SIMILITUD,
+    LOTE_POR_DEFECTO
+)
+from python_estacionamiento.utils.logger import configurar_logger
+from python_estacionamiento.utils.patentes import normalizar_patente
+from python_estacionamiento.persistencia.json_storage import JsonStorage
+from python_estacionamiento.persistencia.storage import Storage
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.patrones.observer.observable import Observable
+from python_estacionamiento.servicios.asignador_plazas import AsignadorPlazas
+from python_estacionamiento.servicios.indice_patentes import IndicePatentes
+from python_estacionamiento.servicios.pricing_registry import PricingRegistry
+from python_estacionamiento.servicios.tabla_ocupacion_compartida import (
+    OcupantePlaza,
+    TablaOcupacionCompartida
+)
+from python_estacionamiento.sensores.eventos import (
+    EventoEstacionamiento,
+    VehiculoIngresoEvento,
+    VehiculoEgresoEvento,
+    PlazasAgotadasEvento,
+    CapacidadCriticaEvento,
+    LoteIngresoEvento,
+    LoteEgresoEvento
+)
+
+
+R = TypeVar('R')
+
+# Stripes de patente a tomar y nucleo de la operacion, que recibe la lista
+# donde acumula los eventos a notificar al salir de la seccion critica
+OperacionPreparada = Tuple[List[int], Callable[[List[EventoEstacionamiento]], Any]]
+
+
+class ParkingLot(Observable[EventoEstacionamiento]):
+    """Estado y operaciones de un estacionamiento.
+
+    Cada ingreso/egreso es atomico: se serializa por patente mediante
+    lock striping y la plaza se reserva con un contador protegido, de modo
+    que operaciones sobre patentes distintas no se esperan entre si.
+
+    Las patentes ingresadas o egresadas desde el ultimo guardado se
+    registran para que guardar_estado persista solo esos cambios.
+
+    Opcionalmente (set_asignador) cada vehiculo recibe una plaza numerada
+    de un pool acorde a su superficie; sin asignador solo se cuentan plazas.
+    Con set_ocupacion_compartida la ocupacion vive en una tabla en memoria
+    compartida con puertas que corren en otros procesos.
+
+    Las patentes se normalizan al entrar ("abc-123" y "ABC123" son el mismo
+    vehiculo) y los vehiculos se guardan con la clave canonica internada.
+    Un indice secundario permite buscar por prefijo o por lecturas
+    confundibles de una camara; los egresos lo usan para conciliar una
+    lectura erronea con la unica patente activa mas cercana.
+
+    Los eventos se arman dentro de la seccion critica y se notifican al
+    salir de ella: un observador lento no demora a las demas patentes del
+    stripe y un observador puede volver a operar sobre el lote sin
+    bloquearse. Operaciones concurrentes sobre la misma patente pueden
+    notificarse en otro orden que el de su ejecucion.
+    """
+
+    def __init__(
+        self,
+        lote_id: str = LOTE_POR_DEFECTO,
+        capacidad: int = CAPACIDAD_MAXIMA_PLAZAS,
+        storage: Storage | None = None
+    ):
+        """Inicializa un estacionamiento vacio.
+
+        Args:
+            lote_id: Identificador del lote
+            capacidad: Cantidad maxima de plazas
+            storage: Backend de persistencia (default: JsonStorage)
+
+        Raises:
+            ValueError: Si la capacidad no es mayor a cero
+        """
+        if capacidad <= 0:
+            raise ValueError("La capacidad del estacionamiento debe ser mayor a cero")
+
+        # Inicializar Observable
+        Observable.__init__(self)
+
+        self._lote_id = lote_id
+        self._vehiculos_activos: Dict[str, Vehiculo] = {}
+        self._capacidad_configurada = capacidad
+        self._capacidad_maxima = capacidad
+        self._plazas_ocupadas = 0
+        self._lock_capacidad = Lock()
+        self._locks_patente = [Lock() for _ in range(CANTIDAD_STRIPES_PATENTE)]
+        self._logger = configurar_logger(type(self).__name__)
+        self._storage: Storage = storage or JsonStorage()
+        self._lock_cambios = Lock()
+        self._lock_guardado = Lock()
+        self._patentes_modificadas: Set[str] = set()
+        self._requiere_guardado_completo = True
+        self._ultimo_ticket = 0
+        self._asignador: AsignadorPlazas | None = None
+        self._ocupacion: TablaOcupacionCompartida | None = None
+        self._indice_patentes = IndicePatentes()
+        self._logger.info(f'{type(self).__name__} {lote_id} inicializado correctamente')
+
+    def get_lote_id(self) -> str:
+        """Obtiene el identificador del lote.
+
+        Returns:
+            Id del lote
+        """
+        return self._lote_id
+
+    def get_capacidad_maxima(self) -> int:
+        """Obtiene la cantidad total de plazas.
+
+        Returns:
+            Capacidad del estacionamiento
+        """
+        return self._capacidad_maxima
+
+    def ingresar_vehiculo(self, vehiculo: Vehiculo) -> None:
+        """Registra el ingreso de un vehiculo al estacionamiento.
+
+        Args:
+            vehiculo: El vehiculo que ingresa
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+            PlazasAgotadasException: Si no hay plazas disponibles
+            VehiculoYaIngresadoException: Si la patente ya esta en el estacionamiento
+        """
+        self._operar(*self._preparar_ingreso(vehiculo))
+
+    def _preparar_ingreso(self, vehiculo: Vehiculo) -> OperacionPreparada:
+        """Prepara un ingreso normalizando la patente fuera de la seccion critica.
+
+        Args:
+            vehiculo: El vehiculo que ingresa
+
+        Returns:
+            Tupla (stripes a tomar, nucleo del ingreso)
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+        """
+        try:
+            patente = self._normalizar_vehiculo(vehiculo)
+        except PatenteInvalidaException:
+            self._logger.warning(
+                f'Intento de ingreso rechazado: patente invalida. Patente: {vehiculo.get_patente()!r}'
+            )
+            raise
+        return [self._stripe(patente)], partial(self._nucleo_ingreso, vehiculo, patente)
+
+    def _nucleo_ingreso(
+        self,
+        vehiculo: Vehiculo,
+        patente: str,
+        eventos: List[EventoEstacionamiento]
+    ) -> None:
+        """Registra un ingreso (requiere el lock del stripe de la patente).
+
+        Args:
+            vehiculo: El vehiculo que ingresa
+            patente: Patente normalizada del vehiculo
+            eventos: Eventos a notificar al salir de la seccion critica
+
+        Raises:
+            PlazasAgotadasException: Si no hay plazas disponibles
+            VehiculoYaIngresadoException: Si la patente ya esta en el estacionamiento
+        """
+        hora_ingreso = datetime.now()
+        try:
+            plazas_ocupadas = self._ocupar_plaza(vehiculo, patente, hora_ingreso)
+        except VehiculoYaIngresadoException:
+            self._logger.warning(f'Intento de ingreso rechazado: patente duplicada. Patente: {patente}')
+            raise
+        if plazas_ocupadas is None:
+            self._logger.warning(
+                f'Intento de ingreso rechazado: plazas agotadas. Patente: {patente}'
+            )
+            eventos.append(PlazasAgotadasEvento(
+                timestamp=datetime.now(),
+                mensaje=f"Acceso denegado a vehiculo {patente}: Estacionamiento completo",
+                patente_rechazada=patente
+            ))
+            raise PlazasAgotadasException(self.get_plazas_disponibles())
+
+        vehiculo.set_hora_ingreso(hora_ingreso)
+        self._vehiculos_activos[patente] = vehiculo
+        self._indice_patentes.agregar(patente)
+        self._marcar_cambios((patente,))
+        self._storage.registrar_ingreso(vehiculo)
+        plazas_disponibles = self._capacidad_maxima - plazas_ocupadas
+        self._logger.info(
+            f'Vehiculo ingresado: {patente} | '
+            f'Tipo: {vehiculo.__class__.__name__} | '
+            f'Plazas ocupadas: {plazas_ocupadas}/{self._capacidad_maxima}'
+        )
+        eventos.append(VehiculoIngresoEvento(
+            timestamp=datetime.now(),
+            mensaje=f"Vehiculo {patente} ingreso al estacionamiento",
+            vehiculo=vehiculo,
+            plazas_ocupadas=plazas_ocupadas,
+            plazas_disponibles=plazas_disponibles
+        ))
+        self._verificar_capacidad_critica(
+            plazas_ocupadas, plazas_disponibles, datetime.now(), eventos
+        )
+
+    def _verificar_capacidad_critica(
+        self,
+        plazas_ocupadas: int,
+        plazas_disponibles: int,
+        timestamp: datetime,
+        eventos: List[EventoEstacionamiento]
+    ) -> None:
+        """Agrega un CapacidadCriticaEvento si queda menos del 10% disponible.
+
+        Un lote sin plazas (por ejemplo, un asignador con pools vacios) no
+        genera alertas.
+
+        Args:
+            plazas_ocupadas: Plazas ocupadas tras la operacion
+            plazas_disponibles: Plazas disponibles tras la operacion
+            timestamp: Momento de la operacion
+            eventos: Eventos a notificar al salir de la seccion critica
+        """
+        capacidad = self._capacidad_maxima
+        if capacidad <= 0 or (plazas_disponibles / capacidad) * 100 >= 10:
+            return
+        eventos.append(CapacidadCriticaEvento(
+            timestamp=timestamp,
+            mensaje="Capacidad critica alcanzada",
+            plazas_disponibles=plazas_disponibles,
+            porcentaje_ocupacion=(plazas_ocupadas / capacidad) * 100
+        ))
+
+    def _operar(self, stripes: List[int], nucleo: Callable[[List[EventoEstacionamiento]], R]) -> R:
+        """Ejecuta el nucleo de una operacion con los locks de sus stripes tomados.
+
+        Los eventos que arma el nucleo se notifican luego de soltar los
+        locks, aunque termine con una excepcion (por ejemplo, plazas
+        agotadas).
+
+        Args:
+            stripes: Stripes de patente a tomar, sin repetir y en orden
+            nucleo: Nucleo de la operacion
+
+        Returns:
+            Lo que devuelve el nucleo
+        """
+        eventos: List[EventoEstacionamiento] = []
+        locks = [self._locks_patente[stripe] for stripe in stripes]
+        for lock in locks:
+            lock.acquire()
+        try:
+            return nucleo(eventos)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+            # Fuera de la seccion critica de las patentes
+            self._notificar_eventos(eventos)
+
+    def _notificar_eventos(self, eventos: List[EventoEstacionamiento]) -> None:
+        """Notifica en orden los eventos de una operacion.
+
+        Se llama sin ningun lock de patente tomado.
+
+        Args:
+            eventos: Eventos armados dentro de la seccion critica
+        """
+        for evento in eventos:
+            self.notificar_observadores(evento)
+
+    def egresar_vehiculo(self, patente: str) -> Vehiculo:
+        """Registra el egreso de un vehiculo del estacionamiento.
+
+        Args:
+            patente: Patente del vehiculo que egresa
+
+        Returns:
+            El vehiculo que egresa
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+            VehiculoNoEncontradoException: Si el vehiculo no esta en el estacionamiento
+        """
+        vehiculo, _ = self._egresar(patente, cobrar=False)
+        return vehiculo
+
+    def cobrar_y_egresar(
+        self,
+        patente: str,
+        zona: str | None = None,
+        clase_cliente: str | None = None
+    ) -> Ticket:
+        """Cobra la estadia de un vehiculo y registra su egreso.
+
+        El precio, el ticket, el egreso y el evento se resuelven en la misma
+        seccion critica de la patente: si el calculo del precio falla el
+        vehiculo sigue estacionado, y el evento de egreso incluye el monto.
+
+        Args:
+            patente: Patente del vehiculo que egresa
+            zona: Zona del estacionamiento (para el ruteo de precios)
+            clase_cliente: Clase de cliente (para el ruteo de precios)
+
+        Returns:
+            El ticket emitido
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+            VehiculoNoEncontradoException: Si el vehiculo no esta en el estacionamiento
+        """
+        _, ticket = self._egresar(patente, cobrar=True, zona=zona, clase_cliente=clase_cliente)
+        return ticket
+
+    def _egresar(
+        self,
+        patente: str,
+        cobrar: bool,
+        zona: str | None = None,
+        clase_cliente: str | None = None
+    ) -> Tuple[Vehiculo, Ticket | None]:
+        """Registra el egreso de un vehiculo, cobrando la estadia si se pide.
+
+        Args:
+            patente: Patente del vehiculo que egresa
+            cobrar: True para calcular el precio y emitir un ticket
+            zona: Zona del estacionamiento
+            clase_cliente: Clase de cliente
+
+        Returns:
+            Tupla (vehiculo, ticket o None si no se cobro)
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+            VehiculoNoEncontradoException: Si la lectura no corresponde a un vehiculo
+                del estacionamiento (ni se pudo conciliar con uno)
+        """
+        return self._operar(*self._preparar_egreso(patente, cobrar, zona, clase_cliente))
+
+    def _preparar_egreso(
+        self,
+        patente: str,
+        cobrar: bool,
+        zona: str | None = None,
+        clase_cliente: str | None = None
+    ) -> OperacionPreparada:
+        """Prepara un egreso normalizando y conciliando la lectura fuera de la seccion critica.
+
+        Args:
+            patente: Patente leida del vehiculo que egresa
+            cobrar: True para calcular el precio y emitir un ticket
+            zona: Zona del estacionamiento
+            clase_cliente: Clase de cliente
+
+        Returns:
+            Tupla (stripes a tomar, nucleo del egreso)
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+        """
+        patente_leida = patente
+        try:
+            patente = normalizar_patente(patente)
+        except PatenteInvalidaException:
+            self._logger.error(f'Intento de egreso fallido: patente invalida. Patente: {patente!r}')
+            raise
+        lectura = patente
+        patente = self._conciliar(lectura)
+        return [self._stripe(patente)], partial(
+            self._nucleo_egreso, patente, lectura, patente_leida, cobrar, zona, clase_cliente
+        )
+
+    def _nucleo_egreso(
+        self,
+        patente: str,
+        lectura: str,
+        patente_leida: str,
+        cobrar: bool,
+        zona: str | None,
+        clase_cliente: str | None,
+        eventos: List[EventoEstacionamiento]
+    ) -> Tuple[Vehiculo, Ticket | None]:
+        """Registra un egreso (requiere el lock del stripe de la patente).
+
+        Args:
+            patente: Patente conciliada del vehiculo que egresa
+            lectura: Patente leida, normalizada
+            patente_leida: Patente tal como se leyo
+            cobrar: True para calcular el precio y emitir un ticket
+            zona: Zona del estacionamiento
+            clase_cliente: Clase de cliente
+            eventos: Eventos a notificar al salir de la seccion critica
+
+        Returns:
+            Tupla (vehiculo, ticket o None si no se cobro)
+
+        Raises:
+            VehiculoNoEncontradoException: Si la lectura no corresponde a un vehiculo
+                del estacionamiento
+        """
+        vehiculo = self._vehiculo_activo(patente)
+        if vehiculo is None:
+            self._logger.error(f'Intento de egreso fallido: vehiculo no encontrado. Patente: {lectura}')
+            raise VehiculoNoEncontradoException(lectura)
+
+        hora_egreso = datetime.now()
+        ticket = None
+        if cobrar:
+            # Se cobra antes de modificar el estado: si falla, el vehiculo sigue adentro
+            precio = PricingRegistry.get_instance().calcular_precio_versionado(
+                vehiculo, vehiculo.get_hora_ingreso(), hora_egreso, zona, clase_cliente
+            )
+            ticket = Ticket(
+                numero=self._emitir_numero_ticket(),
+                patente=patente,
+                tipo_vehiculo=vehiculo.__class__.__name__,
+                hora_ingreso=vehiculo.get_hora_ingreso(),
+                hora_egreso=hora_egreso,
+                monto=precio.monto,
+                version_precios=precio.version,
+                estrategia=precio.estrategia,
+                zona=zona,
+                clase_cliente=clase_cliente
+            )
+
+        plazas_ocupadas = self._desocupar_plaza(patente)
+        self._vehiculos_activos.pop(patente, None)
+        self._indice_patentes.quitar(patente)
+        vehiculo.set_hora_egreso(hora_egreso)
+        self._marcar_cambios((patente,))
+        self._storage.registrar_egreso(vehiculo, ticket.numero if ticket is not None else None)
+
+        tiempo_estadia = vehiculo.get_hora_egreso() - vehiculo.get_hora_ingreso()
+        detalle_cobro = f'Monto: ${ticket.monto:.2f} | ' if ticket is not None else ''
+        self._logger.info(
+            f'Vehiculo egresado: {patente} | '
+            f'Tiempo estadia: {tiempo_estadia} | '
+            f'{detalle_cobro}'
+            f'Plazas ocupadas: {plazas_ocupadas}/{self._capacidad_maxima}'
+        )
+
+        eventos.append(VehiculoEgresoEvento(
+            timestamp=datetime.now(),
+            mensaje=f"Vehiculo {patente} egreso del estacionamiento",
+            vehiculo=vehiculo,
+            plazas_ocupadas=plazas_ocupadas,
+            plazas_disponibles=self._capacidad_maxima - plazas_ocupadas,
+            tiempo_estadia=str(tiempo_estadia),
+            monto=ticket.monto if ticket is not None else None,
+            ticket=ticket,
+            patente_leida=patente_leida
+        ))
+        return vehiculo, ticket
+
+    def ingresar_lote(self, vehiculos: List[Vehiculo]) -> List[ResultadoOperacion]:
+        """Registra el ingreso de un lote de vehiculos.
+
+        Toma los locks involucrados una sola vez, reserva las plazas del lote
+        con una unica verificacion de capacidad y notifica un solo evento
+        agregado. Admite exito parcial: los vehiculos que no entran se
+        informan en el resultado sin interrumpir el resto del lote.
+
+        Args:
+            vehiculos: Vehiculos que ingresan, en orden de llegada
+
+        Returns:
+            Un resultado por vehiculo, en el mismo orden recibido
+        """
+        return self._operar(*self._preparar_ingreso_lote(vehiculos))
+
+    def _preparar_ingreso_lote(self, vehiculos: List[Vehiculo]) -> OperacionPreparada:
+        """Prepara el ingreso de un lote normalizando las patentes fuera de la seccion critica.
+
+        Args:
+            vehiculos: Vehiculos que ingresan, en orden de llegada
+
+        Returns:
+            Tupla (stripes a tomar, nucleo del ingreso del lote)
+        """
+        patentes: List[str | None] = []
+        for vehiculo in vehiculos:
+            try:
+                patentes.append(self._normalizar_vehiculo(vehiculo))
+            except PatenteInvalidaException:
+                patentes.append(None)
+        stripes = self._stripes_para(patente for patente in patentes if patente is not None)
+        return stripes, partial(self._nucleo_ingreso_lote, vehiculos, patentes)
+
+    def _nucleo_ingreso_lote(
+        self,
+        vehiculos: List[Vehiculo],
+        patentes: List[str | None],
+        eventos: List[EventoEstacionamiento]
+    ) -> List[ResultadoOperacion]:
+        """Registra el ingreso de un lote (requiere los locks de sus stripes).
+
+        Args:
+            vehiculos: Vehiculos que ingresan, en orden de llegada
+            patentes: Patente normalizada de cada vehiculo (None si es invalida)
+            eventos: Eventos a notificar al salir de la seccion critica
+
+        Returns:
+            Un resultado por vehiculo, en el mismo orden recibido
+        """
+        resultados: List[ResultadoOperacion | None] = [None] * len(vehiculos)
+
+        # Descartar patentes invalidas y duplicados (ya ingresados o repetidos en el lote)
+        candidatos = []
+        vistas = set()
+        for indice, patente in enumerate(patentes):
+            if patente is None:
+                patente_leida = vehiculos[indice].get_patente()
+                resultados[indice] = ResultadoOperacion(
+                    patente=patente_leida,
+                    exito=False,
+                    vehiculo=vehiculos[indice],
+                    error=PatenteInvalidaException(patente_leida)
+                )
+            elif patente in vistas or self._esta_activa(patente):
+                resultados[indice] = ResultadoOperacion(
+                    patente=patente,
+                    exito=False,
+                    vehiculo=vehiculos[indice],
+                    error=VehiculoYaIngresadoException(patente)
+                )
+            else:
+                vistas.add(patente)
+                candidatos.append(indice)
+
+        ahora = datetime.now()
+        if self._ocupacion is None:
+            reservadas, plazas_ocupadas = self._reservar_plazas(len(candidatos))
+            sin_plaza = [
+                indice for indice in candidatos[:reservadas]
+                if not self._asignar_plaza(vehiculos[indice])
+            ]
+            if sin_plaza:
+                plazas_ocupadas = self._liberar_plazas(len(sin_plaza))
+        else:
+            # Con tabla compartida cada vehiculo reserva su plaza (y su patente) en la tabla
+            sin_plaza = []
+            for indice in candidatos:
+                try:
+                    if self._ocupar_plaza(vehiculos[indice], patentes[indice], ahora) is None:
+                        sin_plaza.append(indice)
+                except VehiculoYaIngresadoException as error:
+                    # Otra puerta la ingreso despues de la verificacion
+                    resultados[indice] = ResultadoOperacion(
+                        patente=patentes[indice],
+                        exito=False,
+                        vehiculo=vehiculos[indice],
+                        error=error
+                    )
+            candidatos = [indice for indice in candidatos if resultados[indice] is None]
+            reservadas = len(candidatos)
+            plazas_ocupadas = self._ocupacion.get_plazas_ocupadas()
+        plazas_disponibles = self._capacidad_maxima - plazas_ocupadas
+
+        ingresados = []
+        descartados = set(sin_plaza)
+        for indice in candidatos[:reservadas]:
+            if indice in descartados:
+                continue
+            vehiculo = vehiculos[indice]
+            vehiculo.set_hora_ingreso(ahora)
+            self._vehiculos_activos[patentes[indice]] = vehiculo
+            self._indice_patentes.agregar(patentes[indice])
+            self._storage.registrar_ingreso(vehiculo)
+            ingresados.append(vehiculo)
+            resultados[indice] = ResultadoOperacion(
+                patente=patentes[indice], exito=True, vehiculo=vehiculo
+            )
+        self._marcar_cambios(vehiculo.get_patente() for vehiculo in ingresados)
+
+        rechazadas = []
+        for indice in sorted(sin_plaza + candidatos[reservadas:]):
+            rechazadas.append(patentes[indice])
+            resultados[indice] = ResultadoOperacion(
+                patente=patentes[indice],
+                exito=False,
+                vehiculo=vehiculos[indice],
+                error=PlazasAgotadasException(plazas_disponibles)
+            )
+
+        self._logger.info(
+            f'Lote ingresado: {len(ingresados)}/{len(vehiculos)} vehiculos | '
+            f'Rechazados por capacidad: {len(rechazadas)} | '
+            f'Plazas ocupadas: {plazas_ocupadas}/{self._capacidad_maxima}'
+        )
+
+        # Un unico evento agregado
+        eventos.append(LoteIngresoEvento(
+            timestamp=ahora,
+            mensaje=f"Lote de {len(ingresados)} vehiculos ingreso al estacionamiento",
+            vehiculos=ingresados,
+            patentes_rechazadas=rechazadas,
+            plazas_ocupadas=plazas_ocupadas,
+            plazas_disponibles=plazas_disponibles
+        ))
+        if ingresados:
+            self._verificar_capacidad_critica(plazas_ocupadas, plazas_disponibles, ahora, eventos)
+        return resultados
+
+    def egresar_lote(self, patentes: List[str]) -> List[ResultadoOperacion]:
+        """Registra el egreso de un lote de vehiculos.
+
+        Cada lectura que no corresponde a una patente activa se concilia
+        como en egresar_vehiculo; el evento agregado informa la lectura
+        original de las patentes conciliadas.
+
+        Args:
+            patentes: Patentes de los vehiculos que egresan
+
+        Returns:
+            Un resultado por patente, en el mismo orden recibido
+        """
+        return self._operar(*self._preparar_egreso_lote(patentes))
+
+    def _preparar_egreso_lote(self, patentes: List[str]) -> OperacionPreparada:
+        """Prepara el egreso de un lote conciliando las lecturas fuera de la seccion critica.
+
+        Args:
+            patentes: Patentes de los vehiculos que egresan
+
+        Returns:
+            Tupla (stripes a tomar, nucleo del egreso del lote)
+        """
+        claves = [self._clave(patente) for patente in patentes]
+        lecturas = {}
+        for indice, clave in enumerate(claves):
+            if clave is not None:
+                claves[indice] = self._conciliar(clave)
+                if claves[indice] != clave:
+                    lecturas[claves[indice]] = patentes[indice]
+        stripes = self._stripes_para(clave for clave in claves if clave is not None)
+        return stripes, partial(self._nucleo_egreso_lote, patentes, claves, lecturas)
+
+    def _nucleo_egreso_lote(
+        self,
+        patentes: List[str],
+        claves: List[str | None],
+        lecturas: Dict[str, str],
+        eventos: List[EventoEstacionamiento]
+    ) -> List[ResultadoOperacion]:
+        """Registra el egreso de un lote (requiere los locks de sus stripes).
+
+        Args:
+            patentes: Patentes leidas de los vehiculos que egresan
+            claves: Patente conciliada de cada lectura (None si es invalida)
+            lecturas: Lectura original de cada patente conciliada
+            eventos: Eventos a notificar al salir de la seccion critica
+
+        Returns:
+            Un resultado por patente, en el mismo orden recibido
+        """
+        resultados: List[ResultadoOperacion] = []
+        ahora = datetime.now()
+        egresados = []
+        no_encontradas = []
+        for patente_leida, patente in zip(patentes, claves):
+            if patente is None:
+                no_encontradas.append(patente_leida)
+                resultados.append(ResultadoOperacion(
+                    patente=patente_leida,
+                    exito=False,
+                    error=PatenteInvalidaException(patente_leida)
+                ))
+                continue
+
+            vehiculo = self._vehiculo_activo(patente)
+            if vehiculo is not None and self._ocupacion is not None:
+                try:
+                    self._ocupacion.egresar(patente)
+                except VehiculoNoEncontradoException:
+                    # Otra puerta lo egreso despues de la consulta
+                    vehiculo = None
+            if vehiculo is None:
+                no_encontradas.append(patente)
+                resultados.append(ResultadoOperacion(
+                    patente=patente,
+                    exito=False,
+                    error=VehiculoNoEncontradoException(patente)
+                ))
+                continue
+
+            self._vehiculos_activos.pop(patente, None)
+            self._indice_patentes.quitar(patente)
+            vehiculo.set_hora_egreso(ahora)
+            if self._asignador is not None:
+                self._asignador.liberar(patente)
+            self._storage.registrar_egreso(vehiculo)
+            egresados.append(vehiculo)
+            resultados.append(ResultadoOperacion(
+                patente=patente, exito=True, vehiculo=vehiculo
+            ))
+        lecturas_conciliadas = {
+            vehiculo.get_patente(): lecturas[vehiculo.get_patente()]
+            for vehiculo in egresados if vehiculo.get_patente() in lecturas
+        }
+
+        if self._ocupacion is None:
+            plazas_ocupadas = self._liberar_plazas(len(egresados))
+        else:
+            plazas_ocupadas = self._ocupacion.get_plazas_ocupadas()
+        self._marcar_cambios(vehiculo.get_patente() for vehiculo in egresados)
+
+        self._logger.info(
+            f'Lote egresado: {len(egresados)}/{len(patentes)} vehiculos | '
+            f'No encontrados: {len(no_encontradas)} | '
+            f'Plazas ocupadas: {plazas_ocupadas}/{self._capacidad_maxima}'
+        )
+
+        # Un unico evento agregado
+        eventos.append(LoteEgresoEvento(
+            timestamp=ahora,
+            mensaje=f"Lote de {len(egresados)} vehiculos egreso del estacionamiento",
+            vehiculos=egresados,
+            patentes_no_encontradas=no_encontradas,
+            plazas_ocupadas=plazas_ocupadas,
+            plazas_disponibles=self._capacidad_maxima - plazas_ocupadas,
+            lecturas_conciliadas=lecturas_conciliadas
+        ))
+        return resultados
+
+    def _normalizar_vehiculo(self, vehiculo: Vehiculo) -> str:
+        """Normaliza la patente de un vehiculo y se la asigna.
+
+        Args:
+            vehiculo: Vehiculo a normalizar
+
+        Returns:
+            Patente canonica (internada) del vehiculo
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+        """
+        patente = normalizar_patente(vehiculo.get_patente())
+        vehiculo.set_patente(patente)
+        return patente
+
+    def _conciliar(self, lectura: str) -> str:
+        """Resuelve una lectura normalizada de salida a la patente activa.
+
+        Si la lectura no esta activa se busca en el indice de patentes el
+        unico candidato mas cercano (confundibles mas una edicion). La
+        consulta se hace sin tomar locks: quien llama vuelve a verificar
+        la patente dentro de su seccion critica.
+
+        Args:
+            lectura: Patente normalizada tal como se leyo
+
+        Returns:
+            La patente conciliada, o la misma lectura si no hay un
+            candidato inequivoco
+        """
+        if self._esta_activa(lectura):
+            return lectura
+        conciliada = self._indice_patentes.conciliar(lectura)
+        if conciliada is None:
+            return lectura
+        self._logger.info(f'Lectura de salida {lectura} conciliada con {conciliada}')
+        return conciliada
+
+    @staticmethod
+    def _clave(patente: str) -> str | None:
+        """Obtiene la clave canonica de una patente leida.
+
+        Args:
+            patente: Patente tal como se leyo
+
+        Returns:
+            Patente normalizada, o None si no es una patente valida
+        """
+        try:
+            return normalizar_patente(patente)
+        except PatenteInvalidaException:
+            return None
+
+    @staticmethod
+    def _stripe(patente: str) -> int:
+        """Obtiene el stripe que corresponde a una patente.
+
+        Args:
+            patente: Patente del vehiculo
+
+        Returns:
+            Indice del lock que serializa las operaciones sobre esa patente
+        """
+        return hash(patente) % CANTIDAD_STRIPES_PATENTE
+
+    def _stripes_para(self, patentes: Iterable[str]) -> List[int]:
+        """Obtiene los stripes de un conjunto de patentes.
+
+        Los stripes se devuelven sin repetir y en orden, de modo que
+        adquirir sus locks en ese orden no genera deadlocks entre lotes.
+
+        Args:
+            patentes: Patentes involucradas
+
+        Returns:
+            Lista ordenada de stripes
+        """
+        return sorted({self._stripe(patente) for patente in patentes})
+
+    def _reservar_plaza(self) -> int | None:
+        """Reserva una plaza de forma atomica.
+
+        Returns:
+            Plazas ocupadas luego de la reserva, None si no hay lugar
+        """
+        with self._lock_capacidad:
+            if self._plazas_ocupadas >= self._capacidad_maxima:
+                return None
+            self._plazas_ocupadas += 1
+            return self._plazas_ocupadas
+
+    def _liberar_plaza(self) -> int:
+        """Libera una plaza de forma atomica.
+
+        Returns:
+            Plazas ocupadas luego de la liberacion
+        """
+        with self._lock_capacidad:
+            self._plazas_ocupadas -= 1
+            return self._plazas_ocupadas
+
+    def _reservar_plazas(self, cantidad: int) -> Tuple[int, int]:
+        """Reserva hasta `cantidad` plazas con una unica verificacion de capacidad.
+
+        Args:
+            cantidad: Plazas solicitadas
+
+        Returns:
+            Tupla (plazas reservadas, plazas ocupadas luego de la reserva)
+        """
+        with self._lock_capacidad:
+            reservadas = max(0, min(cantidad, self._capacidad_maxima - self._plazas_ocupadas))
+            self._plazas_ocupadas += reservadas
+            return reservadas, self._plazas_ocupadas
+
+    def _liberar_plazas(self, cantidad: int) -> int:
+        """Libera varias plazas de forma atomica.
+
+        Args:
+            cantidad: Plazas a liberar
+
+        Returns:
+            Plazas ocupadas luego de la liberacion
+        """
+        with self._lock_capacidad:
+            self._plazas_ocupadas -= cantidad
+            return self._plazas_ocupadas
+
+    def _asignar_plaza(self, vehiculo: Vehiculo) -> bool:
+        """Asigna una plaza numerada al vehiculo si hay asignador configurado.
+
+        Args:
+            vehiculo: Vehiculo que ingresa
+
+        Returns:
+            True si recibio plaza (o no hay asignador), False si no entra
+        """
+        if self._asignador is None:
+            return True
+        return self._asignador.asignar(vehiculo.get_patente(), vehiculo.get_superficie()) is not None
+
+    def _ocupar_plaza(self, vehiculo: Vehiculo, patente: str, hora_ingreso: datetime) -> int | None:
+        """Ocupa una plaza para un vehiculo que ingresa (requiere el lock del stripe de la patente).
+
+        Con tabla compartida es la tabla la que verifica la patente y la
+        capacidad para todas las puertas; si no, el contador y el asignador
+        del lote.
+
+        Args:
+            vehiculo: Vehiculo que ingresa
+            patente: Patente normalizada del vehiculo
+            hora_ingreso: Hora de ingreso
+
+        Returns:
+            Plazas ocupadas luego del ingreso, None si no hay lugar
+
+        Raises:
+            VehiculoYaIngresadoException: Si la patente ya ocupa una plaza
+        """
+        if self._ocupacion is not None:
+            tipo = vehiculo.get_tipo_vehiculo().nombre
+            if self._ocupacion.ingresar(patente, tipo, hora_ingreso) is None:
+                return None
+            return self._ocupacion.get_plazas_ocupadas()
+
+        if patente in self._vehiculos_activos:
+            raise VehiculoYaIngresadoException(patente)
+        plazas_ocupadas = self._reservar_plaza()
+        if plazas_ocupadas is not None and not self._asignar_plaza(vehiculo):
+            self._liberar_plaza()
+            return None
+        return plazas_ocupadas
+
+    def _desocupar_plaza(self, patente: str) -> int:
+        """Libera la plaza de un vehiculo que egresa (requiere el lock del stripe de la patente).
+
+        Args:
+            patente: Patente normalizada del vehiculo
+
+        Returns:
+            Plazas ocupadas luego del egreso
+
+        Raises:
+            VehiculoNoEncontradoException: Si otra puerta ya egreso el vehiculo
+                de la tabla compartida
+        """
+        if self._ocupacion is not None:
+            self._ocupacion.egresar(patente)
+            return self._ocupacion.get_plazas_ocupadas()
+        if self._asignador is not None:
+            self._asignador.liberar(patente)
+        return self._liberar_plaza()
+
+    def _esta_activa(self, patente: str) -> bool:
+        """Indica si una patente normalizada ocupa una plaza (en cualquier puerta)."""
+        if self._ocupacion is not None:
+            return self._ocupacion.get_plaza(patente) is not None
+        return patente in self._vehiculos_activos
+
+    def _vehiculo_activo(self, patente: str) -> Vehiculo | None:
+        """Obtiene el vehiculo estacionado con una patente normalizada.
+
+        Args:
+            patente: Patente normalizada
+
+        Returns:
+            El vehiculo, o None si no esta en el estacionamiento
+        """
+        if self._ocupacion is None:
+            return self._vehiculos_activos.get(patente)
+        ocupante = self._ocupacion.get_ocupante(patente)
+        return None if ocupante is None else self._vehiculo_de_ocupante(ocupante)
+
+    def _vehiculo_de_ocupante(self, ocupante: OcupantePlaza) -> Vehiculo:
+        """Obtiene el vehiculo de un ocupante de la tabla compartida.
+
+        Si ingreso por este proceso (misma patente y hora de ingreso) es el
+        mismo objeto; si ingreso por la puerta de otro proceso se
+        reconstruye con el tipo y la hora de ingreso de la tabla.
+
+        Args:
+            ocupante: Registro de la tabla compartida
+
+        Returns:
+            El vehiculo estacionado
+        """
+        vehiculo = self._vehiculos_activos.get(ocupante.patente)
+        if vehiculo is not None and vehiculo.get_hora_ingreso() == ocupante.hora_ingreso:
+            return vehiculo
+        vehiculo = VehiculoFactory.crear_vehiculo(ocupante.tipo, ocupante.patente)
+        if ocupante.hora_ingreso is not None:
+            vehiculo.set_hora_ingreso(ocupante.hora_ingreso)
+        return vehiculo
+
+    def _emitir_numero_ticket(self) -> int:
+        """Obtiene el numero del proximo ticket.
+
+        El ultimo numero emitido se persiste con el estado, de modo que la
+        numeracion continua luego de cargar_estado.
+
+        Returns:
+            Numero correlativo del ticket
+        """
+        with self._lock_cambios:
+            self._ultimo_ticket += 1
+            return self._ultimo_ticket
+
+    def _marcar_cambios(self, patentes: Iterable[str]) -> None:
+        """Registra patentes cuyo estado cambio desde el ultimo guardado.
+
+        Args:
+            patentes: Patentes ingresadas, egresadas o modificadas
+        """
+        with self._lock_cambios:
+            self._patentes_modificadas.update(patentes)
+
+    def get_cambios_pendientes(self) -> int:
+        """Obtiene la cantidad de patentes con cambios sin guardar.
+
+        Returns:
+            Numero de patentes modificadas desde el ultimo guardado
+        """
+        return len(self._patentes_modificadas)
+
+    def get_plazas_disponibles(self) -> int:
+        """Obtiene la cantidad de plazas disponibles.
+
+        Returns:
+            Numero de plazas libres
+        """
+        return self._capacidad_maxima - self.get_plazas_ocupadas()
+
+    def get_plazas_ocupadas(self) -> int:
+        """Obtiene la cantidad de plazas ocupadas.
+
+        Returns:
+            Numero de plazas ocupadas (de todas las puertas con tabla compartida)
+        """
+        if self._ocupacion is not None:
+            return self._ocupacion.get_plazas_ocupadas()
+        return self._plazas_ocupadas
+
+    def get_plaza(self, patente: str) -> int | None:
+        """Obtiene la plaza numerada que ocupa un vehiculo.
+
+        Args:
+            patente: Patente del vehiculo
+
+        Returns:
+            Numero de plaza, o None si no hay asignador ni tabla compartida o
+            el vehiculo no esta
+        """
+        clave = self._clave(patente)
+        if clave is None:
+            return None
+        if self._ocupacion is not None:
+            return self._ocupacion.get_plaza(clave)
+        return None if self._asignador is None else self._asignador.get_plaza(clave)
+
+    def get_asignador(self) -> AsignadorPlazas | None:
+        """Obtiene el asignador de plazas configurado.
+
+        Returns:
+            El asignador, o None si solo se cuentan plazas
+        """
+        return self._asignador
+
+    def set_asignador(self, asignador: AsignadorPlazas | None) -> None:
+        """Configura la asignacion de plazas numeradas.
+
+        La capacidad pasa a ser la cantidad de plazas del asignador (o la
+        capacidad configurada del lote al quitarlo). Solo puede cambiarse con el
+        estacionamiento vacio.
+
+        Args:
+            asignador: Asignador de plazas, o None para solo contar plazas
+
+        Raises:
+            ValueError: Si hay vehiculos estacionados o hay una tabla compartida configurada
+        """
+        with self._lock_capacidad:
+            if self._vehiculos_activos:
+                raise ValueError("El asignador de plazas solo puede cambiarse con el estacionamiento vacio")
+            if asignador is not None and self._ocupacion is not None:
+                raise ValueError("La tabla de ocupacion compartida ya numera las plazas")
+            if asignador is not None:
+                asignador.limpiar()
+                self._capacidad_maxima = asignador.get_capacidad()
+            else:
+                self._capacidad_maxima = self._capacidad_configurada
+            self._asignador = asignador
+
+    def get_ocupacion_compartida(self) -> TablaOcupacionCompartida | None:
+        """Obtiene la tabla de ocupacion compartida configurada.
+
+        Returns:
+            La tabla, o None si la ocupacion es solo de este proceso
+        """
+        return self._ocupacion
+
+    def set_ocupacion_compartida(self, tabla: TablaOcupacionCompartida | None) -> None:
+        """Comparte la ocupacion del lote con puertas que corren en otros procesos.
+
+        La tabla pasa a decidir la admision, la plaza y la ocupacion de todas
+        las puertas: la capacidad es la de la tabla, una patente no puede
+        ingresar por dos puertas a la vez y un vehiculo puede egresar por
+        cualquiera (si ingreso por otro proceso se reconstruye con el tipo y
+        la hora de ingreso de la tabla). Las busquedas por patente similar y
+        la conciliacion de lecturas solo consideran los vehiculos que
+        ingresaron por este proceso, y guardar_estado siempre es completo.
+        Solo puede cambiarse con el estacionamiento vacio.
+
+        Args:
+            tabla: Tabla compartida, o None para volver a la ocupacion local
+
+        Raises:
+            ValueError: Si hay vehiculos estacionados o un asignador de plazas
+        """
+        with self._lock_capacidad:
+            if self._vehiculos_activos:
+                raise ValueError("La ocupacion compartida solo puede cambiarse con el estacionamiento vacio")
+            if tabla is not None and self._asignador is not None:
+                raise ValueError("La tabla de ocupacion compartida no se combina con un asignador de plazas")
+            if tabla is not None:
+                self._capacidad_maxima = tabla.get_capacidad()
+            else:
+                self._capacidad_maxima = self._capacidad_configurada
+            self._ocupacion = tabla
+        with self._lock_cambios:
+            self._requiere_guardado_completo = True
+
+    def get_vehiculo(self, patente: str) -> Vehiculo | None:
+        """Busca un vehiculo en el estacionamiento.
+
+        Args:
+            patente: Patente del vehiculo a buscar
+
+        Returns:
+            El vehiculo si esta en el estacionamiento, None si no
+        """
+        clave = self._clave(patente)
+        return None if clave is None else self._vehiculo_activo(clave)
+
+    def buscar_por_prefijo(self, prefijo: str, limite: int | None = None) -> List[Vehiculo]:
+        """Busca vehiculos cuya patente empieza con un prefijo.
+
+        Args:
+            prefijo: Comienzo de la patente (se ignoran mayusculas y separadores)
+            limite: Maximo de resultados (default: sin limite)
+
+        Returns:
+            Vehiculos encontrados, ordenados por patente
+        """
+        return self._vehiculos_de(self._indice_patentes.buscar_por_prefijo(prefijo, limite))
+
+    def buscar_confundibles(self, patente: str) -> List[Vehiculo]:
+        """Busca vehiculos cuya patente una camara podria haber leido asi.
+
+        Considera confundibles O/0, I/1, B/8, S/5, etc. Sirve para resolver
+        lecturas erroneas en la salida.
+
+        Args:
+            patente: Patente tal como la leyo la camara
+
+        Returns:
+            Vehiculos candidatos, ordenados por patente
+        """
+        return self._vehiculos_de(self._indice_patentes.buscar_confundibles(patente))
+
+    def buscar_similares(
+        self,
+        patente: str,
+        distancia_maxima: int = DISTANCIA_MAXIMA_SIMILITUD,
+        limite: int = CANDIDATOS_SIMILITUD
+    ) -> List[Vehiculo]:
+        """Busca los vehiculos cuya patente mas se parece a una lectura.
+
+        Tolera caracteres confundibles y hasta distancia_maxima letras o
+        digitos de mas, de menos o cambiados.
+
+        Args:
+            patente: Patente tal como la leyo la camara
+            distancia_maxima: Ediciones toleradas ademas de los confundibles
+            limite: Maximo de candidatos
+
+        Returns:
+            Vehiculos candidatos, del mas parecido al menos parecido
+        """
+        coincidencias = self._indice_patentes.buscar_similares(patente, distancia_maxima, limite)
+        return self._vehiculos_de([coincidencia.patente for coincidencia in coincidencias])
+
+    def conciliar_patente(self, patente: str) -> str | None:
+        """Resuelve una lectura de camara a la patente activa que le corresponde.
+
+        Es la misma conciliacion que aplican los egresos.
+
+        Args:
+            patente: Patente tal como la leyo la camara
+
+        Returns:
+            La patente exacta si esta activa; si no, el unico candidato mas
+            cercano; None si no hay candidatos o el mejor es ambiguo
+        """
+        return self._indice_patentes.conciliar(patente)
+
+    def _vehiculos_de(self, patentes: List[str]) -> List[Vehiculo]:
+        """Obtiene los vehiculos activos de una lista de patentes normalizadas."""
+        if self._ocupacion is not None:
+            vehiculos = [self._vehiculo_activo(patente) for patente in patentes]
+            return [vehiculo for vehiculo in vehiculos if vehiculo is not None]
+        activos = self._vehiculos_activos
+        return [activos[patente] for patente in patentes if patente in activos]
+
+    def get_todos_vehiculos(self) -> Dict[str, Vehiculo]:
+        """Obtiene todos los vehiculos activos.
+
+        Con tabla compartida incluye los que ingresaron por otros procesos.
+
+        Returns:
+            Diccionario de vehiculos activos (copia defensiva)
+        """
+        if self._ocupacion is not None:
+            return {
+                ocupante.patente: self._vehiculo_de_ocupante(ocupante)
+                for ocupante in self._ocupacion.get_ocupantes()
+            }
+        return self._vehiculos_activos.copy()
+
+    def reset(self) -> None:
+        """Resetea el estado del estacionamiento.
+
+        Util para testing o limpieza. Con tabla compartida solo limpia este
+        proceso: la tabla es de todas las puertas.
+        """
+        with self._lock_capacidad:
+            self._vehiculos_activos.clear()
+            self._indice_patentes.limpiar()
+            self._plazas_ocupadas = 0
+            if self._asignador is not None:
+                self._asignador.limpiar()
+        with self._lock_cambios:
+            self._patentes_modificadas.clear()
+            self._requiere_guardado_completo = True
+
+    def set_storage(self, storage: Storage) -> None:
+        """Configura el mecanismo de persistencia del estado.
+
+        Los backends incrementales (journal, SQLite) registran cada ingreso
+        y egreso dentro de su seccion critica; los de snapshot (JSON) solo
+        persisten al llamar a guardar_estado.
+
+        Args:
+            storage: Backend de persistencia a utilizar
+        """
+        if storage is not self._storage:
+            self._storage.cerrar()
+        self._storage = storage
+        # El nuevo backend no conoce el estado actual: el proximo guardado es completo
+        with self._lock_cambios:
+            self._requiere_guardado_completo = True
+
+    def guardar_estado(self, completo: bool = False) -> bool:
+        """Guarda el estado actual del estacionamiento.
+
+        Por defecto solo persiste las patentes que cambiaron desde el ultimo
+        guardado. El guardado es completo la primera vez, luego de reset o
+        de cambiar de backend, o si se pide explicitamente.
+
+        Args:
+            completo: True para reescribir el estado completo
+
+        Returns:
+            True si se guardó correctamente, False si hubo error
+        """
+        # Un guardado a la vez: los deltas deben aplicarse en orden
+        with self._lock_guardado:
+            with self._lock_cambios:
+                cambios = self._patentes_modificadas
+                self._patentes_modificadas = set()
+                # Con tabla compartida los cambios de las demas puertas no se registran aca
+                completo = completo or self._requiere_guardado_completo or self._ocupacion is not None
+                self._requiere_guardado_completo = False
+
+            if completo:
+                resultado = self._storage.guardar_estado({
+                    'plazas_ocupadas': self.get_plazas_ocupadas(),
+                    'capacidad_maxima': self._capacidad_maxima,
+                    'ultimo_ticket': self._ultimo_ticket,
+                    'vehiculos': self.get_todos_vehiculos()
+                })
+            else:
+                modificados = {}
+                eliminados = []
+                for patente in cambios:
+                    vehiculo = self._vehiculos_activos.get(patente)
+                    if vehiculo is None:
+                        eliminados.append(patente)
+                    else:
+                        modificados[patente] = vehiculo
+                resultado = self._storage.guardar_delta(
+                    {
+                        'plazas_ocupadas': self._plazas_ocupadas,
+                        'capacidad_maxima': self._capacidad_maxima,
+                        'ultimo_ticket': self._ultimo_ticket,
+                        'vehiculos': self._vehiculos_activos
+                    },
+                    modificados,
+                    eliminados
+                )
+
+            if not resultado:
+                # Conservar los cambios para reintentarlos en el proximo guardado
+                with self._lock_cambios:
+                    self._patentes_modificadas |= cambios
+                    self._requiere_guardado_completo |= completo
+        return resultado
+
+    def cargar_estado(self) -> bool:
+        """Carga el estado del estacionamiento desde archivo.
+
+        Las plazas ocupadas se recalculan con los vehiculos restaurados: los
+        registros con patente invalida o repetida tras normalizarla no
+        ocupan plaza aunque el contador guardado los incluya. Con tabla
+        compartida los vehiculos restaurados se registran en la tabla.
+
+        Returns:
+            True si se cargó correctamente, False si no existe o hay error
+        """
+        estado = self._storage.cargar_estado()
+        if estado is None:
+            self._logger.warning('No se pudo cargar estado, iniciando vacío')
+            return False
+
+        try:
+            # Restaurar estado básico
+            if self._asignador is not None:
+                self._asignador.limpiar()
+            elif self._ocupacion is None:
+                self._capacidad_maxima = estado.get('capacidad_maxima', self._capacidad_configurada)
+            with self._lock_cambios:
+                # Nunca retroceder: un numero ya emitido no se reutiliza
+                self._ultimo_ticket = max(self._ultimo_ticket, estado.get('ultimo_ticket', 0))
+
+            # Restaurar vehículos
+            self._vehiculos_activos.clear()
+            self._indice_patentes.limpiar()
+            tipos_registrados = set(VehiculoFactory.get_tipos())
+            vehiculos_data = []
+            for vehiculo_data in estado.get('vehiculos_data', []):
+                if vehiculo_data.get('tipo') in tipos_registrados and 'patente' in vehiculo_data:
+                    vehiculos_data.append(vehiculo_data)
+                else:
+                    self._logger.error(f'Error al restaurar vehículo {vehiculo_data.get("patente")}: '
+                                       f'tipo desconocido {vehiculo_data.get("tipo")}')
+
+            # Recrear todos los vehículos de una vez usando factory
+            vehiculos = VehiculoFactory.crear_vehiculos(
+                [vehiculo_data['tipo'] for vehiculo_data in vehiculos_data],
+                [vehiculo_data['patente'] for vehiculo_data in vehiculos_data]
+            )
+
+            for vehiculo_data, vehiculo in zip(vehiculos_data, vehiculos):
+                patente = vehiculo.get_patente()
+                try:
+                    patente = self._normalizar_vehiculo(vehiculo)
+                    if patente in self._vehiculos_activos:
+                        self._logger.error(f'Vehiculo repetido en el estado guardado: {patente}')
+                        continue
+
+                    # Restaurar timestamps (ISO en JSON, datetime en formato binario)
+                    hora_ingreso = vehiculo_data.get('hora_ingreso')
+                    if hora_ingreso:
+                        if isinstance(hora_ingreso, str):
+                            hora_ingreso = datetime.fromisoformat(hora_ingreso)
+                        vehiculo.set_hora_ingreso(hora_ingreso)
+
+                    hora_egreso = vehiculo_data.get('hora_egreso')
+                    if hora_egreso:
+                        if isinstance(hora_egreso, str):
+                            hora_egreso = datetime.fromisoformat(hora_egreso)
+                        vehiculo.set_hora_egreso(hora_egreso)
+
+                    if self._ocupacion is not None and self._ocupacion.ingresar(
+                        patente, vehiculo.get_tipo_vehiculo().nombre, vehiculo.get_hora_ingreso()
+                    ) is None:
+                        self._logger.warning(f'Vehiculo restaurado sin lugar en la tabla compartida: {patente}')
+                        continue
+
+                    self._vehiculos_activos[patente] = vehiculo
+                    self._indice_patentes.agregar(patente)
+                    if not self._asignar_plaza(vehiculo):
+                        self._logger.warning(f'Vehiculo restaurado sin plaza asignada: {patente}')
+
+                except Exception as e:
+                    self._logger.error(f'Error al restaurar vehículo {patente}: {e}')
+
+            with self._lock_capacidad:
+                self._plazas_ocupadas = len(self._vehiculos_activos)
+            if self._plazas_ocupadas != estado.get('plazas_ocupadas', self._plazas_ocupadas):
+                self._logger.warning(
+                    f'Plazas ocupadas guardadas ({estado.get("plazas_ocupadas")}) distintas de los '
+                    f'vehiculos restaurados ({self._plazas_ocupadas})'
+                )
+
+            # El backend ya contiene lo cargado: los proximos guardados son incrementales
+            with self._lock_cambios:
+                self._patentes_modificadas.clear()
+                self._requiere_guardado_completo = False
+
+            self._logger.info(f'Estado cargado: {self._plazas_ocupadas} plazas ocupadas, {len(self._vehiculos_activos)} vehículos')
+            return True
+
+        except Exception as e:
+            self._logger.error(f'Error al restaurar estado: {e}')
+            return False
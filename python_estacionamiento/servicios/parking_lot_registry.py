@@ -0,0 +1,289 @@
+"""Parking Lot Registry - Singleton.
+
+Administra varios lotes (o niveles) independientes en un mismo servicio y
+rutea cada puerta al lote que le corresponde.
+"""
+
+# Standard library
+from __future__ import annotations
+from threading import Lock
+from typing import Dict, List, Tuple
+
+# Local application
+from python_estacionamiento.constantes import CAPACIDAD_MAXIMA_PLAZAS
+from python_estacionamiento.entidades.ticket import Ticket
+from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+from python_estacionamiento.excepciones.estacionamiento_exception import LoteNoEncontradoException
+from python_estacionamiento.persistencia.json_storage import JsonStorage
+from python_estacionamiento.persistencia.storage import Storage
+from python_estacionamiento.servicios.parking_lot import ParkingLot
+from python_estacionamiento.utils.logger import configurar_logger
+
+
+class ParkingLotRegistry:
+    """Registro Singleton de lotes de estacionamiento.
+
+    Cada lote es un ParkingLot con sus propios locks, capacidad,
+    persistencia y observadores, por lo que operaciones en lotes distintos
+    no compiten entre si.
+
+    Los lotes y las puertas se publican como diccionarios inmutables que se
+    reemplazan con una unica asignacion (copy-on-write): rutear una puerta
+    no toma locks. Las consultas agregadas suman los contadores de cada
+    lote sin recorrer vehiculos.
+    """
+
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        """Implementacion del patron Singleton.
+
+        Garantiza que solo exista una instancia del registro.
+        Usa double-checked locking para thread-safety.
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Inicializa el registro de lotes.
+
+        Se ejecuta solo una vez gracias al patron Singleton.
+        """
+        # Evitar re-inicializacion en Singleton
+        if hasattr(self, '_initialized'):
+            return
+
+        self._initialized = True
+        self._lock_cambios = Lock()
+        self._lotes: Dict[str, ParkingLot] = {}
+        self._puertas: Dict[str, ParkingLot] = {}
+        self._logger = configurar_logger('ParkingLotRegistry')
+
+    @classmethod
+    def get_instance(cls):
+        """Obtiene la instancia unica del registro.
+
+        Returns:
+            La instancia Singleton del registro
+        """
+        if cls._instance is None:
+            cls()
+        return cls._instance
+
+    def crear_lote(
+        self,
+        lote_id: str,
+        capacidad: int = CAPACIDAD_MAXIMA_PLAZAS,
+        storage: Storage | None = None
+    ) -> ParkingLot:
+        """Crea y registra un lote nuevo.
+
+        Args:
+            lote_id: Identificador del lote
+            capacidad: Cantidad maxima de plazas
+            storage: Backend de persistencia (default: un JSON propio del lote)
+
+        Returns:
+            El lote creado
+
+        Raises:
+            ValueError: Si ya hay un lote con ese id o la capacidad no es mayor a cero
+        """
+        storage = storage or JsonStorage(archivo=f"estacionamiento_{lote_id}.json")
+        lote = ParkingLot(lote_id, capacidad, storage)
+        self.registrar_lote(lote)
+        return lote
+
+    def registrar_lote(self, lote: ParkingLot) -> None:
+        """Registra un lote existente (por ejemplo, ParkingLotManager).
+
+        Args:
+            lote: Lote a registrar
+
+        Raises:
+            ValueError: Si ya hay un lote con ese id
+        """
+        lote_id = lote.get_lote_id()
+        with self._lock_cambios:
+            if lote_id in self._lotes:
+                raise ValueError(f"Ya existe un lote con id {lote_id}")
+            self._lotes = {**self._lotes, lote_id: lote}
+        self._logger.info(f'Lote registrado: {lote_id} | Capacidad: {lote.get_capacidad_maxima()}')
+
+    def eliminar_lote(self, lote_id: str) -> ParkingLot:
+        """Quita un lote del registro junto con sus puertas.
+
+        Args:
+            lote_id: Identificador del lote
+
+        Returns:
+            El lote quitado
+
+        Raises:
+            LoteNoEncontradoException: Si el lote no esta registrado
+        """
+        with self._lock_cambios:
+            lote = self._lotes.get(lote_id)
+            if lote is None:
+                raise LoteNoEncontradoException(lote_id)
+            self._lotes = {k: v for k, v in self._lotes.items() if k != lote_id}
+            self._puertas = {k: v for k, v in self._puertas.items() if v is not lote}
+        return lote
+
+    def asignar_puerta(self, puerta_id: str, lote_id: str) -> None:
+        """Rutea una puerta a un lote.
+
+        Args:
+            puerta_id: Identificador de la puerta
+            lote_id: Lote al que pertenece la puerta
+
+        Raises:
+            LoteNoEncontradoException: Si el lote no esta registrado
+        """
+        with self._lock_cambios:
+            lote = self._lotes.get(lote_id)
+            if lote is None:
+                raise LoteNoEncontradoException(lote_id)
+            self._puertas = {**self._puertas, puerta_id: lote}
+
+    def get_lote(self, lote_id: str) -> ParkingLot:
+        """Obtiene un lote por su id.
+
+        Args:
+            lote_id: Identificador del lote
+
+        Returns:
+            El lote
+
+        Raises:
+            LoteNoEncontradoException: Si el lote no esta registrado
+        """
+        lote = self._lotes.get(lote_id)
+        if lote is None:
+            raise LoteNoEncontradoException(lote_id)
+        return lote
+
+    def get_lote_de_puerta(self, puerta_id: str) -> ParkingLot:
+        """Obtiene el lote al que rutea una puerta.
+
+        Args:
+            puerta_id: Identificador de la puerta
+
+        Returns:
+            El lote de la puerta
+
+        Raises:
+            LoteNoEncontradoException: Si la puerta no esta asignada
+        """
+        lote = self._puertas.get(puerta_id)
+        if lote is None:
+            raise LoteNoEncontradoException(puerta_id)
+        return lote
+
+    def get_lotes(self) -> List[ParkingLot]:
+        """Obtiene los lotes registrados.
+
+        Returns:
+            Lotes en orden de registro
+        """
+        return list(self._lotes.values())
+
+    def ingresar_por_puerta(self, puerta_id: str, vehiculo: Vehiculo) -> ParkingLot:
+        """Registra un ingreso en el lote de la puerta.
+
+        Args:
+            puerta_id: Puerta por la que ingresa el vehiculo
+            vehiculo: El vehiculo que ingresa
+
+        Returns:
+            El lote en el que ingreso
+
+        Raises:
+            LoteNoEncontradoException: Si la puerta no esta asignada
+            PlazasAgotadasException: Si el lote no tiene plazas disponibles
+            VehiculoYaIngresadoException: Si la patente ya esta en el lote
+        """
+        lote = self.get_lote_de_puerta(puerta_id)
+        lote.ingresar_vehiculo(vehiculo)
+        return lote
+
+    def egresar_por_puerta(self, puerta_id: str, patente: str) -> Vehiculo:
+        """Registra un egreso en el lote de la puerta.
+
+        Args:
+            puerta_id: Puerta por la que egresa el vehiculo
+            patente: Patente del vehiculo que egresa
+
+        Returns:
+            El vehiculo que egresa
+
+        Raises:
+            LoteNoEncontradoException: Si la puerta no esta asignada
+            VehiculoNoEncontradoException: Si el vehiculo no esta en el lote
+        """
+        return self.get_lote_de_puerta(puerta_id).egresar_vehiculo(patente)
+
+    def cobrar_y_egresar_por_puerta(
+        self,
+        puerta_id: str,
+        patente: str,
+        clase_cliente: str | None = None
+    ) -> Ticket:
+        """Cobra y registra un egreso en el lote de la puerta.
+
+        El id del lote se usa como zona para el ruteo de precios.
+
+        Args:
+            puerta_id: Puerta por la que egresa el vehiculo
+            patente: Patente del vehiculo que egresa
+            clase_cliente: Clase de cliente (para el ruteo de precios)
+
+        Returns:
+            El ticket emitido
+
+        Raises:
+            LoteNoEncontradoException: Si la puerta no esta asignada
+            VehiculoNoEncontradoException: Si el vehiculo no esta en el lote
+        """
+        lote = self.get_lote_de_puerta(puerta_id)
+        return lote.cobrar_y_egresar(patente, zona=lote.get_lote_id(), clase_cliente=clase_cliente)
+
+    def get_ocupacion(self) -> Dict[str, Tuple[int, int]]:
+        """Obtiene la ocupacion de cada lote.
+
+        Returns:
+            Diccionario lote_id -> (plazas ocupadas, capacidad)
+        """
+        return {
+            lote_id: (lote.get_plazas_ocupadas(), lote.get_capacidad_maxima())
+            for lote_id, lote in self._lotes.items()
+        }
+
+    def get_plazas_ocupadas(self) -> int:
+        """Obtiene las plazas ocupadas sumando todos los lotes.
+
+        Returns:
+            Total de plazas ocupadas
+        """
+        return sum(lote.get_plazas_ocupadas() for lote in self._lotes.values())
+
+    def get_plazas_disponibles(self) -> int:
+        """Obtiene las plazas disponibles sumando todos los lotes.
+
+        Returns:
+            Total de plazas libres
+        """
+        return sum(lote.get_plazas_disponibles() for lote in self._lotes.values())
+
+    def reset(self) -> None:
+        """Quita todos los lotes y puertas.
+
+        Util para testing o limpieza.
+        """
+        with self._lock_cambios:
+            self._lotes = {}
+            self._puertas = {}
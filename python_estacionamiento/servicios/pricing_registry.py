@@ -5,13 +5,24 @@ Gestiona las estrategias de precio de forma centralizada.
 
 # Standard library
 from __future__ import annotations
+from collections import OrderedDict
 from threading import Lock
-from datetime import datetime
+from typing import List, Sequence, Tuple
+from datetime import datetime, timedelta
 
 # Local application
+from python_estacionamiento.constantes import (
+    CAPACIDAD_CACHE_COTIZACIONES,
+    VERSIONES_PRECIOS_CONSERVADAS
+)
 from python_estacionamiento.patrones.strategy.pricing_strategy import PricingStrategy
 from python_estacionamiento.patrones.strategy.impl.pricing_standard_strategy import PricingStandardStrategy
+from python_estacionamiento.patrones.strategy.impl.pricing_pipeline_strategy import PricingPipelineStrategy
+from python_estacionamiento.patrones.strategy.pipeline_precios import ModificadorPrecio
+from python_estacionamiento.patrones.strategy.ruteo_estrategias import ReglaRuteo, TablaRuteo
+from python_estacionamiento.patrones.strategy.snapshot_precios import PrecioVersionado, SnapshotPrecios
 from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+from python_estacionamiento.utils.cache_lru import CacheLRU, MetricasCache
 
 
 class PricingRegistry:
@@ -19,6 +30,17 @@ class PricingRegistry:
 
     Implementa el patron Singleton con thread-safety para gestionar
     la estrategia de precio activa.
+
+    Ademas de la estrategia por defecto, una tabla de ruteo puede asignar
+    estrategias distintas por tipo de vehiculo, zona o clase de cliente.
+    Estrategia y tabla se publican juntas en un SnapshotPrecios inmutable y
+    versionado, con una unica asignacion de referencia (copy-on-write):
+    cada calculo lee la foto vigente sin tomar locks y nunca ve una mezcla.
+    Las ultimas fotos se conservan para recalcular precios en auditorias.
+
+    Las cotizaciones (cuanto se debe hasta ahora) se memorizan por version,
+    estrategia, tipo, tarifa, tolerancia y minutos cobrables; cambiar la
+    estrategia o el ruteo invalida el cache.
     """
 
     _instance = None
@@ -46,7 +68,16 @@ class PricingRegistry:
             return
 
         self._initialized = True
-        self._estrategia_actual: PricingStrategy = PricingStandardStrategy()
+        self._lock_estrategia = Lock()
+        self._cache_cotizaciones: CacheLRU[float] = CacheLRU(CAPACIDAD_CACHE_COTIZACIONES)
+        self._historial: OrderedDict[int, SnapshotPrecios] = OrderedDict()
+        self._snapshot = SnapshotPrecios(
+            version=1,
+            estrategia=PricingStandardStrategy(),
+            ruteo=TablaRuteo(),
+            publicado=datetime.now()
+        )
+        self._historial[self._snapshot.version] = self._snapshot
 
     @classmethod
     def get_instance(cls):
@@ -65,7 +96,108 @@ class PricingRegistry:
         Args:
             estrategia: La nueva estrategia de precio
         """
-        self._estrategia_actual = estrategia
+        with self._lock_estrategia:
+            self._publicar(estrategia, self._snapshot.ruteo)
+
+    def set_ruteo(self, reglas: Sequence[ReglaRuteo]) -> TablaRuteo:
+        """Reemplaza las reglas de ruteo por tipo, zona y clase de cliente.
+
+        La tabla se construye antes del reemplazo, por lo que los calculos
+        en curso no esperan. Las combinaciones sin regla usan la estrategia
+        por defecto.
+
+        Args:
+            reglas: Reglas de ruteo (lista vacia: sin ruteo)
+
+        Returns:
+            La tabla construida y activada
+
+        Raises:
+            TypeError: Si alguna regla no es un ReglaRuteo
+        """
+        tabla = TablaRuteo(reglas)
+        with self._lock_estrategia:
+            self._publicar(self._snapshot.estrategia, tabla)
+        return tabla
+
+    def get_ruteo(self) -> TablaRuteo:
+        """Obtiene la tabla de ruteo vigente.
+
+        Returns:
+            Tabla de ruteo activa
+        """
+        return self._snapshot.ruteo
+
+    def get_snapshot(self, version: int | None = None) -> SnapshotPrecios:
+        """Obtiene una foto de la configuracion de precios.
+
+        Args:
+            version: Version buscada (default: la vigente)
+
+        Returns:
+            Foto de precios de esa version
+
+        Raises:
+            ValueError: Si la version ya no se conserva o no existe
+        """
+        snapshot = self._snapshot
+        if version is None or version == snapshot.version:
+            return snapshot
+
+        with self._lock_estrategia:
+            snapshot = self._historial.get(version)
+        if snapshot is None:
+            raise ValueError(f"La version de precios {version} no esta disponible")
+        return snapshot
+
+    def get_versiones(self) -> List[int]:
+        """Obtiene las versiones de precios conservadas.
+
+        Returns:
+            Versiones disponibles, de la mas antigua a la vigente
+        """
+        with self._lock_estrategia:
+            return list(self._historial)
+
+    def _publicar(self, estrategia: PricingStrategy, ruteo: TablaRuteo) -> None:
+        """Publica una nueva foto de estrategia y ruteo.
+
+        Debe llamarse con _lock_estrategia tomado.
+
+        Args:
+            estrategia: Estrategia por defecto
+            ruteo: Tabla de ruteo
+        """
+        snapshot = SnapshotPrecios(
+            version=self._snapshot.version + 1,
+            estrategia=estrategia,
+            ruteo=ruteo,
+            publicado=datetime.now()
+        )
+        self._historial[snapshot.version] = snapshot
+        while len(self._historial) > VERSIONES_PRECIOS_CONSERVADAS:
+            self._historial.popitem(last=False)
+        self._snapshot = snapshot
+        self._cache_cotizaciones.limpiar()
+
+    def set_pipeline(self, *modificadores: ModificadorPrecio) -> PricingPipelineStrategy:
+        """Compila un pipeline de modificadores y lo activa.
+
+        La compilacion ocurre antes del reemplazo, por lo que los calculos
+        en curso no esperan y un pipeline invalido no altera el activo.
+
+        Args:
+            modificadores: Modificadores en orden de aplicacion
+
+        Returns:
+            La estrategia compilada y activada
+
+        Raises:
+            ValueError: Si el pipeline no es valido
+        """
+        estrategia = PricingPipelineStrategy(*modificadores)
+        self.set_estrategia(estrategia)
+        return estrategia
 
     def get_estrategia(self) -> PricingStrategy:
         """Obtiene la estrategia de precio actual.
@@ -73,22 +205,179 @@ class PricingRegistry:
         Returns:
             La estrategia activa
         """
-        return self._estrategia_actual
+        return self._snapshot.estrategia
+
+    def get_estrategia_para(
+        self,
+        vehiculo: Vehiculo,
+        zona: str | None = None,
+        clase_cliente: str | None = None
+    ) -> PricingStrategy:
+        """Obtiene la estrategia que corresponde a una estadia.
+
+        Args:
+            vehiculo: El vehiculo estacionado
+            zona: Zona del estacionamiento
+            clase_cliente: Clase de cliente
+
+        Returns:
+            Estrategia ruteada, o la estrategia por defecto si ninguna regla aplica
+        """
+        return self._snapshot.resolver(vehiculo, zona, clase_cliente)
 
     def calcular_precio(
         self,
         vehiculo: Vehiculo,
         hora_ingreso: datetime,
-        hora_egreso: datetime
+        hora_egreso: datetime,
+        zona: str | None = None,
+        clase_cliente: str | None = None
     ) -> float:
-        """Calcula el precio usando la estrategia actual.
+        """Calcula el precio usando la estrategia que corresponde a la estadia.
 
         Args:
             vehiculo: El vehiculo a calcular
             hora_ingreso: Hora de ingreso
             hora_egreso: Hora de egreso
+            zona: Zona del estacionamiento
+            clase_cliente: Clase de cliente
 
         Returns:
             Precio calculado
         """
-        return self._estrategia_actual.calcular_precio(vehiculo, hora_ingreso, hora_egreso)
+        estrategia = self._snapshot.resolver(vehiculo, zona, clase_cliente)
+        return estrategia.calcular_precio(vehiculo, hora_ingreso, hora_egreso)
+
+    def calcular_precio_versionado(
+        self,
+        vehiculo: Vehiculo,
+        hora_ingreso: datetime,
+        hora_egreso: datetime,
+        zona: str | None = None,
+        clase_cliente: str | None = None
+    ) -> PrecioVersionado:
+        """Calcula el precio de una estadia indicando la version usada.
+
+        Args:
+            vehiculo: El vehiculo a calcular
+            hora_ingreso: Hora de ingreso
+            hora_egreso: Hora de egreso
+            zona: Zona del estacionamiento
+            clase_cliente: Clase de cliente
+
+        Returns:
+            Precio con la version y la estrategia que lo produjeron
+        """
+        return self._snapshot.calcular_precio(vehiculo, hora_ingreso, hora_egreso, zona, clase_cliente)
+
+    def recalcular_lote(
+        self,
+        estadias: Sequence[Tuple[Vehiculo, datetime, datetime]],
+        version: int,
+        zona: str | None = None,
+        clase_cliente: str | None = None
+    ) -> List[PrecioVersionado]:
+        """Recalcula un lote de estadias con una version anterior (auditoria).
+
+        Args:
+            estadias: Tuplas (vehiculo, hora_ingreso, hora_egreso)
+            version: Version de precios a aplicar
+            zona: Zona del estacionamiento de todas las estadias
+            clase_cliente: Clase de cliente de todas las estadias
+
+        Returns:
+            Precio de cada estadia, en el mismo orden
+
+        Raises:
+            ValueError: Si la version ya no se conserva o no existe
+        """
+        snapshot = self.get_snapshot(version)
+        return [
+            snapshot.calcular_precio(vehiculo, hora_ingreso, hora_egreso, zona, clase_cliente)
+            for vehiculo, hora_ingreso, hora_egreso in estadias
+        ]
+
+    def calcular_precios_lote(
+        self,
+        tarifas_base: Sequence[float],
+        tolerancias: Sequence[float],
+        ingresos: Sequence[float],
+        egresos: Sequence[float]
+    ) -> List[float]:
+        """Calcula los precios de un lote de estadias con la estrategia por defecto.
+
+        Las columnas no identifican tipo, zona ni clase de cliente, por lo
+        que el lote no se rutea: para eso, agrupar las estadias y calcular
+        cada grupo con get_estrategia_para().
+
+        Args:
+            tarifas_base: Tarifa por hora de cada estadia
+            tolerancias: Minutos sin cargo de cada estadia
+            ingresos: Hora de ingreso de cada estadia (epoch en segundos)
+            egresos: Hora de egreso de cada estadia (epoch en segundos)
+
+        Returns:
+            Precio de cada estadia, en el mismo orden
+        """
+        return self._snapshot.estrategia.calcular_precios_lote(
+            tarifas_base, tolerancias, ingresos, egresos
+        )
+
+    def cotizar(
+        self,
+        vehiculo: Vehiculo,
+        hora_consulta: datetime | None = None,
+        zona: str | None = None,
+        clase_cliente: str | None = None
+    ) -> float:
+        """Cotiza lo que debe un vehiculo estacionado hasta el momento.
+
+        La estadia se cuenta en minutos completos. Si la estrategia depende
+        solo de la duracion, la cotizacion se memoriza y se reutiliza para
+        todos los vehiculos con la misma estrategia, tipo, tarifa, tolerancia
+        y minutos cobrables.
+
+        Args:
+            vehiculo: Vehiculo estacionado (con hora de ingreso)
+            hora_consulta: Momento de la consulta (default: ahora)
+            zona: Zona del estacionamiento
+            clase_cliente: Clase de cliente
+
+        Returns:
+            Monto adeudado a la hora de consulta
+
+        Raises:
+            ValueError: Si el vehiculo no tiene hora de ingreso
+        """
+        hora_ingreso = vehiculo.get_hora_ingreso()
+        if hora_ingreso is None:
+            raise ValueError(f"El vehiculo {vehiculo.get_patente()} no tiene hora de ingreso")
+
+        snapshot = self._snapshot
+        estrategia = snapshot.resolver(vehiculo, zona, clase_cliente)
+        minutos = ((hora_consulta or datetime.now()) - hora_ingreso) // timedelta(minutes=1)
+        if not estrategia.depende_solo_de_duracion():
+            return estrategia.calcular_precio(
+                vehiculo, hora_ingreso, hora_ingreso + timedelta(minutes=minutos)
+            )
+
+        tolerancia = vehiculo.get_tolerancia_minutos()
+        cobrables = max(0, minutos - tolerancia)
+        clave = (
+            snapshot.version, id(estrategia), type(vehiculo).__name__,
+            vehiculo.get_tarifa_base(), tolerancia, cobrables
+        )
+        return self._cache_cotizaciones.obtener_o_calcular(
+            clave,
+            lambda: estrategia.calcular_precio(
+                vehiculo, hora_ingreso, hora_ingreso + timedelta(minutes=tolerancia + cobrables)
+            )
+        )
+
+    def get_metricas_cotizaciones(self) -> MetricasCache:
+        """Obtiene las metricas del cache de cotizaciones.
+
+        Returns:
+            Aciertos, fallos, desalojos y ocupacion del cache
+        """
+        return self._cache_cotizaciones.get_metricas()
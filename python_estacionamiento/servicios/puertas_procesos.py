@@ -0,0 +1,121 @@
+"""Puertas en procesos separados.
+
+Corre las puertas de un estacionamiento en los procesos de un Pool, sin el
+limite del GIL. Cada proceso tiene su propio ParkingLot (normalizacion de
+patentes, vehiculos, eventos y persistencia) conectado a la misma
+TablaOcupacionCompartida, que decide la admision, la plaza y la ocupacion
+de todas las puertas.
+"""
+
+# Standard library
+from __future__ import annotations
+from multiprocessing import Pool
+from typing import Any, List, Sequence, Tuple
+
+# Local application
+from python_estacionamiento.excepciones.estacionamiento_exception import EstacionamientoException
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.servicios.parking_lot import ParkingLot
+from python_estacionamiento.servicios.tabla_ocupacion_compartida import TablaOcupacionCompartida
+
+_lote_trabajador: ParkingLot | None = None
+
+
+def _inicializar_trabajador(nombre: str, locks: Tuple[Any, ...], lote_id: str) -> None:
+    """Arma el lote de un proceso de puerta sobre la tabla compartida.
+
+    Args:
+        nombre: Nombre del bloque de memoria de la tabla
+        locks: Locks de la tabla
+        lote_id: Identificador del lote
+    """
+    global _lote_trabajador
+    tabla = TablaOcupacionCompartida.conectar(nombre, locks)
+    _lote_trabajador = ParkingLot(lote_id, tabla.get_capacidad())
+    _lote_trabajador.set_ocupacion_compartida(tabla)
+
+
+def _procesar_puerta(operaciones: Sequence[Tuple[str, ...]]) -> List[int | None]:
+    """Procesa las operaciones de una puerta en un proceso trabajador.
+
+    Args:
+        operaciones: Tuplas ('ingreso', patente, tipo) o ('egreso', patente)
+
+    Returns:
+        Plaza ocupada o liberada por cada operacion, None si fue rechazada
+    """
+    resultados: List[int | None] = []
+    for operacion in operaciones:
+        try:
+            if operacion[0] == 'ingreso':
+                _lote_trabajador.ingresar_vehiculo(VehiculoFactory.crear_vehiculo(operacion[2], operacion[1]))
+                resultados.append(_lote_trabajador.get_plaza(operacion[1]))
+            else:
+                plaza = _lote_trabajador.get_plaza(operacion[1])
+                _lote_trabajador.egresar_vehiculo(operacion[1])
+                resultados.append(plaza)
+        except (EstacionamientoException, ValueError):
+            resultados.append(None)
+    return resultados
+
+
+class PuertasEnProcesos:
+    """Pool de procesos de puerta sobre una tabla de ocupacion compartida.
+
+    Los procesos se crean una sola vez y atienden sucesivas tandas de
+    operaciones; cerrar() los termina.
+    """
+
+    def __init__(self, tabla: TablaOcupacionCompartida, procesos: int, lote_id: str = "puertas"):
+        """Inicia los procesos de puerta.
+
+        Args:
+            tabla: Tabla compartida del estacionamiento
+            procesos: Cantidad de procesos
+            lote_id: Identificador del lote de cada proceso
+        """
+        self._pool = Pool(
+            processes=procesos,
+            initializer=_inicializar_trabajador,
+            initargs=(tabla.get_nombre(), tabla.get_locks(), lote_id)
+        )
+
+    def procesar(self, operaciones_por_puerta: Sequence[Sequence[Tuple[str, ...]]]) -> List[List[int | None]]:
+        """Procesa las operaciones de varias puertas en paralelo.
+
+        Args:
+            operaciones_por_puerta: Por cada puerta, tuplas ('ingreso', patente,
+                tipo) o ('egreso', patente) en orden
+
+        Returns:
+            Por cada puerta, la plaza de cada operacion (None si fue rechazada)
+        """
+        return self._pool.map(_procesar_puerta, operaciones_por_puerta, chunksize=1)
+
+    def cerrar(self) -> None:
+        """Termina los procesos de puerta."""
+        self._pool.close()
+        self._pool.join()
+
+
+def procesar_puertas(
+    tabla: TablaOcupacionCompartida,
+    operaciones_por_puerta: Sequence[Sequence[Tuple[str, ...]]],
+    procesos: int | None = None
+) -> List[List[int | None]]:
+    """Procesa una tanda de operaciones de varias puertas en procesos separados.
+
+    Args:
+        tabla: Tabla compartida del estacionamiento
+        operaciones_por_puerta: Por cada puerta, tuplas ('ingreso', patente,
+            tipo) o ('egreso', patente) en orden
+        procesos: Cantidad de procesos (default: uno por puerta)
+
+    Returns:
+        Por cada puerta, la plaza de cada operacion (None si fue rechazada)
+    """
+    puertas = PuertasEnProcesos(tabla, procesos or len(operaciones_por_puerta))
+    try:
+        return puertas.procesar(operaciones_por_puerta)
+    finally:
+        puertas.cerrar()
@@ -0,0 +1,611 @@
+"""Tabla de ocupacion en memoria compartida.
+
+Permite que varias puertas corran en procesos separados (sin el limite del
+GIL) compartiendo el estado de ocupacion de un mismo estacionamiento. La
+tabla vive en un bloque de multiprocessing.shared_memory con:
+
+- Encabezado: capacidad, tamano y cantidad de segmentos, total de plazas
+  ocupadas y, por segmento, el cursor de busqueda de plazas, las entradas
+  usadas y un contador por codigo de tipo de vehiculo.
+- Bitmap de plazas: un bit por plaza (1 = ocupada), dividido en regiones.
+- Indice de patentes: tablas hash de direccionamiento abierto (sondeo
+  lineal), una por segmento, con la patente normalizada, la plaza, el tipo
+  y la hora de ingreso de cada vehiculo.
+
+Las modificaciones se serializan con locks compartidos de grano fino, como
+el lock striping de ParkingLot: un lock por segmento del indice (que
+protege tambien los contadores por tipo del segmento), uno por region del
+bitmap y uno para el total de plazas ocupadas, que es el unico punto comun
+a todas las operaciones. Los locks se toman siempre en ese orden.
+
+El hash de la patente es estable entre procesos (blake2b, no hash()). Los
+tipos se identifican por el codigo del registro de VehiculoFactory, por lo
+que los procesos deben registrar los mismos tipos con los mismos codigos.
+"""
+
+# Standard library
+from __future__ import annotations
+import struct
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from hashlib import blake2b
+from multiprocessing import Lock
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Tuple
+
+# Local application
+from python_estacionamiento.constantes import (
+    CARACTERES_MAXIMOS_PATENTE,
+    CODIGO_MAXIMO_TIPO,
+    SEGMENTOS_TABLA_COMPARTIDA
+)
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.excepciones.estacionamiento_exception import (
+    VehiculoNoEncontradoException,
+    VehiculoYaIngresadoException
+)
+from python_estacionamiento.utils.patentes import normalizar_patente
+
+LARGO_MAXIMO_PATENTE = CARACTERES_MAXIMOS_PATENTE  # bytes por patente normalizada en el indice
+
+# Encabezado: capacidad, tamano_segmento, segmentos y ocupadas
+_ENCABEZADO = struct.Struct('<4q')
+_CAPACIDAD, _TAMANO_SEGMENTO, _SEGMENTOS, _OCUPADAS = range(4)
+_CAMPO = struct.Struct('<q')
+# Entrada del indice: patente, plaza (1..capacidad, 0 = vacia), codigo de tipo
+# y hora de ingreso en microsegundos desde 1970 (hora local, 0 = sin hora)
+_ENTRADA = struct.Struct(f'<{LARGO_MAXIMO_PATENTE}siiq')
+_ORIGEN_HORAS = datetime(1970, 1, 1)
+_MICROSEGUNDO = timedelta(microseconds=1)
+
+
+def _hash_patente(patente: bytes) -> int:
+    """Calcula un hash de la patente estable entre procesos.
+
+    Args:
+        patente: Patente codificada
+
+    Returns:
+        Hash de 64 bits
+    """
+    return int.from_bytes(blake2b(patente, digest_size=8).digest(), 'little')
+
+
+def _a_microsegundos(hora: datetime | None) -> int:
+    """Convierte una hora local sin zona horaria a microsegundos (0 si es None).
+
+    Raises:
+        ValueError: Si la hora tiene zona horaria
+    """
+    if hora is None:
+        return 0
+    if hora.tzinfo is not None:
+        raise ValueError(f"La tabla solo admite horas sin zona horaria: {hora.isoformat()}")
+    return (hora - _ORIGEN_HORAS) // _MICROSEGUNDO
+
+
+def _desde_microsegundos(microsegundos: int) -> datetime | None:
+    """Convierte microsegundos desde 1970 a hora local (None si es 0)."""
+    return None if microsegundos == 0 else _ORIGEN_HORAS + microsegundos * _MICROSEGUNDO
+
+
+@dataclass(frozen=True)
+class OcupantePlaza:
+    """Vehiculo registrado en la tabla compartida.
+
+    Attributes:
+        patente: Patente normalizada
+        plaza: Numero de plaza (desde 1)
+        tipo: Tipo de vehiculo registrado en VehiculoFactory
+        hora_ingreso: Hora de ingreso (None si no se registro)
+    """
+    patente: str
+    plaza: int
+    tipo: str
+    hora_ingreso: datetime | None
+
+
+class TablaOcupacionCompartida:
+    """Ocupacion de un estacionamiento compartida entre procesos.
+
+    Se crea en el proceso principal con crear() y se abre en cada proceso
+    de puerta con conectar(nombre, locks), o pasandola como argumento a un
+    multiprocessing.Process (se serializa como nombre y locks). Un
+    ParkingLot la usa como backend de ocupacion con set_ocupacion_compartida.
+    """
+
+    def __init__(self, memoria: SharedMemory, locks: Tuple[Any, ...], propietaria: bool):
+        """Inicializa la vista sobre un bloque de memoria compartida.
+
+        Usar crear() o conectar() en lugar de este constructor.
+
+        Args:
+            memoria: Bloque de memoria compartida
+            locks: Locks de la tabla (por segmento, por region y de ocupadas)
+            propietaria: True si esta instancia creo el bloque
+        """
+        self._memoria = memoria
+        self._locks = locks
+        self._locks_segmento, self._locks_region, self._lock_ocupadas = locks
+        self._propietaria = propietaria
+        encabezado = _ENCABEZADO.unpack_from(memoria.buf, 0)
+        self._capacidad = encabezado[_CAPACIDAD]
+        self._tamano_segmento = encabezado[_TAMANO_SEGMENTO]
+        self._segmentos = encabezado[_SEGMENTOS]
+        self._mascara_segmento = self._tamano_segmento - 1
+        self._inicio_cursores = _ENCABEZADO.size
+        self._inicio_entradas = self._inicio_cursores + self._segmentos * _CAMPO.size
+        self._inicio_contadores = self._inicio_entradas + self._segmentos * _CAMPO.size
+        self._inicio_bitmap = self._inicio_contadores + self._segmentos * CODIGO_MAXIMO_TIPO * _CAMPO.size
+        self._bytes_bitmap = (self._capacidad + 7) // 8
+        self._bytes_region = -(-self._bytes_bitmap // self._segmentos)
+        self._inicio_indice = self._inicio_bitmap + ((self._bytes_bitmap + 7) // 8) * 8
+
+    @classmethod
+    def crear(cls, capacidad: int, segmentos: int = SEGMENTOS_TABLA_COMPARTIDA) -> TablaOcupacionCompartida:
+        """Crea una tabla vacia en un bloque de memoria compartida nuevo.
+
+        Args:
+            capacidad: Cantidad de plazas
+            segmentos: Segmentos del indice y regiones del bitmap (uno por lock)
+
+        Returns:
+            La tabla creada (propietaria del bloque)
+
+        Raises:
+            ValueError: Si la capacidad o los segmentos no son positivos
+        """
+        if capacidad <= 0:
+            raise ValueError("La capacidad debe ser mayor a cero")
+        if segmentos <= 0:
+            raise ValueError("La cantidad de segmentos debe ser mayor a cero")
+
+        # Cada segmento admite el doble de su parte de la capacidad, con margen
+        # para que las patentes se repartan de forma despareja
+        tamano_segmento = 1
+        while tamano_segmento < 2 * -(-capacidad // segmentos) + 8:
+            tamano_segmento *= 2
+        bytes_bitmap = ((capacidad + 7) // 8 + 7) // 8 * 8
+        tamano = (_ENCABEZADO.size + segmentos * (2 + CODIGO_MAXIMO_TIPO) * _CAMPO.size
+                  + bytes_bitmap + segmentos * tamano_segmento * _ENTRADA.size)
+
+        memoria = SharedMemory(create=True, size=tamano)
+        memoria.buf[:tamano] = bytes(tamano)
+        _ENCABEZADO.pack_into(memoria.buf, 0, capacidad, tamano_segmento, segmentos, 0)
+        locks = (
+            [Lock() for _ in range(segmentos)],
+            [Lock() for _ in range(segmentos)],
+            Lock()
+        )
+        tabla = cls(memoria, locks, propietaria=True)
+        for region in range(segmentos):
+            tabla._escribir_campo(tabla._offset_cursor(region), region * tabla._bytes_region)
+        return tabla
+
+    @classmethod
+    def conectar(cls, nombre: str, locks: Tuple[Any, ...]) -> TablaOcupacionCompartida:
+        """Abre una tabla existente desde otro proceso.
+
+        Args:
+            nombre: Nombre del bloque de memoria (get_nombre())
+            locks: Locks de la tabla (get_locks())
+
+        Returns:
+            Vista sobre la tabla compartida
+        """
+        return cls(SharedMemory(name=nombre), locks, propietaria=False)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Serializa la tabla como nombre y locks para pasarla a otro proceso."""
+        return {'nombre': self._memoria.name, 'locks': self._locks}
+
+    def __setstate__(self, estado: Dict[str, Any]) -> None:
+        """Reabre la tabla en el proceso que la recibe."""
+        self.__init__(SharedMemory(name=estado['nombre']), estado['locks'], propietaria=False)
+
+    def get_nombre(self) -> str:
+        """Obtiene el nombre del bloque de memoria compartida.
+
+        Returns:
+            Nombre para conectar() desde otros procesos
+        """
+        return self._memoria.name
+
+    def get_locks(self) -> Tuple[Any, ...]:
+        """Obtiene los locks que protegen la tabla.
+
+        Returns:
+            Locks compartidos, para conectar() desde otros procesos
+        """
+        return self._locks
+
+    def get_capacidad(self) -> int:
+        """Obtiene la cantidad de plazas.
+
+        Returns:
+            Capacidad del estacionamiento
+        """
+        return self._capacidad
+
+    def ingresar(self, patente: str, tipo: str, hora_ingreso: datetime | None = None) -> int | None:
+        """Ocupa una plaza libre para un vehiculo.
+
+        Args:
+            patente: Patente del vehiculo
+            tipo: Tipo de vehiculo registrado en VehiculoFactory
+            hora_ingreso: Hora de ingreso, local y sin zona horaria
+
+        Returns:
+            Numero de plaza (desde 1), o None si no hay plazas libres
+
+        Raises:
+            ValueError: Si el tipo no existe o la hora tiene zona horaria
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+            VehiculoYaIngresadoException: Si la patente ya ocupa una plaza
+        """
+        codigo = VehiculoFactory.get_tipo(tipo).codigo
+        microsegundos = _a_microsegundos(hora_ingreso)
+        clave = self._codificar(patente)
+        segmento, inicio = self._ubicar(clave)
+
+        with self._locks_segmento[segmento]:
+            posicion, encontrada = self._buscar(segmento, clave, inicio)
+            if encontrada:
+                raise VehiculoYaIngresadoException(patente)
+            entradas = self._leer_campo(self._offset_entradas(segmento))
+            if entradas >= self._mascara_segmento:
+                raise RuntimeError(f"Segmento {segmento} del indice de patentes completo")
+            if not self._reservar_ocupada():
+                return None
+
+            plaza = self._ocupar_plaza_libre(segmento)
+            _ENTRADA.pack_into(
+                self._memoria.buf, self._offset_entrada(segmento, posicion),
+                clave, plaza, codigo, microsegundos
+            )
+            self._escribir_campo(self._offset_entradas(segmento), entradas + 1)
+            self._sumar_al_contador(segmento, codigo, 1)
+            return plaza
+
+    def egresar(self, patente: str) -> int:
+        """Libera la plaza de un vehiculo.
+
+        Args:
+            patente: Patente del vehiculo
+
+        Returns:
+            Numero de plaza liberada
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+            VehiculoNoEncontradoException: Si la patente no ocupa ninguna plaza
+        """
+        clave = self._codificar(patente)
+        segmento, inicio = self._ubicar(clave)
+
+        with self._locks_segmento[segmento]:
+            posicion, encontrada = self._buscar(segmento, clave, inicio)
+            if not encontrada:
+                raise VehiculoNoEncontradoException(patente)
+
+            _, plaza, codigo, _ = _ENTRADA.unpack_from(
+                self._memoria.buf, self._offset_entrada(segmento, posicion)
+            )
+            self._borrar_entrada(segmento, posicion)
+            offset = self._offset_entradas(segmento)
+            self._escribir_campo(offset, self._leer_campo(offset) - 1)
+            self._sumar_al_contador(segmento, codigo, -1)
+            # Primero la plaza y despues el total: un ingreso que ya reservo
+            # lugar siempre encuentra un bit libre
+            self._liberar_plaza(plaza)
+            with self._lock_ocupadas:
+                offset = _CAMPO.size * _OCUPADAS
+                self._escribir_campo(offset, self._leer_campo(offset) - 1)
+            return plaza
+
+    def get_ocupante(self, patente: str) -> OcupantePlaza | None:
+        """Obtiene el registro de un vehiculo en la tabla.
+
+        Args:
+            patente: Patente del vehiculo
+
+        Returns:
+            El ocupante, o None si la patente no esta
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+        """
+        clave = self._codificar(patente)
+        segmento, inicio = self._ubicar(clave)
+        with self._locks_segmento[segmento]:
+            posicion, encontrada = self._buscar(segmento, clave, inicio)
+            if not encontrada:
+                return None
+            return self._ocupante_en(segmento, posicion)
+
+    def get_ocupantes(self) -> List[OcupantePlaza]:
+        """Obtiene todos los vehiculos registrados en la tabla.
+
+        Cada segmento se lee con su lock; el resultado no es una foto
+        atomica de toda la tabla si hay puertas operando.
+
+        Returns:
+            Ocupantes, en orden de segmento
+        """
+        ocupantes = []
+        for segmento in range(self._segmentos):
+            with self._locks_segmento[segmento]:
+                for posicion in range(self._tamano_segmento):
+                    if self._patente_en(segmento, posicion):
+                        ocupantes.append(self._ocupante_en(segmento, posicion))
+        return ocupantes
+
+    def get_plaza(self, patente: str) -> int | None:
+        """Obtiene la plaza que ocupa un vehiculo.
+
+        Args:
+            patente: Patente del vehiculo
+
+        Returns:
+            Numero de plaza, o None si la patente no esta
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+        """
+        ocupante = self.get_ocupante(patente)
+        return None if ocupante is None else ocupante.plaza
+
+    def plaza_ocupada(self, plaza: int) -> bool:
+        """Indica si una plaza esta ocupada.
+
+        Args:
+            plaza: Numero de plaza (desde 1)
+
+        Returns:
+            True si la plaza esta ocupada
+
+        Raises:
+            ValueError: Si la plaza no existe
+        """
+        if not 1 <= plaza <= self._capacidad:
+            raise ValueError(f"La plaza {plaza} no existe")
+        byte = self._memoria.buf[self._inicio_bitmap + (plaza - 1) // 8]
+        return bool(byte & (1 << ((plaza - 1) % 8)))
+
+    def get_plazas_ocupadas(self, tipo: str | None = None) -> int:
+        """Obtiene las plazas ocupadas, en total o por tipo.
+
+        Args:
+            tipo: Tipo de vehiculo (None: total)
+
+        Returns:
+            Plazas ocupadas
+
+        Raises:
+            ValueError: Si el tipo no esta registrado
+        """
+        if tipo is None:
+            return self._leer_campo(_CAMPO.size * _OCUPADAS)
+        codigo = VehiculoFactory.get_tipo(tipo).codigo
+        return sum(
+            self._leer_campo(self._offset_contador(segmento, codigo))
+            for segmento in range(self._segmentos)
+        )
+
+    def get_plazas_disponibles(self) -> int:
+        """Obtiene las plazas libres.
+
+        Returns:
+            Plazas disponibles
+        """
+        return self._capacidad - self.get_plazas_ocupadas()
+
+    def cerrar(self) -> None:
+        """Cierra la vista de este proceso sobre la tabla."""
+        self._memoria.close()
+
+    def destruir(self) -> None:
+        """Cierra y elimina el bloque de memoria compartida.
+
+        Solo debe llamarlo el proceso que creo la tabla.
+        """
+        self._memoria.close()
+        if self._propietaria:
+            self._memoria.unlink()
+
+    def _codificar(self, patente: str) -> bytes:
+        """Codifica una patente para el indice.
+
+        Usa la misma clave canonica que ParkingLot, de modo que "ab-123"
+        y "AB123" son el mismo vehiculo en todas las puertas.
+
+        Args:
+            patente: Patente tal como se leyo
+
+        Returns:
+            Patente normalizada en UTF-8
+
+        Raises:
+            PatenteInvalidaException: Si la patente no tiene un formato valido
+        """
+        return normalizar_patente(patente).encode('utf-8')
+
+    def _ubicar(self, clave: bytes) -> Tuple[int, int]:
+        """Obtiene el segmento de una patente y su entrada inicial en el.
+
+        Se calcula antes de tomar el lock para acortar la seccion critica.
+
+        Args:
+            clave: Patente codificada
+
+        Returns:
+            Tupla (segmento, entrada inicial)
+        """
+        valor = _hash_patente(clave)
+        return (valor >> 32) % self._segmentos, valor & self._mascara_segmento
+
+    def _leer_campo(self, offset: int) -> int:
+        """Lee un entero del encabezado."""
+        return _CAMPO.unpack_from(self._memoria.buf, offset)[0]
+
+    def _escribir_campo(self, offset: int, valor: int) -> None:
+        """Escribe un entero del encabezado."""
+        _CAMPO.pack_into(self._memoria.buf, offset, valor)
+
+    def _offset_cursor(self, region: int) -> int:
+        """Obtiene el offset del cursor de busqueda de una region del bitmap."""
+        return self._inicio_cursores + region * _CAMPO.size
+
+    def _offset_entradas(self, segmento: int) -> int:
+        """Obtiene el offset de las entradas usadas de un segmento del indice."""
+        return self._inicio_entradas + segmento * _CAMPO.size
+
+    def _offset_contador(self, segmento: int, codigo: int) -> int:
+        """Obtiene el offset del contador de un codigo de tipo en un segmento."""
+        return self._inicio_contadores + (segmento * CODIGO_MAXIMO_TIPO + codigo - 1) * _CAMPO.size
+
+    def _offset_entrada(self, segmento: int, posicion: int) -> int:
+        """Obtiene el offset en bytes de una entrada del indice."""
+        return self._inicio_indice + (segmento * self._tamano_segmento + posicion) * _ENTRADA.size
+
+    def _reservar_ocupada(self) -> bool:
+        """Suma una plaza ocupada si hay lugar.
+
+        Returns:
+            True si se reservo la plaza, False si la tabla esta completa
+        """
+        offset = _CAMPO.size * _OCUPADAS
+        with self._lock_ocupadas:
+            ocupadas = self._leer_campo(offset)
+            if ocupadas >= self._capacidad:
+                return False
+            self._escribir_campo(offset, ocupadas + 1)
+            return True
+
+    def _sumar_al_contador(self, segmento: int, codigo: int, variacion: int) -> None:
+        """Actualiza el contador de plazas ocupadas de un tipo (requiere el lock del segmento).
+
+        Args:
+            segmento: Segmento del indice de la patente
+            codigo: Codigo del tipo de vehiculo
+            variacion: 1 al ingresar, -1 al egresar
+        """
+        offset = self._offset_contador(segmento, codigo)
+        self._escribir_campo(offset, self._leer_campo(offset) + variacion)
+
+    def _patente_en(self, segmento: int, posicion: int) -> bytes:
+        """Obtiene la patente guardada en una entrada (b'' si esta vacia)."""
+        offset = self._offset_entrada(segmento, posicion)
+        return bytes(self._memoria.buf[offset:offset + LARGO_MAXIMO_PATENTE]).rstrip(b'\x00')
+
+    def _ocupante_en(self, segmento: int, posicion: int) -> OcupantePlaza:
+        """Arma el ocupante de una entrada usada (requiere el lock del segmento)."""
+        patente, plaza, codigo, microsegundos = _ENTRADA.unpack_from(
+            self._memoria.buf, self._offset_entrada(segmento, posicion)
+        )
+        return OcupantePlaza(
+            patente=patente.rstrip(b'\x00').decode('utf-8'),
+            plaza=plaza,
+            tipo=VehiculoFactory.get_tipos_por_codigo()[codigo],
+            hora_ingreso=_desde_microsegundos(microsegundos)
+        )
+
+    def _buscar(self, segmento: int, clave: bytes, posicion: int) -> Tuple[int, bool]:
+        """Busca una patente en un segmento del indice con sondeo lineal.
+
+        Debe llamarse con el lock del segmento tomado.
+
+        Args:
+            segmento: Segmento de la patente
+            clave: Patente codificada
+            posicion: Entrada inicial (hash de la patente)
+
+        Returns:
+            Tupla (posicion, encontrada): la entrada de la patente o la
+            primera entrada vacia donde insertarla
+        """
+        while True:
+            actual = self._patente_en(segmento, posicion)
+            if not actual:
+                return posicion, False
+            if actual == clave:
+                return posicion, True
+            posicion = (posicion + 1) & self._mascara_segmento
+
+    def _borrar_entrada(self, segmento: int, posicion: int) -> None:
+        """Borra una entrada del indice reubicando las siguientes (sin lapidas).
+
+        Debe llamarse con el lock del segmento tomado.
+
+        Args:
+            segmento: Segmento de la entrada
+            posicion: Entrada a borrar
+        """
+        buf = self._memoria.buf
+        hueco = posicion
+        siguiente = posicion
+        while True:
+            siguiente = (siguiente + 1) & self._mascara_segmento
+            patente = self._patente_en(segmento, siguiente)
+            if not patente:
+                break
+            inicio = self._ubicar(patente)[1]
+            # La entrada puede quedarse si su posicion inicial esta entre el hueco y ella
+            if (hueco < siguiente and hueco < inicio <= siguiente) or \
+                    (hueco > siguiente and (inicio > hueco or inicio <= siguiente)):
+                continue
+            origen = self._offset_entrada(segmento, siguiente)
+            destino = self._offset_entrada(segmento, hueco)
+            buf[destino:destino + _ENTRADA.size] = buf[origen:origen + _ENTRADA.size]
+            hueco = siguiente
+
+        offset = self._offset_entrada(segmento, hueco)
+        buf[offset:offset + _ENTRADA.size] = bytes(_ENTRADA.size)
+
+    def _ocupar_plaza_libre(self, region_inicial: int) -> int:
+        """Marca como ocupada la primera plaza libre, recorriendo las regiones del bitmap.
+
+        Debe llamarse luego de reservar la plaza en el total de ocupadas, lo
+        que garantiza que hay un bit libre. Cada region se recorre con su
+        lock desde su cursor, que apunta al primer byte que puede tener
+        plazas libres; si otra puerta toma la ultima plaza libre de una
+        region, la busqueda sigue por las demas.
+
+        Args:
+            region_inicial: Region desde la que buscar (reparte las puertas)
+
+        Returns:
+            Numero de plaza ocupada (desde 1)
+        """
+        buf = self._memoria.buf
+        region = region_inicial
+        while True:
+            fin = min((region + 1) * self._bytes_region, self._bytes_bitmap)
+            offset_cursor = self._offset_cursor(region)
+            with self._locks_region[region]:
+                for byte in range(self._leer_campo(offset_cursor), fin):
+                    valor = buf[self._inicio_bitmap + byte]
+                    if valor == 0xFF:
+                        continue
+                    bit = (~valor & (valor + 1)).bit_length() - 1
+                    plaza = byte * 8 + bit + 1
+                    if plaza > self._capacidad:
+                        break
+                    buf[self._inicio_bitmap + byte] = valor | (1 << bit)
+                    self._escribir_campo(offset_cursor, byte)
+                    return plaza
+                self._escribir_campo(offset_cursor, max(fin, region * self._bytes_region))
+            region = (region + 1) % self._segmentos
+
+    def _liberar_plaza(self, plaza: int) -> None:
+        """Marca una plaza como libre en su region del bitmap.
+
+        Args:
+            plaza: Numero de plaza (desde 1)
+        """
+        byte = (plaza - 1) // 8
+        region = byte // self._bytes_region
+        offset_cursor = self._offset_cursor(region)
+        with self._locks_region[region]:
+            self._memoria.buf[self._inicio_bitmap + byte] &= ~(1 << ((plaza - 1) % 8)) & 0xFF
+            self._escribir_campo(offset_cursor, min(self._leer_campo(offset_cursor), byte))
@@ -0,0 +1,104 @@
+"""Cache LRU thread-safe con metricas de aciertos.
+
+Se usa para memorizar resultados costosos que se consultan repetidamente.
+"""
+
+# Standard library
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Generic, Hashable, TypeVar
+
+V = TypeVar('V')
+
+
+@dataclass(frozen=True)
+class MetricasCache:
+    """Metricas de uso de un cache.
+
+    Attributes:
+        aciertos: Consultas resueltas desde el cache
+        fallos: Consultas que debieron calcularse
+        desalojos: Entradas descartadas por capacidad
+        tamano: Entradas almacenadas
+        capacidad: Maximo de entradas
+    """
+    aciertos: int
+    fallos: int
+    desalojos: int
+    tamano: int
+    capacidad: int
+
+
+class CacheLRU(Generic[V]):
+    """Cache de capacidad fija que descarta la entrada usada hace mas tiempo."""
+
+    def __init__(self, capacidad: int):
+        """Inicializa el cache.
+
+        Args:
+            capacidad: Maximo de entradas a conservar
+
+        Raises:
+            ValueError: Si la capacidad no es positiva
+        """
+        if capacidad <= 0:
+            raise ValueError("La capacidad del cache debe ser mayor a cero")
+
+        self._capacidad = capacidad
+        self._entradas: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = Lock()
+        self._aciertos = 0
+        self._fallos = 0
+        self._desalojos = 0
+
+    def obtener_o_calcular(self, clave: Hashable, calcular: Callable[[], V]) -> V:
+        """Obtiene el valor de una clave, calculandolo si no esta en el cache.
+
+        El calculo se hace fuera del lock: dos consultas simultaneas de la
+        misma clave pueden calcularla ambas, pero ninguna espera a la otra.
+
+        Args:
+            clave: Clave de la consulta
+            calcular: Funcion que produce el valor si no esta cacheado
+
+        Returns:
+            Valor cacheado o recien calculado
+        """
+        with self._lock:
+            if clave in self._entradas:
+                self._entradas.move_to_end(clave)
+                self._aciertos += 1
+                return self._entradas[clave]
+            self._fallos += 1
+
+        valor = calcular()
+
+        with self._lock:
+            self._entradas[clave] = valor
+            self._entradas.move_to_end(clave)
+            if len(self._entradas) > self._capacidad:
+                self._entradas.popitem(last=False)
+                self._desalojos += 1
+        return valor
+
+    def limpiar(self) -> None:
+        """Descarta todas las entradas (las metricas se conservan)."""
+        with self._lock:
+            self._entradas.clear()
+
+    def get_metricas(self) -> MetricasCache:
+        """Obtiene una foto de las metricas del cache.
+
+        Returns:
+            Metricas actuales
+        """
+        with self._lock:
+            return MetricasCache(
+                aciertos=self._aciertos,
+                fallos=self._fallos,
+                desalojos=self._desalojos,
+                tamano=len(self._entradas),
+                capacidad=self._capacidad
+            )
@@ -0,0 +1,138 @@
+"""Normalizacion de patentes.
+
+Lleva cualquier lectura de una patente ("abc 123", "ABC-123", "abc.123") a
+una clave canonica unica ("ABC123") y la interna, de modo que todas las
+lecturas de una misma patente comparten un solo objeto str.
+"""
+
+# Standard library
+from __future__ import annotations
+import re
+import sys
+
+# Local application
+from python_estacionamiento.constantes import (
+    CARACTERES_MINIMOS_PATENTE,
+    CARACTERES_MAXIMOS_PATENTE
+)
+from python_estacionamiento.excepciones.estacionamiento_exception import PatenteInvalidaException
+
+# Separadores que las camaras y los operadores intercalan en las patentes
+_SIN_SEPARADORES = str.maketrans('', '', ' \t-._/')
+
+_FORMATO_PATENTE = re.compile(
+    f'[A-Z0-9]{{{CARACTERES_MINIMOS_PATENTE},{CARACTERES_MAXIMOS_PATENTE}}}'
+)
+
+# Caracteres que una camara suele confundir, llevados a un representante
+_CONFUNDIBLES = str.maketrans('OQDILZSGB', '000112568')
+
+
+def limpiar_patente(patente: str) -> str:
+    """Pasa una patente a mayusculas y quita los separadores, sin validarla.
+
+    Sirve para entradas parciales, como un prefijo de busqueda.
+
+    Args:
+        patente: Patente (o parte de ella) tal como se leyo
+
+    Returns:
+        Texto en mayusculas sin separadores
+    """
+    return patente.translate(_SIN_SEPARADORES).upper()
+
+
+def normalizar_patente(patente: str) -> str:
+    """Obtiene la clave canonica e internada de una patente.
+
+    Args:
+        patente: Patente tal como se leyo
+
+    Returns:
+        Patente en mayusculas, sin separadores e internada
+
+    Raises:
+        PatenteInvalidaException: Si no quedan entre CARACTERES_MINIMOS_PATENTE
+            y CARACTERES_MAXIMOS_PATENTE letras o digitos
+    """
+    if not isinstance(patente, str):
+        raise PatenteInvalidaException(patente)
+    canonica = limpiar_patente(patente)
+    if _FORMATO_PATENTE.fullmatch(canonica) is None:
+        raise PatenteInvalidaException(patente)
+    return sys.intern(canonica)
+
+
+def clave_patente(patente: str) -> str:
+    """Obtiene la clave canonica de una patente, o la lectura tal cual si es invalida.
+
+    Sirve a quienes registran lecturas y no deben descartar las invalidas.
+
+    Args:
+        patente: Patente tal como se leyo
+
+    Returns:
+        Patente normalizada, o la recibida si no tiene un formato valido
+    """
+    try:
+        return normalizar_patente(patente)
+    except PatenteInvalidaException:
+        return patente
+
+
+def esqueleto_patente(patente: str) -> str:
+    """Obtiene el esqueleto de una patente normalizada.
+
+    Dos patentes que solo difieren en caracteres confundibles por una
+    camara (O/0, I/1, B/8, S/5, ...) tienen el mismo esqueleto.
+
+    Args:
+        patente: Patente normalizada
+
+    Returns:
+        Esqueleto de la patente
+    """
+    return patente.translate(_CONFUNDIBLES)
+
+
+def distancia_edicion(a: str, b: str, maximo: int | None = None) -> int | None:
+    """Calcula la distancia de Levenshtein entre dos patentes.
+
+    Args:
+        a: Primera patente
+        b: Segunda patente
+        maximo: Si se indica, corta apenas la distancia lo supera
+
+    Returns:
+        Cantidad minima de inserciones, borrados o reemplazos, o None si
+        supera el maximo
+    """
+    if maximo is not None and abs(len(a) - len(b)) > maximo:
+        return None
+    # El prefijo y el sufijo comunes no cambian la distancia: las patentes
+    # parecidas suelen diferir en uno o dos caracteres
+    inicio = 0
+    while inicio < len(a) and inicio < len(b) and a[inicio] == b[inicio]:
+        inicio += 1
+    fin = 0
+    while fin < len(a) - inicio and fin < len(b) - inicio and a[-1 - fin] == b[-1 - fin]:
+        fin += 1
+    a = a[inicio:len(a) - fin]
+    b = b[inicio:len(b) - fin]
+
+    anterior = list(range(len(b) + 1))
+    for i, caracter_a in enumerate(a, 1):
+        actual = [i]
+        for j, caracter_b in enumerate(b, 1):
+            actual.append(min(
+                anterior[j] + 1,
+                actual[j - 1] + 1,
+                anterior[j - 1] + (caracter_a != caracter_b)
+            ))
+        if maximo is not None and min(actual) > maximo:
+            return None
+        anterior = actual
+    distancia = anterior[-1]
+    if maximo is not None and distancia > maximo:
+        return None
+    return distancia
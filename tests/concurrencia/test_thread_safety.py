@@ -5,8 +5,10 @@ Verifica que el sistema funciona correctamente con múltiples hilos.
 
 # Standard library
 import sys
+from collections import Counter
 from pathlib import Path
-from threading import Thread
+from random import Random
+from threading import Event, Thread
 from time import sleep
 
 # Agregar el directorio raíz al path para imports
@@ -14,9 +16,13 @@ root_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(root_dir))
 
 # Local application
+from python_estacionamiento.servicios.parking_lot import ParkingLot
 from python_estacionamiento.servicios.parking_lot_manager import ParkingLotManager
+from python_estacionamiento.patrones.observer.observer import Observer
+from python_estacionamiento.sensores.eventos import VehiculoIngresoEvento
 from python_estacionamiento.servicios.pricing_registry import PricingRegistry
 from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.excepciones.estacionamiento_exception import EstacionamientoException
 
 
 def test_singleton_thread_safety():
@@ -179,6 +185,79 @@ def test_operaciones_mixtas_concurrentes():
     print(f"[OK] Operaciones mixtas: {plazas_antes} -> {plazas_despues} plazas")
 
 
+def test_estres_operaciones_mixtas_invariantes():
+    """Verifica capacidad y contadores bajo decenas de miles de operaciones mixtas."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+    capacidad = manager.get_plazas_disponibles()
+
+    cantidad_hilos = 16
+    operaciones_por_hilo = 2500
+    # Mas patentes que plazas para forzar rechazos y colisiones por patente
+    patentes = [f"STRESS{i:04d}" for i in range(capacidad * 3)]
+    netos = [Counter() for _ in range(cantidad_hilos)]
+    violaciones = []
+    fin = Event()
+
+    def monitorear():
+        """Verifica continuamente que nunca se supere la capacidad."""
+        while not fin.is_set():
+            ocupadas = manager.get_plazas_ocupadas()
+            if ocupadas < 0 or ocupadas > capacidad:
+                violaciones.append(ocupadas)
+
+    def operar(indice: int):
+        """Ejecuta ingresos y egresos aleatorios sobre el pool de patentes."""
+        aleatorio = Random(indice)
+        for _ in range(operaciones_por_hilo):
+            patente = aleatorio.choice(patentes)
+            try:
+                if aleatorio.random() < 0.5:
+                    vehiculo = VehiculoFactory.crear_vehiculo("Auto", patente)
+                    manager.ingresar_vehiculo(vehiculo)
+                    netos[indice][patente] += 1
+                else:
+                    # Una lectura ausente puede conciliarse con una patente parecida
+                    egresado = manager.egresar_vehiculo(patente)
+                    netos[indice][egresado.get_patente()] -= 1
+            except EstacionamientoException:
+                pass
+
+    intervalo_original = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)  # Mas cambios de contexto, mas intercalado
+    try:
+        monitor = Thread(target=monitorear)
+        monitor.start()
+        hilos = [Thread(target=operar, args=(i,)) for i in range(cantidad_hilos)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        fin.set()
+        monitor.join()
+    finally:
+        sys.setswitchinterval(intervalo_original)
+
+    neto_total = Counter()
+    for neto in netos:
+        neto_total.update(neto)
+
+    vehiculos_activos = manager.get_todos_vehiculos()
+
+    assert violaciones == []
+    assert manager.get_plazas_ocupadas() == len(vehiculos_activos)
+    assert manager.get_plazas_ocupadas() == sum(neto_total.values())
+    assert manager.get_plazas_ocupadas() <= capacidad
+    for patente in patentes:
+        # Cada patente esta dentro a lo sumo una vez
+        assert neto_total[patente] in (0, 1)
+        assert (neto_total[patente] == 1) == (patente in vehiculos_activos)
+
+    manager.reset()
+    print(f"[OK] Estres: {cantidad_hilos * operaciones_por_hilo} operaciones, "
+          f"{len(vehiculos_activos)} vehiculos al final")
+
+
 def test_pricing_registry_thread_safety():
     """Verifica que PricingRegistry es thread-safe."""
     instancias = []
@@ -205,6 +284,35 @@ def test_pricing_registry_thread_safety():
     print(f"[OK] PricingRegistry thread-safe: {len(instancias)} hilos, 1 instancia")
 
 
+class EgresoInmediato(Observer):
+    """Observador que egresa cada vehiculo apenas se notifica su ingreso."""
+
+    def __init__(self, lote):
+        self._lote = lote
+        self.egresados = []
+
+    def actualizar(self, evento):
+        if isinstance(evento, VehiculoIngresoEvento):
+            patente = evento.vehiculo.get_patente()
+            self.egresados.append(self._lote.egresar_vehiculo(patente).get_patente())
+
+
+def test_observador_puede_operar_sobre_la_misma_patente():
+    """Verifica que los eventos se notifican fuera del lock del stripe de la patente."""
+    lote = ParkingLot("reentrante", 10)
+    observador = EgresoInmediato(lote)
+    lote.agregar_observador(observador)
+
+    hilo = Thread(target=lote.ingresar_vehiculo, args=(VehiculoFactory.crear_vehiculo("Auto", "REE001"),))
+    hilo.start()
+    hilo.join(timeout=5)
+
+    assert not hilo.is_alive(), "El observador quedo bloqueado en el lock de la patente"
+    assert observador.egresados == ["REE001"]
+    assert lote.get_plazas_ocupadas() == 0
+    print("[OK] Observador opera sobre el lote sin deadlock")
+
+
 if __name__ == "__main__":
     print("\n=============== TESTS DE CONCURRENCIA Y THREAD-SAFETY ===============\n")
 
@@ -213,6 +321,8 @@ if __name__ == "__main__":
     test_ingreso_concurrente()
     test_egreso_concurrente()
     test_operaciones_mixtas_concurrentes()
+    test_estres_operaciones_mixtas_invariantes()
+    test_observador_puede_operar_sobre_la_misma_patente()
 
     print("\n[OK] Todos los tests de concurrencia pasaron")
     print("     - Singleton thread-safe verificado")
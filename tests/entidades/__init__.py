@@ -0,0 +1,3 @@
+# Standard library
+
+# Local application
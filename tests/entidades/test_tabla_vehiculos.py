@@ -0,0 +1,109 @@
+"""Tests para la representacion compacta de vehiculos.
+
+Verifica los __slots__ de las entidades y la tabla columnar con sus vistas.
+"""
+
+# Standard library
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.entidades.vehiculos.tabla_vehiculos import TablaVehiculos
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.patrones.strategy.impl.pricing_standard_strategy import PricingStandardStrategy
+
+
+def test_vehiculos_sin_dict():
+    """Verifica que las entidades usan __slots__."""
+    for tipo in ["Moto", "Auto", "Camioneta"]:
+        vehiculo = VehiculoFactory.crear_vehiculo(tipo, "SLOT001")
+        assert not hasattr(vehiculo, '__dict__')
+        try:
+            vehiculo.atributo_nuevo = 1
+            assert False, "No deberia aceptar atributos fuera de __slots__"
+        except AttributeError:
+            pass
+    print("[OK] Vehiculos con __slots__")
+
+
+def test_vistas_de_la_tabla():
+    """Verifica que las vistas leen y escriben las columnas de la tabla."""
+    tabla = TablaVehiculos()
+    ingreso = datetime(2025, 11, 4, 9, 30, 15, 123456)
+    for i, tipo in enumerate(["Moto", "Auto", "Camioneta"]):
+        vehiculo = VehiculoFactory.crear_vehiculo(tipo, f"COL00{i}")
+        vehiculo.set_hora_ingreso(ingreso)
+        tabla.agregar(vehiculo)
+
+    vista = tabla.get("COL001")
+    assert vista.get_tipo() == "Auto"
+    assert vista.get_tarifa_base() == 100.0 and vista.get_tolerancia_minutos() == 15
+    assert vista.get_hora_ingreso() == ingreso and vista.get_hora_egreso() is None
+
+    vista.set_hora_egreso(ingreso + timedelta(hours=2))
+    tabla.eliminar("COL000")  # la ultima fila pasa a ocupar la eliminada
+    assert len(tabla) == 2 and "COL000" not in tabla and tabla.get("COL000") is None
+    assert tabla.get("COL002").get_tipo() == "Camioneta"
+    assert vista.get_hora_egreso() == ingreso + timedelta(hours=2)
+    print("[OK] Vistas sobre la tabla columnar")
+
+
+def test_columnas_sirven_para_precios_por_lote():
+    """Verifica que las columnas alimentan calcular_precios_lote."""
+    tabla = TablaVehiculos()
+    estrategia = PricingStandardStrategy()
+    base = datetime(2025, 11, 4, 8, 0)
+    for i in range(30):
+        vehiculo = VehiculoFactory.crear_vehiculo(["Moto", "Auto", "Camioneta"][i % 3], f"LOT{i:03d}")
+        vehiculo.set_hora_ingreso(base + timedelta(minutes=7 * i))
+        vehiculo.set_hora_egreso(base + timedelta(hours=5))
+        tabla.agregar(vehiculo)
+
+    precios = estrategia.calcular_precios_lote(
+        tabla.get_tarifas(), tabla.get_tolerancias(), tabla.get_ingresos(), tabla.get_egresos()
+    )
+    esperados = [
+        estrategia.calcular_precio(vista, vista.get_hora_ingreso(), vista.get_hora_egreso())
+        for vista in tabla
+    ]
+    assert precios == esperados
+    print("[OK] Precios por lote desde las columnas")
+
+
+def test_horas_con_zona_horaria_rechazadas():
+    """Verifica que la tabla rechaza horas con zona horaria en lugar de perder el offset."""
+    tabla = TablaVehiculos()
+    vehiculo = VehiculoFactory.crear_vehiculo("Auto", "TZ0001")
+    vehiculo.set_hora_ingreso(datetime(2025, 11, 4, 9, 0, tzinfo=timezone.utc))
+    try:
+        tabla.agregar(vehiculo)
+        assert False, "Deberia rechazar una hora con zona horaria"
+    except ValueError:
+        pass
+    assert "TZ0001" not in tabla and len(tabla) == 0
+
+    vehiculo.set_hora_ingreso(datetime(2025, 11, 4, 9, 0))
+    vista = tabla.agregar(vehiculo)
+    try:
+        vista.set_hora_egreso(datetime(2025, 11, 4, 11, 0, tzinfo=timezone.utc))
+        assert False, "Deberia rechazar una hora con zona horaria"
+    except ValueError:
+        pass
+    assert vista.get_hora_egreso() is None
+    print("[OK] Horas con zona horaria rechazadas")
+
+
+if __name__ == "__main__":
+    print("\n=============== TESTS DE TABLA DE VEHICULOS ===============\n")
+
+    test_vehiculos_sin_dict()
+    test_vistas_de_la_tabla()
+    test_columnas_sirven_para_precios_por_lote()
+    test_horas_con_zona_horaria_rechazadas()
+
+    print("\n[OK] Todos los tests de TablaVehiculos pasaron")
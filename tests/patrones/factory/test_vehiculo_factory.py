@@ -17,6 +17,25 @@ from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFac
 from python_estacionamiento.entidades.vehiculos.moto import Moto
 from python_estacionamiento.entidades.vehiculos.auto import Auto
 from python_estacionamiento.entidades.vehiculos.camioneta import Camioneta
+from python_estacionamiento.entidades.vehiculos.tipo_vehiculo import TipoVehiculo
+from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+from python_estacionamiento.entidades.vehiculos.tabla_vehiculos import TablaVehiculos
+from python_estacionamiento.persistencia.formato_binario import codificar_snapshot, decodificar_snapshot
+from python_estacionamiento.servicios.tabla_ocupacion_compartida import TablaOcupacionCompartida
+
+
+class Bicicleta(Vehiculo):
+    """Tipo de vehiculo registrado solo para los tests."""
+
+    __slots__ = ()
+    _tipo = TipoVehiculo("Bicicleta", 1.5, 10.0, 30)
+
+
+class Triciclo(Vehiculo):
+    """Tipo de vehiculo con un codigo fijo, registrado solo para los tests."""
+
+    __slots__ = ()
+    _tipo = TipoVehiculo("Triciclo", 2.0, 15.0, 30, codigo=2)
 
 
 def test_crear_moto():
@@ -58,9 +77,130 @@ def test_tipo_desconocido_lanza_excepcion():
         assert "desconocido" in str(e).lower()
 
 
+def test_vehiculos_comparten_descriptor_de_tipo():
+    """Verifica que los vehiculos de un tipo apuntan al mismo descriptor."""
+    auto1 = VehiculoFactory.crear_vehiculo("Auto", "AAA111")
+    auto2 = VehiculoFactory.crear_vehiculo("Auto", "BBB222")
+
+    assert auto1.get_tipo_vehiculo() is auto2.get_tipo_vehiculo()
+    assert auto1.get_tipo_vehiculo() is VehiculoFactory.get_tipo("Auto")
+
+
+def test_actualizar_tipo_afecta_vehiculos_existentes():
+    """Verifica que cambiar la tarifa del tipo alcanza a todos salvo los sobrescritos."""
+    original = VehiculoFactory.get_tipo("Moto")
+    moto = VehiculoFactory.crear_vehiculo("Moto", "MOT001")
+    moto_especial = VehiculoFactory.crear_vehiculo("Moto", "MOT002")
+    moto_especial.set_tarifa_base(30.0)
+    try:
+        VehiculoFactory.actualizar_tipo("Moto", tarifa_base=80.0)
+
+        assert moto.get_tarifa_base() == 80.0
+        assert moto_especial.get_tarifa_base() == 30.0
+        assert VehiculoFactory.crear_vehiculo("Moto", "MOT003").get_tarifa_base() == 80.0
+        assert moto.get_superficie() == original.superficie
+    finally:
+        Moto.set_tipo_vehiculo(original)
+
+    assert moto.get_tarifa_base() == 50.0
+
+
+def test_registrar_tipo_nuevo():
+    """Verifica que un tipo registrado se crea y luego se puede quitar."""
+    VehiculoFactory.registrar_tipo("Bicicleta", Bicicleta)
+    try:
+        bicicleta = VehiculoFactory.crear_vehiculo("Bicicleta", "BICI01")
+
+        assert isinstance(bicicleta, Bicicleta)
+        assert bicicleta.get_tarifa_base() == 10.0
+        assert "Bicicleta" in VehiculoFactory.get_tipos()
+        try:
+            VehiculoFactory.registrar_tipo("Bicicleta", Bicicleta)
+            assert False, "Deberia haber lanzado ValueError"
+        except ValueError as e:
+            assert "registrado" in str(e)
+    finally:
+        VehiculoFactory.desregistrar_tipo("Bicicleta")
+
+    assert "Bicicleta" not in VehiculoFactory.get_tipos()
+    try:
+        VehiculoFactory.crear_vehiculo("Bicicleta", "BICI02")
+        assert False, "Deberia haber lanzado ValueError"
+    except ValueError:
+        pass
+
+
+def test_crear_vehiculos_en_bloque():
+    """Verifica la creacion en bloque con tipos mixtos y con un unico tipo."""
+    tipos = ["Moto", "Auto", "Camioneta"] * 100
+    patentes = [f"BLQ{i:04d}" for i in range(len(tipos))]
+
+    vehiculos = VehiculoFactory.crear_vehiculos(tipos, patentes)
+    assert [type(v).__name__ for v in vehiculos] == tipos
+    assert [v.get_patente() for v in vehiculos] == patentes
+
+    autos = VehiculoFactory.crear_vehiculos("Auto", patentes[:10])
+    assert all(isinstance(v, Auto) for v in autos)
+
+    for tipos_invalidos, patentes_invalidas in ((["Auto", "Bicicleta"], ["X1", "X2"]), (["Auto"], ["X1", "X2"])):
+        try:
+            VehiculoFactory.crear_vehiculos(tipos_invalidos, patentes_invalidas)
+            assert False, "Deberia haber lanzado ValueError"
+        except ValueError:
+            pass
+
+
+def test_codigos_de_tipo_registrados():
+    """Verifica que los codigos de tipo salen del registro y los usan todas las representaciones."""
+    assert VehiculoFactory.get_codigos() == {"Moto": 1, "Auto": 2, "Camioneta": 3}
+    try:
+        VehiculoFactory.registrar_tipo("Triciclo", Triciclo)
+        assert False, "Deberia rechazar un codigo en uso"
+    except ValueError as e:
+        assert "codigo" in str(e)
+    try:
+        VehiculoFactory.actualizar_tipo("Auto", codigo=9)
+        assert False, "Deberia rechazar el cambio de codigo"
+    except ValueError:
+        pass
+
+    VehiculoFactory.registrar_tipo("Bicicleta", Bicicleta)
+    try:
+        assert VehiculoFactory.get_tipo("Bicicleta").codigo == 4
+        assert VehiculoFactory.get_tipos_por_codigo()[4] == "Bicicleta"
+        bicicleta = VehiculoFactory.crear_vehiculo("Bicicleta", "BICI03")
+
+        tabla = TablaVehiculos()
+        assert tabla.agregar(bicicleta).get_tipo() == "Bicicleta"
+
+        snapshot = codificar_snapshot({'vehiculos': [{'patente': "BICI03", 'tipo': "Bicicleta"}]})
+        assert decodificar_snapshot(snapshot)['vehiculos'][0]['tipo'] == "Bicicleta"
+
+        ocupacion = TablaOcupacionCompartida.crear(2)
+        try:
+            assert ocupacion.ingresar("BICI03", "Bicicleta") == 1
+            assert ocupacion.get_plazas_ocupadas("Bicicleta") == 1
+        finally:
+            ocupacion.destruir()
+    finally:
+        VehiculoFactory.desregistrar_tipo("Bicicleta")
+
+    assert 4 not in VehiculoFactory.get_tipos_por_codigo()
+    try:
+        decodificar_snapshot(snapshot)
+        assert False, "Deberia rechazar un codigo de tipo no registrado"
+    except ValueError:
+        pass
+
+
 if __name__ == "__main__":
     test_crear_moto()
     test_crear_auto()
     test_crear_camioneta()
     test_tipo_desconocido_lanza_excepcion()
+    test_vehiculos_comparten_descriptor_de_tipo()
+    test_actualizar_tipo_afecta_vehiculos_existentes()
+    test_registrar_tipo_nuevo()
+    test_crear_vehiculos_en_bloque()
+    test_codigos_de_tipo_registrados()
     print("[OK] Todos los tests de Factory pasaron")
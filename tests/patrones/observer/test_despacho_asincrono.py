@@ -0,0 +1,190 @@
+"""Tests para el despacho asincrono del patron Observer.
+
+Verifica que cada observador se atiende desde su propia cola acotada
+y que las politicas de desborde se respetan.
+"""
+
+# Standard library
+import sys
+from pathlib import Path
+from threading import Event, Thread
+from time import perf_counter
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.patrones.observer.observable import Observable
+from python_estacionamiento.patrones.observer.observer import Observer
+from python_estacionamiento.patrones.observer.despachador_observador import (
+    DespachadorObservador,
+    PoliticaDesborde
+)
+
+
+class ObservableEnteros(Observable[int]):
+    """Observable de prueba que emite enteros."""
+
+    def emitir_valor(self, valor: int):
+        """Emite un valor a los observadores."""
+        self.notificar_observadores(valor)
+
+
+class ObservadorBloqueado(Observer[int]):
+    """Observer de prueba que no procesa hasta que se libera."""
+
+    def __init__(self):
+        self.liberar = Event()
+        self.valores = []
+
+    def actualizar(self, evento: int) -> None:
+        """Espera la liberacion y registra el valor."""
+        self.liberar.wait()
+        self.valores.append(evento)
+
+
+def test_observador_lento_no_bloquea_notificacion():
+    """Verifica que notificar no espera al observador."""
+    observable = ObservableEnteros()
+    observador = ObservadorBloqueado()
+    observable.agregar_observador(observador)
+    observable.habilitar_despacho_asincrono(capacidad_cola=100)
+
+    inicio = perf_counter()
+    for valor in range(50):
+        observable.emitir_valor(valor)
+    duracion = perf_counter() - inicio
+
+    assert duracion < 0.5
+    assert observable.get_metricas_despacho(observador).eventos_encolados == 50
+
+    observador.liberar.set()
+    assert observable.esperar_despacho(timeout=2.0)
+    assert observador.valores == list(range(50))
+
+    observable.deshabilitar_despacho_asincrono()
+
+
+def test_politica_descartar_antiguo():
+    """Verifica que con cola llena se descartan los eventos mas antiguos."""
+    observable = ObservableEnteros()
+    observador = ObservadorBloqueado()
+    observable.agregar_observador(observador)
+    observable.habilitar_despacho_asincrono(
+        capacidad_cola=5, politica=PoliticaDesborde.DESCARTAR_ANTIGUO
+    )
+
+    observable.emitir_valor(0)  # Tomado por el trabajador (queda bloqueado)
+    observable.esperar_despacho(timeout=0.1)
+    for valor in range(1, 21):
+        observable.emitir_valor(valor)
+
+    metricas = observable.get_metricas_despacho(observador)
+    assert metricas.profundidad_cola == 5
+    assert metricas.eventos_descartados == 15
+
+    observador.liberar.set()
+    observable.deshabilitar_despacho_asincrono()
+    assert observador.valores == [0, 16, 17, 18, 19, 20]
+
+
+def test_politica_coalescer():
+    """Verifica que con cola llena se reemplaza el evento de misma clave."""
+    observable = ObservableEnteros()
+    observador = ObservadorBloqueado()
+    observable.agregar_observador(observador)
+    observable.habilitar_despacho_asincrono(
+        capacidad_cola=2,
+        politica=PoliticaDesborde.COALESCER,
+        clave_coalescencia=lambda valor: valor % 2
+    )
+
+    observable.emitir_valor(0)
+    observable.esperar_despacho(timeout=0.1)
+    for valor in range(1, 7):
+        observable.emitir_valor(valor)
+
+    metricas = observable.get_metricas_despacho(observador)
+    assert metricas.eventos_coalescidos == 4
+    assert metricas.eventos_descartados == 0
+
+    observador.liberar.set()
+    observable.deshabilitar_despacho_asincrono()
+    assert observador.valores == [0, 5, 6]
+
+
+def test_deshabilitar_vacia_colas_y_vuelve_a_sincronico():
+    """Verifica que al deshabilitar se entregan los pendientes."""
+    observable = ObservableEnteros()
+    observador = ObservadorBloqueado()
+    observador.liberar.set()
+    observable.agregar_observador(observador)
+    observable.habilitar_despacho_asincrono()
+
+    for valor in range(10):
+        observable.emitir_valor(valor)
+    observable.deshabilitar_despacho_asincrono()
+
+    assert observador.valores == list(range(10))
+    assert observable.get_metricas_despacho(observador) is None
+
+    observable.emitir_valor(99)
+    assert observador.valores[-1] == 99
+
+
+def test_encolar_con_despachador_detenido_descarta():
+    """Verifica que un despachador detenido descarta sin lanzar."""
+    observador = ObservadorBloqueado()
+    observador.liberar.set()
+    despachador = DespachadorObservador(observador)
+    despachador.detener()
+
+    despachador.encolar(1)
+
+    metricas = despachador.get_metricas()
+    assert metricas.eventos_descartados == 1
+    assert metricas.eventos_encolados == 0
+    assert observador.valores == []
+
+
+def test_deshabilitar_concurrente_con_notificacion():
+    """Verifica que deshabilitar mientras otro hilo notifica no hace fallar la notificacion."""
+    observable = ObservableEnteros()
+    observador = ObservadorBloqueado()
+    observador.liberar.set()
+    observable.agregar_observador(observador)
+    observable.habilitar_despacho_asincrono(capacidad_cola=4)
+
+    errores = []
+    terminado = Event()
+
+    def notificar():
+        try:
+            for valor in range(5000):
+                observable.emitir_valor(valor)
+        except Exception as e:
+            errores.append(e)
+        finally:
+            terminado.set()
+
+    hilo = Thread(target=notificar)
+    hilo.start()
+    while not terminado.is_set():
+        observable.deshabilitar_despacho_asincrono()
+        observable.habilitar_despacho_asincrono(capacidad_cola=4)
+    hilo.join()
+    observable.deshabilitar_despacho_asincrono()
+
+    assert errores == []
+    assert len(observador.valores) <= 5000
+
+
+if __name__ == "__main__":
+    test_observador_lento_no_bloquea_notificacion()
+    test_politica_descartar_antiguo()
+    test_politica_coalescer()
+    test_deshabilitar_vacia_colas_y_vuelve_a_sincronico()
+    test_encolar_con_despachador_detenido_descarta()
+    test_deshabilitar_concurrente_con_notificacion()
+    print("[OK] Todos los tests de despacho asincrono pasaron")
@@ -0,0 +1,121 @@
+"""Tests para el cronograma tarifario por franjas horarias.
+
+Verifica la division de estadias en franjas, el cruce de medianoche y
+que el calculo por lote coincide con el individual.
+"""
+
+# Standard library
+import random
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.patrones.strategy import calculo_lote
+from python_estacionamiento.patrones.strategy.cronograma_tarifario import (
+    CronogramaTarifario,
+    FranjaHoraria,
+    FRANJA_HAPPY_HOUR,
+    FRANJA_NOCTURNA
+)
+from python_estacionamiento.patrones.strategy.impl.pricing_happy_hour_strategy import PricingHappyHourStrategy
+from python_estacionamiento.patrones.strategy.impl.pricing_franja_horaria_strategy import PricingFranjaHorariaStrategy
+
+
+def test_happy_hour_solo_descuenta_su_franja():
+    """Verifica que el descuento aplica solo a la parte dentro de la franja."""
+    auto = VehiculoFactory.crear_vehiculo("Auto", "FRJ001")
+    estrategia = PricingHappyHourStrategy()
+
+    # Cobrable de 16:15 a 18:15: 0.75 h con descuento y 1.25 h a tarifa completa
+    # Precio: 100 * (0.75 * 0.8 + 1.25) = 185.0
+    precio = estrategia.calcular_precio(
+        auto, datetime(2025, 11, 4, 16, 0), datetime(2025, 11, 4, 18, 15)
+    )
+
+    assert precio == 185.0
+    print(f"[OK] Happy Hour parcial: ${precio}")
+
+
+def test_franja_nocturna_cruza_medianoche():
+    """Verifica el descuento nocturno en una estadia que cruza la medianoche."""
+    auto = VehiculoFactory.crear_vehiculo("Auto", "FRJ002")
+    estrategia = PricingFranjaHorariaStrategy()
+
+    # Cobrable de 22:00 a 07:00: 8 h nocturnas (factor 0.85) y 1 h normal
+    # Precio: 100 * (8 * 0.85 + 1) = 780.0
+    precio = estrategia.calcular_precio(
+        auto, datetime(2025, 11, 4, 21, 45), datetime(2025, 11, 5, 7, 0)
+    )
+
+    assert precio == 780.0
+
+    tramos = estrategia.get_cronograma().desglosar(
+        datetime(2025, 11, 4, 22, 0), datetime(2025, 11, 5, 7, 0)
+    )
+    assert [(tramo[0].hour, tramo[1].hour, tramo[3]) for tramo in tramos] == [
+        (22, 6, "nocturna"), (6, 7, "normal")
+    ]
+    print(f"[OK] Estadia nocturna: ${precio}")
+
+
+def test_estadia_de_varios_dias_coincide_con_desglose():
+    """Verifica que las horas ponderadas coinciden con la suma de los tramos."""
+    fines_de_semana = FranjaHoraria("fin_de_semana", 0, 24, 0.5, frozenset({5, 6}))
+    cronograma = CronogramaTarifario((fines_de_semana, FRANJA_HAPPY_HOUR, FRANJA_NOCTURNA))
+    inicio = datetime(2025, 11, 3, 9, 17, 30)
+    fin = datetime(2025, 11, 19, 20, 5)
+
+    tramos = cronograma.desglosar(inicio, fin)
+    esperado = sum((hasta - desde).total_seconds() / 3600.0 * factor for desde, hasta, factor, _ in tramos)
+
+    assert abs(cronograma.horas_ponderadas(inicio, fin) - esperado) < 1e-9
+    # El sabado solo aplica la franja de fin de semana (tiene prioridad)
+    assert cronograma.segmentos_del_dia(5) == ((0.0, 24.0, 0.5, "fin_de_semana"),)
+    print(f"[OK] Estadia de varios dias: {esperado:.2f} horas ponderadas")
+
+
+def test_franjas_lote_coinciden_con_calculo_individual():
+    """Verifica que el calculo por lote reproduce calcular_precio, con y sin NumPy."""
+    generador = random.Random(7)
+    base = datetime(2025, 11, 1, 0, 0)
+    estadias = []
+    for i in range(1000):
+        vehiculo = VehiculoFactory.crear_vehiculo(generador.choice(["Moto", "Auto", "Camioneta"]), f"FL{i:04d}")
+        ingreso = base + timedelta(seconds=generador.randint(0, 7 * 86400))
+        egreso = ingreso + timedelta(seconds=generador.randint(0, 3 * 86400))
+        estadias.append((vehiculo, ingreso, egreso))
+
+    tarifas = [v.get_tarifa_base() for v, _, _ in estadias]
+    tolerancias = [v.get_tolerancia_minutos() for v, _, _ in estadias]
+    ingresos = [ingreso.timestamp() for _, ingreso, _ in estadias]
+    egresos = [egreso.timestamp() for _, _, egreso in estadias]
+
+    numpy = calculo_lote.np
+    modos = [numpy, None] if numpy is not None else [None]
+    try:
+        for modo in modos:
+            calculo_lote.np = modo
+            for estrategia in (PricingFranjaHorariaStrategy(), PricingHappyHourStrategy()):
+                esperados = [estrategia.calcular_precio(v, i, e) for v, i, e in estadias]
+                assert estrategia.calcular_precios_lote(tarifas, tolerancias, ingresos, egresos) == esperados
+    finally:
+        calculo_lote.np = numpy
+
+    print("[OK] Calculo por lote con franjas coincide con el individual")
+
+
+if __name__ == "__main__":
+    print("\n=============== TESTS DE CRONOGRAMA TARIFARIO ===============\n")
+
+    test_happy_hour_solo_descuenta_su_franja()
+    test_franja_nocturna_cruza_medianoche()
+    test_estadia_de_varios_dias_coincide_con_desglose()
+    test_franjas_lote_coinciden_con_calculo_individual()
+
+    print("\n[OK] Todos los tests de cronograma tarifario pasaron")
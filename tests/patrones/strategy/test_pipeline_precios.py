@@ -0,0 +1,181 @@
+"""Tests para el pipeline de precios componible.
+
+Verifica que los pipelines reproducen las estrategias clasicas, que se
+pueden combinar modificadores y que el registro los cambia de forma atomica.
+"""
+
+# Standard library
+import random
+import sys
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.constantes import RECARGO_VALET, RECARGO_EVENTO_ESPECIAL
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.patrones.strategy import calculo_lote
+from python_estacionamiento.patrones.strategy.cronograma_tarifario import (
+    CronogramaTarifario,
+    FRANJA_HAPPY_HOUR,
+    FRANJA_NOCTURNA
+)
+from python_estacionamiento.patrones.strategy.pipeline_precios import (
+    Descuento,
+    FranjasHorarias,
+    Minimo,
+    Recargo,
+    TarifaBase,
+    Tolerancia,
+    Tope
+)
+from python_estacionamiento.patrones.strategy.impl.pricing_pipeline_strategy import PricingPipelineStrategy
+from python_estacionamiento.patrones.strategy.impl.pricing_standard_strategy import PricingStandardStrategy
+from python_estacionamiento.patrones.strategy.impl.pricing_valet_strategy import PricingValetStrategy
+from python_estacionamiento.patrones.strategy.impl.pricing_evento_strategy import PricingEventoStrategy
+from python_estacionamiento.patrones.strategy.impl.pricing_franja_horaria_strategy import PricingFranjaHorariaStrategy
+from python_estacionamiento.servicios.pricing_registry import PricingRegistry
+
+
+def _estadias(cantidad):
+    """Genera estadias aleatorias de hasta dos dias."""
+    generador = random.Random(11)
+    base = datetime(2025, 11, 3, 0, 0)
+    estadias = []
+    for i in range(cantidad):
+        vehiculo = VehiculoFactory.crear_vehiculo(generador.choice(["Moto", "Auto", "Camioneta"]), f"PIP{i:04d}")
+        ingreso = base + timedelta(seconds=generador.randint(0, 5 * 86400))
+        egreso = ingreso + timedelta(seconds=generador.randint(0, 2 * 86400))
+        estadias.append((vehiculo, ingreso, egreso))
+    return estadias
+
+
+def test_pipelines_reproducen_estrategias_clasicas():
+    """Verifica que cada estrategia clasica tiene un pipeline equivalente, individual y por lote."""
+    cronograma = CronogramaTarifario((FRANJA_HAPPY_HOUR, FRANJA_NOCTURNA))
+    equivalencias = [
+        (PricingStandardStrategy(), PricingPipelineStrategy(Tolerancia(), TarifaBase())),
+        (PricingValetStrategy(), PricingPipelineStrategy(Tolerancia(), TarifaBase(), Recargo(RECARGO_VALET))),
+        (PricingEventoStrategy(),
+         PricingPipelineStrategy(Tolerancia(), TarifaBase(), Recargo(RECARGO_EVENTO_ESPECIAL))),
+        (PricingFranjaHorariaStrategy(cronograma),
+         PricingPipelineStrategy(Tolerancia(), TarifaBase(), FranjasHorarias(cronograma))),
+    ]
+    estadias = _estadias(500)
+    columnas = (
+        [v.get_tarifa_base() for v, _, _ in estadias],
+        [v.get_tolerancia_minutos() for v, _, _ in estadias],
+        [i.timestamp() for _, i, _ in estadias],
+        [e.timestamp() for _, _, e in estadias],
+    )
+
+    numpy = calculo_lote.np
+    modos = [numpy, None] if numpy is not None else [None]
+    try:
+        for clasica, pipeline in equivalencias:
+            esperados = [clasica.calcular_precio(v, i, e) for v, i, e in estadias]
+            assert [pipeline.calcular_precio(v, i, e) for v, i, e in estadias] == esperados
+            for modo in modos:
+                calculo_lote.np = modo
+                assert pipeline.calcular_precios_lote(*columnas) == esperados
+    finally:
+        calculo_lote.np = numpy
+
+    print("[OK] Pipelines equivalentes a las estrategias clasicas")
+
+
+def test_combina_modificadores():
+    """Verifica una combinacion de reglas sin subclases y con tope."""
+    auto = VehiculoFactory.crear_vehiculo("Auto", "PIP999")
+    estrategia = PricingPipelineStrategy(
+        Tolerancia(),
+        TarifaBase(),
+        FranjasHorarias(CronogramaTarifario((FRANJA_HAPPY_HOUR,))),
+        Recargo(RECARGO_VALET),
+        Descuento(0.10),
+        Minimo(50.0),
+        Tope(1000.0)
+    )
+
+    # Cobrable de 14:15 a 16:00 en Happy Hour: 100 * 1.75 * 0.8 = 140.0
+    # Valet: 182.0, descuento 10%: 163.8
+    assert estrategia.calcular_precio(
+        auto, datetime(2025, 11, 4, 14, 0), datetime(2025, 11, 4, 16, 0)
+    ) == 163.8
+    # Dentro de la tolerancia se aplica el minimo
+    assert estrategia.calcular_precio(
+        auto, datetime(2025, 11, 4, 10, 0), datetime(2025, 11, 4, 10, 5)
+    ) == 50.0
+    # Una estadia de varios dias queda topeada
+    assert estrategia.calcular_precio(
+        auto, datetime(2025, 11, 4, 10, 0), datetime(2025, 11, 7, 10, 0)
+    ) == 1000.0
+    assert [type(m) for m in estrategia.get_modificadores()][-3:] == [Descuento, Minimo, Tope]
+    print("[OK] Pipeline combinado sin subclases")
+
+
+def test_pipeline_invalido():
+    """Verifica que los pipelines mal formados se rechazan al compilar."""
+    for modificadores in (
+        (Tolerancia(),),
+        (TarifaBase(), TarifaBase()),
+        (TarifaBase(), Recargo(0.1), Tolerancia()),
+        (TarifaBase(), "recargo"),
+    ):
+        try:
+            PricingPipelineStrategy(*modificadores)
+            assert False, f"Deberia rechazar {modificadores}"
+        except ValueError:
+            pass
+
+    print("[OK] Pipelines invalidos rechazados")
+
+
+def test_registro_cambia_pipeline_atomicamente():
+    """Verifica que los calculos concurrentes ven siempre un pipeline completo."""
+    registro = PricingRegistry.get_instance()
+    auto = VehiculoFactory.crear_vehiculo("Auto", "PIP500")
+    ingreso = datetime(2025, 11, 4, 9, 0)
+    egreso = datetime(2025, 11, 4, 11, 0)
+    validos = {175.0, 227.5}
+    invalidos = []
+    detener = threading.Event()
+
+    def calcular():
+        while not detener.is_set():
+            precio = registro.calcular_precio(auto, ingreso, egreso)
+            if precio not in validos:
+                invalidos.append(precio)
+
+    hilos = [threading.Thread(target=calcular) for _ in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    try:
+        for i in range(200):
+            if i % 2:
+                registro.set_pipeline(Tolerancia(), TarifaBase(), Recargo(RECARGO_VALET))
+            else:
+                registro.set_pipeline(Tolerancia(), TarifaBase())
+    finally:
+        detener.set()
+        for hilo in hilos:
+            hilo.join()
+        registro.set_estrategia(PricingStandardStrategy())
+
+    assert invalidos == []
+    print("[OK] Cambio de pipeline atomico bajo concurrencia")
+
+
+if __name__ == "__main__":
+    print("\n=============== TESTS DE PIPELINE DE PRECIOS ===============\n")
+
+    test_pipelines_reproducen_estrategias_clasicas()
+    test_combina_modificadores()
+    test_pipeline_invalido()
+    test_registro_cambia_pipeline_atomicamente()
+
+    print("\n[OK] Todos los tests de pipeline de precios pasaron")
@@ -5,6 +5,8 @@ correctamente los montos.
 """
 
 # Standard library
+import math
+import random
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -19,6 +21,18 @@ from python_estacionamiento.patrones.strategy.impl.pricing_standard_strategy imp
 from python_estacionamiento.patrones.strategy.impl.pricing_happy_hour_strategy import PricingHappyHourStrategy
 from python_estacionamiento.patrones.strategy.impl.pricing_valet_strategy import PricingValetStrategy
 from python_estacionamiento.patrones.strategy.impl.pricing_evento_strategy import PricingEventoStrategy
+from python_estacionamiento.patrones.strategy import calculo_lote
+from python_estacionamiento.patrones.strategy.pricing_strategy import PricingStrategy
+
+
+class PricingHoraIniciadaStrategy(PricingStrategy):
+    """Estrategia de prueba sin calculo por lote propio: cobra cada hora iniciada."""
+
+    def calcular_precio(self, vehiculo, hora_ingreso, hora_egreso) -> float:
+        """Cobra la tarifa por cada hora iniciada luego de la tolerancia."""
+        minutos = (hora_egreso - hora_ingreso).total_seconds() / 60.0
+        horas = math.ceil(max(0.0, minutos - vehiculo.get_tolerancia_minutos()) / 60.0)
+        return round(vehiculo.get_tarifa_base() * horas, 2)
 
 
 def test_pricing_standard():
@@ -43,8 +57,9 @@ def test_pricing_happy_hour():
     auto = VehiculoFactory.crear_vehiculo("Auto", "XYZ789")
     estrategia = PricingHappyHourStrategy()
 
-    hora_ingreso = datetime.now() - timedelta(hours=2)
-    hora_egreso = datetime.now()
+    # Estadia completa dentro del Happy Hour (14 a 17 hs)
+    hora_ingreso = datetime(2025, 11, 4, 14, 0)
+    hora_egreso = datetime(2025, 11, 4, 16, 0)
 
     precio = estrategia.calcular_precio(auto, hora_ingreso, hora_egreso)
 
@@ -98,10 +113,75 @@ def test_tolerancia_aplicada():
     assert precio == 0.0
 
 
+def _estadias_aleatorias(cantidad):
+    """Genera estadias con duraciones de hasta 12 horas, en segundos enteros."""
+    generador = random.Random(42)
+    base = datetime(2025, 11, 4, 8, 0)
+    estadias = []
+    for i in range(cantidad):
+        vehiculo = VehiculoFactory.crear_vehiculo(
+            generador.choice(["Moto", "Auto", "Camioneta"]), f"LOT{i:05d}"
+        )
+        ingreso = base + timedelta(seconds=generador.randint(0, 36000))
+        egreso = ingreso + timedelta(seconds=generador.randint(0, 43200))
+        estadias.append((vehiculo, ingreso, egreso))
+    return estadias
+
+
+def test_precios_lote_coinciden_con_calculo_individual():
+    """Verifica que el calculo por lote reproduce calcular_precio, con y sin NumPy."""
+    estadias = _estadias_aleatorias(2000)
+    tarifas = [v.get_tarifa_base() for v, _, _ in estadias]
+    tolerancias = [v.get_tolerancia_minutos() for v, _, _ in estadias]
+    ingresos = [ingreso.timestamp() for _, ingreso, _ in estadias]
+    egresos = [egreso.timestamp() for _, _, egreso in estadias]
+
+    numpy = calculo_lote.np
+    modos = [numpy, None] if numpy is not None else [None]
+    try:
+        for modo in modos:
+            calculo_lote.np = modo
+            for estrategia in (PricingStandardStrategy(), PricingHappyHourStrategy(),
+                               PricingValetStrategy(), PricingEventoStrategy()):
+                esperados = [estrategia.calcular_precio(v, i, e) for v, i, e in estadias]
+                precios = estrategia.calcular_precios_lote(tarifas, tolerancias, ingresos, egresos)
+                assert precios == esperados
+    finally:
+        calculo_lote.np = numpy
+
+
+def test_precios_lote_por_defecto():
+    """Verifica que sin implementacion propia el lote usa calcular_precio fila por fila."""
+    estadias = _estadias_aleatorias(200)
+    estrategia = PricingHoraIniciadaStrategy()
+
+    precios = estrategia.calcular_precios_lote(
+        [v.get_tarifa_base() for v, _, _ in estadias],
+        [v.get_tolerancia_minutos() for v, _, _ in estadias],
+        [ingreso.timestamp() for _, ingreso, _ in estadias],
+        [egreso.timestamp() for _, _, egreso in estadias]
+    )
+
+    assert precios == [estrategia.calcular_precio(v, i, e) for v, i, e in estadias]
+
+
+def test_redondeo_lote_igual_a_round():
+    """Verifica que el redondeo por lote coincide con round() cerca del empate."""
+    valores = [0.125, 0.135, 2.675, 1.005, 0.285, 1.115, 10.005, 227.495, 174.995, 0.0]
+    esperados = [round(valor, 2) for valor in valores]
+
+    if calculo_lote.np is not None:
+        valores = calculo_lote.np.array(valores)
+    assert calculo_lote.a_lista(calculo_lote.redondear_lote(valores)) == esperados
+
+
 if __name__ == "__main__":
     test_pricing_standard()
     test_pricing_happy_hour()
     test_pricing_valet()
     test_pricing_evento()
     test_tolerancia_aplicada()
+    test_precios_lote_coinciden_con_calculo_individual()
+    test_precios_lote_por_defecto()
+    test_redondeo_lote_igual_a_round()
     print("[OK] Todos los tests de Strategy pasaron")
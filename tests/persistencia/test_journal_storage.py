@@ -0,0 +1,191 @@
+"""Tests para la persistencia con journal.
+
+Verifica el registro incremental, la compactacion y la recuperacion.
+"""
+
+# Standard library
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Agregar el directorio raíz al path para imports
+root_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.persistencia.journal_storage import JournalStorage
+from python_estacionamiento.persistencia.json_storage import JsonStorage
+from python_estacionamiento.servicios.parking_lot import ParkingLot
+from python_estacionamiento.servicios.parking_lot_manager import ParkingLotManager
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+
+
+class ArchivoSinEspacio:
+    """Archivo de prueba cuya escritura falla como un disco lleno."""
+
+    def write(self, linea: str) -> int:
+        """Falla siempre."""
+        raise OSError(28, "No space left on device")
+
+    def close(self) -> None:
+        """No hace nada."""
+
+
+class JournalSinSnapshot(JournalStorage):
+    """Journal de prueba que registra en que hilo se intento cada compactacion."""
+
+    def __init__(self, *args, **kwargs):
+        """Inicializa el journal y la lista de intentos."""
+        super().__init__(*args, **kwargs)
+        self.hilos_compactacion = []
+
+    def _compactar(self, snapshot):
+        """Registra el intento y compacta normalmente."""
+        self.hilos_compactacion.append(threading.current_thread())
+        return super()._compactar(snapshot)
+
+
+def test_journal_registra_y_reconstruye():
+    """Verifica que el estado se reconstruye desde el journal."""
+    with tempfile.TemporaryDirectory() as directorio:
+        journal = JournalStorage(directorio=Path(directorio))
+        for i in range(5):
+            vehiculo = VehiculoFactory.crear_vehiculo("Auto", f"JRN{i:03d}")
+            vehiculo.set_hora_ingreso(datetime.now())
+            journal.registrar_ingreso(vehiculo)
+        journal.registrar_egreso(VehiculoFactory.crear_vehiculo("Auto", "JRN001"))
+        journal.cerrar()
+
+        estado = JournalStorage(directorio=Path(directorio)).cargar_estado()
+
+        patentes = {v['patente'] for v in estado['vehiculos_data']}
+        assert patentes == {"JRN000", "JRN002", "JRN003", "JRN004"}
+        assert estado['plazas_ocupadas'] == 4
+
+
+def test_journal_compacta_periodicamente():
+    """Verifica que el journal se compacta y sigue reconstruyendo bien."""
+    with tempfile.TemporaryDirectory() as directorio:
+        journal = JournalStorage(directorio=Path(directorio), registros_por_snapshot=10)
+        for i in range(25):
+            vehiculo = VehiculoFactory.crear_vehiculo("Moto", f"CMP{i:03d}")
+            journal.registrar_ingreso(vehiculo)
+        journal.cerrar()
+
+        # Solo quedan en el journal los registros posteriores al ultimo snapshot
+        lineas = (Path(directorio) / 'estacionamiento.journal').read_text().splitlines()
+        assert len(lineas) < 10
+        assert (Path(directorio) / 'estacionamiento.snapshot.json').exists()
+
+        estado = JournalStorage(directorio=Path(directorio)).cargar_estado()
+        assert estado['plazas_ocupadas'] == 25
+
+
+def test_journal_descarta_registro_truncado():
+    """Verifica que un corte a mitad de registro no impide recuperar."""
+    with tempfile.TemporaryDirectory() as directorio:
+        journal = JournalStorage(directorio=Path(directorio))
+        for i in range(3):
+            journal.registrar_ingreso(VehiculoFactory.crear_vehiculo("Auto", f"CUT{i:03d}"))
+        journal.cerrar()
+
+        path_journal = Path(directorio) / 'estacionamiento.journal'
+        with open(path_journal, 'a', encoding='utf-8') as f:
+            f.write('{"o":"I","p":"CUT9')  # Registro a medio escribir
+
+        recuperado = JournalStorage(directorio=Path(directorio))
+        estado = recuperado.cargar_estado()
+        assert estado['plazas_ocupadas'] == 3
+
+        # Los nuevos registros se agregan luego del ultimo registro valido
+        recuperado.registrar_egreso(VehiculoFactory.crear_vehiculo("Auto", "CUT000"))
+        recuperado.cerrar()
+        estado = JournalStorage(directorio=Path(directorio)).cargar_estado()
+        assert {v['patente'] for v in estado['vehiculos_data']} == {"CUT001", "CUT002"}
+
+
+def test_manager_persiste_cada_operacion():
+    """Verifica que con journal el manager persiste sin guardar_estado."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        manager.set_storage(JournalStorage(directorio=Path(directorio)))
+        try:
+            for i in range(4):
+                manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", f"WAL{i:03d}"))
+            manager.egresar_vehiculo("WAL000")
+            manager.ingresar_lote([VehiculoFactory.crear_vehiculo("Moto", "WAL100")])
+
+            # Simular reinicio
+            manager.reset()
+            manager.set_storage(JournalStorage(directorio=Path(directorio)))
+            assert manager.cargar_estado() is True
+
+            vehiculos = manager.get_todos_vehiculos()
+            assert set(vehiculos) == {"WAL001", "WAL002", "WAL003", "WAL100"}
+            assert manager.get_plazas_ocupadas() == 4
+            assert vehiculos["WAL001"].get_hora_ingreso() is not None
+        finally:
+            manager.set_storage(JsonStorage())
+            manager.reset()
+
+
+def test_escritura_fallida_degrada_y_se_recupera():
+    """Verifica que un error de escritura no interrumpe el ingreso y se recupera al guardar."""
+    with tempfile.TemporaryDirectory() as directorio:
+        journal = JournalStorage(directorio=Path(directorio))
+        lote = ParkingLot("journal", 10, journal)
+        lote.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", "ERR001"))
+
+        journal._journal = ArchivoSinEspacio()
+        lote.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", "ERR002"))
+        journal.sincronizar()
+        assert journal.esta_degradado()
+        assert lote.get_plazas_ocupadas() == 2
+
+        assert lote.guardar_estado() is True
+        assert not journal.esta_degradado()
+        lote.egresar_vehiculo("ERR001")
+        journal.cerrar()
+
+        estado = JournalStorage(directorio=Path(directorio)).cargar_estado()
+        assert {v['patente'] for v in estado['vehiculos_data']} == {"ERR002"}
+
+
+def test_journal_degradado_reintenta_con_espera():
+    """Verifica que degradado no compacta en cada operacion ni en el hilo de la barrera."""
+    with tempfile.TemporaryDirectory() as directorio:
+        journal = JournalSinSnapshot(
+            directorio=Path(directorio), intervalo_volcado=0.01, espera_reintento=0.2
+        )
+        lote = ParkingLot("reintentos", 500, journal)
+        lote.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", "BKF000"))
+        journal._journal = ArchivoSinEspacio()
+        journal._snapshot_path = Path(directorio) / 'inexistente' / 'estacionamiento.snapshot.json'
+        journal.sincronizar()
+        assert journal.esta_degradado()
+
+        for i in range(1, 300):
+            lote.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Moto", f"BKF{i:03d}"))
+        time.sleep(0.7)
+
+        # Esperas de 0.2s, 0.4s, 0.8s...: unos dos reintentos en 0.7s
+        assert 1 <= len(journal.hilos_compactacion) <= 3
+        assert threading.main_thread() not in journal.hilos_compactacion
+        assert journal.esta_degradado()
+        assert lote.get_plazas_ocupadas() == 300
+        journal.cerrar()
+
+
+if __name__ == "__main__":
+    test_journal_registra_y_reconstruye()
+    test_journal_compacta_periodicamente()
+    test_journal_descarta_registro_truncado()
+    test_manager_persiste_cada_operacion()
+    test_escritura_fallida_degrada_y_se_recupera()
+    test_journal_degradado_reintenta_con_espera()
+    print("[OK] Todos los tests de journal pasaron")
@@ -5,6 +5,8 @@ Verifica que el guardado y carga de estado funciona correctamente.
 
 # Standard library
 import sys
+import tempfile
+from datetime import datetime
 from pathlib import Path
 
 # Agregar el directorio raíz al path para imports
@@ -14,58 +16,93 @@ sys.path.insert(0, str(root_dir))
 # Local application
 from python_estacionamiento.servicios.parking_lot_manager import ParkingLotManager
 from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.persistencia.json_storage import JsonStorage, FormatoSnapshot
 
 
-def test_guardar_estado():
-    """Verifica que se puede guardar el estado."""
+def _estado_con(patentes):
+    """Construye un estado con autos para las patentes dadas."""
+    return {
+        'plazas_ocupadas': len(patentes),
+        'capacidad_maxima': 100,
+        'vehiculos': {p: VehiculoFactory.crear_vehiculo("Auto", p) for p in patentes}
+    }
+
+
+def _manager_en(directorio):
+    """Reinicia el manager guardando en un directorio temporal."""
     manager = ParkingLotManager.get_instance()
     manager.reset()
+    manager.set_storage(JsonStorage(directorio=directorio))
+    return manager
+
+
+def _restaurar_manager(manager):
+    """Deja el manager con su configuracion por defecto."""
+    manager.reset()
+    manager.set_storage(JsonStorage())
 
-    # Ingresar algunos vehículos
+
+def _ingresar_y_guardar(manager):
+    """Ingresa tres vehiculos y guarda el estado."""
     vehiculos = [
         VehiculoFactory.crear_vehiculo("Moto", "PERSIST001"),
         VehiculoFactory.crear_vehiculo("Auto", "PERSIST002"),
         VehiculoFactory.crear_vehiculo("Camioneta", "PERSIST003")
     ]
-
     for v in vehiculos:
         manager.ingresar_vehiculo(v)
+    return manager.guardar_estado()
 
-    # Guardar estado
-    resultado = manager.guardar_estado()
 
-    assert resultado is True
-    print(f"[OK] Estado guardado: {len(vehiculos)} vehículos")
+def test_guardar_estado(tmp_path):
+    """Verifica que se puede guardar el estado."""
+    manager = _manager_en(tmp_path)
+    try:
+        resultado = _ingresar_y_guardar(manager)
 
+        assert resultado is True
+        assert (tmp_path / 'estacionamiento_estado.json').exists()
+    finally:
+        _restaurar_manager(manager)
+    print("[OK] Estado guardado: 3 vehículos")
 
-def test_cargar_estado():
-    """Verifica que se puede cargar el estado guardado."""
-    manager = ParkingLotManager.get_instance()
 
-    # Limpiar primero
-    manager.reset()
+def test_cargar_estado(tmp_path):
+    """Verifica que se puede cargar el estado guardado."""
+    manager = _manager_en(tmp_path)
+    try:
+        assert _ingresar_y_guardar(manager) is True
 
-    # Cargar estado guardado
-    resultado = manager.cargar_estado()
+        # Limpiar y cargar el estado guardado
+        manager.reset()
+        resultado = manager.cargar_estado()
 
-    assert resultado is True
+        assert resultado is True
 
-    # Verificar que los vehículos se cargaron
-    vehiculos_cargados = manager.get_todos_vehiculos()
+        # Verificar que los vehículos se cargaron
+        vehiculos_cargados = manager.get_todos_vehiculos()
 
-    assert len(vehiculos_cargados) == 3
-    assert "PERSIST001" in vehiculos_cargados
-    assert "PERSIST002" in vehiculos_cargados
-    assert "PERSIST003" in vehiculos_cargados
+        assert len(vehiculos_cargados) == 3
+        assert "PERSIST001" in vehiculos_cargados
+        assert "PERSIST002" in vehiculos_cargados
+        assert "PERSIST003" in vehiculos_cargados
+    finally:
+        _restaurar_manager(manager)
 
     print(f"[OK] Estado cargado: {len(vehiculos_cargados)} vehículos restaurados")
 
 
-def test_ciclo_completo_persistencia():
+def test_ciclo_completo_persistencia(tmp_path):
     """Verifica un ciclo completo de guardar y cargar."""
-    manager = ParkingLotManager.get_instance()
-    manager.reset()
+    manager = _manager_en(tmp_path)
+    try:
+        _ciclo_completo(manager)
+    finally:
+        _restaurar_manager(manager)
+
 
+def _ciclo_completo(manager):
+    """Ingresa, guarda, reinicia y carga verificando el estado restaurado."""
     # Paso 1: Ingresar vehículos
     patentes_originales = ["CICLO001", "CICLO002", "CICLO003", "CICLO004", "CICLO005"]
     for i, patente in enumerate(patentes_originales):
@@ -98,12 +135,203 @@ def test_ciclo_completo_persistencia():
     print(f"[OK] Ciclo completo: {plazas_ocupadas_antes} -> {plazas_ocupadas_despues} plazas")
 
 
+def test_conserva_generaciones():
+    """Verifica que se conservan solo las ultimas generaciones."""
+    with tempfile.TemporaryDirectory() as directorio:
+        storage = JsonStorage(generaciones=3, directorio=Path(directorio))
+        for i in range(5):
+            assert storage.guardar_estado(_estado_con([f"GEN{i:03d}"])) is True
+
+        archivos = sorted(p.name for p in Path(directorio).iterdir())
+        assert archivos == [
+            'estacionamiento_estado.json',
+            'estacionamiento_estado.json.1',
+            'estacionamiento_estado.json.2'
+        ]
+        estado = storage.cargar_estado()
+        assert estado['vehiculos_data'][0]['patente'] == "GEN004"
+
+
+def test_fallback_a_generacion_valida():
+    """Verifica que un snapshot truncado o alterado no pierde el estado."""
+    with tempfile.TemporaryDirectory() as directorio:
+        storage = JsonStorage(directorio=Path(directorio))
+        storage.guardar_estado(_estado_con(["OK001"]))
+        storage.guardar_estado(_estado_con(["OK001", "OK002"]))
+
+        actual = Path(directorio) / 'estacionamiento_estado.json'
+
+        # Archivo alterado: el checksum no coincide
+        actual.write_text(actual.read_text().replace("OK002", "XX002"), encoding='utf-8')
+        estado = storage.cargar_estado()
+        assert [v['patente'] for v in estado['vehiculos_data']] == ["OK001"]
+
+        # Archivo truncado a mitad de escritura
+        actual.write_text('{"checksum": "ab', encoding='utf-8')
+        estado = storage.cargar_estado()
+        assert [v['patente'] for v in estado['vehiculos_data']] == ["OK001"]
+
+
+def test_snapshot_binario_ida_y_vuelta():
+    """Verifica que el formato binario conserva patente, tipo y horas."""
+    with tempfile.TemporaryDirectory() as directorio:
+        storage = JsonStorage(directorio=Path(directorio), formato=FormatoSnapshot.BINARIO)
+        estado = _estado_con(["BIN001", "BIN002"])
+        estado['vehiculos']["BIN001"] = VehiculoFactory.crear_vehiculo("Moto", "BIN001")
+        hora = datetime(2025, 11, 4, 9, 30, 15, 123456)
+        estado['vehiculos']["BIN001"].set_hora_ingreso(hora)
+
+        assert storage.guardar_estado(estado) is True
+        restaurado = storage.cargar_estado()
+
+        por_patente = {v['patente']: v for v in restaurado['vehiculos_data']}
+        assert por_patente["BIN001"]['tipo'] == "Moto"
+        assert por_patente["BIN001"]['hora_ingreso'] == hora
+        assert por_patente["BIN002"]['hora_ingreso'] is None
+        assert restaurado['capacidad_maxima'] == 100
+
+        # Un byte alterado invalida el checksum y se usa la generacion anterior
+        storage.guardar_estado(_estado_con(["BIN003"]))
+        actual = Path(directorio) / 'estacionamiento_estado.json'
+        datos = bytearray(actual.read_bytes())
+        datos[-1] ^= 0xFF
+        actual.write_bytes(bytes(datos))
+        restaurado = storage.cargar_estado()
+        assert {v['patente'] for v in restaurado['vehiculos_data']} == {"BIN001", "BIN002"}
+
+
+def test_convertir_snapshot_entre_formatos():
+    """Verifica la conversion JSON -> binario -> JSON."""
+    with tempfile.TemporaryDirectory() as directorio:
+        base = Path(directorio)
+        JsonStorage(directorio=base).guardar_estado(_estado_con(["CNV001", "CNV002"]))
+
+        origen = base / 'estacionamiento_estado.json'
+        binario = base / 'estado.bin'
+        assert JsonStorage.convertir_snapshot(origen, binario) is FormatoSnapshot.BINARIO
+        assert JsonStorage.convertir_snapshot(binario, base / 'vuelta.json') is FormatoSnapshot.JSON
+
+        restaurado = JsonStorage(archivo='vuelta.json', directorio=base).cargar_estado()
+        assert [v['patente'] for v in restaurado['vehiculos_data']] == ["CNV001", "CNV002"]
+
+
+class StorageRegistroDelta(JsonStorage):
+    """JsonStorage que registra los deltas recibidos."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.deltas = []
+
+    def guardar_delta(self, estado, modificados, eliminados):
+        self.deltas.append((set(modificados), set(eliminados)))
+        return super().guardar_delta(estado, modificados, eliminados)
+
+
+def test_manager_guarda_solo_cambios():
+    """Verifica que el manager persiste solo las patentes modificadas."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        storage = StorageRegistroDelta(directorio=Path(directorio))
+        manager.set_storage(storage)
+        try:
+            for patente in ["DLT001", "DLT002", "DLT003"]:
+                manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", patente))
+
+            # El primer guardado con un backend nuevo es completo
+            assert manager.guardar_estado() is True
+            assert storage.deltas == []
+            assert manager.get_cambios_pendientes() == 0
+
+            manager.egresar_vehiculo("DLT002")
+            manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Moto", "DLT004"))
+            assert manager.get_cambios_pendientes() == 2
+
+            assert manager.guardar_estado() is True
+            assert storage.deltas == [({"DLT004"}, {"DLT002"})]
+            assert manager.get_cambios_pendientes() == 0
+
+            restaurado = JsonStorage(directorio=Path(directorio)).cargar_estado()
+            por_patente = {v['patente']: v for v in restaurado['vehiculos_data']}
+            assert set(por_patente) == {"DLT001", "DLT003", "DLT004"}
+            assert por_patente["DLT004"]['tipo'] == "Moto"
+        finally:
+            _restaurar_manager(manager)
+
+    print("[OK] Guardado incremental: solo se persisten los cambios")
+
+
+def test_delta_se_agrega_al_log_sin_reescribir_snapshot():
+    """Verifica que guardar_delta agrega al log y el snapshot se compacta al crecer el log."""
+    for formato in FormatoSnapshot:
+        with tempfile.TemporaryDirectory() as directorio:
+            base = Path(directorio)
+            storage = JsonStorage(directorio=base, formato=formato)
+            estado = _estado_con([f"LOG{i:03d}" for i in range(4)])
+            assert storage.guardar_estado(estado) is True
+            snapshot = (base / 'estacionamiento_estado.json').read_bytes()
+
+            moto = VehiculoFactory.crear_vehiculo("Moto", "LOG100")
+            moto.set_hora_ingreso(datetime(2024, 5, 1, 9, 30))
+            estado['vehiculos'].pop("LOG000")
+            estado['vehiculos']["LOG100"] = moto
+            estado['ultimo_ticket'] = 7
+            assert storage.guardar_delta(estado, {"LOG100": moto}, ["LOG000"]) is True
+
+            assert (base / 'estacionamiento_estado.json').read_bytes() == snapshot
+            restaurado = JsonStorage(directorio=base, formato=formato).cargar_estado()
+            por_patente = {v['patente']: v for v in restaurado['vehiculos_data']}
+            assert set(por_patente) == {"LOG001", "LOG002", "LOG003", "LOG100"}, formato
+            assert por_patente["LOG100"]['tipo'] == "Moto"
+            assert restaurado['ultimo_ticket'] == 7
+
+            # Con tantos cambios en el log como vehiculos se escribe un snapshot nuevo
+            estado['vehiculos'].pop("LOG001")
+            estado['vehiculos'].pop("LOG002")
+            assert storage.guardar_delta(estado, {}, ["LOG001", "LOG002"]) is True
+            assert (base / 'estacionamiento_estado.json').read_bytes() != snapshot
+            assert not (base / 'estacionamiento_estado.json.delta').exists()
+            restaurado = JsonStorage(directorio=base, formato=formato).cargar_estado()
+            assert {v['patente'] for v in restaurado['vehiculos_data']} == {"LOG003", "LOG100"}
+
+
+def test_delta_de_otra_generacion_se_ignora():
+    """Verifica que el log no se aplica sobre una generacion anterior ni con una linea truncada."""
+    with tempfile.TemporaryDirectory() as directorio:
+        base = Path(directorio)
+        storage = JsonStorage(directorio=base)
+        estado = _estado_con(["GDL001", "GDL002", "GDL003"])
+        storage.guardar_estado(estado)
+        storage.guardar_estado(estado)
+        nuevo = VehiculoFactory.crear_vehiculo("Auto", "GDL004")
+        estado['vehiculos']["GDL004"] = nuevo
+        storage.guardar_delta(estado, {"GDL004": nuevo}, [])
+
+        with open(base / 'estacionamiento_estado.json.delta', 'a', encoding='utf-8') as f:
+            f.write('{"altas":[{"patente":"GDL9')  # Delta a medio escribir
+        restaurado = JsonStorage(directorio=base).cargar_estado()
+        assert len(restaurado['vehiculos_data']) == 4
+
+        # Generacion actual corrupta: se usa la anterior sin el log
+        (base / 'estacionamiento_estado.json').write_text('{"checksum": "ab', encoding='utf-8')
+        restaurado = JsonStorage(directorio=base).cargar_estado()
+        assert {v['patente'] for v in restaurado['vehiculos_data']} == {"GDL001", "GDL002", "GDL003"}
+
+
 if __name__ == "__main__":
     print("\n=============== TESTS DE PERSISTENCIA ===============\n")
 
-    test_guardar_estado()
-    test_cargar_estado()
-    test_ciclo_completo_persistencia()
+    for test in (test_guardar_estado, test_cargar_estado, test_ciclo_completo_persistencia):
+        with tempfile.TemporaryDirectory() as directorio:
+            test(Path(directorio))
+    test_conserva_generaciones()
+    test_fallback_a_generacion_valida()
+    test_snapshot_binario_ida_y_vuelta()
+    test_convertir_snapshot_entre_formatos()
+    test_manager_guarda_solo_cambios()
+    test_delta_se_agrega_al_log_sin_reescribir_snapshot()
+    test_delta_de_otra_generacion_se_ignora()
 
     print("\n[OK] Todos los tests de persistencia pasaron")
     print("     - Guardado de estado funcional")
@@ -0,0 +1,98 @@
+"""Tests para la persistencia con SQLite.
+
+Verifica vehiculos activos, historial de estadias y recuperacion.
+"""
+
+# Standard library
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Agregar el directorio raíz al path para imports
+root_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.persistencia.sqlite_storage import SqliteStorage
+from python_estacionamiento.persistencia.json_storage import JsonStorage
+from python_estacionamiento.servicios.parking_lot_manager import ParkingLotManager
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+
+
+def test_manager_con_sqlite_restaura_activos():
+    """Verifica que al reiniciar se cargan solo los vehiculos activos."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        manager.set_storage(SqliteStorage(directorio=Path(directorio)))
+        try:
+            for i in range(5):
+                manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", f"SQL{i:03d}"))
+            manager.egresar_lote(["SQL000", "SQL001"])
+
+            # Simular reinicio
+            manager.set_storage(SqliteStorage(directorio=Path(directorio)))
+            manager.reset()
+            assert manager.cargar_estado() is True
+
+            assert set(manager.get_todos_vehiculos()) == {"SQL002", "SQL003", "SQL004"}
+            assert manager.get_plazas_ocupadas() == 3
+        finally:
+            manager.set_storage(JsonStorage())
+            manager.reset()
+
+
+def test_historial_de_estadias():
+    """Verifica que cada egreso queda en el historial consultable."""
+    with tempfile.TemporaryDirectory() as directorio:
+        storage = SqliteStorage(directorio=Path(directorio))
+        base = datetime(2025, 11, 3, 8, 0)
+
+        for i in range(3):
+            auto = VehiculoFactory.crear_vehiculo("Auto", "HIST001")
+            auto.set_hora_ingreso(base + timedelta(days=i))
+            auto.set_hora_egreso(base + timedelta(days=i, hours=2))
+            storage.registrar_ingreso(auto)
+            storage.registrar_egreso(auto)
+
+        moto = VehiculoFactory.crear_vehiculo("Moto", "HIST002")
+        moto.set_hora_ingreso(base)
+        moto.set_hora_egreso(base + timedelta(hours=1))
+        storage.registrar_egreso(moto)
+
+        estadias = storage.consultar_estadias(patente="HIST001")
+        assert len(estadias) == 3
+        assert estadias[0]['hora_ingreso'] == base + timedelta(days=2)
+        assert estadias[0]['hora_egreso'] - estadias[0]['hora_ingreso'] == timedelta(hours=2)
+
+        del_primer_dia = storage.consultar_estadias(desde=base, hasta=base + timedelta(days=1))
+        assert {e['patente'] for e in del_primer_dia} == {"HIST001", "HIST002"}
+
+        storage.cerrar()
+
+
+def test_guardar_estado_reemplaza_activos():
+    """Verifica que guardar_estado persiste el estado completo en una transaccion."""
+    with tempfile.TemporaryDirectory() as directorio:
+        storage = SqliteStorage(directorio=Path(directorio))
+        assert storage.existe_estado() is False
+
+        vehiculos = {p: VehiculoFactory.crear_vehiculo("Camioneta", p) for p in ("FULL001", "FULL002")}
+        assert storage.guardar_estado({'capacidad_maxima': 250, 'vehiculos': vehiculos}) is True
+
+        estado = storage.cargar_estado()
+        assert estado['capacidad_maxima'] == 250
+        assert {v['patente'] for v in estado['vehiculos_data']} == {"FULL001", "FULL002"}
+
+        assert storage.eliminar_estado() is True
+        assert storage.cargar_estado() is None
+        storage.cerrar()
+
+
+if __name__ == "__main__":
+    test_manager_con_sqlite_restaura_activos()
+    test_historial_de_estadias()
+    test_guardar_estado_reemplaza_activos()
+    print("[OK] Todos los tests de SQLite pasaron")
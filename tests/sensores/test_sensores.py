@@ -5,6 +5,7 @@ Verifica que los sensores funcionan correctamente con el patron Observer.
 
 # Standard library
 import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime
 
@@ -20,9 +21,15 @@ from python_estacionamiento.sensores.eventos import (
     VehiculoIngresoEvento,
     VehiculoEgresoEvento,
     PlazasAgotadasEvento,
-    CapacidadCriticaEvento
+    CapacidadCriticaEvento,
+    LoteIngresoEvento,
+    LoteEgresoEvento
 )
 from python_estacionamiento.entidades.vehiculos.moto import Moto
+from python_estacionamiento.excepciones.estacionamiento_exception import VehiculoNoEncontradoException
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.persistencia.json_storage import JsonStorage
+from python_estacionamiento.servicios.parking_lot import ParkingLot
 
 
 def test_sensor_ocupacion_recibe_ingreso():
@@ -244,6 +251,120 @@ def test_multiples_sensores_reciben_mismo_evento():
     print("[OK] Multiples sensores procesan el mismo evento")
 
 
+def test_sensor_seguridad_procesa_lotes():
+    """Verifica que sensor de seguridad monitorea ingresos y egresos por lote."""
+    sensor = SensorSeguridad()
+    vehiculos = [Moto(patente=f"LOT{i:03d}", cilindrada=150) for i in range(3)]
+
+    sensor.actualizar(LoteIngresoEvento(
+        timestamp=datetime.now(),
+        mensaje="Test lote ingreso",
+        vehiculos=vehiculos,
+        patentes_rechazadas=["LOT999"],
+        plazas_ocupadas=3,
+        plazas_disponibles=97
+    ))
+    assert sensor.get_vehiculos_monitoreados() == {"LOT000", "LOT001", "LOT002"}
+
+    sensor.actualizar(LoteEgresoEvento(
+        timestamp=datetime.now(),
+        mensaje="Test lote egreso",
+        vehiculos=vehiculos[:2],
+        patentes_no_encontradas=[],
+        plazas_ocupadas=1,
+        plazas_disponibles=99
+    ))
+    assert sensor.get_vehiculos_monitoreados() == {"LOT002"}
+    assert sensor.get_alertas() == []
+
+    print("[OK] Sensor de seguridad procesa lotes")
+
+
+def _evento_egreso(patente_leida: str, patente: str | None = None) -> VehiculoEgresoEvento:
+    """Crea un evento de egreso con la patente que leyo la camara y la conciliada."""
+    vehiculo = Moto(patente=patente or patente_leida, cilindrada=150)
+    return VehiculoEgresoEvento(
+        timestamp=datetime.now(),
+        mensaje="Test egreso",
+        vehiculo=vehiculo,
+        plazas_ocupadas=0,
+        plazas_disponibles=100,
+        tiempo_estadia="0:00:00",
+        patente_leida=patente_leida
+    )
+
+
+def _evento_ingreso(patente: str) -> VehiculoIngresoEvento:
+    """Crea un evento de ingreso para una patente."""
+    return VehiculoIngresoEvento(
+        timestamp=datetime.now(),
+        mensaje="Test ingreso",
+        vehiculo=Moto(patente=patente, cilindrada=150),
+        plazas_ocupadas=1,
+        plazas_disponibles=99
+    )
+
+
+def test_sensor_seguridad_concilia_lecturas_erroneas():
+    """Verifica que una lectura con caracteres confundidos no genera alerta."""
+    sensor = SensorSeguridad()
+    for patente in ("SEC123", "OCR456"):
+        sensor.actualizar(_evento_ingreso(patente))
+
+    sensor.actualizar(_evento_egreso("5EC1Z3", "SEC123"))
+    sensor.actualizar(_evento_egreso("0CR4567", "OCR456"))
+
+    assert sensor.get_alertas() == []
+    assert sensor.get_conciliaciones() == [("5EC1Z3", "SEC123"), ("0CR4567", "OCR456")]
+    assert sensor.get_vehiculos_monitoreados() == set()
+
+    # Sin ningun candidato cercano se mantiene la alerta
+    sensor.actualizar(_evento_egreso("XYZ999"))
+    assert len(sensor.get_alertas()) == 1
+
+    print("[OK] Sensor de seguridad concilia lecturas erroneas")
+
+
+def test_sensor_camara_concilia_salidas():
+    """Verifica que el lote concilia la salida y la camara registra lectura y patente."""
+    with tempfile.TemporaryDirectory() as directorio:
+        lote = ParkingLot("camara", 10, JsonStorage(directorio=Path(directorio)))
+        sensor = SensorCamara(ubicacion="Test")
+        seguridad = SensorSeguridad()
+        lote.agregar_observador(sensor)
+        lote.agregar_observador(seguridad)
+        for patente in ("AB123CD", "AB128CD", "CD456EF"):
+            lote.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", patente))
+
+        # "AB12XCD" esta a una edicion de ambas: ambiguo
+        assert lote.conciliar_patente("AB12XCD") is None
+        try:
+            lote.egresar_vehiculo("AB12XCD")
+            assert False, "Una lectura ambigua no debe egresar ningun vehiculo"
+        except VehiculoNoEncontradoException:
+            pass
+        # "AB12BCD" solo confunde B/8 con "AB128CD"
+        assert lote.conciliar_patente("AB12BCD") == "AB128CD"
+
+        lote.egresar_vehiculo("a8i-23cd")
+        registros = sensor.get_registros()
+        assert (registros[-1]['patente'], registros[-1]['patente_conciliada']) == ("a8i-23cd", "AB123CD")
+        # "AB123CD" ya salio: la lectura solo puede corresponder a la otra
+        assert lote.conciliar_patente("AB123CD") == "AB128CD"
+
+        resultados = lote.egresar_lote(["AB123CD", "CD4S6EF"])
+        assert [r.patente for r in resultados] == ["AB128CD", "CD456EF"]
+        assert [(r['patente'], r['patente_conciliada']) for r in sensor.get_registros()[-2:]] == [
+            ("AB123CD", "AB128CD"), ("CD4S6EF", "CD456EF")
+        ]
+        assert seguridad.get_alertas() == []
+        assert seguridad.get_conciliaciones() == [
+            ("A8I23CD", "AB123CD"), ("AB123CD", "AB128CD"), ("CD4S6EF", "CD456EF")
+        ]
+
+    print("[OK] Sensor de camara concilia salidas")
+
+
 if __name__ == "__main__":
     print("\n=== Ejecutando Tests de Sensores ===\n")
 
@@ -256,5 +377,8 @@ if __name__ == "__main__":
     test_sensor_seguridad_libera_vehiculos()
     test_sensor_seguridad_alerta_plazas_agotadas()
     test_multiples_sensores_reciben_mismo_evento()
+    test_sensor_seguridad_procesa_lotes()
+    test_sensor_seguridad_concilia_lecturas_erroneas()
+    test_sensor_camara_concilia_salidas()
 
     print("\n[OK] Todos los tests de Sensores pasaron\n")
@@ -0,0 +1,151 @@
+"""Tests para AsignadorPlazas.
+
+Verifica los pools por tipo, el uso de plazas mas grandes cuando un pool
+se completa y la integracion con ParkingLotManager.
+"""
+
+# Standard library
+import sys
+import time
+from pathlib import Path
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.constantes import SUPERFICIE_MOTO, SUPERFICIE_AUTO, SUPERFICIE_CAMIONETA
+from python_estacionamiento.servicios.asignador_plazas import AsignadorPlazas, PoolPlazas, pools_por_defecto
+from python_estacionamiento.servicios.parking_lot_manager import ParkingLotManager
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.entidades.vehiculos.tipo_vehiculo import TipoVehiculo
+from python_estacionamiento.entidades.vehiculos.vehiculo import Vehiculo
+from python_estacionamiento.excepciones.estacionamiento_exception import PlazasAgotadasException
+
+
+class Cuatriciclo(Vehiculo):
+    """Tipo de vehiculo registrado solo para los tests."""
+
+    __slots__ = ()
+    _tipo = TipoVehiculo("Cuatriciclo", 6.0, 70.0, 10)
+
+
+def _asignador_chico():
+    """Crea un asignador con 2 plazas de moto, 2 de auto y 1 de camioneta."""
+    return AsignadorPlazas([
+        PoolPlazas("Moto", SUPERFICIE_MOTO, 2),
+        PoolPlazas("Auto", SUPERFICIE_AUTO, 2),
+        PoolPlazas("Camioneta", SUPERFICIE_CAMIONETA, 1),
+    ])
+
+
+def test_asigna_la_plaza_mas_chica_que_sirve():
+    """Verifica pools por tipo y el uso de plazas mas grandes al completarse."""
+    asignador = _asignador_chico()
+
+    assert asignador.asignar("M1", SUPERFICIE_MOTO) == 1
+    assert asignador.asignar("M2", SUPERFICIE_MOTO) == 2
+    # Pool de motos completo: la moto ocupa una plaza de auto
+    assert asignador.asignar("M3", SUPERFICIE_MOTO) == 3
+    assert asignador.get_tipo_plaza(3) == "Auto"
+    assert asignador.asignar("A1", SUPERFICIE_AUTO) == 4
+    assert asignador.asignar("C1", SUPERFICIE_CAMIONETA) == 5
+    # Un auto nunca ocupa una plaza de moto
+    assert asignador.asignar("A2", SUPERFICIE_AUTO) is None
+
+    assert asignador.liberar("M1") == 1
+    assert asignador.get_ocupante(1) is None
+    assert asignador.asignar("M4", SUPERFICIE_MOTO) == 1
+    assert asignador.get_plaza("M4") == 1 and asignador.get_ocupante(4) == "A1"
+    assert asignador.get_disponibles() == 0
+    print("[OK] Asignacion por superficie con pools por tipo")
+
+
+def test_escala_a_decenas_de_miles_de_plazas():
+    """Verifica que llenar y vaciar 60.000 plazas no degrada la asignacion."""
+    asignador = AsignadorPlazas([
+        PoolPlazas("Moto", SUPERFICIE_MOTO, 10000),
+        PoolPlazas("Auto", SUPERFICIE_AUTO, 40000),
+        PoolPlazas("Camioneta", SUPERFICIE_CAMIONETA, 10000),
+    ])
+
+    inicio = time.perf_counter()
+    for i in range(50000):
+        assert asignador.asignar(f"AUTO{i}", SUPERFICIE_AUTO) is not None
+    for i in range(0, 50000, 2):
+        asignador.liberar(f"AUTO{i}")
+    duracion = time.perf_counter() - inicio
+
+    assert asignador.get_disponibles("Moto") == 10000
+    assert asignador.get_disponibles("Auto") + asignador.get_disponibles("Camioneta") == 25000
+    assert duracion < 2.0
+    print(f"[OK] 75.000 operaciones sobre 60.000 plazas en {duracion:.3f}s")
+
+
+def test_manager_asigna_plazas_por_tipo():
+    """Verifica la integracion del asignador con ingresos y egresos."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+    manager.set_asignador(_asignador_chico())
+    try:
+        assert manager.get_plazas_disponibles() == 5
+
+        manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Camioneta", "PLZ001"))
+        try:
+            manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Camioneta", "PLZ002"))
+            assert False, "No deberia haber plaza para otra camioneta"
+        except PlazasAgotadasException:
+            pass
+        assert manager.get_plazas_ocupadas() == 1
+
+        resultados = manager.ingresar_lote([
+            VehiculoFactory.crear_vehiculo("Auto", "PLZ003"),
+            VehiculoFactory.crear_vehiculo("Auto", "PLZ004"),
+            VehiculoFactory.crear_vehiculo("Auto", "PLZ005"),
+            VehiculoFactory.crear_vehiculo("Moto", "PLZ006"),
+        ])
+        assert [r.exito for r in resultados] == [True, True, False, True]
+        assert isinstance(resultados[2].error, PlazasAgotadasException)
+        assert manager.get_plazas_ocupadas() == 4
+        assert manager.get_plaza("PLZ006") == 1
+
+        manager.egresar_vehiculo("PLZ003")
+        assert manager.get_plaza("PLZ003") is None
+        manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", "PLZ007"))
+        assert manager.get_plaza("PLZ007") == 3
+    finally:
+        manager.reset()
+        manager.set_asignador(None)
+
+    print("[OK] ParkingLotManager asigna plazas numeradas")
+
+
+def test_pools_por_defecto_siguen_al_registro():
+    """Verifica que los pools por defecto salen de los tipos registrados."""
+    assert [pool.tipo for pool in AsignadorPlazas().get_pools()] == VehiculoFactory.get_tipos()
+
+    VehiculoFactory.registrar_tipo("Cuatriciclo", Cuatriciclo)
+    try:
+        pools = {pool.tipo: pool for pool in pools_por_defecto({"Cuatriciclo": 1})}
+        assert pools["Cuatriciclo"].superficie == 6.0 and pools["Cuatriciclo"].cantidad == 1
+        assert pools["Auto"].cantidad == 0
+
+        asignador = AsignadorPlazas()
+        assert asignador.get_disponibles("Cuatriciclo") == 0
+        # Sin plazas propias ocupa la mas chica en la que entra
+        assert asignador.get_tipo_plaza(asignador.asignar("Q1", 6.0)) == "Auto"
+    finally:
+        VehiculoFactory.desregistrar_tipo("Cuatriciclo")
+
+    print("[OK] Pools por defecto derivados del registro de tipos")
+
+
+if __name__ == "__main__":
+    print("\n=============== TESTS DE ASIGNADOR DE PLAZAS ===============\n")
+
+    test_asigna_la_plaza_mas_chica_que_sirve()
+    test_escala_a_decenas_de_miles_de_plazas()
+    test_manager_asigna_plazas_por_tipo()
+    test_pools_por_defecto_siguen_al_registro()
+
+    print("\n[OK] Todos los tests de AsignadorPlazas pasaron")
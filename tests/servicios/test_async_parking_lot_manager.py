@@ -0,0 +1,274 @@
+"""Tests para AsyncParkingLotManager.
+
+Verifica la fachada asyncio sobre un ParkingLot compartido.
+"""
+
+# Standard library
+import asyncio
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.servicios.async_parking_lot_manager import AsyncParkingLotManager
+from python_estacionamiento.servicios.parking_lot import ParkingLot
+from python_estacionamiento.persistencia.journal_storage import JournalStorage
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.patrones.observer.observer import AsyncObserver
+from python_estacionamiento.excepciones.estacionamiento_exception import (
+    EstacionamientoException,
+    PlazasAgotadasException,
+    VehiculoNoEncontradoException
+)
+from python_estacionamiento.sensores.eventos import (
+    EventoEstacionamiento,
+    VehiculoIngresoEvento,
+    VehiculoEgresoEvento
+)
+from python_estacionamiento.sensores.sensor_seguridad import SensorSeguridad
+
+
+class ObservadorAsincrono(AsyncObserver[EventoEstacionamiento]):
+    """Observer asincrono de prueba que cede el loop antes de registrar."""
+
+    def __init__(self):
+        self.eventos = []
+
+    async def actualizar(self, evento: EventoEstacionamiento) -> None:
+        """Registra el evento luego de ceder el control."""
+        await asyncio.sleep(0)
+        self.eventos.append(evento)
+
+
+def test_ingresar_consultar_egresar():
+    """Verifica el ciclo completo con un observador asincrono."""
+    async def escenario():
+        manager = AsyncParkingLotManager(capacidad_maxima=10)
+        observador = ObservadorAsincrono()
+        manager.agregar_observador(observador)
+
+        auto = VehiculoFactory.crear_vehiculo("Auto", "ASYNC001")
+        await manager.ingresar(auto)
+        assert await manager.consultar("ASYNC001") is auto
+        assert manager.get_plazas_ocupadas() == 1
+
+        vehiculo = await manager.egresar("ASYNC001")
+        assert vehiculo.get_hora_egreso() is not None
+        assert await manager.consultar("ASYNC001") is None
+
+        assert isinstance(observador.eventos[0], VehiculoIngresoEvento)
+        assert isinstance(observador.eventos[1], VehiculoEgresoEvento)
+
+    asyncio.run(escenario())
+
+
+def test_errores_mantienen_semantica():
+    """Verifica plazas agotadas y vehiculo no encontrado."""
+    async def escenario():
+        manager = AsyncParkingLotManager(capacidad_maxima=1)
+        await manager.ingresar(VehiculoFactory.crear_vehiculo("Moto", "ASYNC002"))
+
+        try:
+            await manager.ingresar(VehiculoFactory.crear_vehiculo("Moto", "ASYNC003"))
+            assert False, "Deberia haber lanzado PlazasAgotadasException"
+        except PlazasAgotadasException:
+            pass
+
+        try:
+            await manager.egresar("NOEXISTE")
+            assert False, "Deberia haber lanzado VehiculoNoEncontradoException"
+        except VehiculoNoEncontradoException:
+            pass
+
+    asyncio.run(escenario())
+
+
+def test_miles_de_puertas_concurrentes():
+    """Verifica invariantes con miles de corrutinas en un unico loop."""
+    async def escenario():
+        capacidad = 1000
+        manager = AsyncParkingLotManager(capacidad_maxima=capacidad)
+        observador = ObservadorAsincrono()
+        sensor = SensorSeguridad()
+        manager.agregar_observador(observador)
+        manager.agregar_observador(sensor)
+        patentes = [f"GATE{i:04d}" for i in range(capacidad + 500)]
+
+        async def puerta(patente: str) -> bool:
+            """Ingresa, consulta y egresa un vehiculo si hay lugar."""
+            try:
+                await manager.ingresar(VehiculoFactory.crear_vehiculo("Auto", patente))
+            except EstacionamientoException:
+                return False
+            await manager.consultar(patente)
+            await manager.egresar(patente)
+            return True
+
+        resultados = await asyncio.gather(*(puerta(p) for p in patentes))
+
+        assert manager.get_plazas_ocupadas() == 0
+        assert manager.get_todos_vehiculos() == {}
+        assert sum(resultados) >= capacidad
+        assert sensor.get_alertas() == []
+
+    asyncio.run(escenario())
+
+
+def test_fachada_sobre_lote_compartido():
+    """Verifica que la fachada opera sobre el mismo lote que el codigo sincronico."""
+    async def escenario(directorio: Path):
+        lote = ParkingLot("async", 10, JournalStorage(directorio=directorio))
+        manager = AsyncParkingLotManager(lote)
+        observador = ObservadorAsincrono()
+        manager.agregar_observador(observador)
+
+        await manager.ingresar(VehiculoFactory.crear_vehiculo("Auto", "asy-001"))
+        assert lote.get_vehiculo("ASY001") is await manager.consultar("asy 001")
+        resultados = await manager.ingresar_lote([
+            VehiculoFactory.crear_vehiculo("Moto", "ASY002"),
+            VehiculoFactory.crear_vehiculo("Moto", "ASY001")
+        ])
+        assert [r.exito for r in resultados] == [True, False]
+
+        ticket = await manager.cobrar_y_egresar("ASY001")
+        assert ticket.patente == "ASY001" and ticket.zona is None
+        assert lote.get_plazas_ocupadas() == manager.get_plazas_ocupadas() == 1
+        assert [type(e) for e in observador.eventos[-1:]] == [VehiculoEgresoEvento]
+
+        assert await manager.guardar_estado() is True
+        recargado = ParkingLot("async", 10, JournalStorage(directorio=directorio))
+        assert recargado.cargar_estado() is True
+        assert set(recargado.get_todos_vehiculos()) == {"ASY002"}
+        manager.cerrar()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        asyncio.run(escenario(Path(directorio)))
+
+
+def test_despacho_asincrono_no_demora_operaciones():
+    """Verifica que con despacho asincrono la operacion no espera al observador."""
+    async def escenario():
+        manager = AsyncParkingLotManager(capacidad_maxima=10)
+        liberar = asyncio.Event()
+
+        class ObservadorLento(AsyncObserver[EventoEstacionamiento]):
+            """Observer que no termina hasta que se libera."""
+
+            def __init__(self):
+                self.eventos = []
+
+            async def actualizar(self, evento: EventoEstacionamiento) -> None:
+                """Espera la liberacion y registra el evento."""
+                await liberar.wait()
+                self.eventos.append(evento)
+
+        observador = ObservadorLento()
+        manager.agregar_observador(observador)
+        manager.habilitar_despacho_asincrono()
+
+        await asyncio.wait_for(manager.ingresar(VehiculoFactory.crear_vehiculo("Auto", "LENTO1")), 2.0)
+        assert observador.eventos == []
+
+        liberar.set()
+        while not observador.eventos:
+            await asyncio.sleep(0.01)
+        await manager.esperar_notificaciones()
+        assert isinstance(observador.eventos[0], VehiculoIngresoEvento)
+        manager.deshabilitar_despacho_asincrono()
+
+    asyncio.run(escenario())
+
+
+def test_observador_opera_sobre_la_fachada():
+    """Verifica que un observador puede esperar una operacion de la fachada sin deadlock."""
+    async def escenario():
+        manager = AsyncParkingLotManager(capacidad_maxima=10)
+
+        class ObservadorReingreso(AsyncObserver[EventoEstacionamiento]):
+            """Observer que egresa cada vehiculo apenas ingresa."""
+
+            def __init__(self):
+                self.egresados = []
+
+            async def actualizar(self, evento: EventoEstacionamiento) -> None:
+                """Egresa por la fachada el vehiculo del evento de ingreso."""
+                if isinstance(evento, VehiculoIngresoEvento):
+                    patente = evento.vehiculo.get_patente()
+                    self.egresados.append(await manager.egresar(patente))
+
+        observador = ObservadorReingreso()
+        manager.agregar_observador(observador)
+
+        await asyncio.wait_for(manager.ingresar(VehiculoFactory.crear_vehiculo("Auto", "OBS001")), 2.0)
+        assert [v.get_patente() for v in observador.egresados] == ["OBS001"]
+        assert manager.get_plazas_ocupadas() == 0
+
+    asyncio.run(escenario())
+
+
+def test_corrutinas_e_hilos_sobre_el_mismo_lote():
+    """Verifica invariantes con corrutinas e hilos operando sobre las mismas patentes."""
+    async def escenario():
+        lote = ParkingLot("mixto", 50)
+        manager = AsyncParkingLotManager(lote)
+        patentes = [f"MIX{i:03d}" for i in range(40)]
+        ciclos = []
+
+        def hilo():
+            """Ingresa y egresa cada patente desde codigo sincronico."""
+            for patente in patentes:
+                try:
+                    lote.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", patente))
+                    lote.egresar_vehiculo(patente)
+                except EstacionamientoException:
+                    pass
+
+        async def puerta(patente: str) -> None:
+            """Ingresa y egresa una patente por la fachada."""
+            try:
+                await manager.ingresar(VehiculoFactory.crear_vehiculo("Auto", patente))
+                await manager.egresar(patente)
+                ciclos.append(patente)
+            except EstacionamientoException:
+                pass
+
+        hilos = [threading.Thread(target=hilo) for _ in range(4)]
+        for h in hilos:
+            h.start()
+        for _ in range(5):
+            await asyncio.gather(*(puerta(p) for p in patentes))
+        for h in hilos:
+            h.join()
+
+        assert lote.get_plazas_ocupadas() == 0
+        assert lote.get_todos_vehiculos() == {}
+        assert ciclos
+        manager.cerrar()
+
+    asyncio.run(escenario())
+
+
+def test_capacidad_invalida():
+    """Verifica que la fachada rechaza un lote sin plazas."""
+    try:
+        AsyncParkingLotManager(capacidad_maxima=0)
+        assert False, "Deberia rechazar la capacidad"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_ingresar_consultar_egresar()
+    test_errores_mantienen_semantica()
+    test_miles_de_puertas_concurrentes()
+    test_fachada_sobre_lote_compartido()
+    test_despacho_asincrono_no_demora_operaciones()
+    test_observador_opera_sobre_la_fachada()
+    test_corrutinas_e_hilos_sobre_el_mismo_lote()
+    test_capacidad_invalida()
+    print("[OK] Todos los tests de AsyncParkingLotManager pasaron")
@@ -0,0 +1,162 @@
+"""Tests para ServicioAutoguardado.
+
+Verifica los disparadores por cantidad de cambios y por tiempo, la
+coalescencia de rafagas y el guardado final al detener el servicio.
+"""
+
+# Standard library
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.servicios.parking_lot_manager import ParkingLotManager
+from python_estacionamiento.servicios.autoguardado import ServicioAutoguardado
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.persistencia.json_storage import JsonStorage
+
+
+class StorageLento(JsonStorage):
+    """JsonStorage que demora cada guardado incremental."""
+
+    def guardar_delta(self, estado, modificados, eliminados):
+        time.sleep(0.2)
+        return super().guardar_delta(estado, modificados, eliminados)
+
+
+def _esperar(condicion, timeout=3.0):
+    """Espera hasta que la condicion se cumpla o venza el timeout."""
+    limite = time.monotonic() + timeout
+    while not condicion():
+        if time.monotonic() > limite:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _patentes_guardadas(directorio):
+    """Lee las patentes persistidas en el directorio."""
+    estado = JsonStorage(directorio=Path(directorio)).cargar_estado()
+    return {v['patente'] for v in estado['vehiculos_data']}
+
+
+def _preparar_manager(storage):
+    """Reinicia el manager con un backend y un guardado base."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+    manager.set_storage(storage)
+    manager.guardar_estado()
+    return manager
+
+
+def _restaurar_manager(manager):
+    """Deja el manager con su configuracion por defecto."""
+    manager.reset()
+    manager.set_storage(JsonStorage())
+
+
+def test_guarda_al_alcanzar_umbral_de_cambios():
+    """Verifica que N cambios disparan un guardado sin esperar el intervalo."""
+    with tempfile.TemporaryDirectory() as directorio:
+        manager = _preparar_manager(JsonStorage(directorio=Path(directorio)))
+        servicio = ServicioAutoguardado(
+            manager, cambios_por_guardado=5, intervalo=60.0, registrar_atexit=False
+        )
+        try:
+            for i in range(5):
+                manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", f"UMB00{i}"))
+
+            assert _esperar(lambda: servicio.get_metricas().guardados >= 1)
+            assert _patentes_guardadas(directorio) == {f"UMB00{i}" for i in range(5)}
+        finally:
+            servicio.detener()
+            _restaurar_manager(manager)
+
+    print("[OK] Autoguardado por umbral de cambios")
+
+
+def test_guarda_al_vencer_intervalo():
+    """Verifica que un cambio aislado se guarda al vencer el intervalo."""
+    with tempfile.TemporaryDirectory() as directorio:
+        manager = _preparar_manager(JsonStorage(directorio=Path(directorio)))
+        servicio = ServicioAutoguardado(
+            manager, cambios_por_guardado=1000, intervalo=0.1, registrar_atexit=False
+        )
+        try:
+            manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Moto", "INT001"))
+
+            assert _esperar(lambda: servicio.get_metricas().guardados >= 1)
+            assert _patentes_guardadas(directorio) == {"INT001"}
+            assert manager.get_cambios_pendientes() == 0
+        finally:
+            servicio.detener()
+            _restaurar_manager(manager)
+
+    print("[OK] Autoguardado por intervalo")
+
+
+def test_coalesce_rafagas_sin_bloquear_ingresos():
+    """Verifica que una rafaga se guarda en pocos guardados y no frena los ingresos."""
+    with tempfile.TemporaryDirectory() as directorio:
+        manager = _preparar_manager(StorageLento(directorio=Path(directorio)))
+        servicio = ServicioAutoguardado(
+            manager, cambios_por_guardado=1, intervalo=60.0, registrar_atexit=False
+        )
+        try:
+            inicio = time.perf_counter()
+            for i in range(20):
+                manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", f"RAF{i:03d}"))
+            duracion_ingresos = time.perf_counter() - inicio
+        finally:
+            servicio.detener()
+
+        try:
+            metricas = servicio.get_metricas()
+            # Los ingresos no esperan a ningun guardado de 0.2s
+            assert duracion_ingresos < 0.2
+            assert metricas.guardados < 20
+            assert metricas.cambios_guardados == 20
+            assert metricas.duracion_maxima >= 0.2
+            assert _patentes_guardadas(directorio) == {f"RAF{i:03d}" for i in range(20)}
+        finally:
+            _restaurar_manager(manager)
+
+    print(f"[OK] Rafaga de 20 cambios persistida en {metricas.guardados} guardados")
+
+
+def test_detener_guarda_cambios_pendientes():
+    """Verifica que detener persiste lo pendiente antes de terminar."""
+    with tempfile.TemporaryDirectory() as directorio:
+        manager = _preparar_manager(JsonStorage(directorio=Path(directorio)))
+        servicio = ServicioAutoguardado(
+            manager, cambios_por_guardado=1000, intervalo=60.0, registrar_atexit=False
+        )
+        try:
+            for patente in ["FIN001", "FIN002", "FIN003"]:
+                manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Camioneta", patente))
+            manager.egresar_vehiculo("FIN002")
+
+            servicio.detener()
+
+            assert manager.get_cambios_pendientes() == 0
+            assert _patentes_guardadas(directorio) == {"FIN001", "FIN003"}
+        finally:
+            _restaurar_manager(manager)
+
+    print("[OK] Guardado final al detener el servicio")
+
+
+if __name__ == "__main__":
+    print("\n=============== TESTS DE AUTOGUARDADO ===============\n")
+
+    test_guarda_al_alcanzar_umbral_de_cambios()
+    test_guarda_al_vencer_intervalo()
+    test_coalesce_rafagas_sin_bloquear_ingresos()
+    test_detener_guarda_cambios_pendientes()
+
+    print("\n[OK] Todos los tests de autoguardado pasaron")
@@ -5,19 +5,51 @@ Verifica que el gestor del estacionamiento funciona correctamente.
 
 # Standard library
 import sys
+import tempfile
+from dataclasses import FrozenInstanceError
+from datetime import timedelta
 from pathlib import Path
+from threading import Thread
 
 # Agregar el directorio raiz al path para imports
 root_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(root_dir))
 
 # Local application
+from python_estacionamiento.servicios.parking_lot import ParkingLot
 from python_estacionamiento.servicios.parking_lot_manager import ParkingLotManager
+from python_estacionamiento.servicios.indice_patentes import IndicePatentes
+from python_estacionamiento.persistencia.journal_storage import JournalStorage
+from python_estacionamiento.persistencia.json_storage import FormatoSnapshot, JsonStorage
+from python_estacionamiento.persistencia.sqlite_storage import SqliteStorage
 from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.patrones.observer.observer import Observer
+from python_estacionamiento.patrones.strategy.impl.pricing_standard_strategy import PricingStandardStrategy
+from python_estacionamiento.servicios.pricing_registry import PricingRegistry
+from python_estacionamiento.utils.patentes import normalizar_patente
 from python_estacionamiento.excepciones.estacionamiento_exception import (
+    PatenteInvalidaException,
     PlazasAgotadasException,
-    VehiculoNoEncontradoException
+    VehiculoNoEncontradoException,
+    VehiculoYaIngresadoException
 )
+from python_estacionamiento.sensores.eventos import (
+    EventoEstacionamiento,
+    VehiculoEgresoEvento,
+    LoteIngresoEvento,
+    LoteEgresoEvento
+)
+
+
+class ObservadorRegistro(Observer[EventoEstacionamiento]):
+    """Observer de prueba que guarda los eventos recibidos."""
+
+    def __init__(self):
+        self.eventos = []
+
+    def actualizar(self, evento: EventoEstacionamiento) -> None:
+        """Registra el evento."""
+        self.eventos.append(evento)
 
 
 def test_ingresar_vehiculo():
@@ -89,10 +121,295 @@ def test_vehiculo_no_existe_retorna_none():
     assert vehiculo is None
 
 
+def test_ingresar_vehiculo_duplicado():
+    """Verifica que una patente no puede ingresar dos veces."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+
+    manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", "DUP001"))
+
+    try:
+        manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", "DUP001"))
+        assert False, "Deberia haber lanzado VehiculoYaIngresadoException"
+    except VehiculoYaIngresadoException as e:
+        assert e.get_patente() == "DUP001"
+
+    assert manager.get_plazas_ocupadas() == 1
+
+
+def test_ingresar_lote_exito_parcial():
+    """Verifica que un lote ingresa hasta agotar plazas y reporta cada item."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+    observador = ObservadorRegistro()
+    manager.agregar_observador(observador)
+
+    try:
+        capacidad = manager.get_plazas_disponibles()
+        manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Moto", "LOTE0000"))
+
+        vehiculos = [VehiculoFactory.crear_vehiculo("Auto", f"LOTE{i:04d}") for i in range(capacidad + 5)]
+        resultados = manager.ingresar_lote(vehiculos)
+
+        assert len(resultados) == len(vehiculos)
+        assert isinstance(resultados[0].error, VehiculoYaIngresadoException)
+        assert all(r.exito for r in resultados[1:capacidad])
+        assert all(isinstance(r.error, PlazasAgotadasException) for r in resultados[capacidad:])
+        assert manager.get_plazas_ocupadas() == capacidad
+        assert len(manager.get_todos_vehiculos()) == capacidad
+
+        eventos_lote = [e for e in observador.eventos if isinstance(e, LoteIngresoEvento)]
+        assert len(eventos_lote) == 1
+        assert len(eventos_lote[0].vehiculos) == capacidad - 1
+        assert len(eventos_lote[0].patentes_rechazadas) == 5
+    finally:
+        manager.eliminar_observador(observador)
+        manager.reset()
+
+
+def test_egresar_lote():
+    """Verifica que un lote egresa y reporta patentes no encontradas."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+    observador = ObservadorRegistro()
+
+    vehiculos = [VehiculoFactory.crear_vehiculo("Auto", f"SALE{i:03d}") for i in range(10)]
+    manager.ingresar_lote(vehiculos)
+    manager.agregar_observador(observador)
+
+    try:
+        resultados = manager.egresar_lote(["SALE000", "SALE001", "NOEXISTE", "SALE000"])
+
+        assert [r.exito for r in resultados] == [True, True, False, False]
+        assert isinstance(resultados[2].error, VehiculoNoEncontradoException)
+        assert resultados[0].vehiculo.get_hora_egreso() is not None
+        assert manager.get_plazas_ocupadas() == 8
+
+        assert len(observador.eventos) == 1
+        evento = observador.eventos[0]
+        assert isinstance(evento, LoteEgresoEvento)
+        assert evento.patentes_no_encontradas == ["NOEXISTE", "SALE000"]
+    finally:
+        manager.eliminar_observador(observador)
+        manager.reset()
+
+
+class EstrategiaFallida(PricingStandardStrategy):
+    """Estrategia de prueba que no puede calcular precios."""
+
+    def calcular_precio(self, vehiculo, hora_ingreso, hora_egreso):
+        raise RuntimeError("Tarifario no disponible")
+
+
+def test_cobrar_y_egresar_emite_ticket():
+    """Verifica que el egreso cobrado emite ticket y evento con el monto."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+    registro = PricingRegistry.get_instance()
+    registro.set_estrategia(PricingStandardStrategy())
+    observador = ObservadorRegistro()
+
+    auto = VehiculoFactory.crear_vehiculo("Auto", "TICK001")
+    manager.ingresar_vehiculo(auto)
+    ingreso = auto.get_hora_ingreso() - timedelta(hours=2)
+    auto.set_hora_ingreso(ingreso)
+    manager.agregar_observador(observador)
+
+    try:
+        ticket = manager.cobrar_y_egresar("TICK001")
+
+        assert ticket.patente == "TICK001" and ticket.tipo_vehiculo == "Auto"
+        assert ticket.hora_ingreso == ingreso
+        assert ticket.hora_egreso == auto.get_hora_egreso()
+        assert ticket.monto == registro.calcular_precio(auto, ingreso, ticket.hora_egreso)
+        assert ticket.version_precios == registro.get_snapshot().version
+        assert manager.get_vehiculo("TICK001") is None
+
+        evento = observador.eventos[0]
+        assert isinstance(evento, VehiculoEgresoEvento)
+        assert evento.monto == ticket.monto and evento.ticket is ticket
+
+        try:
+            ticket.monto = 0.0
+            assert False, "El ticket deberia ser inmutable"
+        except FrozenInstanceError:
+            pass
+    finally:
+        manager.eliminar_observador(observador)
+        manager.reset()
+
+
+def test_cobro_fallido_no_egresa():
+    """Verifica que si el cobro falla el vehiculo sigue estacionado."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+    registro = PricingRegistry.get_instance()
+
+    manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Moto", "TICK002"))
+    registro.set_estrategia(EstrategiaFallida())
+    try:
+        try:
+            manager.cobrar_y_egresar("TICK002")
+            assert False, "Deberia propagar el error del cobro"
+        except RuntimeError:
+            pass
+
+        assert manager.get_vehiculo("TICK002") is not None
+        assert manager.get_vehiculo("TICK002").get_hora_egreso() is None
+        assert manager.get_plazas_ocupadas() == 1
+    finally:
+        registro.set_estrategia(PricingStandardStrategy())
+        manager.reset()
+
+
+
+def test_patentes_normalizadas():
+    """Verifica que distintas escrituras de una patente son el mismo vehiculo."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+    try:
+        auto = VehiculoFactory.crear_vehiculo("Auto", "abc-123")
+        manager.ingresar_vehiculo(auto)
+
+        assert auto.get_patente() == "ABC123"
+        assert manager.get_vehiculo("Abc 123") is auto
+        clave = next(iter(manager.get_todos_vehiculos()))
+        assert clave is normalizar_patente("abc.123")
+
+        try:
+            manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", "ABC 123"))
+            assert False, "Deberia haber lanzado VehiculoYaIngresadoException"
+        except VehiculoYaIngresadoException:
+            pass
+
+        for invalida in ("AB1", "ABC*123", "ABCDEFGHIJKLM"):
+            try:
+                manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Moto", invalida))
+                assert False, "Deberia haber lanzado PatenteInvalidaException"
+            except PatenteInvalidaException as e:
+                assert e.get_patente() == invalida
+        assert manager.get_vehiculo("AB1") is None
+
+        assert manager.egresar_vehiculo("abc123") is auto
+        assert manager.get_plazas_ocupadas() == 0
+    finally:
+        manager.reset()
+
+
+def test_buscar_por_prefijo_y_confundibles():
+    """Verifica las busquedas del indice secundario de patentes."""
+    manager = ParkingLotManager.get_instance()
+    manager.reset()
+    try:
+        for patente in ("AB123CD", "AB124CD", "AC999ZZ", "B0S123"):
+            manager.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", patente))
+
+        assert [v.get_patente() for v in manager.buscar_por_prefijo("ab-12")] == ["AB123CD", "AB124CD"]
+        assert len(manager.buscar_por_prefijo("A", limite=2)) == 2
+        assert manager.buscar_por_prefijo("ZZ") == []
+
+        # Una camara lee "8OS123" en lugar de "B0S123"
+        assert [v.get_patente() for v in manager.buscar_confundibles("8OS123")] == ["B0S123"]
+        assert manager.buscar_confundibles("??") == []
+
+        # Una letra de mas y una confundida
+        assert [v.get_patente() for v in manager.buscar_similares("AC9992ZZ")] == ["AC999ZZ"]
+        assert [v.get_patente() for v in manager.buscar_similares("AB12OCD")][:2] == ["AB123CD", "AB124CD"]
+        assert manager.buscar_similares("QQ111QQ") == []
+
+        manager.egresar_lote(["AB123CD", "b0s-123"])
+        assert [v.get_patente() for v in manager.buscar_por_prefijo("AB")] == ["AB124CD"]
+        assert manager.buscar_confundibles("B0S123") == []
+    finally:
+        manager.reset()
+
+
+def test_numeracion_de_tickets_continua_al_recargar():
+    """Verifica que luego de guardar y recargar no se repiten numeros de ticket."""
+    PricingRegistry.get_instance().set_estrategia(PricingStandardStrategy())
+    backends = {
+        "json": lambda d: JsonStorage(directorio=d),
+        "binario": lambda d: JsonStorage(directorio=d, formato=FormatoSnapshot.BINARIO),
+        "journal": lambda d: JournalStorage(directorio=d),
+        "sqlite": lambda d: SqliteStorage(directorio=d)
+    }
+    for nombre, crear_storage in backends.items():
+        with tempfile.TemporaryDirectory() as directorio:
+            storage = crear_storage(Path(directorio))
+            lote = ParkingLot(nombre, 10, storage)
+            for i in range(3):
+                lote.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", f"NUM00{i}"))
+            assert [lote.cobrar_y_egresar(f"NUM00{i}").numero for i in range(2)] == [1, 2]
+            assert lote.guardar_estado() is True
+            storage.cerrar()
+
+            storage = crear_storage(Path(directorio))
+            recargado = ParkingLot(nombre, 10, storage)
+            assert recargado.cargar_estado() is True, nombre
+            assert recargado.cobrar_y_egresar("NUM002").numero == 3, nombre
+            storage.cerrar()
+
+
+def test_cargar_estado_recalcula_plazas_ocupadas():
+    """Verifica que las patentes descartadas o fusionadas al cargar no ocupan plaza."""
+    with tempfile.TemporaryDirectory() as directorio:
+        storage = JsonStorage(directorio=Path(directorio))
+        storage.guardar_estado({
+            'plazas_ocupadas': 3,
+            'capacidad_maxima': 10,
+            'vehiculos': {
+                patente: VehiculoFactory.crear_vehiculo("Auto", patente)
+                for patente in ("abc123", "ABC123", "X!")
+            }
+        })
+
+        lote = ParkingLot("recalculo", 10, storage)
+        assert lote.cargar_estado() is True
+        assert list(lote.get_todos_vehiculos()) == ["ABC123"]
+        assert lote.get_plazas_ocupadas() == 1 and lote.get_plazas_disponibles() == 9
+
+
+def test_indice_concurrente_consistente():
+    """Verifica que el indice de patentes queda consistente con altas y bajas concurrentes."""
+    indice = IndicePatentes()
+    patentes = [normalizar_patente(f"AB{i:03d}CD") for i in range(400)]
+
+    def alternar(desde: int):
+        for _ in range(3):
+            for patente in patentes[desde::4]:
+                indice.agregar(patente)
+                indice.buscar_por_prefijo(patente[:3], limite=1)
+            for patente in patentes[desde::8]:
+                indice.quitar(patente)
+
+    hilos = [Thread(target=alternar, args=(desde,)) for desde in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    quitadas = set(patentes[0::8]) | set(patentes[1::8]) | set(patentes[2::8]) | set(patentes[3::8])
+    esperadas = sorted(set(patentes) - quitadas)
+    assert indice.buscar_por_prefijo("AB") == esperadas
+    assert len(indice) == len(esperadas)
+    assert all(patente in indice for patente in esperadas)
+    assert indice.buscar_similares("AB004CD", 2)[0].patente == "AB004CD"
+
+
 if __name__ == "__main__":
     test_ingresar_vehiculo()
     test_egresar_vehiculo()
     test_vehiculo_no_encontrado()
     test_obtener_vehiculo()
     test_vehiculo_no_existe_retorna_none()
+    test_ingresar_vehiculo_duplicado()
+    test_ingresar_lote_exito_parcial()
+    test_egresar_lote()
+    test_cobrar_y_egresar_emite_ticket()
+    test_cobro_fallido_no_egresa()
+    test_patentes_normalizadas()
+    test_buscar_por_prefijo_y_confundibles()
+    test_numeracion_de_tickets_continua_al_recargar()
+    test_cargar_estado_recalcula_plazas_ocupadas()
+    test_indice_concurrente_consistente()
     print("[OK] Todos los tests de ParkingLotManager pasaron")
@@ -0,0 +1,168 @@
+"""Tests para ParkingLotRegistry.
+
+Verifica lotes independientes, el ruteo de puertas y las consultas
+agregadas de ocupacion.
+"""
+
+# Standard library
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.servicios.parking_lot import ParkingLot
+from python_estacionamiento.servicios.parking_lot_manager import ParkingLotManager
+from python_estacionamiento.servicios.parking_lot_registry import ParkingLotRegistry
+from python_estacionamiento.persistencia.json_storage import JsonStorage
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.patrones.observer.observer import Observer
+from python_estacionamiento.excepciones.estacionamiento_exception import (
+    LoteNoEncontradoException,
+    PlazasAgotadasException
+)
+
+
+class ObservadorRegistro(Observer):
+    """Observer de prueba que guarda los eventos recibidos."""
+
+    def __init__(self):
+        self.eventos = []
+
+    def actualizar(self, evento) -> None:
+        """Registra el evento."""
+        self.eventos.append(evento)
+
+
+def _crear_lotes(registro, directorio, capacidades):
+    """Crea lotes con persistencia en un directorio temporal."""
+    return [
+        registro.crear_lote(
+            lote_id, capacidad, JsonStorage(archivo=f"{lote_id}.json", directorio=Path(directorio))
+        )
+        for lote_id, capacidad in capacidades.items()
+    ]
+
+
+def test_lotes_independientes():
+    """Verifica que cada lote tiene su propia capacidad, vehiculos y observadores."""
+    registro = ParkingLotRegistry.get_instance()
+    registro.reset()
+    with tempfile.TemporaryDirectory() as directorio:
+        norte, sur = _crear_lotes(registro, directorio, {"norte": 1, "sur": 2})
+        observador = ObservadorRegistro()
+        norte.agregar_observador(observador)
+
+        norte.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", "LOT001"))
+        sur.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", "LOT001"))
+        try:
+            norte.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Moto", "LOT002"))
+            assert False, "El lote norte deberia estar completo"
+        except PlazasAgotadasException:
+            pass
+
+        assert sur.get_plazas_disponibles() == 1
+        # Ingreso, capacidad critica y plazas agotadas: solo eventos de norte
+        assert len(observador.eventos) == 3
+        assert ParkingLotManager.get_instance() not in registro.get_lotes()
+        assert isinstance(ParkingLotManager.get_instance(), ParkingLot)
+
+        try:
+            registro.crear_lote("norte")
+            assert False, "No deberia admitir ids repetidos"
+        except ValueError:
+            pass
+    registro.reset()
+    print("[OK] Lotes independientes")
+
+
+def test_ruteo_de_puertas_y_ocupacion_agregada():
+    """Verifica que cada puerta opera sobre su lote y los totales suman lotes."""
+    registro = ParkingLotRegistry.get_instance()
+    registro.reset()
+    with tempfile.TemporaryDirectory() as directorio:
+        _crear_lotes(registro, directorio, {"nivel1": 10, "nivel2": 5})
+        registro.asignar_puerta("A", "nivel1")
+        registro.asignar_puerta("B", "nivel1")
+        registro.asignar_puerta("C", "nivel2")
+
+        lote = registro.ingresar_por_puerta("A", VehiculoFactory.crear_vehiculo("Auto", "PTA001"))
+        assert lote.get_lote_id() == "nivel1"
+        registro.ingresar_por_puerta("C", VehiculoFactory.crear_vehiculo("Moto", "PTA002"))
+        registro.ingresar_por_puerta("C", VehiculoFactory.crear_vehiculo("Auto", "PTA003"))
+
+        ticket = registro.cobrar_y_egresar_por_puerta("B", "PTA001")
+        assert ticket.zona == "nivel1"
+        registro.egresar_por_puerta("C", "PTA002")
+
+        assert registro.get_ocupacion() == {"nivel1": (0, 10), "nivel2": (1, 5)}
+        assert registro.get_plazas_ocupadas() == 1
+        assert registro.get_plazas_disponibles() == 14
+
+        registro.eliminar_lote("nivel2")
+        try:
+            registro.ingresar_por_puerta("C", VehiculoFactory.crear_vehiculo("Auto", "PTA004"))
+            assert False, "La puerta C ya no deberia rutear"
+        except LoteNoEncontradoException as e:
+            assert e.get_identificador() == "C"
+    registro.reset()
+    print("[OK] Ruteo de puertas y ocupacion agregada")
+
+
+def test_lotes_concurrentes():
+    """Verifica ingresos y egresos simultaneos en varios lotes."""
+    registro = ParkingLotRegistry.get_instance()
+    registro.reset()
+    with tempfile.TemporaryDirectory() as directorio:
+        lotes = _crear_lotes(registro, directorio, {f"shard{i}": 500 for i in range(4)})
+        for lote in lotes:
+            registro.asignar_puerta(f"puerta_{lote.get_lote_id()}", lote.get_lote_id())
+
+        def operar(lote_id):
+            puerta = f"puerta_{lote_id}"
+            for i in range(300):
+                registro.ingresar_por_puerta(puerta, VehiculoFactory.crear_vehiculo("Auto", f"{lote_id}-{i}"))
+            for i in range(0, 300, 3):
+                registro.egresar_por_puerta(puerta, f"{lote_id}-{i}")
+
+        hilos = [threading.Thread(target=operar, args=(lote.get_lote_id(),)) for lote in lotes]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        assert all(ocupadas == 200 for ocupadas, _ in registro.get_ocupacion().values())
+        assert registro.get_plazas_ocupadas() == 800
+    registro.reset()
+    print("[OK] Operaciones concurrentes en 4 lotes")
+
+
+def test_capacidad_invalida():
+    """Verifica que no se puede crear un lote sin plazas."""
+    registro = ParkingLotRegistry.get_instance()
+    registro.reset()
+    with tempfile.TemporaryDirectory() as directorio:
+        for capacidad in (0, -5):
+            try:
+                _crear_lotes(registro, directorio, {"vacio": capacidad})
+                assert False, "Deberia rechazar la capacidad"
+            except ValueError:
+                pass
+        assert registro.get_ocupacion() == {}
+    registro.reset()
+    print("[OK] Capacidad invalida rechazada")
+
+
+if __name__ == "__main__":
+    print("\n=============== TESTS DE PARKING LOT REGISTRY ===============\n")
+
+    test_lotes_independientes()
+    test_ruteo_de_puertas_y_ocupacion_agregada()
+    test_lotes_concurrentes()
+    test_capacidad_invalida()
+
+    print("\n[OK] Todos los tests de ParkingLotRegistry pasaron")
@@ -0,0 +1,229 @@
+"""Tests para las cotizaciones de PricingRegistry.
+
+Verifica el cache de cotizaciones, su invalidacion al cambiar la
+estrategia, el desalojo LRU, el ruteo de estrategias y las versiones
+de precios.
+"""
+
+# Standard library
+import sys
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.servicios.pricing_registry import PricingRegistry
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.patrones.strategy.impl.pricing_standard_strategy import PricingStandardStrategy
+from python_estacionamiento.patrones.strategy.impl.pricing_valet_strategy import PricingValetStrategy
+from python_estacionamiento.patrones.strategy.impl.pricing_happy_hour_strategy import PricingHappyHourStrategy
+from python_estacionamiento.patrones.strategy.impl.pricing_evento_strategy import PricingEventoStrategy
+from python_estacionamiento.patrones.strategy.ruteo_estrategias import ReglaRuteo, TablaRuteo
+from python_estacionamiento.utils.cache_lru import CacheLRU
+
+
+def _auto_estacionado(patente, hora_ingreso):
+    """Crea un auto con hora de ingreso asignada."""
+    auto = VehiculoFactory.crear_vehiculo("Auto", patente)
+    auto.set_hora_ingreso(hora_ingreso)
+    return auto
+
+
+def test_cotizaciones_se_reutilizan():
+    """Verifica que estadias del mismo tipo y minutos cobrables comparten cotizacion."""
+    registro = PricingRegistry.get_instance()
+    registro.set_estrategia(PricingStandardStrategy())
+    antes = registro.get_metricas_cotizaciones()
+
+    ingreso = datetime(2025, 11, 4, 9, 0)
+    auto1 = _auto_estacionado("COT001", ingreso)
+    auto2 = _auto_estacionado("COT002", ingreso + timedelta(hours=1))
+
+    # 2 horas y 20 segundos: se cotizan 120 minutos (105 cobrables)
+    precio1 = registro.cotizar(auto1, ingreso + timedelta(hours=2, seconds=20))
+    precio2 = registro.cotizar(auto2, ingreso + timedelta(hours=3, seconds=50))
+
+    metricas = registro.get_metricas_cotizaciones()
+    assert precio1 == precio2 == 175.0
+    assert metricas.fallos - antes.fallos == 1
+    assert metricas.aciertos - antes.aciertos == 1
+    print(f"[OK] Cotizacion reutilizada: ${precio1}")
+
+
+def test_cambiar_estrategia_invalida_cache():
+    """Verifica que set_estrategia descarta las cotizaciones anteriores."""
+    registro = PricingRegistry.get_instance()
+    registro.set_estrategia(PricingStandardStrategy())
+    ingreso = datetime(2025, 11, 4, 9, 0)
+    auto = _auto_estacionado("COT003", ingreso)
+    consulta = ingreso + timedelta(hours=2)
+
+    try:
+        assert registro.cotizar(auto, consulta) == 175.0
+        registro.set_estrategia(PricingValetStrategy())
+        assert registro.get_metricas_cotizaciones().tamano == 0
+        assert registro.cotizar(auto, consulta) == 227.5
+    finally:
+        registro.set_estrategia(PricingStandardStrategy())
+
+    print("[OK] Cache invalidado al cambiar la estrategia")
+
+
+def test_estrategias_por_franja_no_se_cachean():
+    """Verifica que las estrategias que dependen de la hora no reutilizan cotizaciones."""
+    registro = PricingRegistry.get_instance()
+    registro.set_estrategia(PricingHappyHourStrategy())
+    try:
+        manana = _auto_estacionado("COT004", datetime(2025, 11, 4, 9, 0))
+        tarde = _auto_estacionado("COT005", datetime(2025, 11, 4, 14, 0))
+
+        assert registro.cotizar(manana, datetime(2025, 11, 4, 11, 0)) == 175.0
+        assert registro.cotizar(tarde, datetime(2025, 11, 4, 16, 0)) == 140.0
+        assert registro.get_metricas_cotizaciones().tamano == 0
+    finally:
+        registro.set_estrategia(PricingStandardStrategy())
+
+    print("[OK] Estrategias por franja calculadas sin cache")
+
+
+def test_cache_lru_desaloja_la_menos_usada():
+    """Verifica el desalojo LRU y los contadores del cache."""
+    cache = CacheLRU(capacidad=2)
+    cache.obtener_o_calcular("a", lambda: 1)
+    cache.obtener_o_calcular("b", lambda: 2)
+    cache.obtener_o_calcular("a", lambda: 0)  # acierto: "a" pasa a ser la mas reciente
+    cache.obtener_o_calcular("c", lambda: 3)  # desaloja "b"
+
+    assert cache.obtener_o_calcular("b", lambda: 20) == 20
+    metricas = cache.get_metricas()
+    assert (metricas.aciertos, metricas.fallos, metricas.desalojos, metricas.tamano) == (1, 4, 2, 2)
+    print("[OK] Desalojo LRU")
+
+
+def test_tabla_ruteo_prefiere_la_regla_mas_especifica():
+    """Verifica la resolucion de comodines y la precedencia entre reglas."""
+    valet = PricingValetStrategy()
+    evento = PricingEventoStrategy()
+    happy = PricingHappyHourStrategy()
+    tabla = TablaRuteo([
+        ReglaRuteo(valet, clase_cliente="valet"),
+        ReglaRuteo(evento, zona="estadio"),
+        ReglaRuteo(happy, tipo="Moto", zona="estadio"),
+    ])
+
+    assert tabla.resolver("Auto", "centro", "valet") is valet
+    assert tabla.resolver("Auto", "estadio") is evento
+    assert tabla.resolver("Moto", "estadio", "valet") is happy
+    # A igual especificidad gana la ultima regla
+    assert tabla.resolver("Auto", "estadio", "valet") is evento
+    # Valores desconocidos caen en la estrategia por defecto
+    assert tabla.resolver("Camioneta", "norte", "abonado") is None
+    print(f"[OK] Tabla de ruteo con {len(tabla)} combinaciones")
+
+
+def test_registry_rutea_por_tipo_y_clase_de_cliente():
+    """Verifica que el registro aplica estrategias distintas a la vez."""
+    registro = PricingRegistry.get_instance()
+    ingreso = datetime(2025, 11, 4, 9, 0)
+    egreso = ingreso + timedelta(hours=2)
+    auto = _auto_estacionado("RUT001", ingreso)
+    moto = VehiculoFactory.crear_vehiculo("Moto", "RUT002")
+    moto.set_hora_ingreso(ingreso)
+
+    registro.set_estrategia(PricingStandardStrategy())
+    registro.set_ruteo([
+        ReglaRuteo(PricingValetStrategy(), clase_cliente="valet"),
+        ReglaRuteo(PricingEventoStrategy(), tipo="Moto", zona="estadio"),
+    ])
+    try:
+        assert registro.calcular_precio(auto, ingreso, egreso) == 175.0
+        assert registro.calcular_precio(auto, ingreso, egreso, clase_cliente="valet") == 227.5
+        assert registro.calcular_precio(moto, ingreso, egreso, zona="estadio") == 137.5
+        assert registro.cotizar(auto, egreso) == 175.0
+        assert registro.cotizar(auto, egreso, clase_cliente="valet") == 227.5
+    finally:
+        registro.set_ruteo([])
+
+    assert registro.calcular_precio(auto, ingreso, egreso, clase_cliente="valet") == 175.0
+    print("[OK] Estrategias ruteadas por tipo, zona y clase de cliente")
+
+
+def test_precios_versionados_y_recalculo_de_auditoria():
+    """Verifica que cada precio indica su version y puede recalcularse con ella."""
+    registro = PricingRegistry.get_instance()
+    ingreso = datetime(2025, 11, 4, 9, 0)
+    egreso = ingreso + timedelta(hours=2)
+    auto = _auto_estacionado("VER001", ingreso)
+
+    registro.set_estrategia(PricingStandardStrategy())
+    estandar = registro.calcular_precio_versionado(auto, ingreso, egreso)
+    registro.set_estrategia(PricingValetStrategy())
+    try:
+        valet = registro.calcular_precio_versionado(auto, ingreso, egreso)
+        assert (estandar.monto, estandar.estrategia) == (175.0, "PricingStandardStrategy")
+        assert (valet.monto, valet.estrategia) == (227.5, "PricingValetStrategy")
+        assert valet.version == estandar.version + 1
+
+        auditoria = registro.recalcular_lote([(auto, ingreso, egreso)] * 3, estandar.version)
+        assert auditoria == [estandar] * 3
+        assert registro.get_versiones()[-1] == valet.version
+
+        try:
+            registro.recalcular_lote([], version=-1)
+            assert False, "Deberia rechazar una version inexistente"
+        except ValueError:
+            pass
+    finally:
+        registro.set_estrategia(PricingStandardStrategy())
+
+    print(f"[OK] Auditoria con la version {estandar.version}")
+
+
+def test_cambio_de_estrategia_concurrente_es_consistente():
+    """Verifica que cada precio coincide con la estrategia de su version."""
+    registro = PricingRegistry.get_instance()
+    ingreso = datetime(2025, 11, 4, 9, 0)
+    egreso = ingreso + timedelta(hours=2)
+    auto = _auto_estacionado("VER002", ingreso)
+    esperados = {"PricingStandardStrategy": 175.0, "PricingValetStrategy": 227.5}
+    resultados = []
+    detener = threading.Event()
+
+    def calcular():
+        while not detener.is_set():
+            resultados.append(registro.calcular_precio_versionado(auto, ingreso, egreso))
+
+    hilos = [threading.Thread(target=calcular) for _ in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    try:
+        for i in range(200):
+            registro.set_estrategia(PricingValetStrategy() if i % 2 else PricingStandardStrategy())
+    finally:
+        detener.set()
+        for hilo in hilos:
+            hilo.join()
+        registro.set_estrategia(PricingStandardStrategy())
+
+    assert resultados
+    assert all(precio.monto == esperados[precio.estrategia] for precio in resultados)
+    print(f"[OK] {len(resultados)} precios consistentes durante 200 cambios")
+
+
+if __name__ == "__main__":
+    print("\n=============== TESTS DE PRICING REGISTRY ===============\n")
+
+    test_cotizaciones_se_reutilizan()
+    test_cambiar_estrategia_invalida_cache()
+    test_estrategias_por_franja_no_se_cachean()
+    test_cache_lru_desaloja_la_menos_usada()
+    test_tabla_ruteo_prefiere_la_regla_mas_especifica()
+    test_registry_rutea_por_tipo_y_clase_de_cliente()
+    test_precios_versionados_y_recalculo_de_auditoria()
+    test_cambio_de_estrategia_concurrente_es_consistente()
+
+    print("\n[OK] Todos los tests de PricingRegistry pasaron")
@@ -0,0 +1,215 @@
+"""Tests para TablaOcupacionCompartida.
+
+Verifica el bitmap de plazas, los contadores por tipo, el indice de
+patentes, su uso como backend de ocupacion de ParkingLot y las puertas en
+procesos separados.
+"""
+
+# Standard library
+import random
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Agregar el directorio raiz al path para imports
+root_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Local application
+from python_estacionamiento.servicios.tabla_ocupacion_compartida import TablaOcupacionCompartida
+from python_estacionamiento.servicios.puertas_procesos import procesar_puertas
+from python_estacionamiento.servicios.parking_lot import ParkingLot
+from python_estacionamiento.servicios.asignador_plazas import AsignadorPlazas
+from python_estacionamiento.patrones.factory.vehiculo_factory import VehiculoFactory
+from python_estacionamiento.excepciones.estacionamiento_exception import (
+    PatenteInvalidaException,
+    PlazasAgotadasException,
+    VehiculoNoEncontradoException,
+    VehiculoYaIngresadoException
+)
+
+
+def test_ingresos_y_egresos_en_la_tabla():
+    """Verifica plazas, contadores y rechazos en un solo proceso."""
+    tabla = TablaOcupacionCompartida.crear(3)
+    try:
+        assert tabla.ingresar("SHM001", "Auto") == 1
+        assert tabla.ingresar("SHM002", "Moto") == 2
+        assert tabla.ingresar("SHM003", "Auto") == 3
+        assert tabla.ingresar("SHM004", "Camioneta") is None
+
+        try:
+            tabla.ingresar("shm-001", "Auto")
+            assert False, "Deberia rechazar la patente duplicada"
+        except VehiculoYaIngresadoException:
+            pass
+        try:
+            tabla.ingresar("S-1", "Auto")
+            assert False, "Deberia rechazar la patente invalida"
+        except PatenteInvalidaException:
+            pass
+
+        assert tabla.egresar("SHM002") == 2
+        assert not tabla.plaza_ocupada(2)
+        assert tabla.ingresar("SHM004", "Camioneta") == 2
+        assert tabla.get_plaza("shm 004") == 2 and tabla.get_plaza("SHM002") is None
+        for plaza in (0, 4):
+            try:
+                tabla.plaza_ocupada(plaza)
+                assert False, "Deberia rechazar una plaza inexistente"
+            except ValueError:
+                pass
+        assert [tabla.get_plazas_ocupadas(tipo) for tipo in VehiculoFactory.get_tipos()] == [0, 2, 1]
+
+        try:
+            tabla.egresar("SHM002")
+            assert False, "Deberia rechazar una patente que no esta"
+        except VehiculoNoEncontradoException:
+            pass
+    finally:
+        tabla.destruir()
+
+    print("[OK] Ingresos y egresos en la tabla compartida")
+
+
+def test_indice_coincide_con_un_diccionario():
+    """Verifica el indice de patentes contra un modelo con operaciones aleatorias."""
+    generador = random.Random(7)
+    tipos = VehiculoFactory.get_tipos()
+    # Pocos segmentos para que el sondeo y los borrados recorran cada uno
+    tabla = TablaOcupacionCompartida.crear(64, segmentos=3)
+    modelo = {}
+    try:
+        for _ in range(5000):
+            patente = f"R{generador.randrange(100):03d}"
+            if patente in modelo:
+                assert tabla.egresar(patente) == modelo.pop(patente)
+            else:
+                plaza = tabla.ingresar(patente, generador.choice(tipos))
+                if plaza is not None:
+                    assert plaza not in modelo.values()
+                    modelo[patente] = plaza
+
+        assert all(tabla.get_plaza(patente) == plaza for patente, plaza in modelo.items())
+        assert tabla.get_plazas_ocupadas() == len(modelo)
+        assert sum(tabla.get_plazas_ocupadas(tipo) for tipo in tipos) == len(modelo)
+        assert sum(tabla.plaza_ocupada(plaza) for plaza in range(1, 65)) == len(modelo)
+    finally:
+        tabla.destruir()
+
+    print(f"[OK] Indice consistente con {len(modelo)} vehiculos")
+
+
+def test_ocupantes_conservan_tipo_y_hora():
+    """Verifica que la tabla devuelve el tipo y la hora de ingreso de cada vehiculo."""
+    tabla = TablaOcupacionCompartida.crear(40, segmentos=4)
+    hora = datetime(2026, 3, 1, 8, 30, 15, 123456)
+    try:
+        plaza = tabla.ingresar("OCU001", "Camioneta", hora)
+        assert tabla.ingresar("OCU002", "Moto") != plaza
+        ocupante = tabla.get_ocupante("ocu-001")
+        assert (ocupante.patente, ocupante.plaza, ocupante.tipo) == ("OCU001", plaza, "Camioneta")
+        assert ocupante.hora_ingreso == hora
+        assert tabla.get_ocupante("OCU002").hora_ingreso is None
+        assert {o.patente for o in tabla.get_ocupantes()} == {"OCU001", "OCU002"}
+        try:
+            tabla.ingresar("OCU003", "Auto", datetime.now().astimezone())
+            assert False, "Deberia rechazar una hora con zona horaria"
+        except ValueError:
+            pass
+    finally:
+        tabla.destruir()
+
+    print("[OK] Ocupantes con tipo y hora de ingreso")
+
+
+def test_lotes_comparten_la_ocupacion():
+    """Verifica dos ParkingLot (puertas) sobre la misma tabla compartida."""
+    tabla = TablaOcupacionCompartida.crear(2)
+    entrada = ParkingLot("entrada", 10)
+    salida = ParkingLot("salida", 10)
+    try:
+        entrada.set_ocupacion_compartida(tabla)
+        salida.set_ocupacion_compartida(tabla)
+        assert entrada.get_capacidad_maxima() == 2
+
+        auto = VehiculoFactory.crear_vehiculo("Auto", "pta-001")
+        entrada.ingresar_vehiculo(auto)
+        assert salida.get_plazas_ocupadas() == 1 and salida.get_plaza("PTA001") == 1
+        try:
+            salida.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", "PTA001"))
+            assert False, "Deberia rechazar la patente ingresada por otra puerta"
+        except VehiculoYaIngresadoException:
+            pass
+
+        salida.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Moto", "PTA002"))
+        try:
+            entrada.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Moto", "PTA003"))
+            assert False, "Deberia rechazar el ingreso con la tabla completa"
+        except PlazasAgotadasException:
+            pass
+        assert set(entrada.get_todos_vehiculos()) == {"PTA001", "PTA002"}
+
+        # Egreso por otra puerta: el vehiculo se reconstruye desde la tabla
+        ticket = salida.cobrar_y_egresar("PTA001")
+        assert ticket.tipo_vehiculo == "Auto" and ticket.hora_ingreso == auto.get_hora_ingreso()
+        assert entrada.get_vehiculo("PTA001") is None
+        resultados = entrada.egresar_lote(["PTA002", "PTA001"])
+        assert [r.exito for r in resultados] == [True, False]
+        assert tabla.get_plazas_ocupadas() == 0
+
+        entrada.ingresar_vehiculo(VehiculoFactory.crear_vehiculo("Auto", "PTA001"))
+        assert salida.get_vehiculo("PTA001").get_hora_ingreso() is not None
+        try:
+            entrada.set_asignador(AsignadorPlazas())
+            assert False, "Deberia rechazar el asignador con tabla compartida"
+        except ValueError:
+            pass
+    finally:
+        tabla.destruir()
+
+    print("[OK] Dos puertas comparten la ocupacion")
+
+
+def test_puertas_en_procesos_separados():
+    """Verifica que varios procesos comparten la ocupacion sin perder cambios."""
+    tipos = VehiculoFactory.get_tipos()
+    tabla = TablaOcupacionCompartida.crear(3000)
+    try:
+        ingresos = [
+            [("ingreso", f"P{puerta}-{i:03d}", tipos[i % len(tipos)]) for i in range(500)]
+            for puerta in range(4)
+        ]
+        resultados = procesar_puertas(tabla, ingresos)
+
+        plazas = [plaza for puerta in resultados for plaza in puerta]
+        assert None not in plazas
+        assert len(set(plazas)) == 2000
+        assert tabla.get_plazas_ocupadas() == 2000
+
+        # Cada puerta egresa vehiculos que ingresaron por otra
+        egresos = [
+            [("egreso", f"P{(puerta + 1) % 4}-{i:03d}") for i in range(0, 500, 2)]
+            for puerta in range(4)
+        ]
+        resultados = procesar_puertas(tabla, egresos)
+
+        assert None not in [plaza for puerta in resultados for plaza in puerta]
+        assert tabla.get_plazas_ocupadas() == 1000
+        assert tabla.get_plaza("P0-000") is None and tabla.get_plaza("P0001") is not None
+    finally:
+        tabla.destruir()
+
+    print("[OK] 4 puertas en procesos separados")
+
+
+if __name__ == "__main__":
+    print("\n=============== TESTS DE TABLA DE OCUPACION COMPARTIDA ===============\n")
+
+    test_ingresos_y_egresos_en_la_tabla()
+    test_indice_coincide_con_un_diccionario()
+    test_ocupantes_conservan_tipo_y_hora()
+    test_lotes_comparten_la_ocupacion()
+    test_puertas_en_procesos_separados()
+
+    print("\n[OK] Todos los tests de TablaOcupacionCompartida pasaron")